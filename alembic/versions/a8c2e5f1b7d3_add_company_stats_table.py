@@ -0,0 +1,122 @@
+"""Add company stats table with per-company filing and analysis summaries
+
+Revision ID: a8c2e5f1b7d3
+Revises: f1a4d7b9c2e6
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c2e5f1b7d3"
+down_revision: str | Sequence[str] | None = "f1a4d7b9c2e6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Company pages read these summaries instead of aggregating filings and
+    # analyses on every request
+    company_stats = op.create_table(
+        "company_stats",
+        sa.Column("company_id", sa.UUID(), nullable=False),
+        sa.Column("filing_count", sa.Integer(), nullable=False),
+        sa.Column("filing_counts_by_type", sa.JSON(), nullable=False),
+        sa.Column("latest_filing_date", sa.Date(), nullable=True),
+        sa.Column("analysis_count", sa.Integer(), nullable=False),
+        sa.Column("latest_analysis_id", sa.UUID(), nullable=True),
+        sa.Column("latest_analysis_confidence", sa.Float(), nullable=True),
+        sa.Column("latest_analysis_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id"),
+    )
+
+    # Backfill from the existing filings and analyses
+    filings = sa.table(
+        "filings",
+        sa.column("id", sa.UUID()),
+        sa.column("company_id", sa.UUID()),
+        sa.column("filing_type", sa.String()),
+        sa.column("filing_date", sa.Date()),
+    )
+    analyses = sa.table(
+        "analyses",
+        sa.column("id", sa.UUID()),
+        sa.column("filing_id", sa.UUID()),
+        sa.column("confidence_score", sa.Float()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    bind = op.get_bind()
+
+    stats: dict[Any, dict[str, Any]] = {}
+    filing_rows = bind.execute(
+        sa.select(
+            filings.c.company_id,
+            filings.c.filing_type,
+            sa.func.count(),
+            sa.func.max(filings.c.filing_date),
+        ).group_by(filings.c.company_id, filings.c.filing_type)
+    )
+    for company_id, filing_type, count, latest in filing_rows:
+        row = stats.setdefault(
+            company_id,
+            {
+                "company_id": company_id,
+                "filing_count": 0,
+                "filing_counts_by_type": {},
+                "latest_filing_date": None,
+                "analysis_count": 0,
+                "latest_analysis_id": None,
+                "latest_analysis_confidence": None,
+                "latest_analysis_at": None,
+            },
+        )
+        row["filing_count"] += count
+        row["filing_counts_by_type"][filing_type] = count
+        if row["latest_filing_date"] is None or latest > row["latest_filing_date"]:
+            row["latest_filing_date"] = latest
+
+    analysis_rows = bind.execute(
+        sa.select(
+            filings.c.company_id,
+            analyses.c.id,
+            analyses.c.confidence_score,
+            analyses.c.created_at,
+        )
+        .join(filings, analyses.c.filing_id == filings.c.id)
+        .order_by(filings.c.company_id, analyses.c.created_at, analyses.c.id)
+    )
+    for company_id, analysis_id, confidence, created_at in analysis_rows:
+        row = stats[company_id]
+        row["analysis_count"] += 1
+        # Rows are ordered by creation, so the last one is the latest
+        row["latest_analysis_id"] = analysis_id
+        row["latest_analysis_confidence"] = confidence
+        row["latest_analysis_at"] = created_at
+
+    if stats:
+        op.bulk_insert(company_stats, list(stats.values()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("company_stats")
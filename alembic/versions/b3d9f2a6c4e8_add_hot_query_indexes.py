@@ -0,0 +1,50 @@
+"""Add composite indexes for hot filing and analysis queries
+
+Revision ID: b3d9f2a6c4e8
+Revises: a8c2e5f1b7d3
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d9f2a6c4e8"
+down_revision: str | Sequence[str] | None = "a8c2e5f1b7d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A filing's analyses filtered by type, newest first
+    op.create_index(
+        "ix_analyses_filing_type_created_at",
+        "analyses",
+        ["filing_id", "analysis_type", "created_at"],
+        unique=False,
+    )
+    # Filings of a processing status oldest first, such as the queue of
+    # pending filings. Replaces the index on the status alone, which left
+    # the order to a sort.
+    op.create_index(
+        "ix_filings_status_created_at",
+        "filings",
+        ["processing_status", "created_at"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_filings_processing_status"), table_name="filings")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_filings_processing_status"),
+        "filings",
+        ["processing_status"],
+        unique=False,
+    )
+    op.drop_index("ix_filings_status_created_at", table_name="filings")
+    op.drop_index("ix_analyses_filing_type_created_at", table_name="analyses")
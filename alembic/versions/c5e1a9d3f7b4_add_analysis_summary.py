@@ -0,0 +1,31 @@
+"""Add compact results summary to analyses
+
+Revision ID: c5e1a9d3f7b4
+Revises: b3d9f2a6c4e8
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e1a9d3f7b4"
+down_revision: str | Sequence[str] | None = "b3d9f2a6c4e8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing analyses keep a NULL summary and are summarized from storage
+    # until backfilled with scripts/backfill_analysis_summaries.py
+    op.add_column("analyses", sa.Column("summary", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("analyses", "summary")
@@ -0,0 +1,68 @@
+"""Add tasks table for background task state
+
+Revision ID: d7e4a1c2b3f5
+Revises: c5a3b8f9d1e2
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e4a1c2b3f5"
+down_revision: str | Sequence[str] | None = "c5a3b8f9d1e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Task state moves from individual storage keys to an indexed table
+    op.create_table(
+        "tasks",
+        sa.Column("task_id", sa.String(length=64), nullable=False),
+        sa.Column("task_type", sa.String(length=100), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("user_id", sa.String(length=255), nullable=True),
+        sa.Column("progress_percent", sa.Float(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    op.create_index(
+        "ix_tasks_user_status_created",
+        "tasks",
+        ["user_id", "status", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_user_created", "tasks", ["user_id", "created_at"], unique=False
+    )
+    op.create_index(
+        "ix_tasks_status_completed", "tasks", ["status", "completed_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_status_completed", table_name="tasks")
+    op.drop_index("ix_tasks_user_created", table_name="tasks")
+    op.drop_index("ix_tasks_user_status_created", table_name="tasks")
+    op.drop_table("tasks")
@@ -0,0 +1,88 @@
+"""Add company tickers table for indexed ticker lookups
+
+Revision ID: e3f9c6a2d8b4
+Revises: d7e4a1c2b3f5
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f9c6a2d8b4"
+down_revision: str | Sequence[str] | None = "d7e4a1c2b3f5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _metadata_tickers(metadata: dict[str, Any] | None) -> list[str]:
+    """Get the normalized tickers stored in company metadata."""
+    if not metadata:
+        return []
+    candidates = [metadata.get("ticker")]
+    if isinstance(metadata.get("tickers"), list):
+        candidates.extend(metadata["tickers"])
+
+    tickers: list[str] = []
+    for candidate in candidates:
+        if not isinstance(candidate, str):
+            continue
+        ticker = candidate.strip().upper()
+        if ticker and len(ticker) <= 10 and ticker not in tickers:
+            tickers.append(ticker)
+    return tickers
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Ticker searches move from an unindexed meta_data JSON extraction to a
+    # normalized table, which also allows several tickers per company
+    company_tickers = op.create_table(
+        "company_tickers",
+        sa.Column("company_id", sa.UUID(), nullable=False),
+        sa.Column("ticker", sa.String(length=10), nullable=False),
+        sa.Column("is_primary", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "ticker"),
+    )
+    op.create_index(
+        op.f("ix_company_tickers_ticker"), "company_tickers", ["ticker"], unique=False
+    )
+
+    # Backfill from the tickers stored in company meta_data
+    companies = sa.table(
+        "companies",
+        sa.column("id", sa.UUID()),
+        sa.column("meta_data", sa.JSON()),
+    )
+    rows = op.get_bind().execute(sa.select(companies.c.id, companies.c.meta_data))
+    backfill = [
+        {"company_id": company_id, "ticker": ticker, "is_primary": index == 0}
+        for company_id, metadata in rows
+        for index, ticker in enumerate(_metadata_tickers(metadata))
+    ]
+    if backfill:
+        op.bulk_insert(company_tickers, backfill)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_company_tickers_ticker"), table_name="company_tickers")
+    op.drop_table("company_tickers")
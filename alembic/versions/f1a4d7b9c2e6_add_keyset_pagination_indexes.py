@@ -0,0 +1,61 @@
+"""Add composite indexes for keyset pagination of filings and analyses
+
+Revision ID: f1a4d7b9c2e6
+Revises: e3f9c6a2d8b4
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a4d7b9c2e6"
+down_revision: str | Sequence[str] | None = "e3f9c6a2d8b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Listing queries seek on (sort column, id) instead of scanning past an offset
+INDEXES = [
+    ("ix_filings_company_date_id", "filings", ["company_id", "filing_date", "id"]),
+    (
+        "ix_filings_company_type_date_id",
+        "filings",
+        ["company_id", "filing_type", "filing_date", "id"],
+    ),
+    ("ix_analyses_created_at_id", "analyses", ["created_at", "id"]),
+    (
+        "ix_analyses_type_created_at_id",
+        "analyses",
+        ["analysis_type", "created_at", "id"],
+    ),
+    (
+        "ix_analyses_filing_created_at_id",
+        "analyses",
+        ["filing_id", "created_at", "id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+    # Analyses without a score sort lowest, as the repository's sort key
+    op.create_index(
+        "ix_analyses_confidence_id",
+        "analyses",
+        [sa.text("coalesce(confidence_score, -1)"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_analyses_confidence_id", table_name="analyses")
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -10,6 +10,7 @@ export interface PaginationMetadata {
   has_previous: boolean
   next_page: number | null
   previous_page: number | null
+  next_cursor?: string | null
 }
 
 export interface PaginatedResponse<T> {
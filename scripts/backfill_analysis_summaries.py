@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Analysis Summary Backfill Command
+
+Records the summary of analyses completed before summaries were kept in the
+``analyses`` table. Until backfilled, summary reads of those analyses load
+the full results from storage.
+
+USAGE EXAMPLES:
+    Backfill every analysis without a summary:
+        python scripts/backfill_analysis_summaries.py
+
+    Smaller batches for a busy database:
+        python scripts/backfill_analysis_summaries.py --batch-size 20
+
+EXIT CODES:
+    - 0: Backfill completed
+    - 1: Backfill failed
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to Python path for src imports
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.infrastructure.database.base import async_session_maker  # noqa: E402
+from src.infrastructure.repositories.analysis_repository import (  # noqa: E402
+    AnalysisRepository,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser.
+
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Backfill the summaries of stored analyses",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        metavar="N",
+        help="Number of analyses loaded per batch (default: 100)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Enable verbose logging (DEBUG level)",
+    )
+    return parser
+
+
+async def main() -> None:
+    """Main entry point for the analysis summary backfill script."""
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        async with async_session_maker() as session:
+            backfilled = await AnalysisRepository(session).backfill_summaries(
+                batch_size=args.batch_size
+            )
+            await session.commit()
+        logger.info(f"Backfilled summaries of {backfilled} analyses")
+    except KeyboardInterrupt:
+        logger.info("Backfill cancelled by user")
+        sys.exit(130)
+    except Exception as e:
+        logger.error(f"Backfill failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark Command
+
+Compares the standard library JSON path that analysis results used to take
+with the orjson path and the raw passthrough of stored results, on synthetic
+comprehensive analysis results of configurable size.
+
+Measured paths:
+    - Storage write: ``json.dumps(indent=2, default=str)`` vs orjson
+    - Storage read: ``json.loads`` vs orjson
+    - API response: read and parse stored results, build the
+      ``AnalysisResponse`` and render it with ``JSONResponse`` vs
+      ``ORJSONResponse``, and the raw results endpoint passing the stored
+      bytes through
+
+USAGE EXAMPLES:
+    Default result size (16 sections of 8 sub-sections):
+        python scripts/benchmark_serialization.py
+
+    Larger results, fewer repetitions:
+        python scripts/benchmark_serialization.py --sections 40 --repeat 5
+
+EXIT CODES:
+    - 0: Benchmark completed
+    - 1: Benchmark failed
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+# Add project root to Python path for src imports
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from fastapi import Response  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from src.application.schemas.responses.analysis_response import (  # noqa: E402
+    AnalysisResponse,
+)
+from src.domain.entities.analysis import Analysis, AnalysisType  # noqa: E402
+from src.shared import serialization  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser.
+
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark JSON serialization of analysis results",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--sections",
+        type=int,
+        default=16,
+        metavar="N",
+        help="Number of section analyses in the results (default: 16)",
+    )
+    parser.add_argument(
+        "--sub-sections",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Number of sub-sections per section (default: 8)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        metavar="N",
+        help="Number of timed runs of each path (default: 20)",
+    )
+    return parser
+
+
+def build_results(sections: int, sub_sections: int) -> dict[str, Any]:
+    """Build synthetic results shaped like a comprehensive analysis.
+
+    Args:
+        sections: Number of section analyses
+        sub_sections: Number of sub-sections per section
+
+    Returns:
+        Analysis results dictionary
+    """
+    sentence = "Revenue grew on services while hardware margins compressed. " * 4
+    return {
+        "filing_summary": sentence,
+        "executive_summary": sentence * 2,
+        "key_insights": [sentence] * 8,
+        "risk_factors": [sentence] * 8,
+        "opportunities": [sentence] * 8,
+        "financial_highlights": [sentence] * 8,
+        "confidence_score": 0.87,
+        "section_analyses": [
+            {
+                "section_name": f"Section {section}",
+                "section_summary": sentence,
+                "overall_sentiment": 0.4,
+                "critical_findings": [sentence] * 4,
+                "processing_time_ms": 1200,
+                "sub_sections": [
+                    {
+                        "schema_type": "BusinessAnalysisSection",
+                        "subsection_name": f"Sub-section {sub_section}",
+                        "processing_time_ms": 800,
+                        "analysis": {
+                            "summary": sentence,
+                            "metrics": [
+                                {"name": f"metric_{i}", "value": i * 1.5, "unit": "USD"}
+                                for i in range(12)
+                            ],
+                            "segments": {
+                                f"segment_{i}": {
+                                    "revenue": 1_000_000 * i,
+                                    "growth": 0.05 * i,
+                                    "notes": [sentence] * 2,
+                                }
+                                for i in range(6)
+                            },
+                        },
+                    }
+                    for sub_section in range(sub_sections)
+                ],
+            }
+            for section in range(sections)
+        ],
+    }
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Best time of a function in milliseconds.
+
+    Args:
+        function: Function to time
+        repeat: Number of timed runs
+
+    Returns:
+        Fastest run in milliseconds
+    """
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    """Main entry point for the serialization benchmark script."""
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    try:
+        results = build_results(args.sections, args.sub_sections)
+        analysis = Analysis(
+            id=uuid4(),
+            filing_id=uuid4(),
+            analysis_type=AnalysisType.COMPREHENSIVE,
+            created_by="benchmark@example.com",
+            llm_provider="openai",
+            llm_model="gpt-4",
+            confidence_score=0.87,
+            created_at=datetime.now(UTC),
+        )
+        adapter = TypeAdapter(AnalysisResponse)
+        stdlib_stored = json.dumps(results, indent=2, default=str).encode()
+        orjson_stored = serialization.dumps(results, indent=True)
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as file:
+            file.write(orjson_stored)
+        stored_file = Path(file.name)
+
+        def respond(loads: Callable[[bytes], Any], response_class: type) -> bytes:
+            response = AnalysisResponse.from_domain(
+                analysis,
+                include_full_results=True,
+                results=loads(stored_file.read_bytes()),
+            )
+            content = adapter.dump_python(response, mode="json")
+            return bytes(response_class(content).body)
+
+        timings = {
+            "storage write (json)": lambda: json.dumps(results, indent=2, default=str),
+            "storage write (orjson)": lambda: serialization.dumps(results, indent=True),
+            "storage read (json)": lambda: json.loads(stdlib_stored),
+            "storage read (orjson)": lambda: serialization.loads(orjson_stored),
+            "full results response (json)": lambda: respond(json.loads, JSONResponse),
+            "full results response (orjson)": lambda: respond(
+                serialization.loads, ORJSONResponse
+            ),
+            "raw results response": lambda: Response(
+                stored_file.read_bytes(), media_type="application/json"
+            ).body,
+        }
+
+        logger.info(
+            f"Results of {args.sections} sections x {args.sub_sections} "
+            f"sub-sections: {len(stdlib_stored) / 1024:.0f} KiB stored"
+        )
+        try:
+            for name, function in timings.items():
+                logger.info(f"{name:<32} {measure(function, args.repeat):8.2f} ms")
+        finally:
+            stored_file.unlink()
+
+    except KeyboardInterrupt:
+        logger.info("Benchmark cancelled by user")
+        sys.exit(130)
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
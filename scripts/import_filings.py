@@ -349,16 +349,21 @@ class FilingImportManager:
                                     edgar_service._extract_filing_data(filing)
                                 )
 
-                        created_count = 0
                         existing_count = 0
-
-                        for filing_data in filing_data_list:
-                            # Check if filing already exists
-                            existing_filing = await filing_repo.get_by_accession_number(
-                                AccessionNumber(filing_data.accession_number)
+                        new_filings: list[Filing] = []
+
+                        # Check which filings already exist with a single query
+                        existing_accessions = (
+                            await filing_repo.get_existing_accession_numbers(
+                                [
+                                    AccessionNumber(filing_data.accession_number)
+                                    for filing_data in filing_data_list
+                                ]
                             )
+                        )
 
-                            if existing_filing:
+                        for filing_data in filing_data_list:
+                            if filing_data.accession_number in existing_accessions:
                                 existing_count += 1
                                 logger.debug(
                                     f"Filing {filing_data.accession_number} already exists"
@@ -426,12 +431,14 @@ class FilingImportManager:
                                 metadata=metadata,
                             )
 
-                            await filing_repo.create(filing)
-                            created_count += 1
+                            new_filings.append(filing)
                             logger.info(
-                                f"Created filing {filing_data.accession_number} - content stored: {storage_success}"
+                                f"Prepared filing {filing_data.accession_number} - content stored: {storage_success}"
                             )
 
+                        # Insert all new filings with multi-row INSERTs
+                        created_count = await filing_repo.bulk_create(new_filings)
+                        existing_count += len(new_filings) - created_count
                         await filing_repo.commit()
 
                         company_result = {
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Company Statistics Rebuild Command
+
+Recomputes the denormalized ``company_stats`` table from the filings and
+analyses tables. Writes through the repositories keep the table current, so a
+rebuild is only needed after bulk changes made outside of them (manual SQL,
+restored backups, data migrations).
+
+USAGE EXAMPLES:
+    Rebuild every company:
+        python scripts/rebuild_company_stats.py
+
+    Smaller batches for a busy database:
+        python scripts/rebuild_company_stats.py --batch-size 100
+
+EXIT CODES:
+    - 0: Rebuild completed
+    - 1: Rebuild failed
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to Python path for src imports
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.infrastructure.database.base import async_session_maker  # noqa: E402
+from src.infrastructure.repositories.company_stats_repository import (  # noqa: E402
+    CompanyStatsRepository,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser.
+
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Rebuild the company statistics table",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        metavar="N",
+        help="Number of companies refreshed per batch (default: 500)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Enable verbose logging (DEBUG level)",
+    )
+    return parser
+
+
+async def main() -> None:
+    """Main entry point for the company statistics rebuild script."""
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        async with async_session_maker() as session:
+            refreshed = await CompanyStatsRepository(session).rebuild(
+                batch_size=args.batch_size
+            )
+            await session.commit()
+        logger.info(f"Rebuilt statistics of {refreshed} companies")
+    except KeyboardInterrupt:
+        logger.info("Rebuild cancelled by user")
+        sys.exit(130)
+    except Exception as e:
+        logger.error(f"Rebuild failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
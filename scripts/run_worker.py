@@ -27,6 +27,8 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
+from prometheus_client import start_http_server
+
 # Add project root to path for imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
@@ -176,6 +178,16 @@ class WorkerProcess:
                 # For development, start the local worker
                 self.running = True
 
+                # Serve this process's task, LLM and queue metrics
+                if (
+                    self.settings.prometheus_enabled
+                    and self.settings.worker_metrics_port
+                ):
+                    start_http_server(self.settings.worker_metrics_port)
+                    logging.info(
+                        f"Serving worker metrics on port {self.settings.worker_metrics_port}"
+                    )
+
                 # Start worker with specified queues
                 await worker_service.start(
                     queues=self.queues,
@@ -0,0 +1,142 @@
+"""Lazy dependency container for handler construction.
+
+Dependencies are registered as named providers. A request opens a scope on
+the container, and handlers are built with only the dependencies their
+constructors declare, each provided on first use.
+
+Example:
+    container = Container()
+    container.register("edgar_service", lambda scope: EdgarService(), singleton=True)
+    container.register(
+        "filing_repository", lambda scope: FilingRepository(scope.values["session"])
+    )
+
+    scope = container.scope(session=session)
+    dependencies = await scope.resolve(["filing_repository"])
+"""
+
+import asyncio
+import inspect
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+from .exceptions import DependencyError
+
+Provider = Callable[["DependencyScope"], Any | Awaitable[Any]]
+
+
+class Container:
+    """Registry of dependency providers shared by all requests."""
+
+    def __init__(self) -> None:
+        """Initialize a container without providers."""
+        self._providers: dict[str, tuple[Provider, bool]] = {}
+        self._singletons: dict[str, Any] = {}
+        self._singleton_locks: dict[str, asyncio.Lock] = {}
+
+    def register(self, name: str, provider: Provider, singleton: bool = False) -> None:
+        """Register the provider of a dependency.
+
+        Args:
+            name: Name handlers declare the dependency under
+            provider: Callable building the dependency from a scope, sync or
+                async
+            singleton: Whether to build the dependency once and share it
+                across scopes instead of once per scope
+        """
+        self._providers[name] = (provider, singleton)
+        self._singletons.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        """Whether a provider is registered under the name."""
+        return name in self._providers
+
+    def scope(self, **values: Any) -> "DependencyScope":
+        """Open a scope for one request.
+
+        Args:
+            **values: Request values providers build dependencies from, such
+                as the database session
+
+        Returns:
+            Scope resolving dependencies lazily
+        """
+        return DependencyScope(self, values)
+
+    async def _provide(self, name: str, scope: "DependencyScope") -> Any:
+        """Build or reuse the dependency registered under the name."""
+        try:
+            provider, singleton = self._providers[name]
+        except KeyError:
+            raise DependencyError(name, f"No provider registered for {name}") from None
+
+        if not singleton:
+            return await _call(provider, scope)
+
+        if name not in self._singletons:
+            lock = self._singleton_locks.setdefault(name, asyncio.Lock())
+            async with lock:
+                if name not in self._singletons:
+                    self._singletons[name] = await _call(provider, scope)
+        return self._singletons[name]
+
+
+class DependencyScope:
+    """Dependencies of one request, built on first use."""
+
+    def __init__(self, container: Container, values: dict[str, Any]) -> None:
+        """Initialize the scope.
+
+        Args:
+            container: Container holding the providers
+            values: Request values available to providers
+        """
+        self._container = container
+        self._values = values
+        self._resolved: dict[str, Any] = dict(values)
+
+    @property
+    def values(self) -> Mapping[str, Any]:
+        """Request values the scope was opened with."""
+        return MappingProxyType(self._values)
+
+    def __contains__(self, name: object) -> bool:
+        """Whether the dependency can be resolved in this scope."""
+        return name in self._resolved or name in self._container
+
+    async def get(self, name: str) -> Any:
+        """Get a dependency, building it if not yet used in this scope.
+
+        Args:
+            name: Dependency name
+
+        Returns:
+            The dependency
+
+        Raises:
+            DependencyError: If no provider is registered under the name
+        """
+        if name not in self._resolved:
+            self._resolved[name] = await self._container._provide(name, self)
+        return self._resolved[name]
+
+    async def resolve(self, names: Iterable[str]) -> dict[str, Any]:
+        """Get the dependencies available under the names.
+
+        Args:
+            names: Dependency names, such as a handler's constructor
+                parameters
+
+        Returns:
+            Dependencies by name; names without a provider are left out
+        """
+        return {name: await self.get(name) for name in names if name in self}
+
+
+async def _call(provider: Provider, scope: DependencyScope) -> Any:
+    """Call a provider and await its result if it is async."""
+    result = provider(scope)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
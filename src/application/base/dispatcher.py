@@ -1,14 +1,17 @@
 """Command and query dispatcher for CQRS pattern.
 
 The dispatcher routes commands and queries to their appropriate handlers
-with basic logging support.
+with basic logging support, timing and tracing each handler.
 """
 
 import inspect
 import logging
 from typing import Any
 
+from src.shared import telemetry
+
 from .command import BaseCommand
+from .container import DependencyScope
 from .exceptions import HandlerNotFoundError
 from .handlers import CommandHandler, QueryHandler
 from .query import BaseQuery
@@ -40,6 +43,27 @@ class Dispatcher:
         ] = {}
         self._query_handlers: dict[type[BaseQuery], type[QueryHandler[Any, Any]]] = {}
         self._handler_instances: dict[str, Any] = {}
+        # Constructor parameter names of handlers, inspected once per class
+        self._handler_parameters: dict[type, tuple[str, ...]] = {}
+
+    def _parameters(self, handler_class: type) -> tuple[str, ...]:
+        """Get the constructor parameter names of a handler class.
+
+        Args:
+            handler_class: The handler class to instantiate
+
+        Returns:
+            Parameter names excluding 'self'
+        """
+        parameters = self._handler_parameters.get(handler_class)
+        if parameters is None:
+            parameters = tuple(
+                param_name
+                for param_name in inspect.signature(handler_class).parameters
+                if param_name != 'self'
+            )
+            self._handler_parameters[handler_class] = parameters
+        return parameters
 
     def _filter_dependencies(
         self, handler_class: type, dependencies: dict[str, Any]
@@ -54,15 +78,7 @@ class Dispatcher:
             Dictionary containing only the dependencies required by the handler
         """
         try:
-            # Get the constructor signature
-            init_signature = inspect.signature(handler_class)
-
-            # Extract parameter names (excluding 'self')
-            required_params = [
-                param_name
-                for param_name in init_signature.parameters.keys()
-                if param_name != 'self'
-            ]
+            required_params = self._parameters(handler_class)
 
             # Filter dependencies to only include required ones
             filtered_deps = {
@@ -83,6 +99,24 @@ class Dispatcher:
             )
             return dependencies
 
+    async def _resolve_dependencies(
+        self, handler_class: type, dependencies: dict[str, Any] | DependencyScope
+    ) -> dict[str, Any]:
+        """Get the dependencies to construct a handler with.
+
+        A dependency scope only builds the dependencies the handler declares.
+
+        Args:
+            handler_class: The handler class to instantiate
+            dependencies: Available dependencies, or a scope providing them
+
+        Returns:
+            Dictionary containing only the dependencies required by the handler
+        """
+        if isinstance(dependencies, DependencyScope):
+            return await dependencies.resolve(self._parameters(handler_class))
+        return self._filter_dependencies(handler_class, dependencies)
+
     def register_command_handler(
         self, handler_class: type[CommandHandler[Any, Any]]
     ) -> None:
@@ -93,6 +127,7 @@ class Dispatcher:
         """
         command_type: type[BaseCommand] = handler_class.command_type()
         self._command_handlers[command_type] = handler_class
+        self._parameters(handler_class)
         logger.debug(
             f"Registered command handler: {handler_class.__name__} for {command_type.__name__}"
         )
@@ -107,18 +142,20 @@ class Dispatcher:
         """
         query_type: type[BaseQuery] = handler_class.query_type()
         self._query_handlers[query_type] = handler_class
+        self._parameters(handler_class)
         logger.debug(
             f"Registered query handler: {handler_class.__name__} for {query_type.__name__}"
         )
 
     async def dispatch_command(
-        self, command: BaseCommand, dependencies: dict[str, Any]
+        self, command: BaseCommand, dependencies: dict[str, Any] | DependencyScope
     ) -> Any:
         """Dispatch a command to its handler.
 
         Args:
             command: The command to dispatch
-            dependencies: Dictionary of dependencies available for injection
+            dependencies: Dependencies available for injection, or a scope
+                providing them
 
         Returns:
             The result of command processing
@@ -130,7 +167,7 @@ class Dispatcher:
         if not handler_class:
             raise HandlerNotFoundError(type(command).__name__)
 
-        filtered_deps = self._filter_dependencies(handler_class, dependencies)
+        filtered_deps = await self._resolve_dependencies(handler_class, dependencies)
         handler = handler_class(**filtered_deps)
 
         logger.info(
@@ -142,7 +179,19 @@ class Dispatcher:
         )
 
         try:
-            result: Any = await handler.handle(command)
+            with (
+                telemetry.span(
+                    f"command {type(command).__name__}",
+                    handler=handler_class.__name__,
+                ),
+                telemetry.timed(
+                    telemetry.HANDLER_DURATION,
+                    track_outcome=True,
+                    kind="command",
+                    handler=handler_class.__name__,
+                ),
+            ):
+                result: Any = await handler.handle(command)
             logger.info(f"Command processed successfully: {type(command).__name__}")
             return result
         except Exception as e:
@@ -154,13 +203,14 @@ class Dispatcher:
             raise
 
     async def dispatch_query(
-        self, query: BaseQuery, dependencies: dict[str, Any]
+        self, query: BaseQuery, dependencies: dict[str, Any] | DependencyScope
     ) -> Any:
         """Dispatch a query to its handler.
 
         Args:
             query: The query to dispatch
-            dependencies: Dictionary of dependencies available for injection
+            dependencies: Dependencies available for injection, or a scope
+                providing them
 
         Returns:
             The result of query processing
@@ -172,7 +222,7 @@ class Dispatcher:
         if not handler_class:
             raise HandlerNotFoundError(type(query).__name__)
 
-        filtered_deps = self._filter_dependencies(handler_class, dependencies)
+        filtered_deps = await self._resolve_dependencies(handler_class, dependencies)
         handler = handler_class(**filtered_deps)
 
         logger.debug(
@@ -186,7 +236,18 @@ class Dispatcher:
         )
 
         try:
-            result: Any = await handler.handle(query)
+            with (
+                telemetry.span(
+                    f"query {type(query).__name__}", handler=handler_class.__name__
+                ),
+                telemetry.timed(
+                    telemetry.HANDLER_DURATION,
+                    track_outcome=True,
+                    kind="query",
+                    handler=handler_class.__name__,
+                ),
+            ):
+                result: Any = await handler.handle(query)
             logger.debug(f"Query processed successfully: {type(query).__name__}")
             return result
         except Exception as e:
@@ -115,7 +115,7 @@ class ImportFilingsCommandHandler(CommandHandler[ImportFilingsCommand, TaskRespo
                 resolved_companies.append(CIK(company_identifier))
             elif command.is_ticker(company_identifier):
                 try:
-                    company_data = self.edgar_service.get_company_by_ticker(
+                    company_data = await self.edgar_service.get_company_by_ticker_async(
                         Ticker(company_identifier)
                     )
                     resolved_companies.append(CIK(company_data.cik))
@@ -5,11 +5,12 @@ different messaging implementations based on environment (mock, RabbitMQ, AWS SQ
 """
 
 import logging
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.application_service import ApplicationService
+from src.application.base.container import Container, DependencyScope
 from src.application.base.dispatcher import Dispatcher
 from src.application.handlers_registry import register_handlers
 from src.application.services.analysis_orchestrator import AnalysisOrchestrator
@@ -22,6 +23,9 @@ from src.infrastructure.edgar.service import EdgarService
 from src.infrastructure.messaging import cleanup_services, initialize_services
 from src.infrastructure.repositories.analysis_repository import AnalysisRepository
 from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
 from src.infrastructure.repositories.filing_repository import FilingRepository
 from src.shared.config.settings import Settings
 
@@ -46,6 +50,7 @@ class ServiceFactory:
         self._repositories: dict[str, Any] = {}
         self._services: dict[str, Any] = {}
         self._messaging_initialized = False
+        self._container: Container | None = None
 
     @property
     def use_background_tasks(self) -> bool:
@@ -143,6 +148,20 @@ class ServiceFactory:
         logger.debug("Creating CompanyRepository with database session")
         return CompanyRepository(session)
 
+    def create_company_stats_repository(
+        self, session: AsyncSession
+    ) -> CompanyStatsRepository:
+        """Create company statistics repository with provided database session.
+
+        Args:
+            session: Async database session for repository operations
+
+        Returns:
+            CompanyStatsRepository instance with database session
+        """
+        logger.debug("Creating CompanyStatsRepository with database session")
+        return CompanyStatsRepository(session)
+
     def create_edgar_service(self) -> EdgarService:
         """Create EdgarService for SEC EDGAR data access.
 
@@ -289,29 +308,89 @@ class ServiceFactory:
             background_task_coordinator=background_task_coordinator,
         )
 
-    async def get_handler_dependencies(self, session: AsyncSession) -> dict[str, Any]:
+    @property
+    def container(self) -> Container:
+        """Dependency container handlers are constructed from.
+
+        Repositories, the analysis orchestrator and the background task
+        coordinator are built per request scope from its database session;
+        services without session state are shared singletons.
+        """
+        if self._container is None:
+            container = Container()
+
+            def session(scope: DependencyScope) -> AsyncSession:
+                return cast(AsyncSession, scope.values["session"])
+
+            container.register(
+                "analysis_repository",
+                lambda scope: self.create_analysis_repository(session(scope)),
+            )
+            container.register(
+                "filing_repository",
+                lambda scope: self.create_filing_repository(session(scope)),
+            )
+            container.register(
+                "company_repository",
+                lambda scope: self.create_company_repository(session(scope)),
+            )
+            container.register(
+                "company_stats_repository",
+                lambda scope: self.create_company_stats_repository(session(scope)),
+            )
+            container.register(
+                "edgar_service", lambda scope: self.create_edgar_service(), True
+            )
+            container.register(
+                "template_service",
+                lambda scope: self.create_analysis_template_service(),
+                True,
+            )
+            container.register("analysis_orchestrator", self._provide_orchestrator)
+            container.register(
+                "background_task_coordinator", self._provide_task_coordinator
+            )
+            self._container = container
+
+        return self._container
+
+    async def _provide_orchestrator(
+        self, scope: DependencyScope
+    ) -> AnalysisOrchestrator:
+        """Build the analysis orchestrator of a request scope."""
+        return AnalysisOrchestrator(
+            analysis_repository=await scope.get("analysis_repository"),
+            filing_repository=await scope.get("filing_repository"),
+            edgar_service=await scope.get("edgar_service"),
+            llm_provider=self._create_llm_provider(),
+            template_service=await scope.get("template_service"),
+        )
+
+    async def _provide_task_coordinator(
+        self, scope: DependencyScope
+    ) -> BackgroundTaskCoordinator:
+        """Build the background task coordinator of a request scope."""
+        await self.ensure_messaging_initialized()
+        return BackgroundTaskCoordinator(
+            analysis_orchestrator=await scope.get("analysis_orchestrator"),
+            task_service=self.create_task_service(),
+            use_background=self.use_background_tasks,
+        )
+
+    async def get_handler_dependencies(self, session: AsyncSession) -> DependencyScope:
         """Get dependencies for handler instantiation with database session.
 
-        This method provides the correct dependencies for CQRS handlers,
-        including session-dependent repositories and singleton services.
+        Dependencies are not built here: the returned scope builds the ones
+        a dispatched handler declares on first use, and reuses them for
+        further handlers dispatched with it.
 
         Args:
             session: Database session for repository operations
 
         Returns:
-            Dictionary of dependencies for handler constructor injection
+            Dependency scope for handler constructor injection
         """
-        return {
-            "analysis_repository": self.create_analysis_repository(session),
-            "filing_repository": self.create_filing_repository(session),
-            "company_repository": self.create_company_repository(session),
-            "edgar_service": self.create_edgar_service(),
-            "analysis_orchestrator": self.create_analysis_orchestrator(session),
-            "background_task_coordinator": await self.create_background_task_coordinator(
-                session
-            ),
-            "template_service": self.create_analysis_template_service(),
-        }
+        return self.container.scope(session=session)
 
     async def ensure_messaging_initialized(self) -> None:
         """Ensure messaging services are initialized."""
@@ -9,6 +9,12 @@ from src.application.commands.handlers.analyze_filing_handler import (
 from src.application.commands.handlers.import_filings_handler import (
     ImportFilingsCommandHandler,
 )
+from src.application.queries.handlers.batch_get_analyses_handler import (
+    BatchGetAnalysesQueryHandler,
+)
+from src.application.queries.handlers.batch_get_filings_handler import (
+    BatchGetFilingsQueryHandler,
+)
 from src.application.queries.handlers.get_analysis_by_accession_handler import (
     GetAnalysisByAccessionQueryHandler,
 )
@@ -52,6 +58,8 @@ def register_handlers(dispatcher: Dispatcher) -> None:
 
     # Register query handlers
     logger.info("Registering query handlers")
+    dispatcher.register_query_handler(BatchGetAnalysesQueryHandler)
+    dispatcher.register_query_handler(BatchGetFilingsQueryHandler)
     dispatcher.register_query_handler(GetAnalysisByAccessionQueryHandler)
     dispatcher.register_query_handler(GetAnalysisQueryHandler)
     dispatcher.register_query_handler(GetCompanyQueryHandler)
@@ -0,0 +1,171 @@
+"""Handler for BatchGetAnalysesQuery - retrieves many analyses at once."""
+
+import asyncio
+import logging
+from typing import Any
+from uuid import UUID
+
+from src.application.base.handlers import QueryHandler
+from src.application.schemas.queries.batch_get_analyses import BatchGetAnalysesQuery
+from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.application.schemas.responses.batch_response import (
+    BatchItemError,
+    BatchResponse,
+)
+from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BatchGetAnalysesQueryHandler(
+    QueryHandler[BatchGetAnalysesQuery, BatchResponse[AnalysisResponse]]
+):
+    """Handler for retrieving many analyses by ID.
+
+    This handler processes BatchGetAnalysesQuery by:
+    - Loading all analyses with a single repository query
+    - Reading the results needed from storage concurrently, with a bound
+    - Reporting analyses that are missing or failed to load per item
+
+    Like GetAnalysisQueryHandler, summaries are served from the summary
+    recorded on the analysis without reading storage when possible.
+    """
+
+    def __init__(self, analysis_repository: AnalysisRepository) -> None:
+        """Initialize the handler with required dependencies.
+
+        Args:
+            analysis_repository: Repository for analysis data access
+        """
+        self.analysis_repository = analysis_repository
+
+    async def handle(
+        self, query: BatchGetAnalysesQuery
+    ) -> BatchResponse[AnalysisResponse]:
+        """Process the batch get analyses query.
+
+        Args:
+            query: The query containing the analysis IDs to retrieve
+
+        Returns:
+            BatchResponse with the analyses found and per-item errors
+        """
+        analysis_ids = list(dict.fromkeys(query.analysis_ids))
+        logger.info(
+            f"Processing batch get of {len(analysis_ids)} analyses",
+            extra={
+                "analysis_count": len(analysis_ids),
+                "include_full_results": query.include_full_results,
+                "user_id": query.user_id,
+            },
+        )
+
+        analyses = {
+            analysis.id: analysis
+            for analysis in await self.analysis_repository.get_by_ids(analysis_ids)
+        }
+
+        # Results are read from storage only when the summary isn't enough
+        needs_results = [
+            analysis_id
+            for analysis_id in analysis_ids
+            if analysis_id in analyses
+            and (query.include_full_results or analyses[analysis_id].summary is None)
+        ]
+        results = await self._read_results(needs_results, query.max_concurrency)
+
+        items: list[AnalysisResponse] = []
+        errors: list[BatchItemError] = []
+        for analysis_id in analysis_ids:
+            analysis = analyses.get(analysis_id)
+            if analysis is None:
+                errors.append(
+                    BatchItemError(
+                        str(analysis_id), 404, f"Analysis {analysis_id} not found"
+                    )
+                )
+                continue
+
+            if analysis_id not in results:
+                items.append(AnalysisResponse.from_domain(analysis))
+                continue
+
+            result = results[analysis_id]
+            if isinstance(result, BaseException):
+                errors.append(
+                    BatchItemError(
+                        str(analysis_id),
+                        500,
+                        f"Failed to read results of analysis {analysis_id}",
+                    )
+                )
+            elif not result:
+                errors.append(
+                    BatchItemError(
+                        str(analysis_id),
+                        404,
+                        f"Results of analysis {analysis_id} not found",
+                    )
+                )
+            else:
+                items.append(
+                    AnalysisResponse.from_domain(
+                        analysis,
+                        include_full_results=query.include_full_results,
+                        results=result,
+                        section_name=query.section_name,
+                    )
+                )
+
+        logger.info(
+            f"Batch get returned {len(items)} of {len(analysis_ids)} analyses",
+            extra={"found": len(items), "errors": len(errors)},
+        )
+
+        return BatchResponse(items=items, errors=errors)
+
+    async def _read_results(
+        self, analysis_ids: list[UUID], max_concurrency: int
+    ) -> dict[UUID, dict[str, Any] | BaseException | None]:
+        """Read the stored results of analyses concurrently.
+
+        Args:
+            analysis_ids: IDs of the analyses whose results to read
+            max_concurrency: Maximum storage reads run at once
+
+        Returns:
+            Results, None if missing from storage or the exception raised
+            reading them, by analysis ID
+        """
+        if not analysis_ids:
+            return {}
+
+        locations = await self.analysis_repository.get_storage_locations(analysis_ids)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read(analysis_id: UUID) -> dict[str, Any] | None:
+            location = locations.get(analysis_id)
+            if location is None:
+                return None
+            async with semaphore:
+                return await self.analysis_repository.get_analysis_results_from_storage(
+                    analysis_id, *location
+                )
+
+        results = await asyncio.gather(
+            *(read(analysis_id) for analysis_id in analysis_ids),
+            return_exceptions=True,
+        )
+        for analysis_id, result in zip(analysis_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Failed to read results of analysis {analysis_id}",
+                    extra={"analysis_id": str(analysis_id)},
+                    exc_info=result,
+                )
+        return dict(zip(analysis_ids, results, strict=True))
+
+    @classmethod
+    def query_type(cls) -> type[BatchGetAnalysesQuery]:
+        """Return the query type this handler processes."""
+        return BatchGetAnalysesQuery
@@ -0,0 +1,104 @@
+"""Handler for BatchGetFilingsQuery - retrieves many filings at once."""
+
+import logging
+
+from src.application.base.handlers import QueryHandler
+from src.application.schemas.queries.batch_get_filings import BatchGetFilingsQuery
+from src.application.schemas.responses.batch_response import (
+    BatchItemError,
+    BatchResponse,
+)
+from src.application.schemas.responses.filing_response import FilingResponse
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.infrastructure.repositories.filing_repository import FilingRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BatchGetFilingsQueryHandler(
+    QueryHandler[BatchGetFilingsQuery, BatchResponse[FilingResponse]]
+):
+    """Handler for retrieving many filings by accession number.
+
+    This handler processes BatchGetFilingsQuery by:
+    - Validating each accession number, reporting invalid ones per item
+    - Loading the filings and their analysis counts with a single query
+    - Reporting filings that are not found per item
+    """
+
+    def __init__(self, filing_repository: FilingRepository) -> None:
+        """Initialize the handler with required dependencies.
+
+        Args:
+            filing_repository: Repository for filing data access
+        """
+        self.filing_repository = filing_repository
+
+    async def handle(
+        self, query: BatchGetFilingsQuery
+    ) -> BatchResponse[FilingResponse]:
+        """Process the batch get filings query.
+
+        Args:
+            query: The query containing the accession numbers to retrieve
+
+        Returns:
+            BatchResponse with the filings found and per-item errors
+        """
+        requested = list(dict.fromkeys(query.accession_numbers))
+        logger.info(
+            f"Processing batch get of {len(requested)} filings",
+            extra={"filing_count": len(requested), "user_id": query.user_id},
+        )
+
+        errors: dict[str, BatchItemError] = {}
+        accession_numbers: dict[str, AccessionNumber] = {}
+        for value in requested:
+            try:
+                accession_numbers[value] = AccessionNumber(value)
+            except ValueError as e:
+                errors[value] = BatchItemError(
+                    value, 422, f"Invalid accession number format: {e}"
+                )
+
+        found = {
+            str(filing.accession_number): FilingResponse.from_domain(
+                filing,
+                analyses_count=analyses_count,
+                latest_analysis_date=(
+                    latest_analysis_at.date() if latest_analysis_at else None
+                ),
+            )
+            for filing, analyses_count, latest_analysis_at in (
+                await self.filing_repository.get_many_by_accession_numbers(
+                    list(accession_numbers.values())
+                )
+            )
+        }
+
+        items: list[FilingResponse] = []
+        for value in requested:
+            if value in errors:
+                continue
+            response = found.get(str(accession_numbers[value]))
+            if response is None:
+                errors[value] = BatchItemError(
+                    value, 404, f"Filing with accession number {value} not found"
+                )
+            else:
+                items.append(response)
+
+        logger.info(
+            f"Batch get returned {len(items)} of {len(requested)} filings",
+            extra={"found": len(items), "errors": len(errors)},
+        )
+
+        return BatchResponse(
+            items=items,
+            errors=[errors[value] for value in requested if value in errors],
+        )
+
+    @classmethod
+    def query_type(cls) -> type[BatchGetFilingsQuery]:
+        """Return the query type this handler processes."""
+        return BatchGetFilingsQuery
@@ -1,6 +1,7 @@
 """Handler for GetAnalysisQuery - retrieves specific analysis details."""
 
 import logging
+from uuid import UUID
 
 from src.application.base.exceptions import ResourceNotFoundError
 from src.application.base.handlers import QueryHandler
@@ -58,44 +59,18 @@ class GetAnalysisQueryHandler(QueryHandler[GetAnalysisQuery, AnalysisResponse]):
             if query.analysis_id is None:
                 raise ValueError("Analysis ID is required")
 
-            # Retrieve analysis entity and results from repository with storage
-            analysis, results = await self.analysis_repository.get_by_id_with_results(
-                query.analysis_id
-            )
+            # Summaries are answered from the summary recorded on the analysis,
+            # without reading the full results from storage
+            response = None
+            if not query.include_full_results:
+                analysis = await self.analysis_repository.get_by_id(query.analysis_id)
+                if not analysis:
+                    raise ResourceNotFoundError("Analysis", str(query.analysis_id))
+                if analysis.summary is not None:
+                    response = AnalysisResponse.from_domain(analysis)
 
-            if not analysis:
-                raise ResourceNotFoundError("Analysis", str(query.analysis_id))
-
-            # With transactional consistency, this should rarely happen
-            # If no results found in storage but metadata exists, it indicates:
-            # 1. Storage was deleted/corrupted after successful analysis
-            # 2. Manual database manipulation
-            # Log this as a critical error for investigation
-            if not results:
-                logger.critical(
-                    f"Data inconsistency detected: Analysis {query.analysis_id} exists in database "
-                    f"but results missing from storage. This should not happen with transactional consistency.",
-                    extra={
-                        "analysis_id": str(query.analysis_id),
-                        "filing_id": str(analysis.filing_id),
-                        "created_at": analysis.created_at.isoformat(),
-                    },
-                )
-                # Return a more informative error
-                raise ResourceNotFoundError(
-                    "Analysis results",
-                    f"{query.analysis_id} (metadata exists but results missing - please contact support)",
-                )
-
-            # Convert to response DTO based on requested detail level
-            if query.include_full_results:
-                response = AnalysisResponse.from_domain(
-                    analysis, include_full_results=True, results=results
-                )
-            else:
-                response = AnalysisResponse.from_domain(
-                    analysis, include_full_results=False, results=results
-                )
+            if response is None:
+                response = await self._from_storage(query.analysis_id, query)
 
             logger.info(
                 f"Successfully retrieved analysis {query.analysis_id}",
@@ -120,6 +95,58 @@ class GetAnalysisQueryHandler(QueryHandler[GetAnalysisQuery, AnalysisResponse]):
             )
             raise
 
+    async def _from_storage(
+        self, analysis_id: UUID, query: GetAnalysisQuery
+    ) -> AnalysisResponse:
+        """Build the response from the analysis results in storage.
+
+        Args:
+            analysis_id: ID of the analysis, validated by the caller
+            query: The query containing analysis retrieval parameters
+
+        Returns:
+            AnalysisResponse: Detailed analysis information
+
+        Raises:
+            ResourceNotFoundError: If the analysis or its results are not found
+        """
+        # Retrieve analysis entity and results from repository with storage
+        analysis, results = await self.analysis_repository.get_by_id_with_results(
+            analysis_id
+        )
+
+        if not analysis:
+            raise ResourceNotFoundError("Analysis", str(analysis_id))
+
+        # With transactional consistency, this should rarely happen
+        # If no results found in storage but metadata exists, it indicates:
+        # 1. Storage was deleted/corrupted after successful analysis
+        # 2. Manual database manipulation
+        # Log this as a critical error for investigation
+        if not results:
+            logger.critical(
+                f"Data inconsistency detected: Analysis {analysis_id} exists in database "
+                f"but results missing from storage. This should not happen with transactional consistency.",
+                extra={
+                    "analysis_id": str(analysis_id),
+                    "filing_id": str(analysis.filing_id),
+                    "created_at": analysis.created_at.isoformat(),
+                },
+            )
+            # Return a more informative error
+            raise ResourceNotFoundError(
+                "Analysis results",
+                f"{analysis_id} (metadata exists but results missing - please contact support)",
+            )
+
+        # Convert to response DTO based on requested detail level
+        return AnalysisResponse.from_domain(
+            analysis,
+            include_full_results=query.include_full_results,
+            results=results,
+            section_name=query.section_name,
+        )
+
     @classmethod
     def query_type(cls) -> type[GetAnalysisQuery]:
         """Return the query type this handler processes."""
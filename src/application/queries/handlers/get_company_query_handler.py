@@ -12,6 +12,9 @@ from src.domain.value_objects.ticker import Ticker
 from src.infrastructure.edgar.service import EdgarService
 from src.infrastructure.repositories.analysis_repository import AnalysisRepository
 from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,7 @@ class GetCompanyQueryHandler(QueryHandler[GetCompanyQuery, CompanyResponse]):
         company_repository: CompanyRepository,
         edgar_service: EdgarService,
         analysis_repository: AnalysisRepository,
+        company_stats_repository: CompanyStatsRepository | None = None,
     ) -> None:
         """Initialize GetCompanyQueryHandler.
 
@@ -31,10 +35,13 @@ class GetCompanyQueryHandler(QueryHandler[GetCompanyQuery, CompanyResponse]):
             company_repository: Repository for company database operations
             edgar_service: Service for accessing SEC EDGAR data
             analysis_repository: Repository for analysis data (for recent analyses)
+            company_stats_repository: Optional repository of precomputed
+                company statistics
         """
         self.company_repository = company_repository
         self.edgar_service = edgar_service
         self.analysis_repository = analysis_repository
+        self.company_stats_repository = company_stats_repository
 
     async def handle(self, query: GetCompanyQuery) -> CompanyResponse:
         """Handle GetCompanyQuery by retrieving company information.
@@ -79,11 +86,11 @@ class GetCompanyQueryHandler(QueryHandler[GetCompanyQuery, CompanyResponse]):
             # Step 2: Get enriched data from EdgarService
             try:
                 if lookup_type == "cik":
-                    edgar_data = self.edgar_service.get_company_by_cik(
+                    edgar_data = await self.edgar_service.get_company_by_cik_async(
                         CIK(lookup_value)
                     )
                 elif lookup_type == "ticker":
-                    edgar_data = self.edgar_service.get_company_by_ticker(
+                    edgar_data = await self.edgar_service.get_company_by_ticker_async(
                         Ticker(lookup_value)
                     )
                 else:
@@ -163,6 +170,17 @@ class GetCompanyQueryHandler(QueryHandler[GetCompanyQuery, CompanyResponse]):
                 logger.warning(f"Failed to get recent analyses: {str(e)}")
                 enrichments["recent_analyses"] = []
 
+        # Statistics are a single precomputed row, so they are always included
+        if self.company_stats_repository and company_entity:
+            try:
+                statistics = await self.company_stats_repository.get_by_company_id(
+                    company_entity.id
+                )
+                if statistics:
+                    enrichments["statistics"] = statistics.to_dict()
+            except Exception as e:
+                logger.warning(f"Failed to get company statistics: {str(e)}")
+
         return enrichments
 
     async def _get_recent_analyses(self, cik: CIK) -> list[dict[str, Any]]:
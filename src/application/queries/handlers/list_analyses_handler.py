@@ -1,13 +1,17 @@
 """Handler for ListAnalysesQuery - retrieves analyses with filtering and pagination."""
 
 import logging
+from typing import Any
 from uuid import uuid4
 
 from src.application.base.handlers import QueryHandler
 from src.application.schemas.queries.list_analyses import ListAnalysesQuery
 from src.application.schemas.responses.analysis_response import AnalysisResponse
 from src.application.schemas.responses.paginated_response import PaginatedResponse
-from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.repositories.analysis_repository import (
+    AnalysisRepository,
+    analysis_cursor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +23,8 @@ class ListAnalysesQueryHandler(
 
     This handler processes ListAnalysesQuery by:
     - Applying filters for company, date range, and analysis types
-    - Implementing pagination with sorting
-    - Converting results to response DTOs
+    - Implementing offset or cursor (keyset) pagination with sorting
+    - Loading column-projected summaries and converting them to response DTOs
     - Providing filter summary for client consumption
 
     The handler focuses on data retrieval and pagination without presentation concerns.
@@ -72,6 +76,7 @@ class ListAnalysesQueryHandler(
                 "sort_direction": query.sort_direction.value,
                 "page": query.page,
                 "page_size": query.page_size,
+                "cursor": query.cursor,
             },
         )
 
@@ -118,42 +123,64 @@ class ListAnalysesQueryHandler(
 
             filters_applied = ", ".join(filter_parts) if filter_parts else "none"
 
+            filter_kwargs: dict[str, Any] = {
+                "company_cik": query.company_cik,
+                "analysis_types": filter_analysis_types,
+                "created_from": query.created_from,
+                "created_to": query.created_to,
+                "min_confidence_score": query.min_confidence_score,
+            }
+
             # Get total count for pagination using determined analysis types
-            total_count = await self.analysis_repository.count_with_filters(
-                company_cik=query.company_cik,
-                analysis_types=filter_analysis_types,
-                created_from=query.created_from,
-                created_to=query.created_to,
-                min_confidence_score=query.min_confidence_score,
-            )
+            total_count = None
+            if query.include_total:
+                total_count = await self.analysis_repository.count_with_filters(
+                    **filter_kwargs
+                )
 
-            # If no results, return empty response
-            if total_count == 0:
-                return PaginatedResponse.empty(
+                # If no results, return empty response
+                if total_count == 0:
+                    return PaginatedResponse.empty(
+                        page=query.page,
+                        page_size=query.page_size,
+                        query_id=uuid4(),
+                        filters_applied=filters_applied,
+                    )
+
+            # Get paginated results using determined analysis types, continuing
+            # after the cursor position when one is given
+            if query.cursor:
+                analyses = await self.analysis_repository.find_summaries_with_filters(
+                    **filter_kwargs,
+                    sort_by=query.sort_by,
+                    sort_direction=query.sort_direction,
+                    page_size=query.page_size,
+                    cursor=query.cursor,
+                )
+            else:
+                analyses = await self.analysis_repository.find_summaries_with_filters(
+                    **filter_kwargs,
+                    sort_by=query.sort_by,
+                    sort_direction=query.sort_direction,
                     page=query.page,
                     page_size=query.page_size,
-                    query_id=uuid4(),
-                    filters_applied=filters_applied,
                 )
 
-            # Get paginated results using determined analysis types
-            analyses = await self.analysis_repository.find_with_filters(
-                company_cik=query.company_cik,
-                analysis_types=filter_analysis_types,
-                created_from=query.created_from,
-                created_to=query.created_to,
-                min_confidence_score=query.min_confidence_score,
-                sort_by=query.sort_by,
-                sort_direction=query.sort_direction,
-                page=query.page,
-                page_size=query.page_size,
-            )
-
-            # Convert to response DTOs (summary version for list view)
+            # Map the projected summary rows to response DTOs
             analysis_responses = [
-                AnalysisResponse.summary_from_domain(analysis) for analysis in analyses
+                AnalysisResponse.from_summary(analysis) for analysis in analyses
             ]
 
+            # Without a page position or a total, a full page may have a successor
+            has_next = None
+            if query.cursor or total_count is None:
+                has_next = len(analyses) == query.page_size
+            next_cursor = (
+                analysis_cursor(analyses[-1], query.sort_by, query.sort_direction)
+                if analyses
+                else None
+            )
+
             # Create paginated response
             response = PaginatedResponse.create(
                 items=analysis_responses,
@@ -162,6 +189,8 @@ class ListAnalysesQueryHandler(
                 total_items=total_count,
                 query_id=uuid4(),
                 filters_applied=filters_applied,
+                next_cursor=next_cursor,
+                has_next=has_next,
             )
 
             logger.info(
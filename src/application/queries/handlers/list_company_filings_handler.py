@@ -7,6 +7,9 @@ from src.application.base.handlers import QueryHandler
 from src.application.schemas.queries.list_company_filings import ListCompanyFilingsQuery
 from src.application.schemas.responses.filing_response import FilingResponse
 from src.application.schemas.responses.paginated_response import PaginatedResponse
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
 from src.infrastructure.repositories.filing_repository import FilingRepository
 
 logger = logging.getLogger(__name__)
@@ -26,13 +29,20 @@ class ListCompanyFilingsQueryHandler(
     The handler focuses on data retrieval and pagination without presentation concerns.
     """
 
-    def __init__(self, filing_repository: FilingRepository) -> None:
+    def __init__(
+        self,
+        filing_repository: FilingRepository,
+        company_stats_repository: CompanyStatsRepository | None = None,
+    ) -> None:
         """Initialize the handler with required dependencies.
 
         Args:
             filing_repository: Repository for filing data access
+            company_stats_repository: Optional repository of precomputed
+                company statistics, used for unfiltered counts
         """
         self.filing_repository = filing_repository
+        self.company_stats_repository = company_stats_repository
 
     async def handle(
         self, query: ListCompanyFilingsQuery
@@ -85,12 +95,7 @@ class ListCompanyFilingsQueryHandler(
             filters_applied = ", ".join(filter_parts)
 
             # Get total count for pagination
-            total_count = await self.filing_repository.count_by_ticker_with_filters(
-                ticker=query.ticker_value_object,
-                filing_type=query.filing_type,
-                start_date=query.start_date,
-                end_date=query.end_date,
-            )
+            total_count = await self._count_filings(query)
 
             # If no results, return empty response
             if total_count == 0:
@@ -156,6 +161,36 @@ class ListCompanyFilingsQueryHandler(
             )
             raise
 
+    async def _count_filings(self, query: ListCompanyFilingsQuery) -> int:
+        """Count the filings matching the query.
+
+        Counts without a date range are read from the company statistics when
+        available instead of aggregating the filings.
+
+        Args:
+            query: The query containing the filters
+
+        Returns:
+            Total number of matching filings
+        """
+        if self.company_stats_repository and not query.has_date_range_filter:
+            statistics = await self.company_stats_repository.get_by_ticker(
+                query.ticker_value_object
+            )
+            if statistics:
+                if query.filing_type:
+                    return statistics.filing_counts_by_type.get(
+                        query.filing_type.value, 0
+                    )
+                return statistics.filing_count
+
+        return await self.filing_repository.count_by_ticker_with_filters(
+            ticker=query.ticker_value_object,
+            filing_type=query.filing_type,
+            start_date=query.start_date,
+            end_date=query.end_date,
+        )
+
     @classmethod
     def query_type(cls) -> type[ListCompanyFilingsQuery]:
         """Return the query type this handler processes."""
@@ -10,7 +10,10 @@ from src.application.schemas.responses.filing_search_response import FilingSearc
 from src.application.schemas.responses.paginated_response import PaginatedResponse
 from src.domain.entities.filing import Filing
 from src.domain.value_objects.ticker import Ticker
-from src.infrastructure.repositories.filing_repository import FilingRepository
+from src.infrastructure.repositories.filing_repository import (
+    FilingRepository,
+    filing_cursor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +27,7 @@ class SearchFilingsHandler(
     - Querying filings from the database repository
     - Applying date and form type filters
     - Converting database results to search result DTOs
-    - Implementing pagination and sorting
+    - Implementing offset or cursor (keyset) pagination and sorting
     - Providing search summary for client consumption
 
     The handler queries locally stored filings for improved performance
@@ -66,6 +69,7 @@ class SearchFilingsHandler(
                 "page": query.page,
                 "page_size": query.page_size,
                 "limit": query.limit,
+                "cursor": query.cursor,
             },
         )
 
@@ -76,30 +80,55 @@ class SearchFilingsHandler(
             ticker_vo = Ticker(query.ticker)
 
             # Get total count for pagination
-            total_count = await self.filing_repository.count_by_ticker_with_filters(
-                ticker=ticker_vo,
-                filing_type=query.form_type,
-                start_date=query.date_from,
-                end_date=query.date_to,
-            )
-
-            # Get filings from database with pagination and company info
-            filings_with_company = (
-                await self.filing_repository.get_by_ticker_with_filters_and_company(
+            total_count = None
+            if query.include_total:
+                total_count = await self.filing_repository.count_by_ticker_with_filters(
                     ticker=ticker_vo,
                     filing_type=query.form_type,
                     start_date=query.date_from,
                     end_date=query.date_to,
-                    sort_field=query.sort_by.value,
-                    sort_direction=query.sort_direction.value,
-                    page=query.page,
-                    page_size=query.page_size,
                 )
-            )
+
+            # Get filings from database with pagination and company info,
+            # continuing after the cursor position when one is given
+            filter_kwargs: dict[str, Any] = {
+                "ticker": ticker_vo,
+                "filing_type": query.form_type,
+                "start_date": query.date_from,
+                "end_date": query.date_to,
+                "sort_field": query.sort_by.value,
+                "sort_direction": query.sort_direction.value,
+            }
+            if query.cursor:
+                filings_with_company = (
+                    await self.filing_repository.get_by_ticker_with_filters_and_company(
+                        **filter_kwargs, page_size=query.page_size, cursor=query.cursor
+                    )
+                )
+            else:
+                filings_with_company = (
+                    await self.filing_repository.get_by_ticker_with_filters_and_company(
+                        **filter_kwargs, page=query.page, page_size=query.page_size
+                    )
+                )
 
             # Convert to search results
             search_results = self._convert_to_search_results(filings_with_company)
 
+            # Without a page position or a total, a full page may have a successor
+            has_next = None
+            if query.cursor or total_count is None:
+                has_next = len(filings_with_company) == query.page_size
+            next_cursor = (
+                filing_cursor(
+                    filings_with_company[-1][0],
+                    query.sort_by.value,
+                    query.sort_direction.value,
+                )
+                if filings_with_company
+                else None
+            )
+
             # Create paginated response
             response = PaginatedResponse.create(
                 items=search_results,
@@ -108,6 +137,8 @@ class SearchFilingsHandler(
                 total_items=total_count,
                 query_id=uuid4(),
                 filters_applied=query.search_summary,
+                next_cursor=next_cursor,
+                has_next=has_next,
             )
 
             logger.info(
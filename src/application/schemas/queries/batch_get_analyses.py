@@ -0,0 +1,38 @@
+"""Batch Get Analyses Query for retrieving many analyses in one request."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.base.query import BaseQuery
+
+
+@dataclass(frozen=True)
+class BatchGetAnalysesQuery(BaseQuery):
+    """Query to retrieve many analyses by ID at once.
+
+    Analyses are loaded with a single database query, and results needed
+    from storage are read concurrently. Analyses that cannot be returned
+    are reported individually instead of failing the whole query.
+
+    Attributes:
+        analysis_ids: UUIDs of the analyses to retrieve
+        include_full_results: Whether to include complete analysis results
+        section_name: Only include this section analysis in the full results
+        max_concurrency: Maximum storage reads run at once
+    """
+
+    analysis_ids: tuple[UUID, ...] = ()
+    include_full_results: bool = False
+    section_name: str | None = None
+    max_concurrency: int = 10
+
+    def __post_init__(self) -> None:
+        """Validate query parameters after initialization."""
+        # Call parent validation first
+        super().__post_init__()
+
+        # Validate required fields
+        if not self.analysis_ids:
+            raise ValueError("analysis_ids is required")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
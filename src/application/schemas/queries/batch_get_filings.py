@@ -0,0 +1,30 @@
+"""Batch Get Filings Query for retrieving many filings in one request."""
+
+from dataclasses import dataclass
+
+from src.application.base.query import BaseQuery
+
+
+@dataclass(frozen=True)
+class BatchGetFilingsQuery(BaseQuery):
+    """Query to retrieve many filings by accession number at once.
+
+    Filings and their analysis counts are loaded with a single database
+    query. Accession numbers that are invalid or not found are reported
+    individually instead of failing the whole query.
+
+    Attributes:
+        accession_numbers: SEC accession numbers of the filings to retrieve,
+            as given by the client
+    """
+
+    accession_numbers: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Validate query parameters after initialization."""
+        # Call parent validation first
+        super().__post_init__()
+
+        # Validate required fields
+        if not self.accession_numbers:
+            raise ValueError("accession_numbers is required")
@@ -18,12 +18,14 @@ class GetAnalysisByAccessionQuery(BaseQuery):
         include_full_results: Whether to include complete analysis results
         include_section_details: Whether to include detailed section breakdowns
         include_processing_metadata: Whether to include processing information
+        section_name: Only include this section analysis in the full results
     """
 
     accession_number: AccessionNumber | None = None
     include_full_results: bool = True
     include_section_details: bool = False
     include_processing_metadata: bool = False
+    section_name: str | None = None
 
     def __post_init__(self) -> None:
         """Validate query parameters after initialization."""
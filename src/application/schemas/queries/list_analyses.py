@@ -44,6 +44,9 @@ class ListAnalysesQuery(BaseQuery):
         limit: Maximum number of results to return (optional)
         sort_by: Field to sort results by
         sort_direction: Sort direction (ascending or descending)
+        cursor: Cursor of the next page from a previous response (optional,
+            takes precedence over page)
+        include_total: Whether to count the total number of matching analyses
     """
 
     company_cik: CIK | None = None
@@ -54,6 +57,8 @@ class ListAnalysesQuery(BaseQuery):
     min_confidence_score: float | None = None
     sort_by: AnalysisSortField = AnalysisSortField.CREATED_AT
     sort_direction: SortDirection = SortDirection.DESC
+    cursor: str | None = None
+    include_total: bool = True
 
     def __post_init__(self) -> None:
         """Validate query parameters after initialization."""
@@ -39,6 +39,9 @@ class SearchFilingsQuery(BaseQuery):
         sort_by: Field to sort results by
         sort_direction: Sort direction (ascending or descending)
         limit: Maximum number of results to return (overrides page_size if set)
+        cursor: Cursor of the next page from a previous response (optional,
+            takes precedence over page)
+        include_total: Whether to count the total number of matching filings
     """
 
     # Required field
@@ -56,6 +59,10 @@ class SearchFilingsQuery(BaseQuery):
     # Optional limit override for search scenarios
     limit: int | None = None
 
+    # Keyset pagination and optional counting
+    cursor: str | None = None
+    include_total: bool = True
+
     def __post_init__(self) -> None:
         """Validate query parameters after initialization."""
         # Call parent validation first
@@ -8,6 +8,7 @@ Response DTOs available:
 - FilingResponse: Filing details with processing status and metadata
 - AnalysisResponse: Analysis results with confidence scores and insights
 - TaskResponse: Background task status and progress information
+- TaskListResponse: Cursor-paginated list of background tasks
 - ErrorResponse: Standardized error information
 - PaginatedResponse: Generic paginated response wrapper
 """
@@ -16,12 +17,16 @@ from src.application.schemas.responses.analysis_response import AnalysisResponse
 from src.application.schemas.responses.error_response import ErrorResponse
 from src.application.schemas.responses.filing_response import FilingResponse
 from src.application.schemas.responses.paginated_response import PaginatedResponse
-from src.application.schemas.responses.task_response import TaskResponse
+from src.application.schemas.responses.task_response import (
+    TaskListResponse,
+    TaskResponse,
+)
 
 __all__ = [
     "FilingResponse",
     "AnalysisResponse",
     "TaskResponse",
+    "TaskListResponse",
     "ErrorResponse",
     "PaginatedResponse",
 ]
@@ -5,7 +5,27 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.analysis import Analysis, AnalysisType, summarize_results
+
+
+@dataclass(frozen=True)
+class AnalysisSummary:
+    """Columns of an analysis shown in list views.
+
+    Loaded by ``AnalysisRepository.find_summaries_with_filters`` through a
+    column projection, without the analysis metadata JSON or the filing and
+    company rows.
+    """
+
+    id: UUID
+    filing_id: UUID
+    analysis_type: AnalysisType
+    created_by: str | None
+    created_at: datetime
+    llm_provider: str | None = None
+    llm_model: str | None = None
+    confidence_score: float | None = None
+    processing_time_seconds: float | None = None
 
 
 @dataclass(frozen=True)
@@ -66,17 +86,21 @@ class AnalysisResponse:
         analysis: Analysis,
         include_full_results: bool = False,
         results: dict[str, Any] | None = None,
+        section_name: str | None = None,
     ) -> "AnalysisResponse":
         """Create AnalysisResponse from domain Analysis entity.
 
         Args:
             analysis: Domain Analysis entity
             include_full_results: Whether to include complete analysis results
-            results: Analysis results from storage (required)
+            results: Analysis results from storage; without them the summary
+                recorded on the analysis is used
+            section_name: Only include this section analysis in the full results
 
         Returns:
             AnalysisResponse with data from domain entity
         """
+        summary = summarize_results(results) if results else analysis.summary
         return cls(
             analysis_id=analysis.id,
             filing_id=analysis.filing_id,
@@ -87,20 +111,22 @@ class AnalysisResponse:
             llm_provider=analysis.llm_provider,
             llm_model=analysis.llm_model,
             processing_time_seconds=analysis.get_processing_time(),
-            # Extract key data from storage results
-            filing_summary=results.get("filing_summary") if results else None,
-            executive_summary=results.get("executive_summary") if results else None,
-            key_insights=results.get("key_insights") if results else None,
-            risk_factors=results.get("risk_factors") if results else None,
-            opportunities=results.get("opportunities") if results else None,
+            # Extract key data from the results summary
+            filing_summary=summary.get("filing_summary") if summary else None,
+            executive_summary=summary.get("executive_summary") if summary else None,
+            key_insights=summary.get("key_insights") if summary else None,
+            risk_factors=summary.get("risk_factors") if summary else None,
+            opportunities=summary.get("opportunities") if summary else None,
             financial_highlights=(
-                results.get("financial_highlights") if results else None
-            ),
-            sections_analyzed=(
-                len(results.get("section_analyses", [])) if results else None
+                summary.get("financial_highlights") if summary else None
             ),
+            sections_analyzed=(summary.get("sections_analyzed") if summary else None),
             # Include full results only if requested
-            full_results=results if include_full_results else None,
+            full_results=(
+                _select_section(results, section_name)
+                if include_full_results and results is not None
+                else None
+            ),
         )
 
     @classmethod
@@ -134,6 +160,32 @@ class AnalysisResponse:
             sections_analyzed=None,
         )
 
+    @classmethod
+    def from_summary(cls, summary: AnalysisSummary) -> "AnalysisResponse":
+        """Create a summary-only AnalysisResponse from a projected summary row.
+
+        Produces the same response as ``summary_from_domain`` for list views
+        loaded with ``AnalysisRepository.find_summaries_with_filters``.
+
+        Args:
+            summary: Analysis summary row
+
+        Returns:
+            AnalysisResponse with summary data only
+        """
+        return cls(
+            analysis_id=summary.id,
+            filing_id=summary.filing_id,
+            analysis_type=summary.analysis_type.value,
+            created_by=summary.created_by,
+            created_at=summary.created_at,
+            confidence_score=summary.confidence_score,
+            llm_provider=summary.llm_provider,
+            llm_model=summary.llm_model,
+            processing_time_seconds=summary.processing_time_seconds,
+            sections_analyzed=None,
+        )
+
     @property
     def is_high_confidence(self) -> bool:
         """Check if analysis has high confidence.
@@ -245,3 +297,19 @@ class AnalysisResponse:
             )
 
         return ", ".join(parts) if parts else "no insights available"
+
+
+def _select_section(
+    results: dict[str, Any], section_name: str | None
+) -> dict[str, Any]:
+    """Limit the section analyses of full results to one section, if named."""
+    if section_name is None:
+        return results
+    return {
+        **results,
+        "section_analyses": [
+            section
+            for section in results.get("section_analyses") or []
+            if isinstance(section, dict) and section.get("section_name") == section_name
+        ],
+    }
@@ -0,0 +1,35 @@
+"""Batch Response DTO for results of batch get queries."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class BatchItemError:
+    """Why an item requested in a batch was not returned.
+
+    Attributes:
+        id: Identifier of the item as requested
+        status: HTTP status the item would have had if requested alone
+        detail: Human-readable reason
+    """
+
+    id: str
+    status: int
+    detail: str
+
+
+@dataclass(frozen=True)
+class BatchResponse[T]:
+    """Generic response DTO of a batch get.
+
+    Items that could be retrieved are returned in the order they were
+    requested; every other requested item has an entry in ``errors``, so a
+    batch partially fails without failing the request.
+
+    Attributes:
+        items: Retrieved items
+        errors: Items that could not be retrieved
+    """
+
+    items: list[T]
+    errors: list[BatchItemError] = field(default_factory=list)
@@ -34,6 +34,7 @@ class CompanyResponse:
 
     # Optional enriched data
     recent_analyses: list[dict[str, Any]] | None = None
+    statistics: dict[str, Any] | None = None
 
     @classmethod
     def from_domain_and_edgar(
@@ -41,6 +42,7 @@ class CompanyResponse:
         company: Company,
         edgar_data: CompanyData,
         recent_analyses: list[dict[str, Any]] | None = None,
+        statistics: dict[str, Any] | None = None,
     ) -> "CompanyResponse":
         """Create response from domain entity and EdgarTools data.
 
@@ -48,6 +50,7 @@ class CompanyResponse:
             company: Company domain entity from database
             edgar_data: Company data from SEC EDGAR
             recent_analyses: Optional list of recent analysis summaries
+            statistics: Optional filing and analysis statistics of the company
 
         Returns:
             CompanyResponse with complete company information
@@ -85,6 +88,7 @@ class CompanyResponse:
             business_address=business_address,
             # Optional enrichments
             recent_analyses=recent_analyses,
+            statistics=statistics,
         )
 
     @classmethod
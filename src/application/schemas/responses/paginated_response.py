@@ -15,41 +15,58 @@ class PaginationMetadata:
     Attributes:
         page: Current page number (1-based)
         page_size: Number of items per page
-        total_items: Total number of items across all pages
-        total_pages: Total number of pages
+        total_items: Total number of items across all pages (None if not counted)
+        total_pages: Total number of pages (None if items were not counted)
         has_next: Whether there is a next page
         has_previous: Whether there is a previous page
         next_page: Next page number (if available)
         previous_page: Previous page number (if available)
+        next_cursor: Opaque cursor to request the next page (if available)
     """
 
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: int | None
+    total_pages: int | None
     has_next: bool
     has_previous: bool
     next_page: int | None
     previous_page: int | None
+    next_cursor: str | None = None
 
     @classmethod
     def create(
-        cls, page: int, page_size: int, total_items: int
+        cls,
+        page: int,
+        page_size: int,
+        total_items: int | None,
+        next_cursor: str | None = None,
+        has_next: bool | None = None,
     ) -> "PaginationMetadata":
         """Create pagination metadata from basic parameters.
 
         Args:
             page: Current page number (1-based)
             page_size: Items per page
-            total_items: Total number of items
+            total_items: Total number of items, None if not counted
+            next_cursor: Optional cursor to request the next page
+            has_next: Whether there is a next page, derived from the page
+                number and total (or the cursor if not counted) when omitted
 
         Returns:
             PaginationMetadata with calculated values
         """
-        total_pages = (
-            (total_items + page_size - 1) // page_size if total_items > 0 else 0
-        )
-        has_next = page < total_pages
+        total_pages = None
+        if total_items is not None:
+            total_pages = (
+                (total_items + page_size - 1) // page_size if total_items > 0 else 0
+            )
+        if has_next is None:
+            has_next = (
+                page < total_pages
+                if total_pages is not None
+                else next_cursor is not None
+            )
         has_previous = page > 1
         next_page = page + 1 if has_next else None
         previous_page = page - 1 if has_previous else None
@@ -63,6 +80,7 @@ class PaginationMetadata:
             has_previous=has_previous,
             next_page=next_page,
             previous_page=previous_page,
+            next_cursor=next_cursor if has_next else None,
         )
 
 
@@ -91,9 +109,11 @@ class PaginatedResponse[T]:
         items: list[T],
         page: int,
         page_size: int,
-        total_items: int,
+        total_items: int | None,
         query_id: UUID | None = None,
         filters_applied: str | None = None,
+        next_cursor: str | None = None,
+        has_next: bool | None = None,
     ) -> "PaginatedResponse[T]":
         """Create a paginated response from items and pagination parameters.
 
@@ -101,14 +121,19 @@ class PaginatedResponse[T]:
             items: List of items for current page
             page: Current page number (1-based)
             page_size: Items per page
-            total_items: Total number of items across all pages
+            total_items: Total number of items across all pages, None if not
+                counted
             query_id: Optional query ID for tracking
             filters_applied: Optional summary of applied filters
+            next_cursor: Optional cursor to request the next page
+            has_next: Optional override of whether there is a next page
 
         Returns:
             PaginatedResponse with items and pagination metadata
         """
-        pagination = PaginationMetadata.create(page, page_size, total_items)
+        pagination = PaginationMetadata.create(
+            page, page_size, total_items, next_cursor=next_cursor, has_next=has_next
+        )
 
         return cls(
             items=items,
@@ -212,6 +237,9 @@ class PaginatedResponse[T]:
         if self.is_empty:
             return "No items found"
 
+        if self.pagination.total_items is None:
+            return f"Showing {self.item_count} items"
+
         if self.pagination.total_items <= self.pagination.page_size:
             return f"Showing all {self.pagination.total_items} items"
 
@@ -227,14 +255,13 @@ class PaginatedResponse[T]:
         Returns:
             Dictionary with navigation page numbers
         """
+        total_pages = self.pagination.total_pages
         return {
-            "first_page": 1 if self.pagination.total_pages > 0 else None,
+            "first_page": 1 if total_pages is None or total_pages > 0 else None,
             "previous_page": self.pagination.previous_page,
             "current_page": self.pagination.page,
             "next_page": self.pagination.next_page,
-            "last_page": (
-                self.pagination.total_pages if self.pagination.total_pages > 0 else None
-            ),
+            "last_page": total_pages if total_pages else None,
         }
 
     # Convenience properties for accessing pagination metadata directly
@@ -249,15 +276,20 @@ class PaginatedResponse[T]:
         return self.pagination.page_size
 
     @property
-    def total_items(self) -> int:
+    def total_items(self) -> int | None:
         """Get total number of items."""
         return self.pagination.total_items
 
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> int | None:
         """Get total number of pages."""
         return self.pagination.total_pages
 
+    @property
+    def next_cursor(self) -> str | None:
+        """Get the cursor of the next page."""
+        return self.pagination.next_cursor
+
     @property
     def has_next(self) -> bool:
         """Check if there is a next page."""
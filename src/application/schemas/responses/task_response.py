@@ -30,3 +30,16 @@ class TaskResponse:
     progress_percent: float | None = None
     current_step: str | None = None
     analysis_stage: str | None = None  # Optional for backward compatibility
+
+
+@dataclass(frozen=True)
+class TaskListResponse:
+    """Cursor-paginated list of background tasks.
+
+    Attributes:
+        tasks: Tasks on this page, newest first
+        next_cursor: Cursor for the following page (None on the last page)
+    """
+
+    tasks: list[TaskResponse]
+    next_cursor: str | None = None
@@ -22,6 +22,7 @@ from src.infrastructure.llm.base import BaseLLMProvider
 from src.infrastructure.repositories.analysis_repository import AnalysisRepository
 from src.infrastructure.repositories.company_repository import CompanyRepository
 from src.infrastructure.repositories.filing_repository import FilingRepository
+from src.shared import telemetry
 from src.shared.config import settings
 
 logger = logging.getLogger(__name__)
@@ -217,9 +218,10 @@ class AnalysisOrchestrator:
             # Ensure company_cik is available for storage retrieval
             assert command.company_cik is not None, "company_cik must not be None"
             # Get filing content directly from storage (no cache dependency)
-            filing_content = await self._get_filing_content_from_storage(
-                command.accession_number, command.company_cik
-            )
+            with telemetry.analysis_stage("storage_fetch"):
+                filing_content = await self._get_filing_content_from_storage(
+                    command.accession_number, command.company_cik
+                )
             if not filing_content:
                 raise FilingAccessError(
                     f"Filing content for {command.accession_number} not found in storage. "
@@ -262,9 +264,10 @@ class AnalysisOrchestrator:
             )
 
             # Step 5: Extract filing sections based on schemas needed
-            filing_sections = await self._extract_relevant_filing_sections(
-                filing_content, schemas_to_use, command.accession_number
-            )
+            with telemetry.analysis_stage("section_extraction"):
+                filing_sections = await self._extract_relevant_filing_sections(
+                    filing_content, schemas_to_use, command.accession_number
+                )
             await self.track_analysis_progress(
                 analysis.id, 0.4, "Filing sections extracted"
             )
@@ -279,12 +282,13 @@ class AnalysisOrchestrator:
 
                 filing_type = FilingType(filing_data.filing_type)
 
-                llm_response = await self.llm_provider.analyze_filing(
-                    filing_sections=filing_sections,
-                    filing_type=filing_type,
-                    company_name=filing_data.company_name,
-                    analysis_focus=schemas_to_use,
-                )
+                with telemetry.analysis_stage("llm_analysis"):
+                    llm_response = await self.llm_provider.analyze_filing(
+                        filing_sections=filing_sections,
+                        filing_type=filing_type,
+                        company_name=filing_data.company_name,
+                        analysis_focus=schemas_to_use,
+                    )
                 await self.track_analysis_progress(
                     analysis.id, 0.8, "LLM analysis completed"
                 )
@@ -305,12 +309,13 @@ class AnalysisOrchestrator:
 
             try:
                 # Store results to storage - MUST succeed before saving to database
-                storage_success = await store_analysis_results(
-                    analysis.id,
-                    command.company_cik,
-                    command.accession_number,
-                    analysis_results,
-                )
+                with telemetry.analysis_stage("store_results"):
+                    storage_success = await store_analysis_results(
+                        analysis.id,
+                        command.company_cik,
+                        command.accession_number,
+                        analysis_results,
+                    )
 
                 if not storage_success:
                     # Storage failed - DO NOT save to database to maintain consistency
@@ -339,6 +344,9 @@ class AnalysisOrchestrator:
                 f"Successfully stored analysis results for {analysis.id} in storage"
             )
             analysis.update_confidence_score(llm_response.confidence_score)
+            # Keep the summary fields in the database so summary reads do not
+            # load the full results from storage
+            analysis.update_summary(analysis_results)
 
             # Determine which schemas were actually processed based on sections analyzed
             actual_schemas_processed = []
@@ -428,8 +436,10 @@ class AnalysisOrchestrator:
             FilingAccessError: If filing cannot be accessed or is invalid
         """
         try:
-            # Attempt to retrieve filing data via EdgarService (now synchronous)
-            filing_data = self.edgar_service.get_filing_by_accession(accession_number)
+            # Retrieve filing data via EdgarService without blocking the event loop
+            filing_data = await self.edgar_service.get_filing_by_accession_async(
+                accession_number
+            )
 
             # Basic validation checks
             if not filing_data.company_name:
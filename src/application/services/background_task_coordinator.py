@@ -1,12 +1,18 @@
 """Background task coordinator for managing long-running analysis operations using new messaging system."""
 
+import asyncio
 import logging
+from collections.abc import AsyncGenerator
 from uuid import UUID, uuid4
 
 from src.application.schemas.commands.analyze_filing import AnalyzeFilingCommand
 from src.application.schemas.responses.task_response import TaskResponse
 from src.application.services.analysis_orchestrator import AnalysisOrchestrator
-from src.application.services.task_service import TaskService
+from src.application.services.task_service import (
+    TERMINAL_TASK_STATUSES,
+    TaskService,
+)
+from src.infrastructure.messaging import TaskPriority
 from src.infrastructure.messaging import task_service as messaging_task_service
 
 logger = logging.getLogger(__name__)
@@ -84,6 +90,10 @@ class BackgroundTaskCoordinator:
                     },
                     queue="analysis_queue",
                     task_id=UUID(task_id),  # Pass the same task_id to messaging system
+                    # Interactive requests from the API run ahead of bulk work
+                    priority=TaskPriority.HIGH,
+                    # Fair-share key so one user's batch cannot starve others
+                    metadata={"user_id": command.user_id},
                 )
 
                 # Update task with messaging task ID
@@ -238,6 +248,95 @@ class BackgroundTaskCoordinator:
                 error_message=f"Failed to get task status: {str(e)}",
             )
 
+    async def wait_for_task_update(
+        self, task_id: str, timeout: float, since: str | None = None
+    ) -> TaskResponse:
+        """Long-poll the status of a background task.
+
+        Args:
+            task_id: Task identifier
+            timeout: Maximum seconds to wait for a change
+            since: ``updated_at`` value the client has already seen
+
+        Returns:
+            TaskResponse with the latest task status
+        """
+        try:
+            task_data = await self.task_service.wait_for_task_update(
+                task_id, timeout=timeout, since=since
+            )
+
+            if not task_data:
+                return TaskResponse(
+                    task_id=task_id,
+                    status="not_found",
+                    error_message="Task not found",
+                )
+
+            return TaskService.task_data_to_response(task_id, task_data)
+
+        except Exception as e:
+            logger.error(f"Failed to wait for task {task_id}: {e}")
+            return TaskResponse(
+                task_id=task_id,
+                status="error",
+                error_message=f"Failed to get task status: {str(e)}",
+            )
+
+    async def stream_task_updates(
+        self, task_id: str, keepalive_interval: float
+    ) -> AsyncGenerator[TaskResponse | None, None]:
+        """Stream task status changes until the task finishes.
+
+        Yields the current status first, then one TaskResponse per published
+        update. ``None`` is yielded when no update arrived within
+        ``keepalive_interval`` so callers can keep the connection alive.
+
+        Args:
+            task_id: Task identifier
+            keepalive_interval: Seconds to wait before yielding a keep-alive
+
+        Yields:
+            TaskResponse snapshots or None keep-alive ticks
+        """
+        subscription = await self.task_service.subscribe_task_events(task_id)
+
+        try:
+            current = await self.get_task_status(task_id)
+            yield current
+            if current.status in TERMINAL_TASK_STATUSES or current.status in (
+                "not_found",
+                "error",
+            ):
+                return
+
+            if subscription is None:
+                # No result backend: degrade to periodic status reads
+                while True:
+                    await asyncio.sleep(keepalive_interval)
+                    current = await self.get_task_status(task_id)
+                    yield current
+                    if current.status in TERMINAL_TASK_STATUSES:
+                        return
+
+            while True:
+                event = await subscription.next_event(timeout=keepalive_interval)
+                if event is None:
+                    yield None
+                    continue
+
+                if event.kind == "progress":
+                    current = TaskService.task_data_to_response(task_id, event.data)
+                else:
+                    current = await self.get_task_status(task_id)
+                yield current
+
+                if current.status in TERMINAL_TASK_STATUSES:
+                    return
+        finally:
+            if subscription is not None:
+                await subscription.close()
+
     async def cancel_task(self, task_id: str) -> TaskResponse:
         """Cancel a background task.
 
@@ -1,45 +1,52 @@
-"""Task service for managing background task operations using the new storage system."""
+"""Task service for managing background task operations using the task state store."""
 
 import logging
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
-from src.application.schemas.responses.task_response import TaskResponse
-from src.infrastructure.messaging import get_storage_service
+from src.application.schemas.responses.task_response import (
+    TaskListResponse,
+    TaskResponse,
+)
+from src.infrastructure.database.task_store import (
+    TaskStore,
+    decode_cursor,
+    encode_cursor,
+)
+from src.infrastructure.messaging import (
+    TaskEvent,
+    TaskSubscription,
+    get_result_backend,
+)
+from src.shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Task statuses after which no further updates are published
+TERMINAL_TASK_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 
 class TaskService:
     """Service for managing background task operations.
 
-    This service provides task tracking and coordination for long-running operations
-    using the new generic storage interface. It supports both distributed storage
-    (for production) and in-memory storage (for development/testing).
+    This service provides task tracking and coordination for long-running operations.
+    Task state lives in the database task store, which supports indexed per-user
+    listing; an in-memory fallback is used when the store is unavailable
+    (for development/testing).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, task_store: TaskStore | None = None) -> None:
         """Initialize the task service.
 
-        Storage backend is determined by the messaging service configuration.
+        Args:
+            task_store: Task state store, defaults to the application database
         """
         self.tasks: dict[str, dict[str, Any]] = {}  # Fallback in-memory storage
-        self._storage_available = False
-        logger.info("TaskService initialized with generic storage backend")
-
-    async def _get_storage(self) -> Any:
-        """Get storage service instance."""
-        try:
-            storage = await get_storage_service()
-            self._storage_available = True
-            return storage
-        except Exception as e:
-            logger.warning(
-                f"Storage service not available, using in-memory fallback: {e}"
-            )
-            self._storage_available = False
-            return None
+        self.task_store = task_store or TaskStore()
+        self._last_compaction = 0.0
+        logger.info("TaskService initialized with database task store")
 
     async def create_task(
         self,
@@ -84,6 +91,7 @@ class TaskService:
 
             # Store task
             await self._store_task(task_id, task_data)
+            await self._maybe_compact()
 
             logger.info(f"Created task {task_id} of type {task_type}")
 
@@ -257,91 +265,84 @@ class TaskService:
             )
 
     async def list_user_tasks(
-        self, user_id: str, limit: int = 50, status_filter: str | None = None
-    ) -> list[TaskResponse]:
-        """List tasks for a specific user.
+        self,
+        user_id: str,
+        limit: int = 50,
+        status_filter: str | None = None,
+        cursor: str | None = None,
+    ) -> TaskListResponse:
+        """List tasks for a specific user, newest first.
 
         Args:
             user_id: User identifier
             limit: Maximum number of tasks to return
             status_filter: Optional status filter
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of TaskResponse objects
+            Page of TaskResponse objects with the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        try:
-            # This is a simplified implementation
-            # In a real implementation, you'd want to use storage indexes
-            # or a separate task index for efficient querying
-
-            # For now, we'll check if we can list keys from storage
-            storage = await self._get_storage()
-
-            if storage and hasattr(storage, "get_all_keys"):
-                # Try to get all task keys and filter
-                all_keys = storage.get_all_keys()
-                task_keys = [key for key in all_keys if key.startswith("task:")]
-
-                tasks = []
-                for key in task_keys[
-                    : limit * 2
-                ]:  # Get more than limit to allow filtering
-                    task_id = key.replace("task:", "")
-                    task_data = await self._get_task(task_id)
-
-                    if (
-                        task_data
-                        and task_data.get("user_id") == user_id
-                        and (
-                            not status_filter
-                            or task_data.get("status") == status_filter
-                        )
-                    ):
-                        tasks.append(
-                            TaskResponse(
-                                task_id=task_id,
-                                status=task_data.get("status", "unknown"),
-                                current_step=task_data.get("message", ""),
-                                result=task_data.get("result"),
-                                progress_percent=task_data.get("progress_percent"),
-                                started_at=task_data.get("started_at"),
-                                completed_at=task_data.get("completed_at"),
-                                error_message=task_data.get("error"),
-                            )
-                        )
-
-                        if len(tasks) >= limit:
-                            break
-
-                return tasks
-            else:
-                # Fall back to in-memory storage
-                tasks = []
-                for task_id, task_data in self.tasks.items():
-                    if task_data.get("user_id") == user_id and (
-                        not status_filter or task_data.get("status") == status_filter
-                    ):
-                        tasks.append(
-                            TaskResponse(
-                                task_id=task_id,
-                                status=task_data.get("status", "unknown"),
-                                current_step=task_data.get("message", ""),
-                                result=task_data.get("result"),
-                                progress_percent=task_data.get("progress_percent"),
-                                started_at=task_data.get("started_at"),
-                                completed_at=task_data.get("completed_at"),
-                                error_message=task_data.get("error"),
-                            )
-                        )
-
-                        if len(tasks) >= limit:
-                            break
-
-                return tasks
+        if cursor is not None:
+            decode_cursor(cursor)
 
+        try:
+            page = await self.task_store.list_user_tasks(
+                user_id, limit=limit, status=status_filter, cursor=cursor
+            )
+            tasks = page.tasks
+            next_cursor = page.next_cursor
         except Exception as e:
-            logger.error(f"Failed to list tasks for user {user_id}: {e}")
-            return []
+            logger.warning(f"Task store not available, using in-memory fallback: {e}")
+            tasks, next_cursor = self._list_fallback_tasks(
+                user_id, limit, status_filter, cursor
+            )
+
+        return TaskListResponse(
+            tasks=[
+                self.task_data_to_response(task_data["task_id"], task_data)
+                for task_data in tasks
+            ],
+            next_cursor=next_cursor,
+        )
+
+    def _list_fallback_tasks(
+        self,
+        user_id: str,
+        limit: int,
+        status_filter: str | None,
+        cursor: str | None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """List tasks from the in-memory fallback with the store's ordering."""
+        matching = sorted(
+            (
+                task_data
+                for task_data in self.tasks.values()
+                if task_data.get("user_id") == user_id
+                and (not status_filter or task_data.get("status") == status_filter)
+            ),
+            key=lambda task_data: (task_data["created_at"], task_data["task_id"]),
+            reverse=True,
+        )
+        if cursor is not None:
+            created_at, task_id = decode_cursor(cursor)
+            position = (created_at.isoformat(), task_id)
+            matching = [
+                task_data
+                for task_data in matching
+                if (task_data["created_at"], task_data["task_id"]) < position
+            ]
+
+        if len(matching) <= limit:
+            return matching, None
+
+        page = matching[:limit]
+        last = page[-1]
+        return page, encode_cursor(
+            datetime.fromisoformat(last["created_at"]), last["task_id"]
+        )
 
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task.
@@ -352,46 +353,150 @@ class TaskService:
         Returns:
             True if deleted successfully
         """
+        deleted = self.tasks.pop(task_id, None) is not None
         try:
-            storage = await self._get_storage()
+            return await self.task_store.delete(task_id) or deleted
+        except Exception as e:
+            logger.error(f"Failed to delete task {task_id}: {e}")
+            return deleted
 
-            if storage:
-                key = f"task:{task_id}"
-                result = await storage.delete(key)
-                return bool(result)
-            else:
-                # In-memory fallback
-                if task_id in self.tasks:
-                    del self.tasks[task_id]
-                    return True
-                return False
+    async def compact_finished_tasks(self, retention: timedelta | None = None) -> int:
+        """Delete finished tasks older than the retention period.
+
+        Args:
+            retention: How long finished tasks are kept, defaults to settings
 
+        Returns:
+            Number of tasks deleted
+        """
+        retention = retention or timedelta(seconds=settings.task_retention_seconds)
+        self._last_compaction = time.monotonic()
+        try:
+            return await self.task_store.compact(retention)
         except Exception as e:
-            logger.error(f"Failed to delete task {task_id}: {e}")
-            return False
+            logger.warning(f"Failed to compact finished tasks: {e}")
+            return 0
+
+    async def _maybe_compact(self) -> None:
+        """Compact finished tasks if the compaction interval has elapsed."""
+        if (
+            time.monotonic() - self._last_compaction
+            >= settings.task_compaction_interval
+        ):
+            await self.compact_finished_tasks()
 
     async def _store_task(self, task_id: str, task_data: dict[str, Any]) -> None:
-        """Store task data."""
-        storage = await self._get_storage()
-
-        if storage:
-            key = f"task:{task_id}"
-            await storage.set(key, task_data)
-        else:
-            # In-memory fallback
+        """Upsert task data and notify subscribers of the change."""
+        try:
+            await self.task_store.upsert(task_data)
+            self.tasks.pop(task_id, None)
+        except Exception as e:
+            logger.warning(f"Task store not available, using in-memory fallback: {e}")
             self.tasks[task_id] = task_data
 
+        await self._publish_task_event(task_id, task_data)
+
+    async def _publish_task_event(
+        self, task_id: str, task_data: dict[str, Any]
+    ) -> None:
+        """Publish a task snapshot to the result backend."""
+        try:
+            result_backend = await get_result_backend()
+        except Exception as e:
+            logger.debug(f"Result backend not available for task {task_id}: {e}")
+            return
+
+        status = task_data.get("status", "unknown")
+        try:
+            await result_backend.publish(
+                TaskEvent(
+                    task_id=task_id,
+                    kind="progress",
+                    status=status,
+                    data=task_data,
+                    terminal=status in TERMINAL_TASK_STATUSES,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish event for task {task_id}: {e}")
+
+    async def subscribe_task_events(self, task_id: str) -> TaskSubscription | None:
+        """Subscribe to change events of a task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Subscription or None if no result backend is available
+        """
+        try:
+            result_backend = await get_result_backend()
+            return await result_backend.subscribe(task_id)
+        except Exception as e:
+            logger.warning(f"Could not subscribe to events for task {task_id}: {e}")
+            return None
+
+    async def wait_for_task_update(
+        self, task_id: str, timeout: float, since: str | None = None
+    ) -> dict[str, Any] | None:
+        """Wait until a task changes, finishes or the timeout expires.
+
+        Args:
+            task_id: Task identifier
+            timeout: Maximum seconds to wait
+            since: ``updated_at`` value the caller has already seen; if the
+                task has changed since then, return immediately
+
+        Returns:
+            Latest task data or None if not found
+        """
+        task_data = await self.get_task_status(task_id)
+        if not task_data or task_data.get("status") in TERMINAL_TASK_STATUSES:
+            return task_data
+        if since is not None and task_data.get("updated_at") != since:
+            return task_data
+
+        subscription = await self.subscribe_task_events(task_id)
+        if subscription is None:
+            return task_data
+
+        async with subscription:
+            # Re-read after subscribing so an update in between is not missed
+            latest = await self._get_task(task_id)
+            if latest and latest.get("updated_at") != task_data.get("updated_at"):
+                return latest
+
+            event = await subscription.next_event(timeout=timeout)
+
+        if event is not None and event.kind == "progress":
+            return event.data
+        return await self._get_task(task_id) or task_data
+
+    @staticmethod
+    def task_data_to_response(task_id: str, task_data: dict[str, Any]) -> TaskResponse:
+        """Build a TaskResponse from stored task data."""
+        return TaskResponse(
+            task_id=task_id,
+            status=task_data.get("status") or "unknown",
+            current_step=task_data.get("message", ""),
+            result=task_data.get("result"),
+            progress_percent=task_data.get("progress_percent"),
+            started_at=task_data.get("started_at"),
+            completed_at=task_data.get("completed_at"),
+            error_message=task_data.get("error"),
+            analysis_stage=task_data.get("analysis_stage"),
+        )
+
     async def _get_task(self, task_id: str) -> dict[str, Any] | None:
         """Get task data."""
-        storage = await self._get_storage()
-
-        if storage:
-            key = f"task:{task_id}"
-            result = await storage.get(key)
-            return result if result is not None else None
-        else:
-            # In-memory fallback
-            return self.tasks.get(task_id)
+        if task_id in self.tasks:
+            return self.tasks[task_id]
+
+        try:
+            return await self.task_store.get(task_id)
+        except Exception as e:
+            logger.warning(f"Task store not available for task {task_id}: {e}")
+            return None
 
     async def _sync_messaging_status(
         self, task_id: str, task_data: dict[str, Any]
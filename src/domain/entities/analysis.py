@@ -18,6 +18,37 @@ class AnalysisType(str, Enum):
     HISTORICAL_TREND = "historical_trend"  # Time-series analysis across filings
 
 
+# Result fields that are small enough to keep in the database, so summaries
+# can be shown without loading the full results from storage
+SUMMARY_FIELDS = (
+    "filing_summary",
+    "executive_summary",
+    "key_insights",
+    "risk_factors",
+    "opportunities",
+    "financial_highlights",
+)
+
+
+def summarize_results(results: dict[str, Any]) -> dict[str, Any]:
+    """Build the compact summary of analysis results.
+
+    Args:
+        results: Complete analysis results
+
+    Returns:
+        The summary fields of the results with the number and names of the
+        sections analyzed, without the section analyses themselves
+    """
+    sections = results.get("section_analyses") or []
+    summary = {field: results.get(field) for field in SUMMARY_FIELDS}
+    summary["sections_analyzed"] = len(sections)
+    summary["section_names"] = [
+        section.get("section_name") for section in sections if isinstance(section, dict)
+    ]
+    return summary
+
+
 class Analysis:
     """Analysis result entity.
 
@@ -36,6 +67,7 @@ class Analysis:
         confidence_score: float | None = None,
         metadata: dict[str, Any] | None = None,
         created_at: datetime | None = None,
+        summary: dict[str, Any] | None = None,
     ) -> None:
         """Initialize an Analysis entity.
 
@@ -50,6 +82,7 @@ class Analysis:
             confidence_score: Confidence in results (0.0 to 1.0)
             metadata: Additional analysis metadata
             created_at: Timestamp of analysis creation
+            summary: Compact summary of the results, see ``summarize_results``
         """
         self._id = id
         self._filing_id = filing_id
@@ -60,6 +93,7 @@ class Analysis:
         self._confidence_score = confidence_score
         self._metadata = metadata or {}
         self._created_at = created_at or datetime.now(UTC)
+        self._summary = summary
 
         self._validate_invariants()
 
@@ -115,6 +149,11 @@ class Analysis:
         """Get creation timestamp."""
         return self._created_at
 
+    @property
+    def summary(self) -> dict[str, Any] | None:
+        """Get the compact summary of the results, None if not recorded."""
+        return dict(self._summary) if self._summary is not None else None
+
     def is_filing_analysis(self) -> bool:
         """Check if this is a comprehensive filing analysis.
 
@@ -243,6 +282,14 @@ class Analysis:
         # Results are now stored in storage, not in entity
         pass
 
+    def update_summary(self, results: dict[str, Any]) -> None:
+        """Record the compact summary of the results stored for the analysis.
+
+        Args:
+            results: Complete analysis results
+        """
+        self._summary = summarize_results(results)
+
     def update_confidence_score(self, score: float) -> None:
         """Update confidence score.
 
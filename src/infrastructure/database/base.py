@@ -1,11 +1,19 @@
+import time
 from collections.abc import AsyncGenerator
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy import DateTime, func
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, StaticPool
 
 from src.shared.config.settings import Settings
 
@@ -34,55 +42,152 @@ class Base(DeclarativeBase):
     )
 
 
-# Convert SQLite URLs to use async driver
-database_url = settings.database_url
-if database_url.startswith("sqlite://"):
-    database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
+class PoolMetrics:
+    """Checkout counters for an instrumented connection pool."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Record the time a checkout waited for a connection."""
+        self.checkouts += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the counters as a dictionary."""
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(
+                (
+                    self.total_wait_seconds / self.checkouts * 1000
+                    if self.checkouts
+                    else 0
+                ),
+                3,
+            ),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start)
+
+
+def build_engine_kwargs(database_url: str, settings: Settings) -> dict[str, Any]:
+    """Build engine arguments for the configured database and pool mode.
+
+    SQLite uses a single static connection. For other databases the
+    ``database_pool_mode`` setting selects between ``null`` - no pool, each
+    session opens and closes its own connection (serverless, e.g. Lambda) -
+    and ``queue`` - a sized pool of reused connections for long-running API
+    containers and workers.
+
+    Args:
+        database_url: Async database URL
+        settings: Application settings
 
-# Create async engine optimized for serverless databases
-# Key principle: Don't hold connections, close immediately after use
-
-engine_kwargs: dict[str, Any] = {
-    "echo": settings.debug,
-    "future": True,
-    # Disable pool_pre_ping - don't test connections, assume DB is healthy
-    "pool_pre_ping": False,
-    "connect_args": (
-        {
-            "server_settings": {
-                "application_name": "aperilex",
+    Returns:
+        Keyword arguments for ``create_async_engine``
+    """
+    engine_kwargs: dict[str, Any] = {
+        "echo": settings.debug,
+        "future": True,
+        # Serverless default: don't test connections, assume DB is healthy
+        "pool_pre_ping": False,
+        "connect_args": (
+            {
+                "server_settings": {
+                    "application_name": "aperilex",
+                }
             }
-        }
-        if "postgresql" in database_url
-        else {}
-    ),
-}
-
-# Configure for serverless pattern - close connections immediately
-if not database_url.startswith("sqlite"):
-    from sqlalchemy.pool import NullPool
-
-    # NullPool: Don't maintain a connection pool at all
-    # Each request gets a fresh connection that's closed immediately after use
-    engine_kwargs["poolclass"] = NullPool
-    # Short connection timeout for serverless - preserve existing connect_args
-    if "connect_args" in engine_kwargs and engine_kwargs["connect_args"]:
-        # Keep existing connect_args (PostgreSQL settings)
-        pass
+            if "postgresql" in database_url
+            else {}
+        ),
+    }
+
+    if database_url.startswith("sqlite"):
+        # For SQLite in development, use StaticPool for single connection
+        engine_kwargs["poolclass"] = StaticPool
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+        return engine_kwargs
+
+    if settings.database_pool_mode == "queue":
+        # Long-running processes: keep connections open and reuse them
+        engine_kwargs.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_recycle=settings.database_pool_recycle,
+            pool_pre_ping=settings.database_pool_pre_ping,
+        )
     else:
-        engine_kwargs["connect_args"] = {}
-else:
-    # For SQLite in development, use StaticPool for single connection
-    from sqlalchemy.pool import StaticPool
+        # NullPool: Don't maintain a connection pool at all
+        # Each request gets a fresh connection that's closed immediately after use
+        engine_kwargs["poolclass"] = NullPool
+
+    if "asyncpg" in database_url and settings.database_statement_cache_size is not None:
+        engine_kwargs["connect_args"][
+            "statement_cache_size"
+        ] = settings.database_statement_cache_size
+
+    return engine_kwargs
+
+
+def get_pool_stats(db_engine: AsyncEngine | None = None) -> dict[str, Any]:
+    """Get connection pool usage metrics.
+
+    Args:
+        db_engine: Engine to inspect, defaults to the application engine
+
+    Returns:
+        Pool class, usage and (in queue mode) checkout wait metrics
+    """
+    pool = (db_engine or engine).pool
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(pool.metrics.as_dict())
 
-    engine_kwargs["poolclass"] = StaticPool
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
+    return stats
 
-# NullPool import is already handled above in the if block
 
-engine = create_async_engine(database_url, **engine_kwargs)
+# Convert SQLite URLs to use async driver
+database_url = settings.database_url
+if database_url.startswith("sqlite://"):
+    database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
+
+engine = create_async_engine(
+    database_url, **build_engine_kwargs(database_url, settings)
+)
 
-# Create async session factory optimized for serverless
+# Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -96,10 +201,9 @@ async_session_maker = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session.
 
-    Optimized for serverless databases:
-    - Creates a fresh connection for each request
-    - Ensures connection is closed immediately after use
-    - No connection pooling or persistent connections
+    The session's connection is released as soon as the request finishes:
+    closed in the serverless (null pool) mode, returned to the pool in the
+    queue pool mode.
     """
     async with async_session_maker() as session:
         try:
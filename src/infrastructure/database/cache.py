@@ -2,15 +2,23 @@
 
 import hashlib
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import Any, TypeVar
+from uuid import uuid4
 
 from dogpile.cache.api import NO_VALUE
 from dogpile.cache.region import CacheRegion, make_region
 from sqlalchemy.orm.query import Query
 
+from src.domain.entities.analysis import AnalysisType
+from src.domain.value_objects.filing_type import FilingType
+from src.infrastructure.database.cache_backends import (
+    TIERED_MEMORY_BACKEND,
+    TieredMemoryBackend,
+)
 from src.shared.config.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -121,6 +129,84 @@ def query_cache_key[T](namespace: str, query: Query[T]) -> str:
     return f"{namespace}:query:{key_hash}"
 
 
+# Region holding tag versions for tag-based invalidation
+TAG_REGION_NAME = "tags"
+
+# Tag of cached company search results
+COMPANY_SEARCH_TAG = "companies"
+
+
+@dataclass(frozen=True)
+class TaggedValue:
+    """Cached value with the versions of its tags at creation time."""
+
+    value: Any
+    tag_versions: dict[str, str]
+
+
+def filing_list_tag(company_id: Any, filing_type: str | None = None) -> str:
+    """Get the tag of a company's cached filing list.
+
+    Lists filtered by filing type get their own tag, so a write to one filing
+    type leaves the lists of other types cached.
+
+    Args:
+        company_id: Company ID
+        filing_type: Filing type filter of the list, if any
+
+    Returns:
+        Cache tag
+    """
+    tag = f"filings:company:{company_id}"
+    return f"{tag}:type:{filing_type}" if filing_type else tag
+
+
+def analysis_list_tag(filing_id: Any, analysis_type: str | None = None) -> str:
+    """Get the tag of a filing's cached analysis list.
+
+    Args:
+        filing_id: Filing ID
+        analysis_type: Analysis type filter of the list, if any
+
+    Returns:
+        Cache tag
+    """
+    tag = f"analyses:filing:{filing_id}"
+    return f"{tag}:type:{analysis_type}" if analysis_type else tag
+
+
+def filing_write_tags(company_id: Any, filing_type: str | None = None) -> list[str]:
+    """Get the tags a write to a company's filing invalidates.
+
+    Args:
+        company_id: Company ID
+        filing_type: Type of the written filing; all types if unknown
+
+    Returns:
+        Cache tags
+    """
+    types = [filing_type] if filing_type else [t.value for t in FilingType]
+    return [filing_list_tag(company_id)] + [
+        filing_list_tag(company_id, t) for t in types
+    ]
+
+
+def analysis_write_tags(filing_id: Any, analysis_type: str | None = None) -> list[str]:
+    """Get the tags a write to a filing's analysis invalidates.
+
+    Args:
+        filing_id: Filing ID
+        analysis_type: Type of the written analysis; all types if unknown
+
+    Returns:
+        Cache tags
+    """
+    types = [analysis_type] if analysis_type else [t.value for t in AnalysisType]
+    return [analysis_list_tag(filing_id)] + [
+        analysis_list_tag(filing_id, t) for t in types
+    ]
+
+
 class CacheManager:
     """Manager for application cache regions with invalidation support."""
 
@@ -128,29 +214,92 @@ class CacheManager:
         """Initialize cache manager with configured regions."""
         self.regions: dict[CacheRegionName, CacheRegion] = {}
         self._initialize_regions()
+        self._initialize_tag_region()
 
     def _initialize_regions(self) -> None:
         """Initialize cache regions based on configuration."""
         for region_name in CacheRegionName:
             config = REGION_CONFIGS[region_name]
 
-            # expiration = config.expiration_time
             self.regions[region_name] = make_region(
                 name=region_name.value,
                 function_key_generator=create_cache_key_generator(region_name.value),
             ).configure(
-                "dogpile.cache.memory",
-                # expiration_time=float(expiration),
-                arguments={"cache_dict": {}},
+                TIERED_MEMORY_BACKEND,
+                expiration_time=config.expiration_time,
+                arguments={
+                    "expiration_time": config.expiration_time,
+                    "max_entries": settings.cache_max_entries,
+                    "max_bytes": settings.cache_max_bytes,
+                    "namespace": region_name.value,
+                    "sync_interval": settings.cache_shared_sync_interval,
+                    **self._shared_tier_arguments(
+                        region_name.value, config.expiration_time
+                    ),
+                },
             )
 
             logger.info(
                 "Initialized cache region '%s': %s (TTL: %ds)",
                 region_name.value,
                 config.description,
-                # config.expiration_time,
+                config.expiration_time,
             )
 
+    def _initialize_tag_region(self) -> None:
+        """Initialize the region holding the current version of each tag.
+
+        Versions never expire on their own; an evicted version is simply
+        replaced by a new one, which only turns entries using it into misses.
+        With a shared tier, versions are re-read from it every sync interval
+        so invalidations by other processes are seen.
+        """
+        shared_tier = self._shared_tier_arguments(TAG_REGION_NAME, None)
+        self.tag_region = make_region(name=TAG_REGION_NAME).configure(
+            TIERED_MEMORY_BACKEND,
+            arguments={
+                "max_entries": settings.cache_max_entries,
+                "namespace": TAG_REGION_NAME,
+                "sync_interval": settings.cache_shared_sync_interval,
+                "local_ttl": (
+                    settings.cache_shared_sync_interval if shared_tier else 0
+                ),
+                **shared_tier,
+            },
+        )
+
+    @staticmethod
+    def _shared_tier_arguments(
+        name: str, expiration_time: int | None
+    ) -> dict[str, Any]:
+        """Get backend arguments for the configured shared cache tier.
+
+        Args:
+            name: Region name
+            expiration_time: Region TTL in seconds, None for no expiry
+
+        Returns:
+            Shared tier arguments, empty if no shared tier is configured
+        """
+        if settings.cache_shared_backend == "file":
+            cache_dir = Path(settings.cache_shared_path)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            return {
+                "shared_backend": "dogpile.cache.dbm",
+                "shared_arguments": {"filename": str(cache_dir / f"{name}.dbm")},
+                "signing_key": settings.secret_key,
+            }
+        if settings.cache_shared_backend == "redis":
+            redis_arguments: dict[str, Any] = {"url": settings.cache_redis_url}
+            if expiration_time:
+                redis_arguments["redis_expiration_time"] = expiration_time
+            return {
+                "shared_backend": "dogpile.cache.redis",
+                "shared_arguments": redis_arguments,
+                "signing_key": settings.secret_key,
+            }
+        return {}
+
     def get_region(self, name: CacheRegionName) -> CacheRegion:
         """Get a cache region by name.
 
@@ -175,6 +324,8 @@ class CacheManager:
         """
         region = self.get_region(name)
         region.invalidate()
+        if isinstance(region.backend, TieredMemoryBackend):
+            region.backend.invalidate()
         logger.info("Invalidated cache region: %s", name.value)
 
     def invalidate_key(self, region_name: CacheRegionName, key: str) -> None:
@@ -188,6 +339,60 @@ class CacheManager:
         region.delete(key)
         logger.debug("Invalidated cache key: %s in region: %s", key, region_name.value)
 
+    def invalidate_keys(
+        self, region_name: CacheRegionName, keys: Iterable[str]
+    ) -> None:
+        """Invalidate several keys in a region at once.
+
+        Args:
+            region_name: Region name enum
+            keys: Cache keys to invalidate
+        """
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return
+        self.get_region(region_name).delete_multi(unique)
+        logger.debug(
+            "Invalidated %d cache keys in region: %s", len(unique), region_name.value
+        )
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """Invalidate every cached entry tagged with any of the given tags.
+
+        Args:
+            tags: Tags to invalidate
+        """
+        unique = list(dict.fromkeys(tags))
+        if not unique:
+            return
+        self.tag_region.set_multi({tag: uuid4().hex for tag in unique})
+        logger.debug("Invalidated cache tags: %s", ", ".join(unique))
+
+    def _tag_versions(self, tags: Iterable[str]) -> dict[str, str]:
+        """Get the current version of each tag, creating missing ones."""
+        versions = {}
+        for tag in tags:
+            version = self.tag_region.get(tag)
+            if version is NO_VALUE:
+                version = uuid4().hex
+                self.tag_region.set(tag, version)
+            versions[tag] = version
+        return versions
+
+    def _lookup(self, region_name: CacheRegionName, key: str) -> Any:
+        """Get a cached value, treating entries with invalidated tags as misses."""
+        region = self.get_region(region_name)
+        value = region.get(key)
+
+        if isinstance(value, TaggedValue):
+            if self._tag_versions(value.tag_versions) != value.tag_versions:
+                if isinstance(region.backend, TieredMemoryBackend):
+                    region.backend.stats.stale += 1
+                return NO_VALUE
+            return value.value
+
+        return value
+
     def invalidate_company(
         self, company_id: str | None = None, cik: str | None = None
     ) -> None:
@@ -202,18 +407,24 @@ class CacheManager:
         if cik:
             self.invalidate_key(CacheRegionName.COMPANY, f"company:cik:{cik}")
 
-        # Also invalidate related query cache
-        self.invalidate_region(CacheRegionName.QUERY)
+        # Also invalidate company searches
+        self.invalidate_tags(COMPANY_SEARCH_TAG)
         logger.info("Invalidated company cache for id=%s, cik=%s", company_id, cik)
 
     def invalidate_filing(
-        self, filing_id: str | None = None, accession_number: str | None = None
+        self,
+        filing_id: str | None = None,
+        accession_number: str | None = None,
+        company_id: str | None = None,
+        filing_type: str | None = None,
     ) -> None:
         """Invalidate filing cache entries.
 
         Args:
             filing_id: Optional filing ID to invalidate
             accession_number: Optional accession number to invalidate
+            company_id: Company of the filing, to invalidate its filing lists
+            filing_type: Filing type, to limit list invalidation to that type
         """
         if filing_id:
             self.invalidate_key(CacheRegionName.FILING, f"filing:id:{filing_id}")
@@ -222,8 +433,11 @@ class CacheManager:
                 CacheRegionName.FILING, f"filing:accession:{accession_number}"
             )
 
-        # Also invalidate related query cache
-        self.invalidate_region(CacheRegionName.QUERY)
+        # Also invalidate the filing lists the filing appears in
+        if company_id:
+            self.invalidate_tags(*filing_write_tags(company_id, filing_type))
+        else:
+            self.invalidate_region(CacheRegionName.QUERY)
         logger.info(
             "Invalidated filing cache for id=%s, accession=%s",
             filing_id,
@@ -231,23 +445,22 @@ class CacheManager:
         )
 
     def invalidate_analysis(
-        self, analysis_id: str | None = None, filing_id: str | None = None
+        self,
+        analysis_id: str | None = None,
+        filing_id: str | None = None,
+        analysis_type: str | None = None,
     ) -> None:
         """Invalidate analysis cache entries.
 
         Args:
             analysis_id: Optional analysis ID to invalidate
             filing_id: Optional filing ID to invalidate all its analyses
+            analysis_type: Analysis type, to limit list invalidation to that type
         """
         if analysis_id:
             self.invalidate_key(CacheRegionName.ANALYSIS, f"analysis:id:{analysis_id}")
         if filing_id:
-            self.invalidate_key(
-                CacheRegionName.ANALYSIS, f"analysis:filing:{filing_id}"
-            )
-
-        # Also invalidate related query cache
-        self.invalidate_region(CacheRegionName.QUERY)
+            self.invalidate_tags(*analysis_write_tags(filing_id, analysis_type))
         logger.info(
             "Invalidated analysis cache for id=%s, filing_id=%s", analysis_id, filing_id
         )
@@ -257,7 +470,7 @@ class CacheManager:
         region_name: CacheRegionName,
         key: str,
         creator: Callable[[], Any],
-        # expiration_time: int | None = None,
+        tags: Iterable[str] | None = None,
     ) -> Any:
         """Get value from cache or create if missing.
 
@@ -265,28 +478,20 @@ class CacheManager:
             region_name: Region name enum
             key: Cache key
             creator: Function to create value if not in cache
-            expiration_time: Optional custom expiration time
+            tags: Optional tags; invalidating any of them invalidates the value
 
         Returns:
             Cached or newly created value
         """
-        region = self.get_region(region_name)
-
-        # Try to get from cache
-        value = region.get(key)
+        value = self._lookup(region_name, key)
 
         if value is NO_VALUE:
             # Not in cache, create it
             logger.debug("Cache miss for key: %s in region: %s", key, region_name.value)
+            # Read tag versions first so an invalidation during creation wins
+            tag_versions = self._tag_versions(tags) if tags else None
             value = creator()
-
-            # CacheRegion.set doesn't support expiration_time parameter
-            # The expiration is controlled at region configuration level
-            region.set(key, value)
-
-            logger.debug(
-                "Cached new value for key: %s in region: %s", key, region_name.value
-            )
+            self._store(region_name, key, value, tag_versions)
         else:
             logger.debug("Cache hit for key: %s in region: %s", key, region_name.value)
 
@@ -297,7 +502,7 @@ class CacheManager:
         region_name: CacheRegionName,
         key: str,
         creator: Callable[[], Any],
-        # expiration_time: int | None = None,
+        tags: Iterable[str] | None = None,
     ) -> Any:
         """Async version of get_or_create for async creators.
 
@@ -305,37 +510,68 @@ class CacheManager:
             region_name: Region name enum
             key: Cache key
             creator: Async function to create value if not in cache
-            expiration_time: Optional custom expiration time
+            tags: Optional tags; invalidating any of them invalidates the value
 
         Returns:
             Cached or newly created value
         """
-        region = self.get_region(region_name)
-
-        # Try to get from cache
-        value = region.get(key)
+        value = self._lookup(region_name, key)
 
         if value is NO_VALUE:
             # Not in cache, create it
             logger.debug("Cache miss for key: %s in region: %s", key, region_name.value)
+            # Read tag versions first so an invalidation during creation wins
+            tag_versions = self._tag_versions(tags) if tags else None
             value = await creator()
-
-            # CacheRegion.set doesn't support expiration_time parameter
-            # The expiration is controlled at region configuration level
-            region.set(key, value)
-
-            logger.debug(
-                "Cached new value for key: %s in region: %s", key, region_name.value
-            )
+            self._store(region_name, key, value, tag_versions)
         else:
             logger.debug("Cache hit for key: %s in region: %s", key, region_name.value)
 
         return value
 
+    def _store(
+        self,
+        region_name: CacheRegionName,
+        key: str,
+        value: Any,
+        tag_versions: dict[str, str] | None,
+    ) -> None:
+        """Store a created value, wrapped with its tag versions if tagged."""
+        # CacheRegion.set doesn't support expiration_time parameter
+        # The expiration is controlled at region configuration level
+        self.get_region(region_name).set(
+            key, TaggedValue(value, tag_versions) if tag_versions else value
+        )
+        logger.debug(
+            "Cached new value for key: %s in region: %s", key, region_name.value
+        )
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get memory usage and hit-ratio metrics for every region.
+
+        Returns:
+            Dictionary of region name to its counters
+        """
+        regions = {
+            **{
+                region_name.value: region
+                for region_name, region in self.regions.items()
+            },
+            TAG_REGION_NAME: self.tag_region,
+        }
+        return {
+            name: region.backend.stats.as_dict()
+            for name, region in regions.items()
+            if isinstance(region.backend, TieredMemoryBackend)
+        }
+
     def clear_all(self) -> None:
         """Clear all cache regions."""
         for region_name in CacheRegionName:
             self.invalidate_region(region_name)
+        self.tag_region.invalidate()
+        if isinstance(self.tag_region.backend, TieredMemoryBackend):
+            self.tag_region.backend.invalidate()
         logger.info("Cleared all cache regions")
 
 
@@ -0,0 +1,319 @@
+"""Bounded in-process dogpile cache backend with an optional shared tier."""
+
+import hashlib
+import hmac
+import logging
+import math
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import uuid4
+
+from dogpile.cache import make_region, register_backend
+from dogpile.cache.api import NO_VALUE, CacheBackend, CachedValue, NoValue
+
+logger = logging.getLogger(__name__)
+
+# Name the backend is registered under with dogpile
+TIERED_MEMORY_BACKEND = "aperilex.tiered_memory"
+
+# Shared-tier key holding the region's current generation
+GENERATION_KEY = "__generation__"
+
+# Length of the HMAC-SHA256 signature prefixed to shared-tier values
+SIGNATURE_LENGTH = hashlib.sha256().digest_size
+
+
+@dataclass
+class CacheStats:
+    """Counters for a single cache region.
+
+    Attributes:
+        hits: Lookups answered by either tier
+        misses: Lookups answered by neither tier
+        shared_hits: Lookups answered by the shared tier
+        sets: Values stored
+        evictions: Entries dropped to stay within the size bounds
+        expirations: Entries dropped because their TTL elapsed
+        stale: Hits discarded because one of the entry's tags was invalidated
+        entries: Entries currently held in process
+        bytes: Approximate size of the entries held in process
+    """
+
+    hits: int = 0
+    misses: int = 0
+    shared_hits: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    stale: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that were served a current value."""
+        lookups = self.hits + self.misses
+        return (self.hits - self.stale) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the counters and hit ratio as a dictionary."""
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory held by a cached value.
+
+    Args:
+        value: Cached payload
+
+    Returns:
+        Approximate size in bytes
+    """
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class TieredMemoryBackend(CacheBackend):
+    """LRU cache bounded by entries and bytes, with per-entry TTLs.
+
+    Entries live in an ordered dict in least-recently-used order; inserting
+    beyond ``max_entries`` or ``max_bytes`` evicts from the cold end, and
+    entries older than ``expiration_time`` are dropped when looked up. When a
+    ``shared_backend`` (any dogpile backend, e.g. ``dogpile.cache.dbm`` or
+    ``dogpile.cache.redis``) is configured, writes go to both tiers and local
+    misses fall through to the shared tier, so the API and workers share hits.
+
+    Shared keys are prefixed with a region generation; invalidating the region
+    switches to a new generation, and other processes notice within
+    ``sync_interval`` seconds and drop their in-process entries. Values are
+    pickled for the shared tier and signed with ``signing_key``; values
+    without a valid signature are ignored, so only processes holding the key
+    can get data unpickled. Without a signing key the shared tier is not used.
+
+    Arguments:
+        expiration_time: Entry TTL in seconds (0 disables)
+        local_ttl: Cap on how long entries stay in process (0 disables)
+        max_entries: Maximum number of in-process entries
+        max_bytes: Approximate maximum in-process bytes (0 disables)
+        namespace: Prefix for shared-tier keys
+        shared_backend: Optional dogpile backend name for the shared tier
+        shared_arguments: Arguments for the shared backend
+        signing_key: Secret signing shared-tier values
+        sync_interval: Seconds between shared generation checks
+        clock: Monotonic clock, for tests
+    """
+
+    def __init__(self, arguments: Mapping[str, Any]) -> None:
+        self.ttl = float(arguments.get("expiration_time") or 0)
+        self.local_ttl = float(arguments.get("local_ttl") or 0)
+        self.max_entries = int(arguments.get("max_entries", 10000))
+        self.max_bytes = int(arguments.get("max_bytes", 0))
+        self.namespace = str(arguments.get("namespace", "cache"))
+        self.sync_interval = float(arguments.get("sync_interval", 1.0))
+        self._clock: Callable[[], float] = arguments.get("clock", time.monotonic)
+
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[CachedValue, float, int]] = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.shared: CacheBackend | None = None
+        self._generation = ""
+        self._generation_checked_at = -math.inf
+        self._signing_key = str(arguments.get("signing_key") or "").encode()
+        shared_backend = arguments.get("shared_backend")
+        if shared_backend and not self._signing_key:
+            logger.warning(
+                f"No signing key for shared cache tier of '{self.namespace}', "
+                "using in-process tier only"
+            )
+        elif shared_backend:
+            try:
+                self.shared = (
+                    make_region()
+                    .configure(
+                        shared_backend,
+                        arguments=dict(arguments.get("shared_arguments") or {}),
+                    )
+                    .backend
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Shared cache tier '{shared_backend}' unavailable for "
+                    f"'{self.namespace}', using in-process tier only: {e}"
+                )
+
+    # Shared tier helpers
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.namespace}:{self._generation}:{key}"
+
+    def _sign(self, data: bytes) -> bytes:
+        return hmac.new(self._signing_key, data, hashlib.sha256).digest()
+
+    def _shared_get(self, key: str) -> Any:
+        assert self.shared is not None
+        if self.shared.serializer:
+            raw = self.shared.get_serialized(key)
+            if raw is NO_VALUE or raw is None:
+                return NO_VALUE
+            signature, data = raw[:SIGNATURE_LENGTH], raw[SIGNATURE_LENGTH:]
+            if not hmac.compare_digest(signature, self._sign(data)):
+                logger.warning(f"Ignoring unsigned shared cache value for {key}")
+                return NO_VALUE
+            return pickle.loads(data)  # nosec B301 - signature verified above
+        return self.shared.get(key)
+
+    def _shared_set(self, key: str, value: Any) -> None:
+        assert self.shared is not None
+        if self.shared.serializer:
+            data = pickle.dumps(value)
+            self.shared.set_serialized(key, self._sign(data) + data)
+        else:
+            self.shared.set(key, value)
+
+    def _sync_generation(self) -> None:
+        """Drop in-process entries if another process invalidated the region."""
+        now = self._clock()
+        if now - self._generation_checked_at < self.sync_interval:
+            return
+        self._generation_checked_at = now
+
+        try:
+            generation = self._shared_get(f"{self.namespace}:{GENERATION_KEY}")
+        except Exception as e:
+            logger.warning(f"Could not read cache generation for {self.namespace}: {e}")
+            return
+
+        generation = "" if generation is NO_VALUE else str(generation)
+        if generation != self._generation:
+            self._clear_local()
+            self._generation = generation
+
+    # In-process tier helpers
+
+    def _store_local(self, key: str, value: CachedValue, ttl: float) -> None:
+        self._remove_local(key)
+
+        size = estimate_size(value.payload)
+        if self.local_ttl:
+            ttl = min(ttl, self.local_ttl) if ttl > 0 else self.local_ttl
+        expires_at = self._clock() + ttl if ttl > 0 else 0.0
+        self._entries[key] = (value, expires_at, size)
+        self.stats.entries += 1
+        self.stats.bytes += size
+
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes and self.stats.bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove_local(oldest)
+            self.stats.evictions += 1
+
+    def _remove_local(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.stats.entries -= 1
+        self.stats.bytes -= entry[2]
+        return True
+
+    def _clear_local(self) -> None:
+        self._entries.clear()
+        self.stats.entries = 0
+        self.stats.bytes = 0
+
+    # Backend API
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            if self.shared is not None:
+                self._sync_generation()
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at and expires_at <= self._clock():
+                    self._remove_local(key)
+                    self.stats.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+
+            if self.shared is not None:
+                shared_value: CachedValue | NoValue
+                try:
+                    shared_value = self._shared_get(self._shared_key(key))
+                except Exception as e:
+                    logger.warning(f"Shared cache read failed for {key}: {e}")
+                    shared_value = NO_VALUE
+
+                if shared_value is not NO_VALUE:
+                    remaining = self.ttl - shared_value.age if self.ttl else 0.0
+                    if not self.ttl or remaining > 0:
+                        self._store_local(key, shared_value, remaining)
+                        self.stats.hits += 1
+                        self.stats.shared_hits += 1
+                        return shared_value
+
+            self.stats.misses += 1
+            return NO_VALUE
+
+    def get_multi(self, keys: Sequence[str]) -> list[Any]:  # type: ignore[override]
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: CachedValue) -> None:  # type: ignore[override]
+        with self._lock:
+            self._store_local(key, value, self.ttl)
+            self.stats.sets += 1
+
+            if self.shared is not None:
+                try:
+                    self._shared_set(self._shared_key(key), value)
+                except Exception as e:
+                    logger.warning(f"Shared cache write failed for {key}: {e}")
+
+    def set_multi(self, mapping: Mapping[str, CachedValue]) -> None:  # type: ignore[override]
+        for key, value in mapping.items():
+            self.set(key, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove_local(key)
+
+            if self.shared is not None:
+                try:
+                    self.shared.delete(self._shared_key(key))
+                except Exception as e:
+                    logger.warning(f"Shared cache delete failed for {key}: {e}")
+
+    def delete_multi(self, keys: Sequence[str]) -> None:  # type: ignore[override]
+        for key in keys:
+            self.delete(key)
+
+    def invalidate(self) -> None:
+        """Drop every entry of the region in this and all sharing processes."""
+        with self._lock:
+            self._clear_local()
+
+            if self.shared is not None:
+                generation = uuid4().hex
+                try:
+                    self._shared_set(f"{self.namespace}:{GENERATION_KEY}", generation)
+                    self._generation = generation
+                except Exception as e:
+                    logger.warning(
+                        f"Could not invalidate shared cache for {self.namespace}: {e}"
+                    )
+
+
+register_backend(TIERED_MEMORY_BACKEND, __name__, "TieredMemoryBackend")
@@ -2,7 +2,20 @@ from datetime import date, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Date, DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,12 +55,106 @@ class Company(Base):
         back_populates="company",
         lazy="select",
     )
+    tickers: Mapped[list["CompanyTicker"]] = relationship(
+        "CompanyTicker",
+        back_populates="company",
+        lazy="select",
+        cascade="all, delete-orphan",
+    )
+
+
+class CompanyTicker(Base):
+    """Ticker symbols a company trades under, for indexed ticker lookups."""
+
+    __tablename__: str = "company_tickers"
+
+    company_id: Mapped[UUID] = mapped_column(
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    ticker: Mapped[str] = mapped_column(
+        String(10),
+        primary_key=True,
+        index=True,
+    )
+    is_primary: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+    )
+
+    # Relationships
+    company: Mapped["Company"] = relationship(
+        "Company",
+        back_populates="tickers",
+        lazy="select",
+    )
+
+
+class CompanyStats(Base):
+    """Denormalized filing and analysis summary of a company.
+
+    Kept current by the filing and analysis repositories so company pages
+    read one row instead of aggregating filings and analyses.
+    """
+
+    __tablename__: str = "company_stats"
+
+    company_id: Mapped[UUID] = mapped_column(
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    filing_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    filing_counts_by_type: Mapped[dict[str, int]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )
+    latest_filing_date: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+    )
+    analysis_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    latest_analysis_id: Mapped[UUID | None] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        nullable=True,
+    )
+    latest_analysis_confidence: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    latest_analysis_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
 
 class Filing(Base):
     """Filing model for tracking SEC filing processing status."""
 
     __tablename__: str = "filings"
+    __table_args__ = (
+        # Keyset pagination of a company's filings by (filing_date, id)
+        Index("ix_filings_company_date_id", "company_id", "filing_date", "id"),
+        Index(
+            "ix_filings_company_type_date_id",
+            "company_id",
+            "filing_type",
+            "filing_date",
+            "id",
+        ),
+        # Filings of a processing status oldest first, such as the queue of
+        # pending filings
+        Index("ix_filings_status_created_at", "processing_status", "created_at"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
@@ -79,7 +186,6 @@ class Filing(Base):
         String(20),
         nullable=False,
         default="PENDING",
-        index=True,
     )
     processing_error: Mapped[str | None] = mapped_column(
         Text,
@@ -109,6 +215,24 @@ class Analysis(Base):
     """Analysis model for storing LLM analysis results."""
 
     __tablename__: str = "analyses"
+    __table_args__ = (
+        # Keyset pagination of analyses by (sort column, id)
+        Index("ix_analyses_created_at_id", "created_at", "id"),
+        Index("ix_analyses_type_created_at_id", "analysis_type", "created_at", "id"),
+        # Analyses without a score sort lowest, as CONFIDENCE_SORT_KEY of the
+        # analysis repository
+        Index(
+            "ix_analyses_confidence_id", text("coalesce(confidence_score, -1)"), "id"
+        ),
+        Index("ix_analyses_filing_created_at_id", "filing_id", "created_at", "id"),
+        # Analyses of a filing filtered by type, newest first
+        Index(
+            "ix_analyses_filing_type_created_at",
+            "filing_id",
+            "analysis_type",
+            "created_at",
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
@@ -148,6 +272,12 @@ class Analysis(Base):
         nullable=True,
         default=dict,
     )
+    # Summary fields of the results kept in storage, so summaries are read
+    # without loading the full results
+    summary: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON(none_as_null=True),
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -161,3 +291,50 @@ class Analysis(Base):
         back_populates="analyses",
         lazy="joined",
     )
+
+
+class Task(Base):
+    """Task model for tracking the state of background tasks."""
+
+    __tablename__: str = "tasks"
+    __table_args__ = (
+        # Listing a user's tasks, optionally filtered by status, newest first
+        Index("ix_tasks_user_status_created", "user_id", "status", "created_at"),
+        Index("ix_tasks_user_created", "user_id", "created_at"),
+        # Compaction of finished tasks
+        Index("ix_tasks_status_completed", "status", "completed_at"),
+    )
+
+    task_id: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+    )
+    task_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    user_id: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    progress_percent: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    data: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )
@@ -0,0 +1,169 @@
+"""Keyset (cursor) pagination helpers.
+
+Listing endpoints page through results ordered by a sort column with the
+row id as tie-breaker. A cursor records the (sort value, id) of the last
+row of a page; the next page continues strictly after it with a range
+condition instead of an ``OFFSET``, so deep pages cost the same as the
+first one.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or was issued for a
+    different sort order."""
+
+
+def _direction(direction: Any) -> str:
+    """Normalize a sort direction enum or string to ``asc`` or ``desc``."""
+    value = str(getattr(direction, "value", direction) or "desc").lower()
+    return "asc" if value == "asc" else "desc"
+
+
+def _encode_value(value: Any) -> tuple[str, Any]:
+    """Encode a sort value as a (type, JSON value) pair."""
+    if value is None:
+        return "null", None
+    if isinstance(value, datetime):
+        return "datetime", value.isoformat()
+    if isinstance(value, date):
+        return "date", value.isoformat()
+    if isinstance(value, int | float):
+        return "number", value
+    return "str", str(getattr(value, "value", value))
+
+
+def _decode_value(value_type: str, value: Any) -> Any:
+    """Decode a sort value encoded by ``_encode_value``."""
+    if value_type == "null":
+        return None
+    if value_type == "datetime":
+        return datetime.fromisoformat(value)
+    if value_type == "date":
+        return date.fromisoformat(value)
+    if value_type == "number":
+        return float(value)
+    if value_type == "str":
+        return str(value)
+    raise InvalidCursorError(f"Unknown cursor value type: {value_type}")
+
+
+def encode_cursor(sort_key: str, direction: Any, value: Any, row_id: UUID) -> str:
+    """Build an opaque cursor positioned after a row.
+
+    Args:
+        sort_key: Name of the sort column
+        direction: Sort direction ("asc" or "desc")
+        value: Sort column value of the row
+        row_id: ID of the row
+
+    Returns:
+        URL-safe cursor string
+    """
+    value_type, encoded = _encode_value(value)
+    payload = {
+        "k": sort_key,
+        "d": _direction(direction),
+        "t": value_type,
+        "v": encoded,
+        "i": str(row_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, direction: Any) -> tuple[Any, UUID]:
+    """Decode a cursor for the current sort order.
+
+    Args:
+        cursor: Cursor returned with a previous page
+        sort_key: Name of the sort column of the current request
+        direction: Sort direction of the current request
+
+    Returns:
+        Tuple of (sort value, row id) of the last row of the previous page
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different sort order
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_key, cursor_direction = payload["k"], payload["d"]
+        value = _decode_value(payload["t"], payload["v"])
+        row_id = UUID(payload["i"])
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if cursor_key != sort_key or cursor_direction != _direction(direction):
+        raise InvalidCursorError(
+            "Pagination cursor does not match the requested sort order"
+        )
+    return value, row_id
+
+
+def keyset_order_by(
+    column: ColumnElement[Any] | InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[Any],
+    direction: Any,
+) -> list[Any]:
+    """Get the ORDER BY clauses of a keyset-paginated query.
+
+    The sort key must never be NULL; sort nullable columns by a
+    ``coalesce`` expression instead. A (sort key, id) index then serves the
+    order in both directions.
+
+    Args:
+        column: Sort column or expression
+        id_column: Row id column used as tie-breaker
+        direction: Sort direction
+
+    Returns:
+        ORDER BY clauses
+    """
+    if _direction(direction) == "desc":
+        return [column.desc(), id_column.desc()]
+    return [column.asc(), id_column.asc()]
+
+
+def keyset_after(
+    column: ColumnElement[Any] | InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[Any],
+    direction: Any,
+    value: Any,
+    row_id: UUID,
+) -> ColumnElement[bool]:
+    """Get the condition selecting rows after a cursor position.
+
+    Matches the order of ``keyset_order_by``. The position is compared as a
+    row value, ``(column, id) < (value, row_id)``, which the database seeks
+    as a single range of the (sort key, id) index. The implied bound on the
+    sort key alone lets SQLite seek indexes on expressions too, which it
+    cannot do with row values.
+
+    Args:
+        column: Sort column or expression
+        id_column: Row id column used as tie-breaker
+        direction: Sort direction
+        value: Sort value of the last row of the previous page
+        row_id: ID of the last row of the previous page
+
+    Returns:
+        WHERE condition
+    """
+    position = tuple_(column, id_column)
+    if _direction(direction) == "desc":
+        return and_(column <= value, position < (value, row_id))
+    return and_(column >= value, position > (value, row_id))
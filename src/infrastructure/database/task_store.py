@@ -0,0 +1,241 @@
+"""Database-backed store for background task state."""
+
+import base64
+import binascii
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.base import async_session_maker
+from src.infrastructure.database.models import Task
+
+logger = logging.getLogger(__name__)
+
+# Task statuses eligible for TTL compaction
+FINISHED_TASK_STATUSES = ("completed", "failed", "cancelled")
+
+
+@dataclass
+class TaskPage:
+    """A page of task snapshots from a cursor query.
+
+    Attributes:
+        tasks: Task data dictionaries, newest first
+        next_cursor: Opaque cursor for the following page, None on the last page
+    """
+
+    tasks: list[dict[str, Any]] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(created_at: datetime, task_id: str) -> str:
+    """Encode a keyset position as an opaque cursor.
+
+    Args:
+        created_at: Creation time of the last task on the page
+        task_id: Identifier of the last task on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{task_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, task_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, task_id = (
+            base64.urlsafe_b64decode(padded).decode().split("|", maxsplit=1)
+        )
+        return datetime.fromisoformat(created_at), task_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid task cursor: {cursor}") from e
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Convert a stored ISO timestamp to a datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+class TaskStore:
+    """Task state table with indexed per-user listing and TTL compaction.
+
+    Every write is a single ``INSERT ... ON CONFLICT DO UPDATE`` keyed by
+    ``task_id``, so creating a task and each later status update are one
+    round trip and concurrent writers cannot create duplicate rows. The full
+    task snapshot is kept in a JSON column; the columns used for filtering
+    and ordering are denormalized next to it and covered by indexes.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] | None = None
+    ) -> None:
+        """Initialize the task store.
+
+        Args:
+            session_factory: Session factory to use, defaults to the app's
+        """
+        self.session_factory = session_factory or async_session_maker
+
+    @staticmethod
+    def _insert(dialect_name: str) -> Any:
+        """Get the dialect-specific INSERT construct supporting upserts."""
+        if dialect_name == "postgresql":
+            return postgresql.insert(Task)
+        return sqlite.insert(Task)
+
+    async def upsert(self, task_data: dict[str, Any]) -> None:
+        """Insert a task or overwrite its current state.
+
+        Args:
+            task_data: Full task snapshot; must contain ``task_id``
+        """
+        now = datetime.now(UTC)
+        values = {
+            "task_id": task_data["task_id"],
+            "task_type": task_data.get("task_type") or "generic",
+            "status": task_data.get("status") or "unknown",
+            "user_id": task_data.get("user_id"),
+            "progress_percent": task_data.get("progress_percent"),
+            "started_at": _parse_timestamp(task_data.get("started_at")),
+            "completed_at": _parse_timestamp(task_data.get("completed_at")),
+            "created_at": _parse_timestamp(task_data.get("created_at")) or now,
+            "updated_at": _parse_timestamp(task_data.get("updated_at")) or now,
+            "data": task_data,
+        }
+
+        async with self.session_factory() as session:
+            insert = self._insert(session.get_bind().dialect.name).values(**values)
+            stmt = insert.on_conflict_do_update(
+                index_elements=[Task.task_id],
+                set_={
+                    column: getattr(insert.excluded, column)
+                    for column in values
+                    if column not in ("task_id", "created_at")
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get(self, task_id: str) -> dict[str, Any] | None:
+        """Get a task snapshot.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Task data or None if not found
+        """
+        async with self.session_factory() as session:
+            data = await session.scalar(
+                select(Task.data).where(Task.task_id == task_id)
+            )
+            return dict(data) if data is not None else None
+
+    async def list_user_tasks(
+        self,
+        user_id: str,
+        limit: int = 50,
+        status: str | None = None,
+        cursor: str | None = None,
+    ) -> TaskPage:
+        """List a user's tasks newest first using keyset pagination.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of tasks to return
+            status: Optional status filter
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Page of task snapshots
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = select(Task.task_id, Task.created_at, Task.data).where(
+            Task.user_id == user_id
+        )
+        if status is not None:
+            query = query.where(Task.status == status)
+        if cursor is not None:
+            created_at, task_id = decode_cursor(cursor)
+            query = query.where(
+                or_(
+                    Task.created_at < created_at,
+                    and_(Task.created_at == created_at, Task.task_id < task_id),
+                )
+            )
+        query = query.order_by(Task.created_at.desc(), Task.task_id.desc()).limit(
+            limit + 1
+        )
+
+        async with self.session_factory() as session:
+            rows = (await session.execute(query)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].task_id)
+
+        return TaskPage(tasks=[dict(row.data) for row in rows], next_cursor=next_cursor)
+
+    async def delete(self, task_id: str) -> bool:
+        """Delete a task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if a task was deleted
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(delete(Task).where(Task.task_id == task_id))
+            await session.commit()
+            return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def compact(self, retention: timedelta) -> int:
+        """Delete finished tasks that completed longer ago than ``retention``.
+
+        Args:
+            retention: How long finished tasks are kept
+
+        Returns:
+            Number of tasks deleted
+        """
+        cutoff = datetime.now(UTC) - retention
+        async with self.session_factory() as session:
+            result = await session.execute(
+                delete(Task).where(
+                    Task.status.in_(FINISHED_TASK_STATUSES),
+                    Task.completed_at < cutoff,
+                )
+            )
+            await session.commit()
+
+        deleted = int(result.rowcount)  # type: ignore[attr-defined]
+        if deleted:
+            logger.info(f"Compacted {deleted} finished tasks older than {retention}")
+        return deleted
@@ -0,0 +1,128 @@
+"""In-memory ticker to CIK map for the hot company lookup path."""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.base import async_session_maker
+from src.infrastructure.database.models import Company as CompanyModel
+from src.infrastructure.database.models import CompanyTicker as CompanyTickerModel
+
+logger = logging.getLogger(__name__)
+
+# Longest ticker accepted by the Ticker value object and the tickers table
+MAX_TICKER_LENGTH = 10
+
+
+def company_tickers(metadata: dict[str, Any] | None) -> list[str]:
+    """Get the normalized ticker symbols stored in company metadata.
+
+    The primary ticker is kept under ``ticker``; companies with several
+    listed share classes may add the others under ``tickers``.
+
+    Args:
+        metadata: Company metadata
+
+    Returns:
+        Unique upper-case tickers, primary ticker first
+    """
+    if not metadata:
+        return []
+
+    candidates: list[Any] = [metadata.get("ticker")]
+    extra = metadata.get("tickers")
+    if isinstance(extra, list | tuple):
+        candidates.extend(extra)
+
+    tickers: list[str] = []
+    for candidate in candidates:
+        if not isinstance(candidate, str):
+            continue
+        ticker = candidate.strip().upper()
+        if ticker and len(ticker) <= MAX_TICKER_LENGTH and ticker not in tickers:
+            tickers.append(ticker)
+    return tickers
+
+
+class TickerCikMap:
+    """Process-local map of ticker symbols to company CIKs.
+
+    The map is loaded from the ``company_tickers`` table at startup and kept
+    current by the company repository's writes. It is only consulted once
+    loaded; a miss or a stale entry falls back to the indexed database
+    lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, unloaded map."""
+        self._ciks: dict[str, str] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        """Get the number of mapped tickers."""
+        return len(self._ciks)
+
+    def get(self, ticker: str) -> str | None:
+        """Get the CIK of a ticker.
+
+        Args:
+            ticker: Ticker symbol
+
+        Returns:
+            CIK if the map is loaded and contains the ticker, None otherwise
+        """
+        if not self.loaded:
+            return None
+        return self._ciks.get(ticker.upper())
+
+    def register(self, cik: str, tickers: Iterable[str]) -> None:
+        """Map tickers to a company's CIK.
+
+        Args:
+            cik: Company CIK
+            tickers: Ticker symbols the company trades under
+        """
+        if not self.loaded:
+            return
+        for ticker in tickers:
+            self._ciks[ticker.upper()] = cik
+
+    def clear(self) -> None:
+        """Empty the map and mark it unloaded."""
+        self._ciks.clear()
+        self.loaded = False
+
+    async def load(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_maker,
+    ) -> int:
+        """Load every ticker from the database.
+
+        Args:
+            session_factory: Factory for database sessions
+
+        Returns:
+            Number of tickers loaded
+        """
+        stmt = (
+            select(CompanyTickerModel.ticker, CompanyModel.cik).join(
+                CompanyModel, CompanyTickerModel.company_id == CompanyModel.id
+            )
+            # Primary tickers are applied last so they win any collisions
+            .order_by(CompanyTickerModel.is_primary)
+        )
+        async with session_factory() as session:
+            result = await session.execute(stmt)
+            ciks = dict(result.tuples().all())
+
+        self._ciks = ciks
+        self.loaded = True
+        logger.info(f"Loaded {len(ciks)} tickers into the ticker to CIK map")
+        return len(ciks)
+
+
+# Global ticker map instance
+ticker_cik_map = TickerCikMap()
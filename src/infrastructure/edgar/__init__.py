@@ -1,7 +1,8 @@
 """Edgar Tools integration for SEC data access."""
 
-from .service import EdgarService
+from .service import EdgarNotFoundError, EdgarService
 
 __all__ = [
+    "EdgarNotFoundError",
     "EdgarService",
 ]
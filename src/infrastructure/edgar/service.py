@@ -2,22 +2,74 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
+from typing import Any, TypeVar
 
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.region import CacheRegion, make_region
 from edgar import Company, Filing, get_by_accession_number, set_identity
 
 from src.domain.value_objects import CIK, FilingType, Ticker
 from src.domain.value_objects.accession_number import AccessionNumber
+from src.infrastructure.database.cache_backends import TIERED_MEMORY_BACKEND
 from src.infrastructure.edgar.schemas.company_data import CompanyData
 from src.infrastructure.edgar.schemas.filing_data import FilingData
 from src.infrastructure.edgar.schemas.filing_query import FilingQueryParams
+from src.shared import telemetry
 from src.shared.config import settings
 
 # Get logger for this method
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# CIK edgartools gives entities it cannot find
+UNKNOWN_CIK = -999999999
+
+# Lookup caches of the async methods
+FOUND_CACHE_TTL = 86400  # 1 day - company details change rarely
+MISSING_CACHE_TTL = 900  # 15 minutes - new registrants appear eventually
+LOOKUP_CACHE_MAX_ENTRIES = 10000
+
+
+class EdgarNotFoundError(ValueError):
+    """Raised when SEC EDGAR has no company or filing for a lookup."""
+
+
+def _make_lookup_cache(name: str, expiration_time: int) -> CacheRegion:
+    """Create a bounded in-process cache of EDGAR lookups.
+
+    Args:
+        name: Region name
+        expiration_time: Entry TTL in seconds
+
+    Returns:
+        Cache region
+    """
+    return make_region(name=name).configure(
+        TIERED_MEMORY_BACKEND,
+        expiration_time=expiration_time,
+        arguments={
+            "expiration_time": expiration_time,
+            "max_entries": LOOKUP_CACHE_MAX_ENTRIES,
+            "namespace": name,
+        },
+    )
+
+
+# Shared by all service instances, as tasks create a service per call
+_found_lookups = _make_lookup_cache("edgar_found", FOUND_CACHE_TTL)
+_missing_lookups = _make_lookup_cache("edgar_missing", MISSING_CACHE_TTL)
+
 
 class EdgarService:
-    """Service for interacting with SEC EDGAR through edgartools."""
+    """Service for interacting with SEC EDGAR through edgartools.
+
+    edgartools is synchronous, so the ``*_async`` methods run lookups in a
+    worker thread and must be used from the event loop. They also cache
+    lookups, including lookups SEC had no result for, so repeated requests
+    for the same company don't reach SEC.
+    """
 
     def __init__(self) -> None:
         """Initialize Edgar service with SEC identity."""
@@ -28,6 +80,11 @@ class EdgarService:
         set_identity(identity)
         logger.info(f"Edgar service initialized with identity: {identity}")
 
+    @telemetry.timed(
+        telemetry.EDGAR_REQUEST_DURATION,
+        track_outcome=True,
+        operation="company_by_ticker",
+    )
     def get_company_by_ticker(self, ticker: Ticker) -> CompanyData:
         """Get company information by ticker symbol.
 
@@ -38,16 +95,24 @@ class EdgarService:
             Company data from SEC
 
         Raises:
-            ValueError: If company not found
+            EdgarNotFoundError: If SEC has no company with the ticker
+            ValueError: If company cannot be retrieved
         """
         try:
             company = Company(ticker.value)
+            if self._is_not_found(company):
+                raise EdgarNotFoundError(f"No company found for ticker {ticker.value}")
             return self._extract_company_data(company)
+        except EdgarNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(
                 f"Failed to get company for ticker {ticker.value}: {str(e)}"
             ) from e
 
+    @telemetry.timed(
+        telemetry.EDGAR_REQUEST_DURATION, track_outcome=True, operation="company_by_cik"
+    )
     def get_company_by_cik(self, cik: CIK) -> CompanyData:
         """Get company information by CIK.
 
@@ -58,16 +123,24 @@ class EdgarService:
             Company data from SEC
 
         Raises:
-            ValueError: If company not found
+            EdgarNotFoundError: If SEC has no company with the CIK
+            ValueError: If company cannot be retrieved
         """
         try:
             company = Company(int(cik.value))
+            if self._is_not_found(company):
+                raise EdgarNotFoundError(f"No company found for CIK {cik.value}")
             return self._extract_company_data(company)
+        except EdgarNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(
                 f"Failed to get company for CIK {cik.value}: {str(e)}"
             ) from e
 
+    @telemetry.timed(
+        telemetry.EDGAR_REQUEST_DURATION, track_outcome=True, operation="filing"
+    )
     def get_filing(
         self,
         ticker: Ticker,
@@ -359,7 +432,7 @@ class EdgarService:
             return {}
 
     async def get_company_by_cik_async(self, cik: CIK) -> CompanyData:
-        """Async version of get_company_by_cik.
+        """Async, cached version of get_company_by_cik.
 
         Args:
             cik: Central Index Key
@@ -368,9 +441,100 @@ class EdgarService:
             Company data from SEC
 
         Raises:
-            ValueError: If company not found
+            EdgarNotFoundError: If SEC has no company with the CIK
+            ValueError: If company cannot be retrieved
+        """
+        return await self._lookup_async(
+            f"company:cik:{cik.value}", self.get_company_by_cik, cik
+        )
+
+    async def get_company_by_ticker_async(self, ticker: Ticker) -> CompanyData:
+        """Async, cached version of get_company_by_ticker.
+
+        Args:
+            ticker: Company ticker symbol
+
+        Returns:
+            Company data from SEC
+
+        Raises:
+            EdgarNotFoundError: If SEC has no company with the ticker
+            ValueError: If company cannot be retrieved
+        """
+        return await self._lookup_async(
+            f"company:ticker:{ticker.value}", self.get_company_by_ticker, ticker
+        )
+
+    async def get_filing_by_accession_async(
+        self, accession_number: AccessionNumber
+    ) -> FilingData:
+        """Async version of get_filing_by_accession.
+
+        Only missing filings are cached; filing data holds the full document,
+        which callers keep in storage.
+
+        Args:
+            accession_number: SEC accession number
+
+        Returns:
+            Filing data
+
+        Raises:
+            EdgarNotFoundError: If SEC has no filing with the accession number
+            ValueError: If filing cannot be accessed
         """
-        return await asyncio.to_thread(self.get_company_by_cik, cik)
+        return await self._lookup_async(
+            f"filing:accession:{accession_number.value}",
+            self.get_filing_by_accession,
+            accession_number,
+            cache_found=False,
+        )
+
+    async def _lookup_async(
+        self,
+        key: str,
+        lookup: Callable[..., T],
+        *args: Any,
+        cache_found: bool = True,
+    ) -> T:
+        """Run a synchronous lookup in a worker thread, through the caches.
+
+        Args:
+            key: Cache key of the lookup
+            lookup: Synchronous lookup method
+            *args: Arguments of the lookup
+            cache_found: Whether to cache results, not only misses
+
+        Returns:
+            Result of the lookup
+
+        Raises:
+            EdgarNotFoundError: If SEC has no result for the lookup
+        """
+        missing = _missing_lookups.get(key)
+        if missing is not NO_VALUE:
+            raise EdgarNotFoundError(missing)
+        if cache_found:
+            found = _found_lookups.get(key)
+            if found is not NO_VALUE:
+                return found  # type: ignore[no-any-return]
+
+        try:
+            result = await asyncio.to_thread(lookup, *args)
+        except EdgarNotFoundError as e:
+            _missing_lookups.set(key, str(e))
+            raise
+
+        if cache_found:
+            _found_lookups.set(key, result)
+        return result
+
+    @staticmethod
+    def _is_not_found(company: Company) -> bool:
+        """Check whether edgartools could not find a company."""
+        return (
+            company.cik == UNKNOWN_CIK or getattr(company, "not_found", False) is True
+        )
 
     def _extract_company_data(self, company: Company) -> CompanyData:
         """Extract company data from edgartools Company object."""
@@ -471,6 +635,9 @@ class EdgarService:
             sections=sections,
         )
 
+    @telemetry.timed(
+        telemetry.EDGAR_REQUEST_DURATION, track_outcome=True, operation="filings"
+    )
     def get_filings(
         self,
         ticker: Ticker,
@@ -522,6 +689,11 @@ class EdgarService:
         except Exception as e:
             raise ValueError(f"Failed to get filings: {str(e)}") from e
 
+    @telemetry.timed(
+        telemetry.EDGAR_REQUEST_DURATION,
+        track_outcome=True,
+        operation="filing_by_accession",
+    )
     def get_filing_by_accession(self, accession_number: AccessionNumber) -> FilingData:
         """Get filing data by accession number.
 
@@ -532,20 +704,23 @@ class EdgarService:
             Filing data
 
         Raises:
-            ValueError: If filing not found or cannot be accessed
+            EdgarNotFoundError: If SEC has no filing with the accession number
+            ValueError: If filing cannot be accessed
         """
         try:
             # Get filing by accession number
             filing = get_by_accession_number(accession_number.value)
 
             if not filing:
-                raise ValueError(
+                raise EdgarNotFoundError(
                     f"No filing found with accession number: {accession_number.value}"
                 )
 
             # Extract filing data using existing method
             return self._extract_filing_data(filing)
 
+        except EdgarNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(
                 f"Failed to get filing by accession number {accession_number.value}: {str(e)}"
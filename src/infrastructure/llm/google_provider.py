@@ -32,6 +32,7 @@ from src.infrastructure.llm.base import (
     create_section_summary_prompts,
     extract_subsection_schemas,
 )
+from src.shared import telemetry
 from src.shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -82,6 +83,29 @@ class GoogleProvider(BaseLLMProvider):
         # Use shared section schemas
         self.section_schemas = SECTION_SCHEMAS
 
+    def _record_usage(self, response: Any, schema: str) -> None:
+        """Log and count the tokens used by a generation.
+
+        Args:
+            response: Generation returned by the API
+            schema: Name of the schema the generation was for
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return
+        logger.warning(
+            "Tokens used: %d prompt and %d output",
+            usage.prompt_token_count,
+            usage.candidates_token_count,
+        )
+        telemetry.record_llm_tokens(
+            "google",
+            self.model,
+            schema,
+            usage.prompt_token_count,
+            usage.candidates_token_count,
+        )
+
     async def _extract_subsection_text(
         self,
         section_text: str,
@@ -96,22 +120,20 @@ class GoogleProvider(BaseLLMProvider):
         )
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=[
-                    f"You are a text extraction specialist. Extract relevant text for specific subsection analysis from {company_name}'s filing.",
-                    prompt,
-                ],
-                config=types.GenerateContentConfig(**GENERATE_CONFIG),
-            )
-
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    response.usage_metadata.prompt_token_count,
-                    response.usage_metadata.candidates_token_count,
+            with telemetry.observe_llm_call(
+                "google", self.model, subsection_schema.__name__
+            ):
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=[
+                        f"You are a text extraction specialist. Extract relevant text for specific subsection analysis from {company_name}'s filing.",
+                        prompt,
+                    ],
+                    config=types.GenerateContentConfig(**GENERATE_CONFIG),
                 )
 
+            self._record_usage(response, subsection_schema.__name__)
+
             extracted_text = response.text
             if not extracted_text:
                 return section_text
@@ -160,23 +182,21 @@ class GoogleProvider(BaseLLMProvider):
         )
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=f"{system_prompt}\n\n{user_prompt}",
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=subsection_schema,
-                    **GENERATE_CONFIG,
-                ),
-            )
-
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    response.usage_metadata.prompt_token_count,
-                    response.usage_metadata.candidates_token_count,
+            with telemetry.observe_llm_call(
+                "google", self.model, subsection_schema.__name__
+            ):
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=f"{system_prompt}\n\n{user_prompt}",
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=subsection_schema,
+                        **GENERATE_CONFIG,
+                    ),
                 )
 
+            self._record_usage(response, subsection_schema.__name__)
+
             if not response.text:
                 raise ValueError("Empty response from LLM")
 
@@ -310,23 +330,21 @@ class GoogleProvider(BaseLLMProvider):
         )
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=f"{system_prompt}\n\n{user_prompt}",
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=schema_class,
-                    **GENERATE_CONFIG,
-                ),
-            )
-
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    response.usage_metadata.prompt_token_count,
-                    response.usage_metadata.candidates_token_count,
+            with telemetry.observe_llm_call(
+                "google", self.model, schema_class.__name__
+            ):
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=f"{system_prompt}\n\n{user_prompt}",
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=schema_class,
+                        **GENERATE_CONFIG,
+                    ),
                 )
 
+            self._record_usage(response, schema_class.__name__)
+
             if not response.text:
                 return []
 
@@ -476,23 +494,21 @@ class GoogleProvider(BaseLLMProvider):
         )
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=f"{system_prompt}\n\n{user_prompt}",
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=SectionSummaryResponse,
-                    **GENERATE_CONFIG,
-                ),
-            )
-
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    response.usage_metadata.prompt_token_count,
-                    response.usage_metadata.candidates_token_count,
+            with telemetry.observe_llm_call(
+                "google", self.model, SectionSummaryResponse.__name__
+            ):
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=f"{system_prompt}\n\n{user_prompt}",
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=SectionSummaryResponse,
+                        **GENERATE_CONFIG,
+                    ),
                 )
 
+            self._record_usage(response, SectionSummaryResponse.__name__)
+
             summary_result: SectionSummaryResponse = (
                 SectionSummaryResponse.model_validate_json(response.text or "{}")
             )
@@ -541,23 +557,21 @@ class GoogleProvider(BaseLLMProvider):
         )
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=f"{system_prompt}\n\n{user_prompt}",
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=OverallAnalysisResponse,
-                    **GENERATE_CONFIG,
-                ),
-            )
-
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    response.usage_metadata.prompt_token_count,
-                    response.usage_metadata.candidates_token_count,
+            with telemetry.observe_llm_call(
+                "google", self.model, OverallAnalysisResponse.__name__
+            ):
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=f"{system_prompt}\n\n{user_prompt}",
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=OverallAnalysisResponse,
+                        **GENERATE_CONFIG,
+                    ),
                 )
 
+            self._record_usage(response, OverallAnalysisResponse.__name__)
+
             return OverallAnalysisResponse.model_validate_json(response.text or "{}")
 
         except Exception as e:
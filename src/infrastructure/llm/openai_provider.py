@@ -13,6 +13,7 @@ from pydantic import BaseModel as PydanticBaseModel
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.domain.value_objects import FilingType
+from src.shared import telemetry
 from src.shared.config import settings
 
 from .base import (
@@ -93,6 +94,28 @@ class OpenAIProvider(BaseLLMProvider):
         # Use shared section schemas
         self.section_schemas = SECTION_SCHEMAS
 
+    def _record_usage(self, response: Any, schema: str) -> None:
+        """Log and count the tokens used by a completion.
+
+        Args:
+            response: Completion returned by the API
+            schema: Name of the schema the completion was for
+        """
+        if response.usage is None:
+            return
+        try:
+            prompt_tokens = int(response.usage.prompt_tokens)
+            output_tokens = int(response.usage.completion_tokens)
+        except (TypeError, ValueError):
+            logger.warning("Token usage info unavailable")
+            return
+        logger.warning(
+            "Tokens used: %d prompt and %d output", prompt_tokens, output_tokens
+        )
+        telemetry.record_llm_tokens(
+            "openai", self.model, schema, prompt_tokens, output_tokens
+        )
+
     async def _extract_subsection_text(
         self,
         section_text: str,
@@ -107,28 +130,23 @@ class OpenAIProvider(BaseLLMProvider):
         )
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"You are a text extraction specialist. Extract relevant text for specific subsection analysis from {company_name}'s filing.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                **GENERATION_CONFIG,
-                extra_body=EXTRA_BODY,
-            )
+            with telemetry.observe_llm_call(
+                "openai", self.model, subsection_schema.__name__
+            ):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": f"You are a text extraction specialist. Extract relevant text for specific subsection analysis from {company_name}'s filing.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    **GENERATION_CONFIG,
+                    extra_body=EXTRA_BODY,
+                )
 
-            if response.usage is not None:
-                try:
-                    logger.warning(
-                        "Tokens used: %d prompt and %d output",
-                        int(response.usage.prompt_tokens),
-                        int(response.usage.completion_tokens),
-                    )
-                except (TypeError, ValueError):
-                    logger.warning("Token usage info unavailable")
+            self._record_usage(response, subsection_schema.__name__)
 
             extracted_text: str | None = response.choices[0].message.content
             if not extracted_text:
@@ -174,31 +192,26 @@ class OpenAIProvider(BaseLLMProvider):
         )
 
         try:
-            response: ParsedChatCompletion[Any] = (
-                await self.client.chat.completions.parse(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": f"You are a financial analyst specializing in {human_readable_name} analysis. Use the provided schema to structure your focused analysis.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    **GENERATION_CONFIG,
-                    response_format=subsection_schema,
-                    extra_body=EXTRA_BODY,
+            with telemetry.observe_llm_call(
+                "openai", self.model, subsection_schema.__name__
+            ):
+                response: ParsedChatCompletion[Any] = (
+                    await self.client.chat.completions.parse(
+                        model=self.model,
+                        messages=[
+                            {
+                                "role": "system",
+                                "content": f"You are a financial analyst specializing in {human_readable_name} analysis. Use the provided schema to structure your focused analysis.",
+                            },
+                            {"role": "user", "content": prompt},
+                        ],
+                        **GENERATION_CONFIG,
+                        response_format=subsection_schema,
+                        extra_body=EXTRA_BODY,
+                    )
                 )
-            )
 
-            if response.usage is not None:
-                try:
-                    logger.warning(
-                        "Tokens used: %d prompt and %d output",
-                        int(response.usage.prompt_tokens),
-                        int(response.usage.completion_tokens),
-                    )
-                except (TypeError, ValueError):
-                    logger.warning("Token usage info unavailable")
+            self._record_usage(response, subsection_schema.__name__)
 
             if not response.choices[0].message.content:
                 raise ValueError("Empty response from LLM")
@@ -379,29 +392,24 @@ class OpenAIProvider(BaseLLMProvider):
             section_name, company_name, filing_type, section_text
         )
 
-        response: ParsedChatCompletion[Any] = await self.client.chat.completions.parse(
-            model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are a financial analyst. Use the provided schema to structure your analysis of the {section_name} section.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            **GENERATION_CONFIG,
-            response_format=schema_class,
-            extra_body=EXTRA_BODY,
-        )
-
-        if response.usage is not None:
-            try:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    int(response.usage.prompt_tokens),
-                    int(response.usage.completion_tokens),
+        with telemetry.observe_llm_call("openai", self.model, schema_class.__name__):
+            response: ParsedChatCompletion[Any] = (
+                await self.client.chat.completions.parse(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": f"You are a financial analyst. Use the provided schema to structure your analysis of the {section_name} section.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    **GENERATION_CONFIG,
+                    response_format=schema_class,
+                    extra_body=EXTRA_BODY,
                 )
-            except (TypeError, ValueError):
-                logger.warning("Token usage info unavailable")
+            )
+
+        self._record_usage(response, schema_class.__name__)
 
         if not response.choices[0].message.content:
             return []
@@ -444,28 +452,23 @@ class OpenAIProvider(BaseLLMProvider):
             sub_sections, section_name, filing_type, company_name
         )
 
-        response: ParsedChatCompletion[SectionSummaryResponse] = (
-            await self.client.chat.completions.parse(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                **GENERATION_CONFIG,
-                response_format=SectionSummaryResponse,
-                extra_body=EXTRA_BODY,
+        with telemetry.observe_llm_call(
+            "openai", self.model, SectionSummaryResponse.__name__
+        ):
+            response: ParsedChatCompletion[SectionSummaryResponse] = (
+                await self.client.chat.completions.parse(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    **GENERATION_CONFIG,
+                    response_format=SectionSummaryResponse,
+                    extra_body=EXTRA_BODY,
+                )
             )
-        )
 
-        if response.usage is not None:
-            try:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    int(response.usage.prompt_tokens),
-                    int(response.usage.completion_tokens),
-                )
-            except (TypeError, ValueError):
-                logger.warning("Token usage info unavailable")
+        self._record_usage(response, SectionSummaryResponse.__name__)
 
         summary_result: SectionSummaryResponse = (
             SectionSummaryResponse.model_validate_json(
@@ -502,28 +505,23 @@ class OpenAIProvider(BaseLLMProvider):
             section_analyses, filing_type, company_name, analysis_focus
         )
 
-        response: ParsedChatCompletion[OverallAnalysisResponse] = (
-            await self.client.chat.completions.parse(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                **GENERATION_CONFIG,
-                response_format=OverallAnalysisResponse,
-                extra_body=EXTRA_BODY,
+        with telemetry.observe_llm_call(
+            "openai", self.model, OverallAnalysisResponse.__name__
+        ):
+            response: ParsedChatCompletion[OverallAnalysisResponse] = (
+                await self.client.chat.completions.parse(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    **GENERATION_CONFIG,
+                    response_format=OverallAnalysisResponse,
+                    extra_body=EXTRA_BODY,
+                )
             )
-        )
 
-        if response.usage is not None:
-            try:
-                logger.warning(
-                    "Tokens used: %d prompt and %d output",
-                    int(response.usage.prompt_tokens),
-                    int(response.usage.completion_tokens),
-                )
-            except (TypeError, ValueError):
-                logger.warning("Token usage info unavailable")
+        self._record_usage(response, OverallAnalysisResponse.__name__)
 
         return OverallAnalysisResponse.model_validate_json(
             response.choices[0].message.content or "{}"
@@ -6,18 +6,23 @@ from .factory import (
     cleanup_services,
     get_queue_service,
     get_registry,
+    get_result_backend,
     get_storage_service,
     get_worker_service,
     initialize_services,
 )
 from .interfaces import (
     IQueueService,
+    IResultBackend,
     IStorageService,
     IWorkerService,
+    StoredObject,
+    TaskEvent,
     TaskMessage,
     TaskPriority,
     TaskResult,
     TaskStatus,
+    TaskSubscription,
 )
 from .task_service import (
     AsyncResult,
@@ -32,18 +37,23 @@ from .task_service import (
 __all__ = [
     # Interfaces
     "IQueueService",
+    "IResultBackend",
     "IStorageService",
     "IWorkerService",
+    "StoredObject",
+    "TaskEvent",
     "TaskMessage",
     "TaskPriority",
     "TaskResult",
     "TaskStatus",
+    "TaskSubscription",
     # Factory and registry
     "MessagingFactory",
     "ServiceRegistry",
     "cleanup_services",
     "get_queue_service",
     "get_registry",
+    "get_result_backend",
     "get_storage_service",
     "get_worker_service",
     "initialize_services",
@@ -7,7 +7,7 @@ from typing import Any
 from src.shared.config.settings import Settings
 
 # Lazy imports - only import what we need for each environment
-from .interfaces import IQueueService, IStorageService, IWorkerService
+from .interfaces import IQueueService, IResultBackend, IStorageService, IWorkerService
 
 logger = logging.getLogger(__name__)
 
@@ -184,6 +184,61 @@ class MessagingFactory:
                 f"Unsupported storage service type: {settings.storage_service_type}"
             )
 
+    @staticmethod
+    def create_result_backend(
+        settings: Settings,
+        storage_service: IStorageService | None = None,
+        **kwargs: Any,
+    ) -> IResultBackend:
+        """Create task result backend based on settings.
+
+        Args:
+            settings: Application settings
+            storage_service: Storage service (required for the SQS fallback)
+            **kwargs: Additional provider-specific configuration
+
+        Returns:
+            Result backend implementation
+        """
+        if settings.queue_service_type == "rabbitmq":
+            # Use a RabbitMQ topic exchange for push notifications
+            try:
+                from .implementations.rabbitmq_result_backend import (
+                    RabbitMQResultBackend,
+                )
+
+                connection_url = kwargs.get("rabbitmq_url", settings.rabbitmq_url)
+                return RabbitMQResultBackend(
+                    connection_url=connection_url, storage_service=storage_service
+                )
+            except ImportError as e:
+                raise ImportError(
+                    "RabbitMQ dependencies not available for development environment. "
+                    "Install with: poetry add aio-pika"
+                ) from e
+
+        elif settings.queue_service_type == "mock":
+            # Use in-process event bus for testing
+            from .implementations.event_bus import InProcessResultBackend
+
+            return InProcessResultBackend()
+
+        elif settings.queue_service_type == "sqs":
+            # SQS has no pub/sub, fall back to storage-backed events
+            from .implementations.storage_result_backend import StorageResultBackend
+
+            if storage_service is None:
+                raise ValueError("storage_service is required for SQS result backend")
+            return StorageResultBackend(
+                storage_service=storage_service,
+                poll_interval=settings.result_backend_poll_interval,
+            )
+
+        else:
+            raise ValueError(
+                f"Unsupported queue service type: {settings.queue_service_type}"
+            )
+
 
 class ServiceRegistry:
     """Registry for managing service instances."""
@@ -193,10 +248,13 @@ class ServiceRegistry:
         self._queue_service: IQueueService | None = None
         self._worker_service: IWorkerService | None = None
         self._storage_service: IStorageService | None = None
+        self._result_backend: IResultBackend | None = None
+        self._config: dict[str, Any] = {}
         self._connected = False
 
     async def initialize(self, **config: Any) -> None:
         """Initialize all services with configuration."""
+        self._config = config
         try:
             # Create services
             self._queue_service = MessagingFactory.create_queue_service(
@@ -228,6 +286,13 @@ class ServiceRegistry:
 
     async def cleanup(self) -> None:
         """Cleanup all services."""
+        if self._result_backend:
+            try:
+                await self._result_backend.disconnect()
+            except Exception as e:
+                logger.warning(f"Error disconnecting result backend: {e}")
+            self._result_backend = None
+
         if self._worker_service:
             try:
                 await self._worker_service.stop()
@@ -270,6 +335,24 @@ class ServiceRegistry:
             raise RuntimeError("Services not initialized. Call initialize() first.")
         return self._storage_service
 
+    async def get_result_backend(self) -> IResultBackend:
+        """Get result backend instance, connecting it on first use.
+
+        The result backend is created lazily because only processes waiting
+        on or publishing task events need it.
+        """
+        if self._result_backend is None:
+            if not self._connected:
+                raise RuntimeError("Services not initialized. Call initialize() first.")
+
+            result_backend = MessagingFactory.create_result_backend(
+                self.settings, storage_service=self._storage_service, **self._config
+            )
+            await result_backend.connect()
+            self._result_backend = result_backend
+
+        return self._result_backend
+
     @property
     def is_connected(self) -> bool:
         """Check if services are connected."""
@@ -357,3 +440,9 @@ async def get_storage_service() -> IStorageService:
     """Get the storage service instance."""
     registry = await get_registry()
     return registry.storage_service
+
+
+async def get_result_backend() -> IResultBackend:
+    """Get the result backend instance."""
+    registry = await get_registry()
+    return await registry.get_result_backend()
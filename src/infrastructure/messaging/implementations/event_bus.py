@@ -0,0 +1,85 @@
+"""In-process event bus used as result backend for local and test setups."""
+
+import logging
+from collections import OrderedDict
+
+from ..interfaces import IResultBackend, TaskEvent, TaskSubscription
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessResultBackend(IResultBackend):
+    """In-process publish/subscribe result backend.
+
+    Events are fanned out to subscriptions registered in the same process.
+    Terminal events are retained (bounded, oldest evicted first) so that
+    waiters subscribing after a task finished still see its outcome.
+    """
+
+    def __init__(self, max_retained_results: int = 10000) -> None:
+        self._subscribers: dict[str, set[TaskSubscription]] = {}
+        self._results: OrderedDict[str, TaskEvent] = OrderedDict()
+        self.max_retained_results = max_retained_results
+        self._connected = False
+
+    async def connect(self) -> None:
+        """Connect to the event bus (no-op)."""
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        """Close all subscriptions and disconnect."""
+        for subscriptions in list(self._subscribers.values()):
+            for subscription in list(subscriptions):
+                await subscription.close()
+        self._subscribers.clear()
+        self._connected = False
+
+    async def publish(self, event: TaskEvent) -> None:
+        """Publish an event to local subscribers."""
+        self._retain(event)
+        self._dispatch(event)
+
+    async def subscribe(self, task_id: str) -> TaskSubscription:
+        """Register a local subscription for a task."""
+        subscription = TaskSubscription(task_id, on_close=self._unsubscribe)
+        self._subscribers.setdefault(task_id, set()).add(subscription)
+        return subscription
+
+    async def get_result(self, task_id: str) -> TaskEvent | None:
+        """Get the retained terminal event of a task."""
+        return self._results.get(task_id)
+
+    async def health_check(self) -> bool:
+        """Check if event bus is connected."""
+        return self._connected
+
+    def _retain(self, event: TaskEvent) -> None:
+        """Retain terminal events for late subscribers."""
+        if not event.terminal:
+            return
+
+        self._results[event.task_id] = event
+        self._results.move_to_end(event.task_id)
+        while len(self._results) > self.max_retained_results:
+            self._results.popitem(last=False)
+
+    def _dispatch(self, event: TaskEvent) -> None:
+        """Deliver an event to local subscriptions of its task."""
+        for subscription in list(self._subscribers.get(event.task_id, ())):
+            subscription.deliver(event)
+
+    async def _unsubscribe(self, subscription: TaskSubscription) -> None:
+        """Remove a closed subscription."""
+        subscriptions = self._subscribers.get(subscription.task_id)
+        if subscriptions is None:
+            return
+
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.task_id]
+
+    def get_subscriber_count(self, task_id: str | None = None) -> int:
+        """Get number of open subscriptions (for monitoring and tests)."""
+        if task_id is not None:
+            return len(self._subscribers.get(task_id, ()))
+        return sum(len(subs) for subs in self._subscribers.values())
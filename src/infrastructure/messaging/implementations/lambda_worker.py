@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from mypy_boto3_lambda import LambdaClient
     from mypy_boto3_lambda.literals import InvocationTypeType
 
-from ..interfaces import IWorkerService, TaskResult, TaskStatus
+from ..interfaces import IWorkerService, TaskEvent, TaskResult, TaskStatus
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +117,15 @@ class LambdaWorkerService(IWorkerService):
         else:
             self.stats["tasks_failed"] += 1
 
+        # Notify waiters through the (storage-backed) result backend
+        try:
+            from ..factory import get_result_backend
+
+            result_backend = await get_result_backend()
+            await result_backend.publish(TaskEvent.from_task_result(result))
+        except Exception as e:
+            logger.warning(f"Failed to publish result for task {result.task_id}: {e}")
+
     async def get_worker_stats(self) -> dict[str, Any]:
         """Get worker statistics."""
         uptime = None
@@ -1,13 +1,17 @@
 """Local file-based storage service for development."""
 
+import asyncio
 import json
 import logging
 import shutil
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from ..interfaces import IStorageService
+from src.shared import serialization
+
+from ..interfaces import STREAM_CHUNK_SIZE, IStorageService, StoredObject
 
 logger = logging.getLogger(__name__)
 
@@ -157,8 +161,7 @@ class LocalFileStorageService(IStorageService):
             return None
 
         try:
-            with open(file_path, encoding='utf-8') as f:
-                content = json.load(f)
+            content = serialization.loads(file_path.read_bytes())
 
             logger.debug(f"Retrieved key from file: {key}")
             return content
@@ -167,6 +170,84 @@ class LocalFileStorageService(IStorageService):
             logger.error(f"Failed to read file for key {key}: {e}")
             return None
 
+    async def get_raw(self, key: str) -> bytes | None:
+        """Get the stored JSON of a key without parsing it."""
+        if not self._connected:
+            await self.connect()
+
+        # Check if expired
+        if self._is_expired(key):
+            self._remove_expired(key)
+            return None
+
+        file_path = self._get_file_path(key)
+
+        try:
+            return file_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read file for key {key}: {e}")
+            return None
+
+    async def open(self, key: str) -> StoredObject | None:
+        """Open a stored file for reading in chunks."""
+        if not self._connected:
+            await self.connect()
+
+        # Check if expired
+        if self._is_expired(key):
+            self._remove_expired(key)
+            return None
+
+        try:
+            size = self._get_file_path(key).stat().st_size
+        except FileNotFoundError:
+            return None
+        return StoredObject(self, key, size)
+
+    async def stream(
+        self,
+        key: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a stored file, one chunk in memory at a time."""
+        file_path = self._get_file_path(key)
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(f.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def set_raw(
+        self, key: str, data: bytes, ttl: timedelta | None = None
+    ) -> bool:
+        """Write serialized content to a file as is."""
+        if not self._connected:
+            await self.connect()
+
+        file_path = self._get_file_path(key)
+
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(data)
+            self._save_metadata(key, ttl)
+
+            logger.debug(f"Saved key to file: {key} at {file_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to write file for key {key}: {e}")
+            return False
+
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """Set a value with optional TTL in file storage."""
         if not self._connected:
@@ -179,8 +260,7 @@ class LocalFileStorageService(IStorageService):
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write content to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(value, f, indent=2, default=str)
+            file_path.write_bytes(serialization.dumps(value, indent=True))
 
             # Save metadata including TTL
             self._save_metadata(key, ttl)
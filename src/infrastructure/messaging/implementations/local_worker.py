@@ -2,21 +2,27 @@
 
 import asyncio
 import logging
+import time
 import traceback
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any, TypedDict
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from opentelemetry.trace import SpanKind
+
+from src.shared import telemetry
 from src.shared.config.settings import settings
 
 from ..interfaces import (
     IQueueService,
     IWorkerService,
+    TaskEvent,
     TaskMessage,
     TaskResult,
     TaskStatus,
 )
+from ..retry import compute_retry_delay
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +51,15 @@ class LocalWorkerService(IWorkerService):
         self.min_sleep = settings.worker_min_sleep
         self.max_sleep = settings.worker_max_sleep
         self.backoff_factor = settings.worker_backoff_factor
+        self.batch_size = max(1, settings.worker_batch_size)
+        self.heartbeat_interval = settings.task_heartbeat_interval
+        self.visibility_timeout = settings.task_visibility_timeout
+        self.queue_depth_interval = settings.queue_depth_sample_interval
         self.current_sleep = self.min_sleep
+        self._queue_depth_sampled_at = float("-inf")
+
+        # Visibility heartbeats of the received tasks not yet finished
+        self._heartbeats: dict[UUID, asyncio.Task[None]] = {}
 
         self.stats: WorkerStats = {
             "tasks_processed": 0,
@@ -97,9 +111,7 @@ class LocalWorkerService(IWorkerService):
             logger.debug(f"Unregistered task handler: {name}")
 
     async def submit_task_result(self, result: TaskResult) -> None:
-        """Submit task execution result."""
-        # For local worker, we just log the result
-        # In a real implementation, this might send to a result backend
+        """Submit task execution result to the result backend."""
         logger.info(
             f"Task {result.task_id} completed with status {result.status.value}"
         )
@@ -109,6 +121,18 @@ class LocalWorkerService(IWorkerService):
         else:
             self.stats["tasks_failed"] += 1
 
+        await self._publish_result(result)
+
+    async def _publish_result(self, result: TaskResult) -> None:
+        """Publish the task outcome so waiting clients wake immediately."""
+        try:
+            from ..factory import get_result_backend
+
+            result_backend = await get_result_backend()
+            await result_backend.publish(TaskEvent.from_task_result(result))
+        except Exception as e:
+            logger.warning(f"Failed to publish result for task {result.task_id}: {e}")
+
     async def get_worker_stats(self) -> dict[str, Any]:
         """Get worker statistics."""
         uptime = None
@@ -145,6 +169,7 @@ class LocalWorkerService(IWorkerService):
 
         while self.running:
             try:
+                await self._sample_queue_depths(queues)
                 tasks_found = False
 
                 # Round-robin through queues
@@ -152,18 +177,11 @@ class LocalWorkerService(IWorkerService):
                     if not self.running:
                         break
 
-                    # Try to get a task from this queue
-                    task = await self.queue_service.receive_task(
-                        queue=queue_name,
-                        timeout=(
-                            int(self.queue_timeout)
-                            if self.queue_timeout is not None
-                            else None
-                        ),
-                    )
+                    # Try to get tasks from this queue
+                    tasks = await self._receive_tasks(queue_name)
+                    await self._process_tasks(tasks)
 
-                    if task:
-                        await self._process_task(task)
+                    if tasks:
                         tasks_found = True
                         # Reset sleep time when we find tasks
                         self.current_sleep = self.min_sleep
@@ -180,8 +198,88 @@ class LocalWorkerService(IWorkerService):
                 logger.error(f"Error in worker loop: {e}", exc_info=True)
                 await asyncio.sleep(1)  # Longer pause on error
 
+    async def _sample_queue_depths(self, queues: list[str]) -> None:
+        """Record the depth of the queues, at most once per sample interval."""
+        now = time.monotonic()
+        if (
+            not settings.prometheus_enabled
+            or now - self._queue_depth_sampled_at < self.queue_depth_interval
+        ):
+            return
+        self._queue_depth_sampled_at = now
+
+        for queue_name in queues:
+            try:
+                depth = await self.queue_service.get_queue_size(queue_name)
+                telemetry.QUEUE_DEPTH.labels(queue=queue_name).set(depth)
+            except Exception as e:
+                logger.warning(f"Failed to sample depth of queue {queue_name}: {e}")
+
+    async def _receive_tasks(self, queue_name: str) -> list[TaskMessage]:
+        """Fetch up to ``batch_size`` tasks from a queue in one call."""
+        timeout = int(self.queue_timeout) if self.queue_timeout is not None else None
+
+        # Queue services deliver by priority and per-user fair share, so tasks
+        # are run in the order received
+        if self.batch_size > 1:
+            return await self.queue_service.receive_tasks(
+                queue=queue_name, max_messages=self.batch_size, timeout=timeout
+            )
+
+        task: TaskMessage | None = await self.queue_service.receive_task(
+            queue=queue_name, timeout=timeout
+        )
+        return [task] if task else []
+
+    async def _process_tasks(self, tasks: list[TaskMessage]) -> None:
+        """Process received tasks in order, keeping all of them reserved.
+
+        Tasks waiting for their turn in a batch are heartbeated from the
+        moment they are received, so they are not redelivered while the
+        worker holds them.
+        """
+        for task in tasks:
+            self._reserve(task)
+        try:
+            for task in tasks:
+                await self._process_task(task)
+        finally:
+            for task in tasks:
+                self._release(task)
+
+    def _reserve(self, task: TaskMessage) -> None:
+        """Start extending the visibility of a received task, once."""
+        if task.task_id not in self._heartbeats:
+            self._heartbeats[task.task_id] = asyncio.create_task(self._heartbeat(task))
+
+    def _release(self, task: TaskMessage) -> None:
+        """Stop extending the visibility of a task."""
+        heartbeat = self._heartbeats.pop(task.task_id, None)
+        if heartbeat is not None:
+            heartbeat.cancel()
+
     async def _process_task(self, task: TaskMessage) -> None:
-        """Process a single task."""
+        """Process a single task, in the trace of the request that queued it."""
+        started = time.perf_counter()
+        with telemetry.span(
+            f"process {task.task_name}",
+            kind=SpanKind.CONSUMER,
+            context=telemetry.extract_trace_context(task.metadata),
+            task_id=str(task.task_id),
+            retry_count=task.retry_count,
+        ):
+            result = await self._run_task(task)
+
+        if settings.prometheus_enabled:
+            telemetry.WORKER_BUSY_SECONDS.labels(task=task.task_name).inc(
+                time.perf_counter() - started
+            )
+            telemetry.WORKER_TASKS.labels(
+                task=task.task_name, status=result.status.value
+            ).inc()
+
+    async def _run_task(self, task: TaskMessage) -> TaskResult:
+        """Run a task, retrying or failing it on errors, and submit its result."""
         logger.info(f"Processing task {task.task_id}: {task.task_name}")
         self.stats["tasks_processed"] += 1
 
@@ -193,6 +291,9 @@ class LocalWorkerService(IWorkerService):
             worker_id=self.worker_id,
         )
 
+        # Keep the task reserved while it runs so it is not redelivered
+        self._reserve(task)
+
         try:
             # Check if we have a handler for this task
             if task.task_name not in self.task_handlers:
@@ -229,6 +330,7 @@ class LocalWorkerService(IWorkerService):
             # Decide whether to retry or fail permanently
             if task.retry_count < task.max_retries:
                 # Increment retry count and requeue with exponential backoff
+                result.status = TaskStatus.RETRY
                 await self._requeue_task_with_retry(task, error_msg)
             else:
                 # Permanently fail - send to dead letter queue
@@ -251,6 +353,7 @@ class LocalWorkerService(IWorkerService):
             # Decide whether to retry or fail permanently
             if task.retry_count < task.max_retries:
                 # Increment retry count and requeue with exponential backoff
+                result.status = TaskStatus.RETRY
                 await self._requeue_task_with_retry(task, error_msg)
             else:
                 # Permanently fail - send to dead letter queue
@@ -260,9 +363,29 @@ class LocalWorkerService(IWorkerService):
                 )
 
         finally:
+            self._release(task)
+
             # Submit the result
             await self.submit_task_result(result)
 
+        return result
+
+    async def _heartbeat(self, task: TaskMessage) -> None:
+        """Periodically extend the visibility of a running task."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                extended = await self.queue_service.extend_visibility(
+                    task.task_id, self.visibility_timeout
+                )
+                if not extended:
+                    logger.warning(
+                        f"Could not extend visibility of task {task.task_id}, "
+                        "it may be redelivered"
+                    )
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for task {task.task_id}: {e}")
+
     async def _execute_handler(
         self, handler: Callable[..., Any], task: TaskMessage
     ) -> Any:
@@ -286,18 +409,8 @@ class LocalWorkerService(IWorkerService):
         # Increment retry count
         task.retry_count += 1
 
-        # Calculate exponential backoff delay (in seconds)
-        # Formula: base_delay * (2^retry_count) with jitter
-        base_delay = settings.task_retry_base_delay
-        delay = min(
-            base_delay * (2 ** (task.retry_count - 1)), settings.task_retry_max_delay
-        )
-
-        # Add some jitter to prevent thundering herd
-        import secrets
-
-        jitter_factor = 0.8 + (secrets.randbelow(401) / 1000)
-        delay *= jitter_factor
+        # Exponential backoff with jitter (in seconds)
+        delay = compute_retry_delay(task.retry_count)
 
         logger.info(
             f"Requeuing task {task.task_id} for retry {task.retry_count}/{task.max_retries} "
@@ -324,11 +437,6 @@ class LocalWorkerService(IWorkerService):
             },
         )
 
-        # First nack the current message
-        await self.queue_service.nack_task(task.task_id, requeue=False)
-
-        # Wait for the delay
-        await asyncio.sleep(delay)
-
-        # Send the retry task
-        await self.queue_service.send_task(retry_task)
+        # Hand the delay to the broker instead of blocking this worker
+        if not await self.queue_service.retry_task(retry_task, delay):
+            logger.error(f"Failed to schedule retry for task {task.task_id}")
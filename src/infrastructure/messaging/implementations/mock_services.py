@@ -15,16 +15,27 @@ from ..interfaces import (
     TaskResult,
     TaskStatus,
 )
+from ..retry import TimerWheel
+from ..scheduling import FairShareQueue
 
 
 class MockQueueService(IQueueService):
     """Mock queue service for testing."""
 
     def __init__(self) -> None:
-        self.queues: dict[str, list[TaskMessage]] = {}
+        self.queues: dict[str, FairShareQueue] = {}
         self.task_statuses: dict[UUID, TaskStatus] = {}
         self.connected = False
         self.call_log: list[tuple[str, Any]] = []
+        self.in_flight: dict[UUID, TaskMessage] = {}
+        self.dead_letters: dict[str, list[TaskMessage]] = {}
+        self.delayed: TimerWheel[TaskMessage] = TimerWheel(tick=0.1)
+
+    def _release_delayed(self) -> None:
+        """Move retries whose delay has elapsed back onto their queues."""
+        for message in self.delayed.advance():
+            self.queues.setdefault(message.queue, FairShareQueue()).push(message)
+            self.task_statuses[message.task_id] = TaskStatus.PENDING
 
     async def connect(self) -> None:
         self.connected = True
@@ -40,14 +51,25 @@ class MockQueueService(IQueueService):
 
         queue_name = message.queue
         if queue_name not in self.queues:
-            self.queues[queue_name] = []
+            self.queues[queue_name] = FairShareQueue()
 
-        self.queues[queue_name].append(message)
+        self.queues[queue_name].push(message)
         self.task_statuses[message.task_id] = TaskStatus.PENDING
         self.call_log.append(("send_task", message))
 
         return message.task_id
 
+    async def send_tasks(self, messages: list[TaskMessage]) -> list[UUID]:
+        if not self.connected:
+            raise RuntimeError("Not connected")
+
+        for message in messages:
+            self.queues.setdefault(message.queue, FairShareQueue()).push(message)
+            self.task_statuses[message.task_id] = TaskStatus.PENDING
+        self.call_log.append(("send_tasks", messages))
+
+        return [message.task_id for message in messages]
+
     async def receive_task(
         self, queue: str = "default", timeout: int | None = None
     ) -> TaskMessage | None:
@@ -55,27 +77,105 @@ class MockQueueService(IQueueService):
             raise RuntimeError("Not connected")
 
         self.call_log.append(("receive_task", {"queue": queue, "timeout": timeout}))
+        self._release_delayed()
 
         if queue not in self.queues or not self.queues[queue]:
             return None
 
-        message = self.queues[queue].pop(0)
+        message = self.queues[queue].pop()
+        if message is None:
+            return None
         self.task_statuses[message.task_id] = TaskStatus.RUNNING
+        self.in_flight[message.task_id] = message
         return message
 
+    async def receive_tasks(
+        self,
+        queue: str = "default",
+        max_messages: int = 10,
+        timeout: int | None = None,
+    ) -> list[TaskMessage]:
+        if not self.connected:
+            raise RuntimeError("Not connected")
+
+        self.call_log.append(
+            (
+                "receive_tasks",
+                {"queue": queue, "max_messages": max_messages, "timeout": timeout},
+            )
+        )
+
+        self._release_delayed()
+
+        pending = self.queues.get(queue)
+        messages = pending.pop_many(max_messages) if pending else []
+        for message in messages:
+            self.task_statuses[message.task_id] = TaskStatus.RUNNING
+            self.in_flight[message.task_id] = message
+        return messages
+
     async def ack_task(self, task_id: UUID) -> bool:
+        self.in_flight.pop(task_id, None)
         self.task_statuses[task_id] = TaskStatus.SUCCESS
         self.call_log.append(("ack_task", task_id))
         return True
 
+    async def ack_tasks(self, task_ids: list[UUID]) -> list[UUID]:
+        for task_id in task_ids:
+            self.in_flight.pop(task_id, None)
+            self.task_statuses[task_id] = TaskStatus.SUCCESS
+        self.call_log.append(("ack_tasks", task_ids))
+        return list(task_ids)
+
     async def nack_task(self, task_id: UUID, requeue: bool = True) -> bool:
+        message = self.in_flight.pop(task_id, None)
         if requeue:
             self.task_statuses[task_id] = TaskStatus.RETRY
+            if message is not None:
+                self.queues.setdefault(message.queue, FairShareQueue()).push(message)
         else:
             self.task_statuses[task_id] = TaskStatus.FAILURE
+            if message is not None:
+                self.dead_letters.setdefault(message.queue, []).append(message)
         self.call_log.append(("nack_task", {"task_id": task_id, "requeue": requeue}))
         return True
 
+    async def retry_task(self, message: TaskMessage, delay: float) -> bool:
+        self.in_flight.pop(message.task_id, None)
+        self.task_statuses[message.task_id] = TaskStatus.RETRY
+        self.delayed.schedule(message, delay)
+        self.call_log.append(
+            ("retry_task", {"task_id": message.task_id, "delay": delay})
+        )
+        return True
+
+    async def extend_visibility(self, task_id: UUID, timeout: int) -> bool:
+        self.call_log.append(
+            ("extend_visibility", {"task_id": task_id, "timeout": timeout})
+        )
+        return task_id in self.in_flight
+
+    async def get_dead_letter_tasks(
+        self, queue: str = "default", limit: int = 10
+    ) -> list[TaskMessage]:
+        return list(self.dead_letters.get(queue, [])[:limit])
+
+    async def requeue_dead_letter_tasks(
+        self, queue: str = "default", limit: int | None = None
+    ) -> int:
+        dead_letters = self.dead_letters.get(queue, [])
+        count = len(dead_letters) if limit is None else min(limit, len(dead_letters))
+
+        for message in dead_letters[:count]:
+            self.queues.setdefault(queue, FairShareQueue()).push(message)
+            self.task_statuses[message.task_id] = TaskStatus.PENDING
+        del dead_letters[:count]
+
+        self.call_log.append(
+            ("requeue_dead_letter_tasks", {"queue": queue, "count": count})
+        )
+        return count
+
     async def get_task_status(self, task_id: UUID) -> TaskStatus | None:
         self.call_log.append(("get_task_status", task_id))
         return self.task_statuses.get(task_id)
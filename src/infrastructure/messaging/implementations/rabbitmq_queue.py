@@ -12,6 +12,7 @@ from aio_pika import ExchangeType, Message
 from aio_pika.abc import (
     AbstractChannel,
     AbstractExchange,
+    AbstractIncomingMessage,
     AbstractQueue,
     AbstractRobustConnection,
 )
@@ -20,25 +21,62 @@ if TYPE_CHECKING:
     from pamqp.common import Arguments
 
 from src.application.patterns.circuit_breaker import CircuitBreaker
+from src.shared.config.settings import settings
 
 from ..interfaces import IQueueService, TaskMessage, TaskPriority, TaskStatus
+from ..retry import retry_delay_bucket
+from ..scheduling import (
+    RoundRobin,
+    WeightedPriorityDrainer,
+    fair_share_lane,
+    fair_share_queue_name,
+    priority_queue_name,
+)
 
 logger = logging.getLogger(__name__)
 
+# Number of publishes awaited together when sending task batches
+PUBLISH_BATCH_SIZE = 100
+
+# Headers exchange routing delayed retries into per-delay TTL queues
+RETRY_EXCHANGE = "aperilex_retry"
+
 
 class RabbitMQQueueService(IQueueService):
     """RabbitMQ implementation for local development and testing."""
 
-    def __init__(self, connection_url: str = "amqp://localhost:5672/") -> None:
+    def __init__(
+        self,
+        connection_url: str = "amqp://localhost:5672/",
+        prefetch_count: int | None = None,
+        fair_share_lanes: int | None = None,
+    ) -> None:
         self.connection_url = connection_url
+        self.prefetch_count = prefetch_count or settings.rabbitmq_prefetch_count
+        self.fair_share_lanes = max(
+            1, fair_share_lanes or settings.rabbitmq_fair_share_lanes
+        )
         self.connection: AbstractRobustConnection | None = None
         self.channel: AbstractChannel | None = None
         self.exchange: AbstractExchange | None = None
         self.dlx: AbstractExchange | None = None
+        self.retry_exchange: AbstractExchange | None = None
         self.queues: dict[str, AbstractQueue] = {}
+        self.dead_letter_queues: dict[str, AbstractQueue] = {}
+        self.retry_queues: dict[int, AbstractQueue] = {}
         self.task_statuses: dict[UUID, TaskStatus] = {}
         self._connected = False
 
+        # Deliveries pushed by per-sub-queue consumers, bounded by the channel
+        # prefetch, and a per-queue event signalling that any of them has data
+        self._consumer_buffers: dict[str, asyncio.Queue[AbstractIncomingMessage]] = {}
+        self._deliveries_ready: dict[str, asyncio.Event] = {}
+        self._drainers: dict[str, WeightedPriorityDrainer] = {}
+        # Rotation over the fair-share lanes of each priority sub-queue
+        self._lane_rotations: dict[str, RoundRobin[str]] = {}
+        # Delivery tags handed out but not yet acked or nacked
+        self._unacked_tags: set[int] = set()
+
         # Circuit breakers for different operations
         self._health_circuit_breaker = CircuitBreaker(
             service_name="rabbitmq_health_check",
@@ -76,8 +114,8 @@ class RabbitMQQueueService(IQueueService):
         self.connection = await aio_pika.connect_robust(self.connection_url)
         self.channel = await self.connection.channel()
 
-        # Set quality of service for fair task distribution
-        await self.channel.set_qos(prefetch_count=1)
+        # Bound unacknowledged deliveries per consumer for batched receives
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
 
         # Declare default exchange
         self.exchange = await self.channel.declare_exchange(
@@ -89,6 +127,12 @@ class RabbitMQQueueService(IQueueService):
             "aperilex_dlx", ExchangeType.DIRECT, durable=True
         )
 
+        # Declare retry exchange; expired retries dead-letter back to the tasks
+        # exchange with their original routing key
+        self.retry_exchange = await self.channel.declare_exchange(
+            RETRY_EXCHANGE, ExchangeType.HEADERS, durable=True
+        )
+
         self._connected = True
 
     async def disconnect(self) -> None:
@@ -96,6 +140,9 @@ class RabbitMQQueueService(IQueueService):
         if self.connection and not self.connection.is_closed:
             await self.connection.close()
             self._connected = False
+            self._consumer_buffers.clear()
+            self._deliveries_ready.clear()
+            self._unacked_tags.clear()
             logger.info("Disconnected from RabbitMQ")
 
     async def _ensure_connected(self) -> None:
@@ -138,10 +185,80 @@ class RabbitMQQueueService(IQueueService):
             await dlq.bind(self.dlx, routing_key=f"{queue_name}.dead")
 
             self.queues[queue_name] = queue
+            self.dead_letter_queues[queue_name] = dlq
             logger.debug(f"Declared queue: {queue_name}")
 
         return self.queues[queue_name]
 
+    async def _ensure_retry_queue(self, delay_seconds: int) -> AbstractQueue:
+        """Ensure the TTL queue holding retries for a delay bucket exists."""
+        if delay_seconds not in self.retry_queues:
+            await self._ensure_connected()
+            if self.channel is None or self.retry_exchange is None:
+                raise RuntimeError("Channel not initialized")
+
+            retry_args: Arguments = {
+                "x-message-ttl": delay_seconds * 1000,
+                "x-dead-letter-exchange": "aperilex_tasks",
+            }
+            queue = await self.channel.declare_queue(
+                f"aperilex.retry.{delay_seconds}s", durable=True, arguments=retry_args
+            )
+            await queue.bind(
+                self.retry_exchange,
+                arguments={"x-match": "all", "retry-delay": delay_seconds},
+            )
+
+            self.retry_queues[delay_seconds] = queue
+            logger.debug(f"Declared retry queue for {delay_seconds}s delay")
+
+        return self.retry_queues[delay_seconds]
+
+    def _route(self, message: TaskMessage) -> str:
+        """Get the sub-queue of a task's priority and its user's fair-share lane."""
+        return fair_share_queue_name(
+            message.queue,
+            message.priority,
+            fair_share_lane(message, self.fair_share_lanes),
+        )
+
+    def _lane_names(self, queue: str, priority: TaskPriority) -> list[str]:
+        """Get the fair-share lane sub-queue names of a priority level."""
+        return [
+            fair_share_queue_name(queue, priority, lane)
+            for lane in range(self.fair_share_lanes)
+        ]
+
+    def _sub_queue_names(self, queue: str) -> list[str]:
+        """Get every priority and lane sub-queue name of a queue, highest first."""
+        return [
+            queue_name
+            for priority in sorted(TaskPriority, reverse=True)
+            for queue_name in self._lane_names(queue, priority)
+        ]
+
+    async def _ensure_sub_queues(self, queue: str) -> list[AbstractQueue]:
+        """Ensure all priority and lane sub-queues of a queue exist, highest first."""
+        return [
+            await self._ensure_queue(queue_name)
+            for queue_name in self._sub_queue_names(queue)
+        ]
+
+    def _next_drain_order(self, queue: str) -> list[RoundRobin[str]]:
+        """Get the lanes of each priority of a queue in weighted draining order.
+
+        Priorities are picked by weight; within a priority the lanes are
+        served round-robin so users hashed to different lanes take turns.
+        """
+        drainer = self._drainers.setdefault(queue, WeightedPriorityDrainer())
+        return [
+            self._lane_rotations.setdefault(
+                priority_queue_name(queue, priority),
+                RoundRobin(self._lane_names(queue, priority)),
+            )
+            for priority in drainer.next_order()
+        ]
+
     def _task_to_message_body(self, task: TaskMessage) -> dict[str, Any]:
         """Convert task message to JSON serializable dict."""
         return {
@@ -194,31 +311,31 @@ class RabbitMQQueueService(IQueueService):
             )
             raise
 
+    def _to_amqp_message(self, message: TaskMessage) -> Message:
+        """Build the persistent AMQP message for a task."""
+        return Message(
+            json.dumps(self._task_to_message_body(message)).encode(),
+            # Higher number = higher priority in RabbitMQ
+            priority=message.priority.value,
+            message_id=str(message.task_id),
+            content_type="application/json",
+            delivery_mode=2,  # Persistent
+        )
+
     async def _perform_send_task(self, message: TaskMessage) -> UUID:
         """Perform the actual task sending operation."""
         if self.exchange is None:
             raise RuntimeError("Exchange not initialized")
 
-        _ = await self._ensure_queue(message.queue)
-
-        # Convert priority (higher number = higher priority in RabbitMQ)
-        priority = message.priority.value
-
-        # Create message body
-        body = self._task_to_message_body(message)
-
-        # Create AMQP message
-        amqp_message = Message(
-            json.dumps(body).encode(),
-            priority=priority,
-            message_id=str(message.task_id),
-            content_type="application/json",
-            delivery_mode=2,  # Persistent
-        )
+        # Route to the physical sub-queue for the task's priority and user
+        queue_name = self._route(message)
+        _ = await self._ensure_queue(queue_name)
 
         # Send message with timeout
         await asyncio.wait_for(
-            self.exchange.publish(amqp_message, routing_key=message.queue),
+            self.exchange.publish(
+                self._to_amqp_message(message), routing_key=queue_name
+            ),
             timeout=5.0,  # 5 second timeout for publishing
         )
 
@@ -228,35 +345,93 @@ class RabbitMQQueueService(IQueueService):
         logger.debug(f"Sent task {message.task_id} to queue {message.queue}")
         return message.task_id
 
+    async def send_tasks(self, messages: list[TaskMessage]) -> list[UUID]:
+        """Send task messages, awaiting publisher confirms per batch."""
+        await self._ensure_connected()
+
+        try:
+            sent: list[UUID] = await self._message_circuit_breaker.call(
+                self._perform_send_tasks, messages
+            )
+            return sent
+        except Exception as e:
+            logger.error(f"Failed to send task batch through circuit breaker: {e}")
+            raise
+
+    async def _perform_send_tasks(self, messages: list[TaskMessage]) -> list[UUID]:
+        """Publish tasks in pipelined batches instead of one confirm per message."""
+        if self.exchange is None:
+            raise RuntimeError("Exchange not initialized")
+        exchange = self.exchange
+
+        routing_keys = [self._route(message) for message in messages]
+        for queue_name in set(routing_keys):
+            _ = await self._ensure_queue(queue_name)
+
+        sent: list[UUID] = []
+        for start in range(0, len(messages), PUBLISH_BATCH_SIZE):
+            chunk = messages[start : start + PUBLISH_BATCH_SIZE]
+
+            # Publishes are pipelined; the confirms for the chunk arrive together
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(
+                        exchange.publish(
+                            self._to_amqp_message(message), routing_key=routing_key
+                        )
+                        for message, routing_key in zip(
+                            chunk,
+                            routing_keys[start : start + PUBLISH_BATCH_SIZE],
+                            strict=True,
+                        )
+                    )
+                ),
+                timeout=30.0,  # 30 second timeout for a confirmed batch
+            )
+
+            for message in chunk:
+                self.task_statuses[message.task_id] = TaskStatus.PENDING
+                sent.append(message.task_id)
+
+        logger.debug(f"Sent {len(sent)} tasks in batches of {PUBLISH_BATCH_SIZE}")
+        return sent
+
     async def receive_task(
         self, queue: str = "default", timeout: int | None = None
     ) -> TaskMessage | None:
-        """Receive a task message from RabbitMQ queue."""
+        """Receive a task message from RabbitMQ, draining priorities by weight."""
+        if queue in self._deliveries_ready:
+            # Consumers already hold the prefetched deliveries for this queue
+            tasks = await self.receive_tasks(queue, max_messages=1, timeout=timeout)
+            return tasks[0] if tasks else None
+
         await self._ensure_connected()
-        queue_obj = await self._ensure_queue(queue)
 
         try:
-            # Get message with timeout
-            if timeout:
-                message = await asyncio.wait_for(
-                    queue_obj.get(no_ack=False), timeout=timeout
-                )
-            else:
-                message = await queue_obj.get(no_ack=False)
+            message = None
+            for lanes in self._next_drain_order(queue):
+                for queue_name in lanes.order():
+                    queue_obj = await self._ensure_queue(queue_name)
+
+                    # Get message with timeout
+                    if timeout:
+                        message = await asyncio.wait_for(
+                            queue_obj.get(no_ack=False, fail=False), timeout=timeout
+                        )
+                    else:
+                        message = await queue_obj.get(no_ack=False, fail=False)
+
+                    if message is not None:
+                        lanes.served(queue_name)
+                        break
+
+                if message is not None:
+                    break
 
             if message is None:
                 return None
 
-            # Parse message body
-            body = json.loads(message.body.decode())
-            task = self._message_body_to_task(body)
-
-            # Store message for later acknowledgment
-            self._pending_messages = getattr(self, "_pending_messages", {})
-            self._pending_messages[task.task_id] = message
-
-            # Update status
-            self.task_statuses[task.task_id] = TaskStatus.RUNNING
+            task = self._track_delivery(message)
 
             logger.debug(f"Received task {task.task_id} from queue {queue}")
             return task
@@ -270,6 +445,102 @@ class RabbitMQQueueService(IQueueService):
             )
             return None
 
+    def _track_delivery(self, message: AbstractIncomingMessage) -> TaskMessage:
+        """Parse a delivery and hold on to it for later acknowledgment."""
+        body = json.loads(message.body.decode())
+        task = self._message_body_to_task(body)
+
+        # Store message for later acknowledgment
+        self._pending_messages = getattr(self, "_pending_messages", {})
+        self._pending_messages[task.task_id] = message
+        if message.delivery_tag is not None:
+            self._unacked_tags.add(message.delivery_tag)
+
+        # Update status
+        self.task_statuses[task.task_id] = TaskStatus.RUNNING
+        return task
+
+    async def _ensure_consumers(self, queue: str) -> asyncio.Event:
+        """Start consumers on every priority and lane sub-queue of a queue.
+
+        Each consumer buffers up to ``prefetch_count`` deliveries; the returned
+        event is set whenever any of them receives a message.
+        """
+        if queue not in self._deliveries_ready:
+            ready = asyncio.Event()
+
+            for queue_obj in await self._ensure_sub_queues(queue):
+                buffer: asyncio.Queue[AbstractIncomingMessage] = asyncio.Queue()
+
+                async def on_message(
+                    message: AbstractIncomingMessage,
+                    buffer: asyncio.Queue[AbstractIncomingMessage] = buffer,
+                ) -> None:
+                    buffer.put_nowait(message)
+                    ready.set()
+
+                await queue_obj.consume(on_message, no_ack=False)
+                self._consumer_buffers[queue_obj.name] = buffer
+
+            self._deliveries_ready[queue] = ready
+            logger.debug(
+                f"Started consumers for queue {queue} (prefetch={self.prefetch_count})"
+            )
+        return self._deliveries_ready[queue]
+
+    async def receive_tasks(
+        self,
+        queue: str = "default",
+        max_messages: int = 10,
+        timeout: int | None = None,
+    ) -> list[TaskMessage]:
+        """Receive up to ``max_messages`` prefetched deliveries by priority weight.
+
+        Within a priority, deliveries are taken from the fair-share lanes in
+        turn so one user's backlog does not crowd out other users.
+        """
+        await self._ensure_connected()
+
+        tasks: list[TaskMessage] = []
+        try:
+            ready = await self._ensure_consumers(queue)
+            drain_order = self._next_drain_order(queue)
+            buffers = [
+                self._consumer_buffers[queue_name]
+                for lanes in drain_order
+                for queue_name in lanes.items
+            ]
+
+            # Wait for the first delivery on any sub-queue; without a timeout
+            # only the deliveries already buffered are returned
+            if timeout and all(buffer.empty() for buffer in buffers):
+                ready.clear()
+                await asyncio.wait_for(ready.wait(), timeout=timeout)
+
+            # Weighted pick first, then the remaining priorities highest first
+            for lanes in drain_order:
+                served = True
+                while served and len(tasks) < max_messages:
+                    served = False
+                    for queue_name in lanes.order():
+                        buffer = self._consumer_buffers[queue_name]
+                        if len(tasks) < max_messages and not buffer.empty():
+                            tasks.append(self._track_delivery(buffer.get_nowait()))
+                            lanes.served(queue_name)
+                            served = True
+
+        except TimeoutError:
+            pass
+        except Exception as e:
+            logger.error(
+                f"Error receiving tasks from queue {queue}: {e}",
+                exc_info=True,
+            )
+
+        if tasks:
+            logger.debug(f"Received {len(tasks)} tasks from queue {queue}")
+        return tasks
+
     async def ack_task(self, task_id: UUID) -> bool:
         """Acknowledge task completion."""
         try:
@@ -277,6 +548,7 @@ class RabbitMQQueueService(IQueueService):
             if task_id in self._pending_messages:
                 message = self._pending_messages.pop(task_id)
                 await message.ack()
+                self._unacked_tags.discard(message.delivery_tag or 0)
                 self.task_statuses[task_id] = TaskStatus.SUCCESS
                 logger.debug(f"Acknowledged task {task_id}")
                 return True
@@ -287,6 +559,47 @@ class RabbitMQQueueService(IQueueService):
             logger.error(f"Error acknowledging task {task_id}: {e}")
             return False
 
+    async def ack_tasks(self, task_ids: list[UUID]) -> list[UUID]:
+        """Acknowledge tasks, collapsing contiguous deliveries into one ack."""
+        self._pending_messages = getattr(self, "_pending_messages", {})
+
+        messages: dict[UUID, AbstractIncomingMessage] = {}
+        for task_id in task_ids:
+            if task_id in self._pending_messages:
+                messages[task_id] = self._pending_messages[task_id]
+            else:
+                logger.warning(f"Task {task_id} not found in pending messages")
+
+        tags = {
+            message.delivery_tag
+            for message in messages.values()
+            if message.delivery_tag is not None
+        }
+        if len(tags) > 1 and len(tags) == len(messages):
+            # basic.ack(multiple=True) covers every outstanding tag up to the
+            # highest one, so it is only safe when all of those are being acked
+            highest = max(tags)
+            if {tag for tag in self._unacked_tags if tag <= highest} <= tags:
+                try:
+                    last = next(
+                        message
+                        for message in messages.values()
+                        if message.delivery_tag == highest
+                    )
+                    await last.ack(multiple=True)
+                except Exception as e:
+                    logger.error(f"Error acknowledging task batch: {e}")
+                    return []
+
+                for task_id in messages:
+                    self._pending_messages.pop(task_id, None)
+                    self.task_statuses[task_id] = TaskStatus.SUCCESS
+                self._unacked_tags -= tags
+                logger.debug(f"Acknowledged {len(messages)} tasks with one ack")
+                return list(messages)
+
+        return [task_id for task_id in messages if await self.ack_task(task_id)]
+
     async def nack_task(self, task_id: UUID, requeue: bool = True) -> bool:
         """Negative acknowledge task (reject)."""
         try:
@@ -294,6 +607,7 @@ class RabbitMQQueueService(IQueueService):
             if task_id in self._pending_messages:
                 message = self._pending_messages.pop(task_id)
                 await message.nack(requeue=requeue)
+                self._unacked_tags.discard(message.delivery_tag or 0)
                 self.task_statuses[task_id] = (
                     TaskStatus.FAILURE if not requeue else TaskStatus.RETRY
                 )
@@ -306,6 +620,102 @@ class RabbitMQQueueService(IQueueService):
             logger.error(f"Error nacking task {task_id}: {e}")
             return False
 
+    async def retry_task(self, message: TaskMessage, delay: float) -> bool:
+        """Redeliver a task after a delay through a TTL queue and the DLX.
+
+        Delays are rounded up to power-of-two buckets, each backed by a queue
+        with a fixed message TTL, so retries never wait behind a longer delay.
+        """
+        self._pending_messages = getattr(self, "_pending_messages", {})
+        try:
+            delay_seconds = retry_delay_bucket(delay)
+            await self._ensure_retry_queue(delay_seconds)
+            if self.retry_exchange is None:
+                raise RuntimeError("Retry exchange not initialized")
+
+            amqp_message = self._to_amqp_message(message)
+            amqp_message.headers = {"retry-delay": delay_seconds}
+
+            # Publish the retry before settling the original delivery
+            await asyncio.wait_for(
+                self.retry_exchange.publish(
+                    amqp_message, routing_key=self._route(message)
+                ),
+                timeout=5.0,
+            )
+
+            original = self._pending_messages.pop(message.task_id, None)
+            if original is not None:
+                await original.ack()
+                self._unacked_tags.discard(original.delivery_tag or 0)
+
+            self.task_statuses[message.task_id] = TaskStatus.RETRY
+            logger.debug(
+                f"Task {message.task_id} will be redelivered in {delay_seconds}s"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error scheduling retry for task {message.task_id}: {e}")
+            return False
+
+    async def _get_dead_letters(
+        self, queue: str, limit: int | None
+    ) -> list[AbstractIncomingMessage]:
+        """Fetch (unacked) deliveries from every dead-letter sub-queue of a queue."""
+        await self._ensure_sub_queues(queue)
+
+        deliveries: list[AbstractIncomingMessage] = []
+        for queue_name in self._sub_queue_names(queue):
+            dlq = self.dead_letter_queues[queue_name]
+            while limit is None or len(deliveries) < limit:
+                delivery = await dlq.get(no_ack=False, fail=False)
+                if delivery is None:
+                    break
+                deliveries.append(delivery)
+        return deliveries
+
+    async def get_dead_letter_tasks(
+        self, queue: str = "default", limit: int = 10
+    ) -> list[TaskMessage]:
+        """Peek at dead-lettered tasks, returning them to the dead-letter queue."""
+        await self._ensure_connected()
+
+        deliveries = await self._get_dead_letters(queue, limit)
+        try:
+            return [
+                self._message_body_to_task(json.loads(delivery.body.decode()))
+                for delivery in deliveries
+            ]
+        finally:
+            for delivery in deliveries:
+                await delivery.nack(requeue=True)
+
+    async def requeue_dead_letter_tasks(
+        self, queue: str = "default", limit: int | None = None
+    ) -> int:
+        """Move dead-lettered tasks back onto their priority and lane sub-queues."""
+        await self._ensure_connected()
+        if self.exchange is None:
+            raise RuntimeError("Exchange not initialized")
+
+        requeued = 0
+        for delivery in await self._get_dead_letters(queue, limit):
+            try:
+                task = self._message_body_to_task(json.loads(delivery.body.decode()))
+                task.retry_count = 0
+                await self.exchange.publish(
+                    self._to_amqp_message(task), routing_key=self._route(task)
+                )
+                await delivery.ack()
+                self.task_statuses[task.task_id] = TaskStatus.PENDING
+                requeued += 1
+            except Exception as e:
+                logger.error(f"Error requeuing dead-letter task: {e}")
+                await delivery.nack(requeue=True)
+
+        logger.info(f"Requeued {requeued} dead-letter tasks onto {queue}")
+        return requeued
+
     async def get_task_status(self, task_id: UUID) -> TaskStatus | None:
         """Get task status."""
         return self.task_statuses.get(task_id)
@@ -321,22 +731,23 @@ class RabbitMQQueueService(IQueueService):
         return False
 
     async def purge_queue(self, queue: str) -> int:
-        """Purge all messages from a queue."""
+        """Purge all messages from a queue and its priority and lane sub-queues."""
         await self._ensure_connected()
-        queue_obj = await self._ensure_queue(queue)
-        result = await queue_obj.purge()
-        purge_count: int = result.message_count if result.message_count else 0
+        purge_count = 0
+        for queue_obj in await self._ensure_sub_queues(queue):
+            result = await queue_obj.purge()
+            purge_count += result.message_count if result.message_count else 0
         logger.info(f"Purged {purge_count} messages from queue {queue}")
         return purge_count
 
     async def get_queue_size(self, queue: str) -> int:
-        """Get number of messages in queue."""
+        """Get number of messages in queue and its priority and lane sub-queues."""
         await self._ensure_connected()
-        queue_obj = await self._ensure_queue(queue)
-
-        # Get queue info
-        queue_info = await queue_obj.declare()
-        message_count: int = queue_info.message_count if queue_info.message_count else 0
+        message_count = 0
+        for queue_obj in await self._ensure_sub_queues(queue):
+            # Get queue info
+            queue_info = await queue_obj.declare()
+            message_count += queue_info.message_count if queue_info.message_count else 0
 
         logger.debug(f"Queue {queue} has {message_count} messages")
         return message_count
@@ -0,0 +1,164 @@
+"""RabbitMQ topic-exchange result backend for local development."""
+
+import asyncio
+import json
+import logging
+from datetime import timedelta
+
+import aio_pika
+from aio_pika import ExchangeType, Message
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractQueue,
+    AbstractRobustConnection,
+)
+
+from ..interfaces import IStorageService, TaskEvent, TaskSubscription
+from .event_bus import InProcessResultBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RabbitMQResultBackend(InProcessResultBackend):
+    """Result backend publishing task events to a RabbitMQ topic exchange.
+
+    Every subscription consumes from its own exclusive, auto-deleted queue
+    bound to ``task.<task_id>``, so API processes are woken as soon as a
+    worker publishes. Terminal events are also written to the storage
+    service (when given) so late subscribers in other processes can still
+    read the outcome.
+    """
+
+    EXCHANGE_NAME = "aperilex_task_events"
+    RESULT_KEY_PREFIX = "task_event:"
+
+    def __init__(
+        self,
+        connection_url: str = "amqp://localhost:5672/",
+        storage_service: IStorageService | None = None,
+        result_ttl: timedelta = timedelta(days=1),
+    ) -> None:
+        super().__init__()
+        self.connection_url = connection_url
+        self.storage_service = storage_service
+        self.result_ttl = result_ttl
+        self.connection: AbstractRobustConnection | None = None
+        self.channel: AbstractChannel | None = None
+        self.exchange: AbstractExchange | None = None
+        self._consumers: dict[TaskSubscription, tuple[AbstractQueue, str]] = {}
+
+    async def connect(self) -> None:
+        """Connect to RabbitMQ and declare the events exchange."""
+        try:
+            self.connection = await aio_pika.connect_robust(self.connection_url)
+            self.channel = await self.connection.channel()
+            self.exchange = await self.channel.declare_exchange(
+                self.EXCHANGE_NAME, ExchangeType.TOPIC, durable=True
+            )
+            self._connected = True
+            logger.info("Connected RabbitMQ result backend")
+        except Exception as e:
+            logger.error(f"Failed to connect RabbitMQ result backend: {e}")
+            self._connected = False
+            raise
+
+    async def disconnect(self) -> None:
+        """Close subscriptions and the RabbitMQ connection."""
+        for subscription in list(self._consumers):
+            await subscription.close()
+        await super().disconnect()
+        if self.connection and not self.connection.is_closed:
+            await self.connection.close()
+        logger.info("Disconnected RabbitMQ result backend")
+
+    def _routing_key(self, task_id: str) -> str:
+        """Get routing key for events of a task."""
+        return f"task.{task_id}"
+
+    async def _ensure_connected(self) -> AbstractExchange:
+        """Ensure connection and return the events exchange."""
+        if not self._connected:
+            await self.connect()
+        if self.exchange is None:
+            raise RuntimeError("Events exchange not initialized")
+        return self.exchange
+
+    async def publish(self, event: TaskEvent) -> None:
+        """Publish an event to the topic exchange."""
+        self._retain(event)
+
+        if event.terminal and self.storage_service is not None:
+            try:
+                await self.storage_service.set(
+                    f"{self.RESULT_KEY_PREFIX}{event.task_id}",
+                    event.to_dict(),
+                    ttl=self.result_ttl,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to store result for {event.task_id}: {e}")
+
+        exchange = await self._ensure_connected()
+        message = Message(
+            json.dumps(event.to_dict(), default=str).encode(),
+            message_id=event.event_id,
+            content_type="application/json",
+        )
+        await asyncio.wait_for(
+            exchange.publish(message, routing_key=self._routing_key(event.task_id)),
+            timeout=5.0,
+        )
+
+    async def subscribe(self, task_id: str) -> TaskSubscription:
+        """Consume events of a task from an exclusive queue."""
+        exchange = await self._ensure_connected()
+        if self.channel is None:
+            raise RuntimeError("Channel not initialized")
+
+        subscription = TaskSubscription(task_id, on_close=self._unsubscribe)
+
+        queue = await self.channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(exchange, routing_key=self._routing_key(task_id))
+
+        async def on_message(message: AbstractIncomingMessage) -> None:
+            async with message.process():
+                subscription.deliver(
+                    TaskEvent.from_dict(json.loads(message.body.decode()))
+                )
+
+        consumer_tag = await queue.consume(on_message)
+        self._consumers[subscription] = (queue, consumer_tag)
+        return subscription
+
+    async def get_result(self, task_id: str) -> TaskEvent | None:
+        """Get terminal event from local retention or storage."""
+        event = await super().get_result(task_id)
+        if event is not None or self.storage_service is None:
+            return event
+
+        try:
+            body = await self.storage_service.get(f"{self.RESULT_KEY_PREFIX}{task_id}")
+        except Exception as e:
+            logger.warning(f"Failed to load result for {task_id}: {e}")
+            return None
+        return TaskEvent.from_dict(body) if body else None
+
+    async def health_check(self) -> bool:
+        """Check if the RabbitMQ connection is open."""
+        return bool(
+            self._connected and self.connection and not self.connection.is_closed
+        )
+
+    async def _unsubscribe(self, subscription: TaskSubscription) -> None:
+        """Cancel the consumer and drop the subscription queue."""
+        consumer = self._consumers.pop(subscription, None)
+        if consumer is None:
+            return
+
+        queue, consumer_tag = consumer
+        try:
+            await queue.cancel(consumer_tag)
+            await queue.delete(if_unused=False, if_empty=False)
+        except Exception as e:
+            logger.debug(f"Failed to clean up subscription queue: {e}")
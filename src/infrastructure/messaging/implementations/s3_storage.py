@@ -1,14 +1,17 @@
 """AWS S3-based storage service for production deployment."""
 
-import json
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import boto3
 from botocore.exceptions import ClientError
 
-from ..interfaces import IStorageService
+from src.shared import serialization
+
+from ..interfaces import STREAM_CHUNK_SIZE, IStorageService, StoredObject
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
@@ -54,7 +57,7 @@ class S3StorageService(IStorageService):
         """Connect to AWS S3."""
         try:
             # Test connection by checking if bucket exists
-            self.s3_client.head_bucket(Bucket=self.bucket_name)
+            await asyncio.to_thread(self.s3_client.head_bucket, Bucket=self.bucket_name)
             self._connected = True
             logger.info(f"Connected to S3 bucket: {self.bucket_name}")
 
@@ -97,13 +100,27 @@ class S3StorageService(IStorageService):
 
     async def get(self, key: str) -> Any:
         """Get a value by key."""
+        content = await self.get_raw(key)
+        if content is None:
+            return None
+
+        try:
+            return serialization.loads(content)
+        except Exception as e:
+            logger.error(f"Failed to get key {key}: {e}")
+            return None
+
+    async def get_raw(self, key: str) -> bytes | None:
+        """Get the stored JSON of a key without parsing it."""
         if not self._connected:
             await self.connect()
 
         s3_key = self._get_s3_key(key)
 
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket_name, Key=s3_key
+            )
 
             # Check if expired
             metadata = response.get("Metadata", {})
@@ -112,9 +129,8 @@ class S3StorageService(IStorageService):
                 await self.delete(key)
                 return None
 
-            # Read and deserialize content
-            content = response["Body"].read().decode("utf-8")
-            return json.loads(content)
+            body: bytes = await asyncio.to_thread(response["Body"].read)
+            return body
 
         except ClientError as e:
             logger.error(f"Failed to get S3 object {s3_key}: {e}")
@@ -123,6 +139,79 @@ class S3StorageService(IStorageService):
             logger.error(f"Failed to get key {key}: {e}")
             return None
 
+    async def open(self, key: str) -> StoredObject | None:
+        """Open an object for reading in chunks, reading only its metadata."""
+        if not self._connected:
+            await self.connect()
+
+        s3_key = self._get_s3_key(key)
+
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket_name, Key=s3_key
+            )
+        except ClientError as e:
+            logger.debug(f"S3 object {s3_key} not found: {e}")
+            return None
+
+        if self._is_expired(response.get("Metadata", {})):
+            await self.delete(key)
+            return None
+
+        return StoredObject(self, key, response["ContentLength"])
+
+    async def stream(
+        self,
+        key: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of an object with a ranged GET."""
+        s3_key = self._get_s3_key(key)
+        if start == 0 and end is None:
+            # Whole objects are read without a range, which S3 rejects for
+            # empty objects
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket_name, Key=s3_key
+            )
+        else:
+            response = await asyncio.to_thread(
+                self.s3_client.get_object,
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Range=f"bytes={start}-{'' if end is None else end}",
+            )
+        body = response["Body"]
+        try:
+            chunks = body.iter_chunks(chunk_size)
+            while chunk := await asyncio.to_thread(next, chunks, b""):
+                yield chunk
+        finally:
+            body.close()
+
+    async def set_raw(
+        self, key: str, data: bytes, ttl: timedelta | None = None
+    ) -> bool:
+        """Upload serialized content as is."""
+        if not self._connected:
+            await self.connect()
+
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=self._get_s3_key(key),
+                Body=data,
+                Metadata=self._create_metadata(ttl),
+            )
+
+            logger.debug(f"Set S3 key: {key}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to set key {key}: {e}")
+            return False
+
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """Set a value with optional TTL."""
         if not self._connected:
@@ -132,7 +221,7 @@ class S3StorageService(IStorageService):
 
         try:
             # Serialize value
-            content = json.dumps(value, default=str)
+            content = serialization.dumps(value)
 
             # Create metadata
             metadata = self._create_metadata(ttl)
@@ -2,7 +2,8 @@
 
 import json
 import logging
-from datetime import datetime
+import math
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -11,11 +12,32 @@ from botocore.exceptions import ClientError
 
 if TYPE_CHECKING:
     from mypy_boto3_sqs import SQSClient
+    from mypy_boto3_sqs.type_defs import (
+        DeleteMessageBatchRequestEntryTypeDef,
+        SendMessageBatchRequestEntryTypeDef,
+    )
 
 from ..interfaces import IQueueService, TaskMessage, TaskPriority, TaskStatus
+from ..scheduling import (
+    WeightedPriorityDrainer,
+    fair_share_key,
+    priority_queue_name,
+)
 
 logger = logging.getLogger(__name__)
 
+# SQS caps SendMessageBatch, ReceiveMessage and DeleteMessageBatch at 10 entries
+SQS_BATCH_SIZE = 10
+
+# SQS limits MessageGroupId to 128 characters
+MAX_MESSAGE_GROUP_ID_LENGTH = 128
+
+# SQS caps message visibility at 12 hours
+MAX_VISIBILITY_TIMEOUT = 43200
+
+# Suffix of the optional per-queue dead-letter FIFO queue
+DEAD_LETTER_SUFFIX = "-dead"
+
 
 class SQSQueueService(IQueueService):
     """AWS SQS FIFO implementation for production deployment."""
@@ -34,6 +56,10 @@ class SQSQueueService(IQueueService):
         self.task_statuses: dict[UUID, TaskStatus] = {}
         self._connected = False
 
+        # Priority sub-queues that are not provisioned (fall back to the base queue)
+        self._missing_queues: set[str] = set()
+        self._drainers: dict[str, WeightedPriorityDrainer] = {}
+
         # Initialize SQS client
         session = boto3.Session(
             aws_access_key_id=aws_access_key_id,
@@ -71,6 +97,7 @@ class SQSQueueService(IQueueService):
         """Disconnect from AWS SQS (no-op for SQS)."""
         self._connected = False
         self.queue_urls.clear()
+        self._missing_queues.clear()
         logger.info("Disconnected from AWS SQS")
 
     def _get_queue_name(self, queue: str) -> str:
@@ -100,6 +127,61 @@ class SQSQueueService(IQueueService):
         logger.debug(f"Queue URL for {queue_name}: {queue_url}")
         return queue_url
 
+    async def _find_queue(self, queue_name: str) -> str | None:
+        """Look up an optional queue, returning None when it is not provisioned."""
+        if queue_name in self.queue_urls:
+            return self.queue_urls[queue_name]
+        if queue_name in self._missing_queues:
+            return None
+
+        if not self._connected:
+            await self.connect()
+
+        try:
+            response = self.sqs_client.get_queue_url(
+                QueueName=self._get_queue_name(queue_name)
+            )
+        except ClientError:
+            logger.debug(f"Priority queue {queue_name} not provisioned, skipping")
+            self._missing_queues.add(queue_name)
+            return None
+
+        self.queue_urls[queue_name] = response["QueueUrl"]
+        return self.queue_urls[queue_name]
+
+    async def _priority_queue_urls(
+        self, queue: str, order: list[TaskPriority] | None = None
+    ) -> list[str]:
+        """Get URLs of the provisioned priority sub-queues of a queue.
+
+        Args:
+            queue: Logical queue name
+            order: Priority order to return the URLs in (highest first if None)
+
+        Returns:
+            Queue URLs; the base queue is always included
+        """
+        if order is None:
+            order = sorted(TaskPriority, reverse=True)
+
+        queue_urls: list[str] = []
+        for priority in order:
+            queue_name = priority_queue_name(queue, priority, separator="-")
+            if queue_name == queue:
+                queue_urls.append(await self._ensure_queue(queue))
+            elif queue_url := await self._find_queue(queue_name):
+                queue_urls.append(queue_url)
+        return queue_urls
+
+    async def _send_queue_url(self, message: TaskMessage) -> str:
+        """Get the URL of the priority sub-queue a task should be sent to."""
+        queue_name = priority_queue_name(message.queue, message.priority, "-")
+        if queue_name != message.queue:
+            queue_url = await self._find_queue(queue_name)
+            if queue_url:
+                return queue_url
+        return await self._ensure_queue(message.queue)
+
     def _task_to_message_body(self, task: TaskMessage) -> dict[str, Any]:
         """Convert task message to SQS message body."""
         return {
@@ -137,37 +219,57 @@ class SQSQueueService(IQueueService):
             metadata=body.get("metadata", {}),
         )
 
-    async def send_task(self, message: TaskMessage) -> UUID:
-        """Send a task message to SQS FIFO queue."""
-        queue_url = await self._ensure_queue(message.queue)
-
-        # Create message body
-        body = self._task_to_message_body(message)
-
+    def _message_send_params(self, message: TaskMessage) -> dict[str, Any]:
+        """Build the per-message SQS send parameters shared by single and batch sends."""
         # Use filing_id or task_id as deduplication ID for 5-minute window
         deduplication_id = str(message.task_id)
         if "filing_id" in message.kwargs:
             deduplication_id = f"{message.task_name}:{message.kwargs['filing_id']}"
 
-        # Message group ID for FIFO ordering (use queue name)
-        message_group_id = message.queue
+        # One message group per user: FIFO order is kept within a user's
+        # tasks while SQS interleaves deliveries across users (fair share).
+        # Tasks scheduled for later get a group of their own, as they are
+        # hidden until due and would hold back the rest of their group.
+        group_id = f"{message.queue}:{fair_share_key(message)}"
+        if message.eta is not None:
+            group_id = f"{message.queue}:scheduled:{message.task_id}"
+
+        return {
+            "MessageBody": json.dumps(self._task_to_message_body(message)),
+            "MessageGroupId": group_id[:MAX_MESSAGE_GROUP_ID_LENGTH],
+            "MessageDeduplicationId": deduplication_id,
+            "MessageAttributes": {
+                "priority": {
+                    "StringValue": str(message.priority.value),
+                    "DataType": "Number",
+                },
+                "task_name": {
+                    "StringValue": message.task_name,
+                    "DataType": "String",
+                },
+            },
+        }
+
+    def _message_batch_entry(
+        self, entry_id: str, message: TaskMessage
+    ) -> "SendMessageBatchRequestEntryTypeDef":
+        """Build the SendMessageBatch entry of a message."""
+        params = self._message_send_params(message)
+        return {
+            "Id": entry_id,
+            "MessageBody": params["MessageBody"],
+            "MessageGroupId": params["MessageGroupId"],
+            "MessageDeduplicationId": params["MessageDeduplicationId"],
+            "MessageAttributes": params["MessageAttributes"],
+        }
+
+    async def send_task(self, message: TaskMessage) -> UUID:
+        """Send a task message to the SQS FIFO queue for its priority."""
+        queue_url = await self._send_queue_url(message)
 
         try:
             _ = self.sqs_client.send_message(
-                QueueUrl=queue_url,
-                MessageBody=json.dumps(body),
-                MessageGroupId=message_group_id,
-                MessageDeduplicationId=deduplication_id,
-                MessageAttributes={
-                    "priority": {
-                        "StringValue": str(message.priority.value),
-                        "DataType": "Number",
-                    },
-                    "task_name": {
-                        "StringValue": message.task_name,
-                        "DataType": "String",
-                    },
-                },
+                QueueUrl=queue_url, **self._message_send_params(message)
             )
 
             # Track task status
@@ -180,52 +282,152 @@ class SQSQueueService(IQueueService):
             logger.error(f"Failed to send task to SQS: {e}")
             raise
 
+    async def send_tasks(self, messages: list[TaskMessage]) -> list[UUID]:
+        """Send task messages with SendMessageBatch, up to 10 per request."""
+        by_queue: dict[str, list[TaskMessage]] = {}
+        for message in messages:
+            queue_url = await self._send_queue_url(message)
+            by_queue.setdefault(queue_url, []).append(message)
+
+        sent: list[UUID] = []
+        for queue_url, queue_messages in by_queue.items():
+            for start in range(0, len(queue_messages), SQS_BATCH_SIZE):
+                chunk = queue_messages[start : start + SQS_BATCH_SIZE]
+                entries = [
+                    self._message_batch_entry(str(index), message)
+                    for index, message in enumerate(chunk)
+                ]
+
+                try:
+                    response = self.sqs_client.send_message_batch(
+                        QueueUrl=queue_url, Entries=entries
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to send task batch to SQS: {e}")
+                    raise
+
+                for entry in response.get("Successful", []):
+                    task_id = chunk[int(entry["Id"])].task_id
+                    self.task_statuses[task_id] = TaskStatus.PENDING
+                    sent.append(task_id)
+
+                for failure in response.get("Failed", []):
+                    logger.error(
+                        f"Failed to send task {chunk[int(failure['Id'])].task_id} "
+                        f"to SQS queue {queue_url}: {failure.get('Message')}"
+                    )
+
+        logger.debug(f"Sent {len(sent)}/{len(messages)} tasks to SQS in batches")
+        return sent
+
+    def _track_received_message(self, sqs_message: Any, queue_url: str) -> TaskMessage:
+        """Parse an SQS message and remember its receipt handle for acking."""
+        if "Body" not in sqs_message:
+            raise ValueError("Received SQS message without Body")
+        if "ReceiptHandle" not in sqs_message:
+            raise ValueError("Received SQS message without ReceiptHandle")
+        body = json.loads(sqs_message["Body"])
+        task = self._message_body_to_task(body)
+
+        # Messages redelivered after their visibility timeout, e.g. when a
+        # worker died, count as attempts made
+        receive_count = int(
+            sqs_message.get("Attributes", {}).get("ApproximateReceiveCount", 1)
+        )
+        task.retry_count = max(task.retry_count, receive_count - 1)
+
+        # Store receipt handle for later deletion
+        self._pending_receipts = getattr(self, "_pending_receipts", {})
+        self._pending_receipts[task.task_id] = {
+            "receipt_handle": sqs_message["ReceiptHandle"],
+            "queue_url": queue_url,
+            "task": task,
+        }
+
+        # Update status
+        self.task_statuses[task.task_id] = TaskStatus.RUNNING
+        return task
+
     async def receive_task(
         self, queue: str = "default", timeout: int | None = None
     ) -> TaskMessage | None:
         """Receive a task message from SQS queue."""
-        queue_url = await self._ensure_queue(queue)
+        tasks = await self.receive_tasks(queue=queue, max_messages=1, timeout=timeout)
+        return tasks[0] if tasks else None
 
+    async def receive_tasks(
+        self,
+        queue: str = "default",
+        max_messages: int = SQS_BATCH_SIZE,
+        timeout: int | None = None,
+    ) -> list[TaskMessage]:
+        """Receive up to 10 task messages, draining priority sub-queues by weight."""
+        drainer = self._drainers.setdefault(queue, WeightedPriorityDrainer())
+        queue_urls = await self._priority_queue_urls(queue, drainer.next_order())
+
+        tasks: list[TaskMessage] = []
         try:
-            # SQS receive message
-            wait_time = min(timeout or 20, 20)  # Max long polling is 20 seconds
-
-            response = self.sqs_client.receive_message(
-                QueueUrl=queue_url,
-                MaxNumberOfMessages=1,
-                WaitTimeSeconds=wait_time,
-                MessageAttributeNames=["All"],
-            )
+            for index, queue_url in enumerate(queue_urls):
+                remaining = min(max_messages, SQS_BATCH_SIZE) - len(tasks)
+                if remaining <= 0:
+                    break
+
+                # Only long-poll the last sub-queue and only if nothing arrived yet
+                if index == len(queue_urls) - 1 and not tasks:
+                    wait_time = min(timeout or 20, 20)  # Max long polling is 20s
+                else:
+                    wait_time = 0
+
+                response = self.sqs_client.receive_message(
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=max(1, remaining),
+                    WaitTimeSeconds=wait_time,
+                    MessageAttributeNames=["All"],
+                    AttributeNames=["ApproximateReceiveCount"],
+                )
 
-            if "Messages" not in response:
-                return None
+                for sqs_message in response.get("Messages", []):
+                    task = self._track_received_message(sqs_message, queue_url)
+                    if not self._defer_until_due(task):
+                        tasks.append(task)
 
-            sqs_message = response["Messages"][0]
+        except Exception as e:
+            logger.error(f"Error receiving task from SQS queue {queue}: {e}")
 
-            # Parse message body
-            if "Body" not in sqs_message:
-                raise ValueError("Received SQS message without Body")
-            if "ReceiptHandle" not in sqs_message:
-                raise ValueError("Received SQS message without ReceiptHandle")
-            body = json.loads(sqs_message["Body"])
-            task = self._message_body_to_task(body)
+        if tasks:
+            logger.debug(f"Received {len(tasks)} tasks from SQS queue {queue}")
+        return tasks
 
-            # Store receipt handle for later deletion
-            self._pending_receipts = getattr(self, "_pending_receipts", {})
-            self._pending_receipts[task.task_id] = {
-                "receipt_handle": sqs_message["ReceiptHandle"],
-                "queue_url": queue_url,
-            }
+    def _defer_until_due(self, task: TaskMessage) -> bool:
+        """Hide a received task scheduled for later until it is due.
 
-            # Update status
-            self.task_statuses[task.task_id] = TaskStatus.RUNNING
+        FIFO queues do not support per-message DelaySeconds, so a scheduled
+        task is received once and made invisible for the time left.
 
-            logger.debug(f"Received task {task.task_id} from SQS queue {queue}")
-            return task
+        Args:
+            task: Received task
 
-        except Exception as e:
-            logger.error(f"Error receiving task from SQS queue {queue}: {e}")
-            return None
+        Returns:
+            True if the task is not due yet and was hidden
+        """
+        if task.eta is None:
+            return False
+        now = datetime.now(UTC) if task.eta.tzinfo else datetime.utcnow()
+        remaining = (task.eta - now).total_seconds()
+        if remaining <= 0:
+            return False
+
+        receipt_info = self._pending_receipts.pop(task.task_id)
+        self.sqs_client.change_message_visibility(
+            QueueUrl=receipt_info["queue_url"],
+            ReceiptHandle=receipt_info["receipt_handle"],
+            VisibilityTimeout=min(math.ceil(remaining), MAX_VISIBILITY_TIMEOUT),
+        )
+        self.task_statuses[task.task_id] = (
+            TaskStatus.RETRY if task.retry_count else TaskStatus.PENDING
+        )
+        logger.debug(f"Task {task.task_id} is due in {remaining:.1f}s")
+        return True
 
     async def ack_task(self, task_id: UUID) -> bool:
         """Acknowledge task completion by deleting from SQS."""
@@ -249,22 +451,77 @@ class SQSQueueService(IQueueService):
             logger.error(f"Error acknowledging task {task_id}: {e}")
             return False
 
+    async def ack_tasks(self, task_ids: list[UUID]) -> list[UUID]:
+        """Acknowledge tasks with DeleteMessageBatch, up to 10 per request."""
+        self._pending_receipts = getattr(self, "_pending_receipts", {})
+
+        by_queue: dict[str, list[UUID]] = {}
+        for task_id in task_ids:
+            if task_id in self._pending_receipts:
+                queue_url = self._pending_receipts[task_id]["queue_url"]
+                by_queue.setdefault(queue_url, []).append(task_id)
+            else:
+                logger.warning(f"Task {task_id} not found in pending receipts")
+
+        acknowledged: list[UUID] = []
+        for queue_url, queue_task_ids in by_queue.items():
+            for start in range(0, len(queue_task_ids), SQS_BATCH_SIZE):
+                chunk = queue_task_ids[start : start + SQS_BATCH_SIZE]
+                entries: list[DeleteMessageBatchRequestEntryTypeDef] = [
+                    {
+                        "Id": str(index),
+                        "ReceiptHandle": self._pending_receipts[task_id][
+                            "receipt_handle"
+                        ],
+                    }
+                    for index, task_id in enumerate(chunk)
+                ]
+
+                try:
+                    response = self.sqs_client.delete_message_batch(
+                        QueueUrl=queue_url, Entries=entries
+                    )
+                except Exception as e:
+                    logger.error(f"Error acknowledging task batch: {e}")
+                    continue
+
+                for entry in response.get("Successful", []):
+                    task_id = chunk[int(entry["Id"])]
+                    self._pending_receipts.pop(task_id, None)
+                    self.task_statuses[task_id] = TaskStatus.SUCCESS
+                    acknowledged.append(task_id)
+
+                for failure in response.get("Failed", []):
+                    logger.error(
+                        f"Error acknowledging task {chunk[int(failure['Id'])]}: "
+                        f"{failure.get('Message')}"
+                    )
+
+        logger.debug(f"Acknowledged {len(acknowledged)}/{len(task_ids)} tasks")
+        return acknowledged
+
     async def nack_task(self, task_id: UUID, requeue: bool = True) -> bool:
-        """Negative acknowledge task (let visibility timeout expire for requeue)."""
+        """Negative acknowledge task (requeue immediately or dead-letter)."""
         try:
             self._pending_receipts = getattr(self, "_pending_receipts", {})
             if task_id in self._pending_receipts:
                 receipt_info = self._pending_receipts.pop(task_id)
 
                 if not requeue:
-                    # Delete message permanently
+                    # Keep a copy for inspection before deleting permanently
+                    await self._send_to_dead_letter_queue(receipt_info["task"])
                     self.sqs_client.delete_message(
                         QueueUrl=receipt_info["queue_url"],
                         ReceiptHandle=receipt_info["receipt_handle"],
                     )
                     self.task_statuses[task_id] = TaskStatus.FAILURE
                 else:
-                    # Let visibility timeout expire for automatic requeue
+                    # Make the message visible again right away
+                    self.sqs_client.change_message_visibility(
+                        QueueUrl=receipt_info["queue_url"],
+                        ReceiptHandle=receipt_info["receipt_handle"],
+                        VisibilityTimeout=0,
+                    )
                     self.task_statuses[task_id] = TaskStatus.RETRY
 
                 logger.debug(f"Nacked task {task_id}, requeue={requeue}")
@@ -276,6 +533,152 @@ class SQSQueueService(IQueueService):
             logger.error(f"Error nacking task {task_id}: {e}")
             return False
 
+    async def retry_task(self, message: TaskMessage, delay: float) -> bool:
+        """Send a task to be redelivered after a delay and delete the received one.
+
+        The retry is scheduled with an ETA, so it gets a message group of its
+        own and is hidden until due when first received. Hiding the received
+        message instead would hold back every later task of the user's
+        message group for the whole delay.
+        """
+        self._pending_receipts = getattr(self, "_pending_receipts", {})
+        receipt_info = self._pending_receipts.get(message.task_id)
+
+        message.eta = datetime.utcnow() + timedelta(seconds=delay)
+        params = self._message_send_params(message)
+        # Each attempt is a new message, never deduplicated against the last
+        params["MessageDeduplicationId"] = f"{message.task_id}:{message.retry_count}"
+
+        try:
+            queue_url = await self._send_queue_url(message)
+            self.sqs_client.send_message(QueueUrl=queue_url, **params)
+            if receipt_info is not None:
+                self.sqs_client.delete_message(
+                    QueueUrl=receipt_info["queue_url"],
+                    ReceiptHandle=receipt_info["receipt_handle"],
+                )
+        except Exception as e:
+            logger.error(f"Error scheduling retry for task {message.task_id}: {e}")
+            return False
+
+        self._pending_receipts.pop(message.task_id, None)
+        self.task_statuses[message.task_id] = TaskStatus.RETRY
+        logger.debug(f"Task {message.task_id} will be redelivered in {delay:.1f}s")
+        return True
+
+    async def extend_visibility(self, task_id: UUID, timeout: int) -> bool:
+        """Extend the visibility timeout of a running task (heartbeat)."""
+        self._pending_receipts = getattr(self, "_pending_receipts", {})
+        receipt_info = self._pending_receipts.get(task_id)
+        if receipt_info is None:
+            return False
+
+        try:
+            self.sqs_client.change_message_visibility(
+                QueueUrl=receipt_info["queue_url"],
+                ReceiptHandle=receipt_info["receipt_handle"],
+                VisibilityTimeout=min(timeout, MAX_VISIBILITY_TIMEOUT),
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error extending visibility for task {task_id}: {e}")
+            return False
+
+    async def _send_to_dead_letter_queue(self, task: TaskMessage) -> None:
+        """Copy a permanently failed task to the queue's dead-letter queue."""
+        queue_url = await self._find_queue(f"{task.queue}{DEAD_LETTER_SUFFIX}")
+        if queue_url is None:
+            logger.warning(
+                f"No dead-letter queue provisioned for {task.queue}, "
+                f"dropping task {task.task_id}"
+            )
+            return
+
+        params = self._message_send_params(task)
+        params["MessageDeduplicationId"] = f"{task.task_id}:{task.retry_count}"
+        self.sqs_client.send_message(QueueUrl=queue_url, **params)
+        logger.info(f"Moved task {task.task_id} to dead-letter queue")
+
+    async def get_dead_letter_tasks(
+        self, queue: str = "default", limit: int = 10
+    ) -> list[TaskMessage]:
+        """Peek at dead-lettered tasks without consuming them."""
+        queue_url = await self._find_queue(f"{queue}{DEAD_LETTER_SUFFIX}")
+        if queue_url is None:
+            return []
+
+        tasks: dict[UUID, TaskMessage] = {}
+        try:
+            # Visibility 0 leaves messages in place; stop once a receive
+            # returns nothing new
+            while len(tasks) < limit:
+                response = self.sqs_client.receive_message(
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=min(limit - len(tasks), SQS_BATCH_SIZE),
+                    VisibilityTimeout=0,
+                    WaitTimeSeconds=0,
+                )
+                found = [
+                    self._message_body_to_task(json.loads(sqs_message["Body"]))
+                    for sqs_message in response.get("Messages", [])
+                    if "Body" in sqs_message
+                ]
+                new = [task for task in found if task.task_id not in tasks]
+                if not new:
+                    break
+                tasks.update((task.task_id, task) for task in new)
+
+        except Exception as e:
+            logger.error(f"Error inspecting dead-letter queue for {queue}: {e}")
+
+        return list(tasks.values())[:limit]
+
+    async def requeue_dead_letter_tasks(
+        self, queue: str = "default", limit: int | None = None
+    ) -> int:
+        """Move dead-lettered tasks back onto their queue."""
+        queue_url = await self._find_queue(f"{queue}{DEAD_LETTER_SUFFIX}")
+        if queue_url is None:
+            return 0
+
+        requeued = 0
+        try:
+            while limit is None or requeued < limit:
+                batch_size = SQS_BATCH_SIZE
+                if limit is not None:
+                    batch_size = min(limit - requeued, SQS_BATCH_SIZE)
+
+                response = self.sqs_client.receive_message(
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=batch_size,
+                    WaitTimeSeconds=0,
+                )
+                sqs_messages = response.get("Messages", [])
+                if not sqs_messages:
+                    break
+
+                tasks = []
+                for sqs_message in sqs_messages:
+                    task = self._message_body_to_task(json.loads(sqs_message["Body"]))
+                    task.retry_count = 0
+                    tasks.append(task)
+
+                await self.send_tasks(tasks)
+                self.sqs_client.delete_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {"Id": str(index), "ReceiptHandle": m["ReceiptHandle"]}
+                        for index, m in enumerate(sqs_messages)
+                    ],
+                )
+                requeued += len(tasks)
+
+        except Exception as e:
+            logger.error(f"Error requeuing dead-letter tasks for {queue}: {e}")
+
+        logger.info(f"Requeued {requeued} dead-letter tasks onto {queue}")
+        return requeued
+
     async def get_task_status(self, task_id: UUID) -> TaskStatus | None:
         """Get task status."""
         return self.task_statuses.get(task_id)
@@ -291,18 +694,20 @@ class SQSQueueService(IQueueService):
         return False
 
     async def purge_queue(self, queue: str) -> int:
-        """Purge all messages from SQS queue."""
-        queue_url = await self._ensure_queue(queue)
+        """Purge all messages from SQS queue and its priority sub-queues."""
+        queue_urls = await self._priority_queue_urls(queue)
 
         try:
-            # Get queue size before purge
-            attrs = self.sqs_client.get_queue_attributes(
-                QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
-            )
-            message_count = int(attrs["Attributes"]["ApproximateNumberOfMessages"])
+            message_count = 0
+            for queue_url in queue_urls:
+                # Get queue size before purge
+                attrs = self.sqs_client.get_queue_attributes(
+                    QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+                )
+                message_count += int(attrs["Attributes"]["ApproximateNumberOfMessages"])
 
-            # Purge queue
-            self.sqs_client.purge_queue(QueueUrl=queue_url)
+                # Purge queue
+                self.sqs_client.purge_queue(QueueUrl=queue_url)
 
             logger.info(
                 f"Purged approximately {message_count} messages from SQS queue {queue}"
@@ -314,14 +719,16 @@ class SQSQueueService(IQueueService):
             return 0
 
     async def get_queue_size(self, queue: str) -> int:
-        """Get approximate number of messages in SQS queue."""
-        queue_url = await self._ensure_queue(queue)
+        """Get approximate number of messages in SQS queue and its sub-queues."""
+        queue_urls = await self._priority_queue_urls(queue)
 
         try:
-            attrs = self.sqs_client.get_queue_attributes(
-                QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
-            )
-            message_count = int(attrs["Attributes"]["ApproximateNumberOfMessages"])
+            message_count = 0
+            for queue_url in queue_urls:
+                attrs = self.sqs_client.get_queue_attributes(
+                    QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+                )
+                message_count += int(attrs["Attributes"]["ApproximateNumberOfMessages"])
 
             logger.debug(
                 f"SQS queue {queue} has approximately {message_count} messages"
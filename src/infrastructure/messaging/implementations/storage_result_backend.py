@@ -0,0 +1,100 @@
+"""Storage-backed result backend for queues without pub/sub support (SQS)."""
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from ..interfaces import IStorageService, TaskEvent, TaskSubscription
+from .event_bus import InProcessResultBackend
+
+logger = logging.getLogger(__name__)
+
+
+class StorageResultBackend(InProcessResultBackend):
+    """Result backend that shares the latest event per task through storage.
+
+    Publishers write the latest event of a task to the storage service and
+    notify subscribers in the same process immediately. Subscribers in other
+    processes detect new events by polling the task's event key, which is a
+    single small read per interval instead of re-loading full task state.
+    """
+
+    EVENT_KEY_PREFIX = "task_event:"
+
+    def __init__(
+        self,
+        storage_service: IStorageService,
+        poll_interval: float = 2.0,
+        event_ttl: timedelta = timedelta(days=1),
+        max_retained_results: int = 10000,
+    ) -> None:
+        super().__init__(max_retained_results=max_retained_results)
+        self.storage_service = storage_service
+        self.poll_interval = poll_interval
+        self.event_ttl = event_ttl
+        self._pollers: dict[TaskSubscription, asyncio.Task[None]] = {}
+
+    def _event_key(self, task_id: str) -> str:
+        """Get the storage key holding the latest event of a task."""
+        return f"{self.EVENT_KEY_PREFIX}{task_id}"
+
+    async def _load_event(self, task_id: str) -> TaskEvent | None:
+        """Load the latest stored event of a task."""
+        try:
+            body = await self.storage_service.get(self._event_key(task_id))
+            return TaskEvent.from_dict(body) if body else None
+        except Exception as e:
+            logger.warning(f"Failed to load event for task {task_id}: {e}")
+            return None
+
+    async def publish(self, event: TaskEvent) -> None:
+        """Store the event and notify local subscribers."""
+        try:
+            await self.storage_service.set(
+                self._event_key(event.task_id), event.to_dict(), ttl=self.event_ttl
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store event for task {event.task_id}: {e}")
+
+        await super().publish(event)
+
+    async def subscribe(self, task_id: str) -> TaskSubscription:
+        """Subscribe locally and start polling storage for remote events."""
+        subscription = await super().subscribe(task_id)
+
+        # Only events published after subscribing are delivered
+        stored = await self._load_event(task_id)
+        if stored is not None:
+            subscription.last_event_id = stored.event_id
+
+        self._pollers[subscription] = asyncio.create_task(self._poll(subscription))
+        return subscription
+
+    async def get_result(self, task_id: str) -> TaskEvent | None:
+        """Get terminal event from local retention or storage."""
+        event = await super().get_result(task_id)
+        if event is not None:
+            return event
+
+        stored = await self._load_event(task_id)
+        return stored if stored is not None and stored.terminal else None
+
+    async def health_check(self) -> bool:
+        """Check if the underlying storage is healthy."""
+        return await self.storage_service.health_check()
+
+    async def _unsubscribe(self, subscription: TaskSubscription) -> None:
+        """Stop polling for a closed subscription."""
+        poller = self._pollers.pop(subscription, None)
+        if poller is not None:
+            poller.cancel()
+        await super()._unsubscribe(subscription)
+
+    async def _poll(self, subscription: TaskSubscription) -> None:
+        """Deliver events stored by other processes."""
+        while not subscription.closed:
+            await asyncio.sleep(self.poll_interval)
+
+            event = await self._load_event(subscription.task_id)
+            if event is not None and event.event_id != subscription.last_event_id:
+                subscription.deliver(event)
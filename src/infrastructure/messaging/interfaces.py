@@ -1,12 +1,18 @@
 """Generic interfaces for messaging and queue services."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
+
+from src.shared import serialization
+
+# Size of the chunks stored values are streamed in
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class TaskStatus(Enum):
@@ -96,6 +102,125 @@ class TaskResult:
             self.metadata = {}
 
 
+@dataclass
+class TaskEvent:
+    """Task progress or completion event published through a result backend.
+
+    ``kind`` is ``"progress"`` for tracking updates and ``"result"`` for the
+    final outcome submitted by a worker. ``terminal`` marks events after which
+    no further updates are expected for the task.
+    """
+
+    task_id: str
+    kind: str
+    status: str
+    data: dict[str, Any] = field(default_factory=dict)
+    terminal: bool = False
+    event_id: str = field(default_factory=lambda: uuid4().hex)
+    published_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert event to a JSON serializable dict."""
+        return {
+            "task_id": self.task_id,
+            "kind": self.kind,
+            "status": self.status,
+            "data": self.data,
+            "terminal": self.terminal,
+            "event_id": self.event_id,
+            "published_at": self.published_at.isoformat(),
+        }
+
+    @classmethod
+    def from_task_result(cls, result: "TaskResult") -> "TaskEvent":
+        """Create a result event from a worker's task result."""
+        return cls(
+            task_id=str(result.task_id),
+            kind="result",
+            status=result.status.value,
+            data={
+                "result": result.result,
+                "error": result.error,
+                "worker_id": result.worker_id,
+                "completed_at": (
+                    result.completed_at.isoformat() if result.completed_at else None
+                ),
+            },
+            terminal=result.status
+            in (TaskStatus.SUCCESS, TaskStatus.FAILURE, TaskStatus.REVOKED),
+        )
+
+    @classmethod
+    def from_dict(cls, body: dict[str, Any]) -> "TaskEvent":
+        """Create event from a dict produced by ``to_dict``."""
+        return cls(
+            task_id=body["task_id"],
+            kind=body["kind"],
+            status=body["status"],
+            data=body.get("data") or {},
+            terminal=body.get("terminal", False),
+            event_id=body.get("event_id") or uuid4().hex,
+            published_at=(
+                datetime.fromisoformat(body["published_at"])
+                if body.get("published_at")
+                else datetime.now(UTC)
+            ),
+        )
+
+
+class TaskSubscription:
+    """Subscription to the events of a single task.
+
+    Events are buffered in an asyncio queue by the result backend. Use as an
+    async context manager so the backend can release its resources on exit.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        on_close: Callable[["TaskSubscription"], Awaitable[None]] | None = None,
+    ) -> None:
+        self.task_id = task_id
+        self._events: asyncio.Queue[TaskEvent] = asyncio.Queue()
+        self._on_close = on_close
+        self.closed = False
+        self.last_event_id: str | None = None
+
+    def deliver(self, event: TaskEvent) -> None:
+        """Buffer an event for this subscription."""
+        if not self.closed:
+            self.last_event_id = event.event_id
+            self._events.put_nowait(event)
+
+    async def next_event(self, timeout: float | None = None) -> TaskEvent | None:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait (None to wait indefinitely)
+
+        Returns:
+            Next event or None if the timeout expired
+        """
+        try:
+            return await asyncio.wait_for(self._events.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        """Stop receiving events."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._on_close is not None:
+            await self._on_close(self)
+
+    async def __aenter__(self) -> "TaskSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
 class IQueueService(ABC):
     """Generic queue service interface."""
 
@@ -148,6 +273,57 @@ class IQueueService(ABC):
         """
         pass
 
+    async def send_tasks(self, messages: list[TaskMessage]) -> list[UUID]:
+        """Send several task messages to their queues.
+
+        Implementations should override this with the broker's native batch
+        API; the default sends messages one at a time.
+
+        Args:
+            messages: Task messages to send
+
+        Returns:
+            IDs of the tasks that were sent
+        """
+        return [await self.send_task(message) for message in messages]
+
+    async def receive_tasks(
+        self,
+        queue: str = "default",
+        max_messages: int = 10,
+        timeout: int | None = None,
+    ) -> list[TaskMessage]:
+        """Receive up to ``max_messages`` task messages from the queue.
+
+        Args:
+            queue: Queue name to receive from
+            max_messages: Maximum number of messages to return
+            timeout: Timeout in seconds to wait for the first message
+
+        Returns:
+            Received task messages (empty if none arrived before the timeout)
+        """
+        messages: list[TaskMessage] = []
+        while len(messages) < max_messages:
+            message = await self.receive_task(
+                queue=queue, timeout=timeout if not messages else 0
+            )
+            if message is None:
+                break
+            messages.append(message)
+        return messages
+
+    async def ack_tasks(self, task_ids: list[UUID]) -> list[UUID]:
+        """Acknowledge completion of several tasks.
+
+        Args:
+            task_ids: Task IDs to acknowledge
+
+        Returns:
+            IDs of the tasks that were acknowledged
+        """
+        return [task_id for task_id in task_ids if await self.ack_task(task_id)]
+
     @abstractmethod
     async def nack_task(self, task_id: UUID, requeue: bool = True) -> bool:
         """Negative acknowledge task (reject).
@@ -161,6 +337,72 @@ class IQueueService(ABC):
         """
         pass
 
+    async def retry_task(self, message: TaskMessage, delay: float) -> bool:
+        """Settle a received task and redeliver it after a delay.
+
+        ``message`` carries the incremented retry count. Implementations
+        should use the broker's native delayed delivery; the default rejects
+        the original delivery and re-sends the task from an in-process timer,
+        which is lost if the process exits.
+
+        Args:
+            message: Task message to redeliver
+            delay: Delay before redelivery in seconds
+
+        Returns:
+            True if the retry was scheduled
+        """
+        if not await self.nack_task(message.task_id, requeue=False):
+            return False
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(delay, lambda: loop.create_task(self.send_task(message)))
+        return True
+
+    async def extend_visibility(self, task_id: UUID, timeout: int) -> bool:
+        """Keep a running task from being redelivered to another worker.
+
+        Workers call this periodically (heartbeat) while a task runs. Brokers
+        that hold unacknowledged deliveries until the consumer disconnects
+        need no extension, which is the default.
+
+        Args:
+            task_id: ID of a received, unacknowledged task
+            timeout: Seconds from now the task should stay invisible
+
+        Returns:
+            True if the task remains reserved for this worker
+        """
+        return True
+
+    async def get_dead_letter_tasks(
+        self, queue: str = "default", limit: int = 10
+    ) -> list[TaskMessage]:
+        """Inspect permanently failed tasks without removing them.
+
+        Args:
+            queue: Queue whose dead-letter queue to inspect
+            limit: Maximum number of tasks to return
+
+        Returns:
+            Dead-lettered task messages
+        """
+        return []
+
+    async def requeue_dead_letter_tasks(
+        self, queue: str = "default", limit: int | None = None
+    ) -> int:
+        """Move dead-lettered tasks back onto their queue for another attempt.
+
+        Args:
+            queue: Queue whose dead-letter queue to drain
+            limit: Maximum number of tasks to move (None for all)
+
+        Returns:
+            Number of tasks requeued
+        """
+        return 0
+
     @abstractmethod
     async def get_task_status(self, task_id: UUID) -> TaskStatus | None:
         """Get task status.
@@ -308,6 +550,80 @@ class IStorageService(ABC):
         """
         pass
 
+    async def get_raw(self, key: str) -> bytes | None:
+        """Get the serialized JSON of a value by key.
+
+        Backends that store JSON should override this to return the stored
+        bytes without parsing them; the default serializes ``get``.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            UTF-8 encoded JSON of the stored value, or None
+        """
+        value = await self.get(key)
+        if value is None or isinstance(value, bytes):
+            return value
+        return serialization.dumps(value)
+
+    async def open(self, key: str) -> "StoredObject | None":
+        """Open a stored value for reading in chunks.
+
+        Backends should override this together with ``stream`` to read only
+        the object's size; the default loads the stored JSON.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            Handle to the stored value, or None if not found
+        """
+        data = await self.get_raw(key)
+        return None if data is None else StoredObject(self, key, len(data))
+
+    async def stream(
+        self,
+        key: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a stored value.
+
+        Backends should override this to read one chunk at a time, so memory
+        stays constant regardless of the value's size; the default slices
+        the stored JSON.
+
+        Args:
+            key: Storage key
+            start: First byte to read
+            end: Last byte to read (inclusive), None for the end of the value
+            chunk_size: Maximum size of the chunks
+
+        Yields:
+            Chunks of the stored bytes
+        """
+        data = await self.get_raw(key) or b""
+        stop = len(data) if end is None else min(end + 1, len(data))
+        for offset in range(start, stop, chunk_size):
+            yield data[offset : min(offset + chunk_size, stop)]
+
+    async def set_raw(
+        self, key: str, data: bytes, ttl: timedelta | None = None
+    ) -> bool:
+        """Store serialized content as is, such as newline-delimited JSON.
+
+        Args:
+            key: Storage key
+            data: Bytes to store
+            ttl: Time to live
+
+        Returns:
+            True if set successfully
+        """
+        return await self.set(key, data, ttl)
+
     @abstractmethod
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """Set a value with optional TTL.
@@ -404,3 +720,87 @@ class IStorageService(ABC):
             True if healthy
         """
         pass
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """Handle to a stored value that is read in chunks."""
+
+    storage: IStorageService
+    key: str
+    size: int
+
+    def stream(
+        self,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of the stored value.
+
+        Args:
+            start: First byte to read
+            end: Last byte to read (inclusive), None for the end of the value
+            chunk_size: Maximum size of the chunks
+
+        Returns:
+            Iterator over chunks of the stored bytes
+        """
+        return self.storage.stream(self.key, start, end, chunk_size)
+
+
+class IResultBackend(ABC):
+    """Publish/subscribe backend for task progress and completion events."""
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Connect to the result backend."""
+        pass
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        """Disconnect from the result backend."""
+        pass
+
+    @abstractmethod
+    async def publish(self, event: TaskEvent) -> None:
+        """Publish an event to every subscriber of its task.
+
+        Args:
+            event: Task event to publish
+        """
+        pass
+
+    @abstractmethod
+    async def subscribe(self, task_id: str) -> TaskSubscription:
+        """Subscribe to events of a task.
+
+        Args:
+            task_id: Task ID to subscribe to
+
+        Returns:
+            Subscription receiving events published after this call
+        """
+        pass
+
+    @abstractmethod
+    async def get_result(self, task_id: str) -> TaskEvent | None:
+        """Get the retained terminal event of a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Terminal event or None if the task has not finished (or the
+            event is no longer retained)
+        """
+        pass
+
+    @abstractmethod
+    async def health_check(self) -> bool:
+        """Check if result backend is healthy.
+
+        Returns:
+            True if healthy
+        """
+        pass
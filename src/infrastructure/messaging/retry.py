@@ -0,0 +1,115 @@
+"""Retry backoff and delayed-delivery helpers shared by the queue services."""
+
+import math
+import secrets
+import time
+from collections.abc import Callable
+
+from src.shared.config.settings import settings
+
+
+def compute_retry_delay(retry_count: int) -> float:
+    """Calculate the exponential backoff delay before a retry attempt.
+
+    Formula: ``base_delay * 2^(retry_count - 1)`` capped at the configured
+    maximum, with +/-20% jitter to prevent a thundering herd.
+
+    Args:
+        retry_count: Retry attempt number (1 for the first retry)
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(
+        settings.task_retry_base_delay * (2 ** max(retry_count - 1, 0)),
+        settings.task_retry_max_delay,
+    )
+    jitter_factor = 0.8 + (secrets.randbelow(401) / 1000)
+    return float(delay * jitter_factor)
+
+
+def retry_delay_bucket(delay: float) -> int:
+    """Round a delay up to a power-of-two number of seconds.
+
+    Brokers that implement delays with per-queue TTLs need one queue per
+    distinct delay; bucketing keeps that to a handful of queues.
+
+    Args:
+        delay: Requested delay in seconds
+
+    Returns:
+        Bucketed delay in whole seconds (at least 1)
+    """
+    if delay <= 1:
+        return 1
+    return int(2 ** math.ceil(math.log2(delay)))
+
+
+class TimerWheel[T]:
+    """Hashed timer wheel for delaying in-memory task redelivery.
+
+    Items are placed in one of ``slots`` buckets by their due tick, so
+    scheduling and expiring are O(1) per item instead of keeping a sorted
+    structure. Items due more than one revolution ahead stay in their slot
+    until the wheel reaches their absolute due tick.
+    """
+
+    def __init__(
+        self,
+        tick: float = 1.0,
+        slots: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.tick = tick
+        self.slots = slots
+        self._clock = clock
+        self._wheel: list[list[tuple[int, T]]] = [[] for _ in range(slots)]
+        self._current_tick = self._tick_at(clock())
+        self._size = 0
+
+    def _tick_at(self, timestamp: float) -> int:
+        return int(timestamp // self.tick)
+
+    def schedule(self, item: T, delay: float) -> None:
+        """Schedule an item to become due after ``delay`` seconds.
+
+        Args:
+            item: Item to release later
+            delay: Delay in seconds
+        """
+        due_tick = max(
+            self._tick_at(self._clock() + max(delay, 0.0)), self._current_tick
+        )
+        self._wheel[due_tick % self.slots].append((due_tick, item))
+        self._size += 1
+
+    def advance(self) -> list[T]:
+        """Advance the wheel to the current time and pop every due item.
+
+        Returns:
+            Items whose delay has elapsed, in due order
+        """
+        now_tick = self._tick_at(self._clock())
+        due: list[T] = []
+
+        # Visit each slot at most once even after a long pause
+        first_tick = max(self._current_tick, now_tick - self.slots + 1)
+        for tick in range(first_tick, now_tick + 1):
+            slot = self._wheel[tick % self.slots]
+            if not slot:
+                continue
+
+            remaining = []
+            for due_tick, item in slot:
+                if due_tick <= now_tick:
+                    due.append(item)
+                else:
+                    remaining.append((due_tick, item))
+            self._wheel[tick % self.slots] = remaining
+
+        self._current_tick = now_tick
+        self._size -= len(due)
+        return due
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,238 @@
+"""Priority and per-user fair-share scheduling shared by the queue services."""
+
+import heapq
+import itertools
+import zlib
+from collections.abc import Iterator, Sequence
+
+from .interfaces import TaskMessage, TaskPriority
+
+# Relative share of receive attempts each priority level gets when draining
+PRIORITY_WEIGHTS: dict[TaskPriority, int] = {
+    TaskPriority.CRITICAL: 8,
+    TaskPriority.HIGH: 4,
+    TaskPriority.NORMAL: 2,
+    TaskPriority.LOW: 1,
+}
+
+# Fair-share key for tasks that do not carry a user identifier
+DEFAULT_FAIR_SHARE_KEY = "default"
+
+
+def fair_share_key(message: TaskMessage) -> str:
+    """Get the key tasks are fairly shared between (the submitting user).
+
+    Args:
+        message: Task message
+
+    Returns:
+        The ``user_id`` from the task metadata, or the default key
+    """
+    user_id = (message.metadata or {}).get("user_id")
+    return str(user_id) if user_id else DEFAULT_FAIR_SHARE_KEY
+
+
+def priority_queue_name(
+    queue: str, priority: TaskPriority, separator: str = "."
+) -> str:
+    """Get the physical sub-queue name for a priority level.
+
+    Normal priority keeps the plain queue name so existing queues and
+    producers that ignore priorities continue to work unchanged.
+
+    Args:
+        queue: Logical queue name
+        priority: Task priority
+        separator: Separator allowed by the broker's queue naming rules
+
+    Returns:
+        Physical queue name
+    """
+    if priority == TaskPriority.NORMAL:
+        return queue
+    return f"{queue}{separator}{priority.name.lower()}"
+
+
+def fair_share_lane(message: TaskMessage, lanes: int) -> int:
+    """Get the fair-share lane a task is routed to.
+
+    Users are hashed onto a fixed number of lanes (stochastic fair queuing),
+    so each user's tasks stay in order on one lane while lanes are drained
+    round-robin. The hash is stable across processes so every producer
+    routes a user to the same lane.
+
+    Args:
+        message: Task message
+        lanes: Number of lanes per priority level
+
+    Returns:
+        Lane index in ``range(lanes)``
+    """
+    if lanes <= 1:
+        return 0
+    return zlib.crc32(fair_share_key(message).encode()) % lanes
+
+
+def fair_share_queue_name(
+    queue: str, priority: TaskPriority, lane: int, separator: str = "."
+) -> str:
+    """Get the physical sub-queue name for a priority level and lane.
+
+    Lane 0 keeps the priority sub-queue name, so with a single lane the
+    naming is that of :func:`priority_queue_name`.
+
+    Args:
+        queue: Logical queue name
+        priority: Task priority
+        lane: Fair-share lane
+        separator: Separator allowed by the broker's queue naming rules
+
+    Returns:
+        Physical queue name
+    """
+    name = priority_queue_name(queue, priority, separator)
+    if lane == 0:
+        return name
+    return f"{name}{separator}lane{lane}"
+
+
+class RoundRobin[T]:
+    """Rotating order over a fixed set of items, such as fair-share lanes.
+
+    The item after the last one served comes first in the next order, so
+    items with work are served in turn whichever of them is busiest.
+    """
+
+    def __init__(self, items: Sequence[T]) -> None:
+        self.items = list(items)
+        self._next = 0
+
+    def order(self) -> list[T]:
+        """Get the items in the order they should be served next.
+
+        Returns:
+            Items, starting after the last one served
+        """
+        return self.items[self._next :] + self.items[: self._next]
+
+    def served(self, item: T) -> None:
+        """Record that an item was served.
+
+        Args:
+            item: Item that was served
+        """
+        self._next = (self.items.index(item) + 1) % len(self.items)
+
+
+class WeightedPriorityDrainer:
+    """Smooth weighted round-robin over priority sub-queues.
+
+    Each call picks the priority to drain first in proportion to its weight
+    and falls back to the remaining levels from highest to lowest, so higher
+    priorities are served more often while low priority work never starves.
+    """
+
+    def __init__(self, weights: dict[TaskPriority, int] | None = None) -> None:
+        self.weights = weights or PRIORITY_WEIGHTS
+        self._current: dict[TaskPriority, int] = dict.fromkeys(self.weights, 0)
+
+    def next_order(self) -> list[TaskPriority]:
+        """Get the order in which priority sub-queues should be polled next.
+
+        Returns:
+            Priorities, the weighted pick first and the rest by descending level
+        """
+        total = sum(self.weights.values())
+        for priority, weight in self.weights.items():
+            self._current[priority] += weight
+
+        selected = max(self._current, key=lambda p: (self._current[p], p.value))
+        self._current[selected] -= total
+
+        rest = sorted(
+            (p for p in self.weights if p != selected),
+            key=lambda p: p.value,
+            reverse=True,
+        )
+        return [selected, *rest]
+
+
+class FairShareQueue:
+    """Heap-based in-memory task queue ordered by priority and fair share.
+
+    Tasks are ordered by priority first. Within a priority, each user's tasks
+    get increasing virtual start times (start-time fair queuing), so a single
+    request from one user is interleaved ahead of the remainder of another
+    user's large batch instead of waiting behind all of it. Tasks from the
+    same user and priority keep FIFO order.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, int, TaskMessage]] = []
+        self._counter = itertools.count()
+        self._virtual_time = 0
+        self._last_tag: dict[str, int] = {}
+
+    def push(self, message: TaskMessage) -> None:
+        """Add a task to the queue.
+
+        Args:
+            message: Task message
+        """
+        key = fair_share_key(message)
+        tag = max(self._virtual_time, self._last_tag.get(key, 0)) + 1
+        self._last_tag[key] = tag
+
+        heapq.heappush(
+            self._heap, (-message.priority.value, tag, next(self._counter), message)
+        )
+
+    def pop(self) -> TaskMessage | None:
+        """Remove and return the next task to run.
+
+        Returns:
+            Next task message or None if the queue is empty
+        """
+        if not self._heap:
+            return None
+
+        _, tag, _, message = heapq.heappop(self._heap)
+        self._virtual_time = max(self._virtual_time, tag)
+
+        # Forget users whose backlog has been fully served
+        key = fair_share_key(message)
+        if self._last_tag.get(key, 0) <= self._virtual_time:
+            self._last_tag.pop(key, None)
+
+        return message
+
+    def pop_many(self, max_messages: int) -> list[TaskMessage]:
+        """Remove and return up to ``max_messages`` tasks in scheduling order.
+
+        Args:
+            max_messages: Maximum number of tasks to return
+
+        Returns:
+            Task messages
+        """
+        messages: list[TaskMessage] = []
+        while len(messages) < max_messages and self._heap:
+            message = self.pop()
+            if message is not None:
+                messages.append(message)
+        return messages
+
+    def clear(self) -> None:
+        """Remove all tasks."""
+        self._heap.clear()
+        self._last_tag.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[TaskMessage]:
+        """Iterate over queued tasks in scheduling order without removing them."""
+        return (entry[3] for entry in sorted(self._heap))
+
+    def __contains__(self, message: object) -> bool:
+        return any(entry[3] == message for entry in self._heap)
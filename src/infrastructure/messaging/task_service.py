@@ -7,11 +7,19 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from .factory import get_queue_service, get_worker_service
-from .interfaces import TaskMessage, TaskPriority, TaskStatus
+from opentelemetry.trace import SpanKind
+
+from src.shared import telemetry
+
+from .factory import get_queue_service, get_result_backend, get_worker_service
+from .interfaces import IResultBackend, TaskEvent, TaskMessage, TaskPriority, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Safety net for events missed by the result backend: the queue status is
+# re-checked at least this often while waiting on a subscription.
+RESULT_RECHECK_INTERVAL = 30.0
+
 
 class Task:
     """Task decorator and execution wrapper."""
@@ -106,7 +114,21 @@ class Task:
         )
 
         queue_service = await get_queue_service()
-        await queue_service.send_task(message)
+        with telemetry.span(
+            f"send {self.name}",
+            kind=SpanKind.PRODUCER,
+            task_id=str(task_id),
+            queue=message.queue,
+        ):
+            # The worker continues this trace from the message metadata
+            if message.metadata is not None:
+                telemetry.inject_trace_context(message.metadata)
+            else:
+                logger.warning(
+                    f"Task {self.name} ({task_id}) has no metadata, "
+                    "sending it without trace context"
+                )
+            await queue_service.send_task(message)
 
         logger.info(f"Queued task {self.name} with ID {task_id}")
         return AsyncResult(task_id)
@@ -125,9 +147,54 @@ class AsyncResult:
         self._error: str | None = None
 
     async def get(self, timeout: int | None = None) -> Any:
-        """Get task result, waiting if necessary."""
-        queue_service = await get_queue_service()
+        """Get task result, waiting if necessary.
 
+        Waits on the result backend so completion wakes the caller
+        immediately. Falls back to polling the queue service when no result
+        backend is available.
+        """
+        queue_service = await get_queue_service()
+        result_backend = await self._get_result_backend()
+
+        if result_backend is None:
+            return await self._poll_result(queue_service, timeout)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+
+        async with await result_backend.subscribe(self.id) as subscription:
+            event = await result_backend.get_result(self.id)
+            while True:
+                if event is not None and event.kind == "result" and event.terminal:
+                    return self._resolve_event(event)
+
+                status = await queue_service.get_task_status(self.task_id)
+                if status in (
+                    TaskStatus.SUCCESS,
+                    TaskStatus.FAILURE,
+                    TaskStatus.REVOKED,
+                ):
+                    # The result may have been published since it was fetched
+                    event = await result_backend.get_result(self.id)
+                    if event is not None and event.kind == "result" and event.terminal:
+                        return self._resolve_event(event)
+                    if status == TaskStatus.SUCCESS:
+                        return self._result
+                    raise TaskFailure(f"Task {self.task_id} failed: {self._error}")
+
+                wait = RESULT_RECHECK_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise TaskTimeout(
+                            f"Task {self.task_id} timed out after {timeout} seconds"
+                        )
+                    wait = min(wait, remaining)
+
+                event = await subscription.next_event(timeout=wait)
+
+    async def _poll_result(self, queue_service: Any, timeout: int | None) -> Any:
+        """Poll the queue service for completion."""
         start_time = datetime.utcnow()
         while True:
             status = await queue_service.get_task_status(self.task_id)
@@ -146,6 +213,24 @@ class AsyncResult:
             # Wait before checking again
             await asyncio.sleep(1)
 
+    async def _get_result_backend(self) -> IResultBackend | None:
+        """Get result backend if messaging services are initialized."""
+        try:
+            return await get_result_backend()
+        except Exception as e:
+            logger.debug(f"Result backend not available, polling instead: {e}")
+            return None
+
+    def _resolve_event(self, event: TaskEvent) -> Any:
+        """Record a result event and return its value or raise its error."""
+        self._status = TaskStatus(event.status)
+        self._result = event.data.get("result")
+        self._error = event.data.get("error")
+
+        if self._status == TaskStatus.SUCCESS:
+            return self._result
+        raise TaskFailure(f"Task {self.task_id} failed: {self._error}")
+
     async def ready(self) -> bool:
         """Check if task is ready (completed or failed)."""
         status = await self.get_status()
@@ -237,6 +322,14 @@ class TaskService:
 
         return AsyncResult(task_id)
 
+    @staticmethod
+    async def send_tasks(messages: list[TaskMessage]) -> list[AsyncResult]:
+        """Send many prepared task messages using the queue's batch API."""
+        queue_service = await get_queue_service()
+        task_ids = await queue_service.send_tasks(messages)
+
+        return [AsyncResult(task_id) for task_id in task_ids]
+
     @staticmethod
     async def get_task_result(task_id: UUID) -> AsyncResult:
         """Get result object for a task ID."""
@@ -248,6 +341,22 @@ class TaskService:
         queue_service = await get_queue_service()
         return await queue_service.purge_queue(queue)
 
+    @staticmethod
+    async def get_dead_letter_tasks(
+        queue: str = "default", limit: int = 10
+    ) -> list[TaskMessage]:
+        """Inspect tasks that exhausted their retries on a queue."""
+        queue_service = await get_queue_service()
+        return await queue_service.get_dead_letter_tasks(queue, limit=limit)
+
+    @staticmethod
+    async def requeue_dead_letter_tasks(
+        queue: str = "default", limit: int | None = None
+    ) -> int:
+        """Give dead-lettered tasks on a queue another attempt."""
+        queue_service = await get_queue_service()
+        return await queue_service.requeue_dead_letter_tasks(queue, limit=limit)
+
     @staticmethod
     async def get_queue_size(queue: str) -> int:
         """Get number of tasks in queue."""
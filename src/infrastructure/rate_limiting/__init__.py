@@ -1,6 +1,13 @@
 """Rate limiting infrastructure for API endpoints."""
 
-from .rate_limiter import APIRateLimiter
-from .storage import InMemoryRateLimitStorage
+from .rate_limiter import APIRateLimiter, create_rate_limit_storage
+from .redis_storage import RedisRateLimitStorage
+from .storage import InMemoryRateLimitStorage, RateLimitStorage
 
-__all__ = ["APIRateLimiter", "InMemoryRateLimitStorage"]
+__all__ = [
+    "APIRateLimiter",
+    "InMemoryRateLimitStorage",
+    "RateLimitStorage",
+    "RedisRateLimitStorage",
+    "create_rate_limit_storage",
+]
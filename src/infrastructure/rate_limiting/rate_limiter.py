@@ -4,11 +4,27 @@ import logging
 
 from fastapi import Request
 
-from .storage import InMemoryRateLimitStorage, RateLimitResult
+from src.shared.config.settings import settings
+
+from .storage import InMemoryRateLimitStorage, RateLimitResult, RateLimitStorage
 
 logger = logging.getLogger(__name__)
 
 
+def create_rate_limit_storage() -> RateLimitStorage:
+    """Create the rate limit storage configured in settings.
+
+    Returns:
+        Redis storage shared by all replicas if configured, otherwise
+        in-process storage
+    """
+    if settings.rate_limit_backend == "redis":
+        from .redis_storage import RedisRateLimitStorage
+
+        return RedisRateLimitStorage.from_url(settings.rate_limit_redis_url)
+    return InMemoryRateLimitStorage()
+
+
 class APIRateLimiter:
     """Rate limiter for API endpoints with IP-based tracking."""
 
@@ -16,7 +32,7 @@ class APIRateLimiter:
         self,
         hourly_limit: int | None = 8,
         daily_limit: int | None = 24,
-        storage: InMemoryRateLimitStorage | None = None,
+        storage: RateLimitStorage | None = None,
     ) -> None:
         """Initialize the API rate limiter.
 
@@ -27,13 +43,13 @@ class APIRateLimiter:
         """
         self.hourly_limit = hourly_limit
         self.daily_limit = daily_limit
-        self.storage = storage or InMemoryRateLimitStorage()
+        self.storage = storage or create_rate_limit_storage()
 
         logger.info(
             f"APIRateLimiter initialized: {hourly_limit} req/hour, {daily_limit} req/day"
         )
 
-    def check_request(self, request: Request) -> RateLimitResult:
+    async def check_request(self, request: Request) -> RateLimitResult:
         """Check if a request should be allowed based on rate limits.
 
         Args:
@@ -44,7 +60,7 @@ class APIRateLimiter:
         """
         client_ip = self._extract_client_ip(request)
 
-        result = self.storage.check_rate_limit(
+        result = await self.storage.check_rate_limit(
             client_id=client_ip,
             hourly_limit=self.hourly_limit,
             daily_limit=self.daily_limit,
@@ -118,7 +134,7 @@ class APIRateLimiter:
 
         return headers
 
-    def get_current_usage(self, request: Request) -> tuple[int, int]:
+    async def get_current_usage(self, request: Request) -> tuple[int, int]:
         """Get current usage for a client.
 
         Args:
@@ -128,35 +144,35 @@ class APIRateLimiter:
             Tuple of (hourly_count, daily_count)
         """
         client_ip = self._extract_client_ip(request)
-        return self.storage.get_current_counts(client_ip)
+        return await self.storage.get_current_counts(client_ip)
 
-    def reset_client_limits(self, request: Request) -> None:
+    async def reset_client_limits(self, request: Request) -> None:
         """Reset rate limits for a specific client.
 
         Args:
             request: FastAPI request object
         """
         client_ip = self._extract_client_ip(request)
-        self.storage.reset_client_limits(client_ip)
+        await self.storage.reset_client_limits(client_ip)
         logger.info(f"Rate limits reset for IP {client_ip}")
 
-    def cleanup_expired_clients(self) -> int:
+    async def cleanup_expired_clients(self) -> int:
         """Clean up expired client data.
 
         Returns:
             Number of clients cleaned up
         """
-        cleaned_count = self.storage.cleanup_expired_clients()
+        cleaned_count = await self.storage.cleanup_expired_clients()
         if cleaned_count > 0:
             logger.info(
                 f"Cleaned up rate limit data for {cleaned_count} expired clients"
             )
         return cleaned_count
 
-    def get_stats(self) -> dict[str, int]:
+    async def get_stats(self) -> dict[str, int]:
         """Get rate limiter statistics.
 
         Returns:
             Dictionary with rate limiter statistics
         """
-        return self.storage.get_storage_stats()
+        return await self.storage.get_storage_stats()
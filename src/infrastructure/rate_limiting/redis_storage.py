@@ -0,0 +1,208 @@
+"""Redis storage for rate limiting counters shared by all API replicas."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .storage import (
+    DAY,
+    HOUR,
+    WINDOWS,
+    RateLimitResult,
+    RateLimitStorage,
+    evaluate_limits,
+    sliding_window_count,
+)
+
+
+class RedisRateLimitStorage(RateLimitStorage):
+    """Rate limiting counters kept in Redis, so limits hold across replicas.
+
+    Each client has one counter key per fixed window, which expires once it
+    no longer affects any count. A request increments the counters of its
+    windows before being checked and is rolled back if it is denied, so
+    concurrent requests on different replicas can never exceed a limit.
+    Clients are indexed by their last request in a sorted set, so idle
+    clients are removed without scanning keys.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = "ratelimit",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the storage.
+
+        Args:
+            client: ``redis.asyncio`` compatible client
+            prefix: Prefix of the keys used by the storage
+            clock: Function returning the current timestamp
+        """
+        self._client = client
+        self._prefix = prefix
+        self._clients_key = f"{prefix}:clients"
+        self._clock = clock
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "ratelimit") -> "RedisRateLimitStorage":
+        """Create a storage connected to a Redis URL.
+
+        Args:
+            url: Redis URL, e.g. ``redis://localhost:6379/0``
+            prefix: Prefix of the keys used by the storage
+
+        Returns:
+            Redis rate limit storage
+        """
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url), prefix=prefix)
+
+    def _key(self, client_id: str, length: int, start: float) -> str:
+        """Get the counter key of a client's fixed window.
+
+        Args:
+            client_id: Client identifier
+            length: Window length in seconds
+            start: Start timestamp of the fixed window
+
+        Returns:
+            Redis key of the counter
+        """
+        return f"{self._prefix}:{client_id}:{length}:{int(start // length)}"
+
+    def _window_keys(
+        self, client_id: str, current_time: float
+    ) -> list[tuple[int, float, str, str]]:
+        """Get the current and previous counter keys of a client's windows.
+
+        Args:
+            client_id: Client identifier
+            current_time: Current timestamp
+
+        Returns:
+            Window length, elapsed seconds, current key and previous key
+            of each window
+        """
+        keys = []
+        for length in WINDOWS:
+            start = current_time - current_time % length
+            keys.append(
+                (
+                    length,
+                    current_time - start,
+                    self._key(client_id, length, start),
+                    self._key(client_id, length, start - length),
+                )
+            )
+        return keys
+
+    async def check_rate_limit(
+        self, client_id: str, hourly_limit: int | None, daily_limit: int | None
+    ) -> RateLimitResult:
+        """Check if request is allowed within rate limits, and record it if so.
+
+        Args:
+            client_id: Unique identifier for the client (typically IP address)
+            hourly_limit: Maximum requests allowed per hour (None = unlimited)
+            daily_limit: Maximum requests allowed per day (None = unlimited)
+
+        Returns:
+            RateLimitResult with rate limit decision and metadata
+        """
+        current_time = self._clock()
+        windows = self._window_keys(client_id, current_time)
+
+        pipeline = self._client.pipeline(transaction=True)
+        for length, _, current_key, previous_key in windows:
+            pipeline.incr(current_key)
+            pipeline.expire(current_key, 2 * length)
+            pipeline.get(previous_key)
+        replies = await pipeline.execute()
+
+        # Counts before this request
+        counts = {
+            length: (
+                int(replies[3 * i]) - 1,
+                int(replies[3 * i + 2] or 0),
+                elapsed,
+            )
+            for i, (length, elapsed, _, _) in enumerate(windows)
+        }
+        result = evaluate_limits(counts, hourly_limit, daily_limit)
+
+        pipeline = self._client.pipeline(transaction=True)
+        if result.allowed:
+            pipeline.zadd(self._clients_key, {client_id: current_time})
+            result.current_hourly_count += 1
+            result.current_daily_count += 1
+        else:
+            for _, _, current_key, _ in windows:
+                pipeline.decr(current_key)
+        await pipeline.execute()
+        return result
+
+    async def get_current_counts(self, client_id: str) -> tuple[int, int]:
+        """Get current request counts for a client.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Tuple of (hourly_count, daily_count)
+        """
+        windows = self._window_keys(client_id, self._clock())
+        values = await self._client.mget(
+            [
+                key
+                for _, _, current_key, previous_key in windows
+                for key in (current_key, previous_key)
+            ]
+        )
+
+        counts = {
+            length: sliding_window_count(
+                int(values[2 * i] or 0), int(values[2 * i + 1] or 0), elapsed, length
+            )
+            for i, (length, elapsed, _, _) in enumerate(windows)
+        }
+        return counts[HOUR], counts[DAY]
+
+    async def cleanup_expired_clients(self, max_idle_time: float = DAY) -> int:
+        """Remove clients that haven't made requests recently.
+
+        Counters expire on their own; this only trims the index of clients,
+        visiting just the idle ones.
+
+        Args:
+            max_idle_time: Maximum idle time in seconds before cleanup
+
+        Returns:
+            Number of clients cleaned up
+        """
+        cutoff = self._clock() - max_idle_time
+        return int(
+            await self._client.zremrangebyscore(self._clients_key, "-inf", cutoff)
+        )
+
+    async def reset_client_limits(self, client_id: str) -> None:
+        """Reset rate limits for a specific client.
+
+        Args:
+            client_id: Client identifier to reset
+        """
+        windows = self._window_keys(client_id, self._clock())
+        pipeline = self._client.pipeline(transaction=True)
+        for _, _, current_key, previous_key in windows:
+            pipeline.delete(current_key, previous_key)
+        pipeline.zrem(self._clients_key, client_id)
+        await pipeline.execute()
+
+    async def get_storage_stats(self) -> dict[str, int]:
+        """Get storage statistics.
+
+        Returns:
+            Dictionary with the number of clients seen by all replicas
+        """
+        return {"total_clients": int(await self._client.zcard(self._clients_key))}
@@ -1,18 +1,106 @@
-"""In-memory storage for rate limiting counters."""
+"""Storage for rate limiting counters.
 
+Requests are counted with a sliding window counter: per client and window
+length only the request counts of the current and the previous fixed window
+are kept. The count over the last window length is estimated by weighting
+the previous window's count by how much of it still overlaps, so memory per
+client stays constant regardless of its request rate.
+"""
+
+import math
 import time
-from collections import defaultdict, deque
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from threading import Lock
+
+HOUR = 3600
+DAY = 86400
+WINDOWS = (HOUR, DAY)
+
+
+def sliding_window_count(
+    current: int, previous: int, elapsed: float, length: int
+) -> int:
+    """Estimate the requests made within the last window length.
+
+    The weighted previous count is rounded up, so the estimate never admits
+    more requests than the limit.
+
+    Args:
+        current: Requests in the current fixed window
+        previous: Requests in the previous fixed window
+        elapsed: Seconds since the current fixed window started
+        length: Window length in seconds
+
+    Returns:
+        Estimated number of requests
+    """
+    return math.ceil(previous * (1 - elapsed / length)) + current
+
+
+def sliding_window_retry_after(
+    current: int, previous: int, elapsed: float, length: int, limit: int
+) -> int:
+    """Calculate the seconds until a limited client may make a request.
+
+    Args:
+        current: Requests in the current fixed window
+        previous: Requests in the previous fixed window
+        elapsed: Seconds since the current fixed window started
+        length: Window length in seconds
+        limit: Maximum requests per window length
+
+    Returns:
+        Seconds until the estimated count drops below the limit
+    """
+    if limit <= 0:
+        return length
+    if current < limit:
+        # Wait until enough of the previous window has slid out
+        wait = length * (1 - (limit - current - 1) / previous) - elapsed
+    else:
+        # Wait for the next window, until enough of this one has slid out
+        wait = length * (2 - (limit - 1) / current) - elapsed
+    # Rounded first, so float error cannot add a second
+    return max(math.ceil(round(wait, 6)), 1)
+
+
+@dataclass
+class WindowCounter:
+    """Track requests of a client in the current and previous fixed window."""
+
+    start: float = 0.0
+    current: int = 0
+    previous: int = 0
+
+    def advance(self, now: float, length: int) -> None:
+        """Move the counter to the fixed window containing now.
+
+        Args:
+            now: Current timestamp
+            length: Window length in seconds
+        """
+        start = now - now % length
+        if start == self.start:
+            return
+        self.previous = self.current if start - self.start == length else 0
+        self.current = 0
+        self.start = start
 
 
 @dataclass
 class RateLimitCounter:
     """Track rate limit counts for a specific client."""
 
-    hourly_requests: deque[float] = field(default_factory=deque)
-    daily_requests: deque[float] = field(default_factory=deque)
-    last_cleanup: float = field(default_factory=time.time)
+    hourly: WindowCounter = field(default_factory=WindowCounter)
+    daily: WindowCounter = field(default_factory=WindowCounter)
+    last_request: float = field(default_factory=time.time)
+
+    @property
+    def expires_at(self) -> float:
+        """Time after which the counter no longer affects any count."""
+        return self.last_request - self.last_request % DAY + 2 * DAY
 
 
 @dataclass
@@ -28,18 +116,59 @@ class RateLimitResult:
     limit_type: str | None = None  # "hourly" or "daily"
 
 
-class InMemoryRateLimitStorage:
-    """In-memory storage for rate limiting with thread-safe operations."""
+def evaluate_limits(
+    counts: dict[int, tuple[int, int, float]],
+    hourly_limit: int | None,
+    daily_limit: int | None,
+) -> RateLimitResult:
+    """Decide whether a request is allowed from the counts of its client.
+
+    Args:
+        counts: Current count, previous count and elapsed seconds of the
+            client's fixed windows, by window length
+        hourly_limit: Maximum requests allowed per hour (None = unlimited)
+        daily_limit: Maximum requests allowed per day (None = unlimited)
+
+    Returns:
+        RateLimitResult with the counts before the request
+    """
+    hourly_count = sliding_window_count(*counts[HOUR], HOUR)
+    daily_count = sliding_window_count(*counts[DAY], DAY)
+
+    for limit_type, length, limit, count in (
+        ("hourly", HOUR, hourly_limit, hourly_count),
+        ("daily", DAY, daily_limit, daily_count),
+    ):
+        if limit is not None and count >= limit:
+            return RateLimitResult(
+                allowed=False,
+                current_hourly_count=hourly_count,
+                current_daily_count=daily_count,
+                hourly_limit=hourly_limit,
+                daily_limit=daily_limit,
+                retry_after_seconds=sliding_window_retry_after(
+                    *counts[length], length, limit
+                ),
+                limit_type=limit_type,
+            )
+
+    return RateLimitResult(
+        allowed=True,
+        current_hourly_count=hourly_count,
+        current_daily_count=daily_count,
+        hourly_limit=hourly_limit,
+        daily_limit=daily_limit,
+    )
 
-    def __init__(self) -> None:
-        """Initialize the storage."""
-        self._counters: dict[str, RateLimitCounter] = defaultdict(RateLimitCounter)
-        self._lock = Lock()
 
-    def check_rate_limit(
+class RateLimitStorage(ABC):
+    """Abstract storage for rate limiting counters."""
+
+    @abstractmethod
+    async def check_rate_limit(
         self, client_id: str, hourly_limit: int | None, daily_limit: int | None
     ) -> RateLimitResult:
-        """Check if request is allowed within rate limits.
+        """Check if request is allowed within rate limits, and record it if so.
 
         Args:
             client_id: Unique identifier for the client (typically IP address)
@@ -49,89 +178,124 @@ class InMemoryRateLimitStorage:
         Returns:
             RateLimitResult with rate limit decision and metadata
         """
-        with self._lock:
-            current_time = time.time()
-            counter = self._counters[client_id]
-
-            # Clean up old requests
-            self._cleanup_old_requests(counter, current_time)
-
-            # Count current requests
-            hourly_count = len(counter.hourly_requests)
-            daily_count = len(counter.daily_requests)
-
-            # Check hourly limit
-            if hourly_limit is not None and hourly_count >= hourly_limit:
-                # Calculate retry after based on oldest hourly request
-                if counter.hourly_requests:
-                    oldest_hourly = counter.hourly_requests[0]
-                    retry_after = int(3600 - (current_time - oldest_hourly)) + 1
-                else:
-                    retry_after = 3600
-
-                return RateLimitResult(
-                    allowed=False,
-                    current_hourly_count=hourly_count,
-                    current_daily_count=daily_count,
-                    hourly_limit=hourly_limit,
-                    daily_limit=daily_limit,
-                    retry_after_seconds=retry_after,
-                    limit_type="hourly",
-                )
-
-            # Check daily limit
-            if daily_limit is not None and daily_count >= daily_limit:
-                # Calculate retry after based on oldest daily request
-                if counter.daily_requests:
-                    oldest_daily = counter.daily_requests[0]
-                    retry_after = int(86400 - (current_time - oldest_daily)) + 1
-                else:
-                    retry_after = 86400
-
-                return RateLimitResult(
-                    allowed=False,
-                    current_hourly_count=hourly_count,
-                    current_daily_count=daily_count,
-                    hourly_limit=hourly_limit,
-                    daily_limit=daily_limit,
-                    retry_after_seconds=retry_after,
-                    limit_type="daily",
-                )
-
-            # Request is allowed - record it
-            counter.hourly_requests.append(current_time)
-            counter.daily_requests.append(current_time)
 
-            return RateLimitResult(
-                allowed=True,
-                current_hourly_count=hourly_count + 1,
-                current_daily_count=daily_count + 1,
-                hourly_limit=hourly_limit,
-                daily_limit=daily_limit,
-            )
+    @abstractmethod
+    async def get_current_counts(self, client_id: str) -> tuple[int, int]:
+        """Get current request counts for a client.
 
-    def _cleanup_old_requests(
-        self, counter: RateLimitCounter, current_time: float
-    ) -> None:
-        """Remove old requests outside the time windows.
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Tuple of (hourly_count, daily_count)
+        """
+
+    @abstractmethod
+    async def cleanup_expired_clients(self, max_idle_time: float = DAY) -> int:
+        """Remove clients that haven't made requests recently.
 
         Args:
-            counter: Counter to clean up
-            current_time: Current timestamp
+            max_idle_time: Maximum idle time in seconds before cleanup
+
+        Returns:
+            Number of clients cleaned up
+        """
+
+    @abstractmethod
+    async def reset_client_limits(self, client_id: str) -> None:
+        """Reset rate limits for a specific client.
+
+        Args:
+            client_id: Client identifier to reset
         """
-        # Clean hourly requests (older than 1 hour)
-        hourly_cutoff = current_time - 3600
-        while counter.hourly_requests and counter.hourly_requests[0] < hourly_cutoff:
-            counter.hourly_requests.popleft()
 
-        # Clean daily requests (older than 24 hours)
-        daily_cutoff = current_time - 86400
-        while counter.daily_requests and counter.daily_requests[0] < daily_cutoff:
-            counter.daily_requests.popleft()
+    @abstractmethod
+    async def get_storage_stats(self) -> dict[str, int]:
+        """Get storage statistics.
+
+        Returns:
+            Dictionary with storage statistics
+        """
+
+
+class InMemoryRateLimitStorage(RateLimitStorage):
+    """In-process storage for rate limiting counters.
+
+    Meant to be used from the event loop: no method awaits between reading
+    and updating a counter, so checks of concurrent requests cannot
+    interleave and no lock is needed. Clients are kept in order of their
+    last request, so expired clients are always found at the front.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Initialize the storage.
+
+        Args:
+            clock: Function returning the current timestamp
+        """
+        self._counters: OrderedDict[str, RateLimitCounter] = OrderedDict()
+        self._clock = clock
+
+    async def check_rate_limit(
+        self, client_id: str, hourly_limit: int | None, daily_limit: int | None
+    ) -> RateLimitResult:
+        """Check if request is allowed within rate limits, and record it if so.
+
+        Args:
+            client_id: Unique identifier for the client (typically IP address)
+            hourly_limit: Maximum requests allowed per hour (None = unlimited)
+            daily_limit: Maximum requests allowed per day (None = unlimited)
+
+        Returns:
+            RateLimitResult with rate limit decision and metadata
+        """
+        current_time = self._clock()
+        # Counters of expired clients no longer affect any count
+        self._remove_expired(current_time, 0)
+
+        counter = self._counters.get(client_id) or RateLimitCounter(
+            last_request=current_time
+        )
+        result = evaluate_limits(
+            self._window_counts(counter, current_time), hourly_limit, daily_limit
+        )
+        if not result.allowed:
+            return result
+
+        # Request is allowed - record it
+        counter.hourly.current += 1
+        counter.daily.current += 1
+        counter.last_request = current_time
+        self._counters[client_id] = counter
+        self._counters.move_to_end(client_id)
+
+        result.current_hourly_count += 1
+        result.current_daily_count += 1
+        return result
+
+    def _window_counts(
+        self, counter: RateLimitCounter, current_time: float
+    ) -> dict[int, tuple[int, int, float]]:
+        """Advance a client's windows and get their counts.
 
-        counter.last_cleanup = current_time
+        Args:
+            counter: Counter of the client
+            current_time: Current timestamp
 
-    def get_current_counts(self, client_id: str) -> tuple[int, int]:
+        Returns:
+            Current count, previous count and elapsed seconds by window length
+        """
+        counts = {}
+        for length, window in ((HOUR, counter.hourly), (DAY, counter.daily)):
+            window.advance(current_time, length)
+            counts[length] = (
+                window.current,
+                window.previous,
+                current_time - window.start,
+            )
+        return counts
+
+    async def get_current_counts(self, client_id: str) -> tuple[int, int]:
         """Get current request counts for a client.
 
         Args:
@@ -140,75 +304,75 @@ class InMemoryRateLimitStorage:
         Returns:
             Tuple of (hourly_count, daily_count)
         """
-        with self._lock:
-            current_time = time.time()
-            counter = self._counters[client_id]
-            self._cleanup_old_requests(counter, current_time)
+        counter = self._counters.get(client_id)
+        if counter is None:
+            return 0, 0
 
-            return len(counter.hourly_requests), len(counter.daily_requests)
+        counts = self._window_counts(counter, self._clock())
+        return (
+            sliding_window_count(*counts[HOUR], HOUR),
+            sliding_window_count(*counts[DAY], DAY),
+        )
 
-    def cleanup_expired_clients(self, max_idle_time: float = 86400) -> int:
+    async def cleanup_expired_clients(self, max_idle_time: float = DAY) -> int:
         """Remove clients that haven't made requests recently.
 
+        Clients whose counts still affect their limits are kept. Only
+        the idle clients at the front of the storage are visited.
+
         Args:
             max_idle_time: Maximum idle time in seconds before cleanup
 
         Returns:
             Number of clients cleaned up
         """
-        with self._lock:
-            current_time = time.time()
-            cutoff_time = current_time - max_idle_time
+        return self._remove_expired(self._clock(), max_idle_time)
 
-            clients_to_remove = []
-            for client_id, counter in self._counters.items():
-                # Check if client should be removed BEFORE cleaning up requests
-                # (to avoid updating last_cleanup time)
-                should_remove = counter.last_cleanup < cutoff_time
+    def _remove_expired(self, current_time: float, max_idle_time: float) -> int:
+        """Remove the clients idle for too long whose counts no longer apply.
 
-                # Clean up old requests
-                self._cleanup_old_requests(counter, current_time)
-
-                # Remove client if they have no recent requests and were idle for too long
-                if (
-                    should_remove
-                    and not counter.hourly_requests
-                    and not counter.daily_requests
-                ):
-                    clients_to_remove.append(client_id)
-
-            for client_id in clients_to_remove:
-                del self._counters[client_id]
-
-            return len(clients_to_remove)
+        Args:
+            current_time: Current timestamp
+            max_idle_time: Maximum idle time in seconds before removal
 
-    def reset_client_limits(self, client_id: str) -> None:
+        Returns:
+            Number of clients removed
+        """
+        removed = 0
+        while self._counters:
+            counter = next(iter(self._counters.values()))
+            if (
+                counter.last_request > current_time - max_idle_time
+                or counter.expires_at > current_time
+            ):
+                break
+            self._counters.popitem(last=False)
+            removed += 1
+        return removed
+
+    async def reset_client_limits(self, client_id: str) -> None:
         """Reset rate limits for a specific client.
 
         Args:
             client_id: Client identifier to reset
         """
-        with self._lock:
-            if client_id in self._counters:
-                del self._counters[client_id]
+        self._counters.pop(client_id, None)
 
-    def get_storage_stats(self) -> dict[str, int]:
+    async def get_storage_stats(self) -> dict[str, int]:
         """Get storage statistics.
 
         Returns:
             Dictionary with storage statistics
         """
-        with self._lock:
-            total_clients = len(self._counters)
-            total_hourly_requests = sum(
-                len(counter.hourly_requests) for counter in self._counters.values()
-            )
-            total_daily_requests = sum(
-                len(counter.daily_requests) for counter in self._counters.values()
-            )
-
-            return {
-                "total_clients": total_clients,
-                "total_hourly_requests": total_hourly_requests,
-                "total_daily_requests": total_daily_requests,
-            }
+        current_time = self._clock()
+        total_hourly_requests = total_daily_requests = 0
+        for counter in self._counters.values():
+            counts = self._window_counts(counter, current_time)
+            total_hourly_requests += sliding_window_count(*counts[HOUR], HOUR)
+            total_daily_requests += sliding_window_count(*counts[DAY], DAY)
+
+        return {
+            "total_clients": len(self._counters),
+            "total_hourly_requests": total_hourly_requests,
+            "total_daily_requests": total_daily_requests,
+        }
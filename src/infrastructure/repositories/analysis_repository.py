@@ -1,18 +1,92 @@
 """Repository for Analysis entities."""
 
+from collections.abc import Collection, Sequence
 from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from src.application.schemas.responses.analysis_response import AnalysisSummary
 from src.domain.entities.analysis import Analysis, AnalysisType
 from src.domain.value_objects import CIK
 from src.domain.value_objects.accession_number import AccessionNumber
-from src.infrastructure.database.cache import CacheRegionName, cache_manager
+from src.infrastructure.database.cache import (
+    CacheRegionName,
+    analysis_list_tag,
+    analysis_write_tags,
+    cache_manager,
+)
 from src.infrastructure.database.models import Analysis as AnalysisModel
+from src.infrastructure.database.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_order_by,
+)
+from src.infrastructure.messaging.interfaces import StoredObject
 from src.infrastructure.repositories.cached_base import CachedRepository
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
+
+# Loader option for queries that only map analysis columns: skips the
+# joined eager load of the filing (and its company) configured on the model
+WITHOUT_FILING = lazyload(AnalysisModel.filing)
+
+
+# Analysis columns the company statistics are derived from
+STATISTICS_COLUMNS = frozenset({"filing_id", "confidence_score", "created_at"})
+
+# Analyses without a confidence score sort below every score. The sort key
+# is never NULL, so cursor pages seek one range of ix_analyses_confidence_id,
+# which indexes the same expression
+MISSING_CONFIDENCE_SCORE = -1
+CONFIDENCE_SORT_KEY = func.coalesce(
+    AnalysisModel.confidence_score, literal_column(str(MISSING_CONFIDENCE_SCORE))
+)
+
+
+def _analysis_sort_column(sort_by: Any) -> tuple[str, Any]:
+    """Get the name and column of an analysis sort field.
+
+    Fields that are not analysis columns fall back to the creation date.
+    """
+    key = str(getattr(sort_by, "value", sort_by) or "created_at")
+    if key == "confidence_score":
+        return key, CONFIDENCE_SORT_KEY
+    if key == "analysis_type":
+        return key, AnalysisModel.analysis_type
+    return "created_at", AnalysisModel.created_at
+
+
+def analysis_cursor(
+    analysis: Analysis | AnalysisSummary, sort_by: Any, sort_direction: Any
+) -> str:
+    """Build the cursor of the page following an analysis.
+
+    Args:
+        analysis: Last analysis or analysis summary of a page
+        sort_by: Field the page is sorted by
+        sort_direction: Sort direction of the page
+
+    Returns:
+        Opaque cursor for ``AnalysisRepository.find_with_filters``
+    """
+    sort_key, _ = _analysis_sort_column(sort_by)
+    value = {
+        "created_at": analysis.created_at,
+        "confidence_score": (
+            MISSING_CONFIDENCE_SCORE
+            if analysis.confidence_score is None
+            else analysis.confidence_score
+        ),
+        "analysis_type": analysis.analysis_type.value,
+    }[sort_key]
+    direction = sort_direction if sort_by and sort_direction else "desc"
+    return encode_cursor(sort_key, direction, value, analysis.id)
 
 
 class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
@@ -25,6 +99,7 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             session: Async database session
         """
         super().__init__(session, AnalysisModel, CacheRegionName.ANALYSIS)
+        self.company_stats = CompanyStatsRepository(session)
 
     def to_entity(self, model: AnalysisModel) -> Analysis:
         """Convert AnalysisModel to Analysis entity.
@@ -45,6 +120,7 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             confidence_score=model.confidence_score,
             metadata=model.meta_data,
             created_at=model.created_at,
+            summary=model.summary,
         )
 
     def to_model(self, entity: Analysis) -> AnalysisModel:
@@ -66,8 +142,27 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             confidence_score=entity.confidence_score,
             meta_data=entity.metadata,
             created_at=entity.created_at,
+            summary=entity.summary,
         )
 
+    async def _after_write(
+        self, entities: Sequence[Analysis], columns: Collection[str] | None = None
+    ) -> None:
+        """Refresh the statistics of the companies of written analyses.
+
+        Updates that leave the columns the statistics are derived from
+        unchanged, such as progress updates, skip the refresh.
+        """
+        if columns is not None and STATISTICS_COLUMNS.isdisjoint(columns):
+            return
+        await self.company_stats.refresh_for_filings(
+            analysis.filing_id for analysis in entities
+        )
+
+    def _invalidation_tags(self, entity: Analysis) -> list[str]:
+        """Get the cached analysis lists a write to the analysis invalidates."""
+        return analysis_write_tags(entity.filing_id, entity.analysis_type.value)
+
     async def get_by_filing_id(
         self,
         filing_id: UUID,
@@ -95,6 +190,7 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
 
             stmt = (
                 select(AnalysisModel)
+                .options(WITHOUT_FILING)
                 .where(and_(*conditions))
                 .order_by(AnalysisModel.created_at.desc())
             )
@@ -104,7 +200,14 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             return [self.to_entity(model) for model in models]
 
         result = await cache_manager.get_or_create_async(
-            CacheRegionName.ANALYSIS, cache_key, fetch_from_db
+            CacheRegionName.ANALYSIS,
+            cache_key,
+            fetch_from_db,
+            tags=[
+                analysis_list_tag(
+                    filing_id, analysis_type.value if analysis_type else None
+                )
+            ],
         )
         return cast("list[Analysis]", result)
 
@@ -124,6 +227,7 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
         """
         stmt = (
             select(AnalysisModel)
+            .options(WITHOUT_FILING)
             .where(AnalysisModel.analysis_type == analysis_type.value)
             .order_by(AnalysisModel.created_at.desc())
         )
@@ -161,6 +265,7 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
 
         stmt = (
             select(AnalysisModel)
+            .options(WITHOUT_FILING)
             .where(and_(*conditions))
             .order_by(AnalysisModel.created_at.desc())
         )
@@ -180,17 +285,19 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
         """
         return await self.get_by_filing_id(filing_id)
 
-    async def count_with_filters(
+    def _filtered(
         self,
+        stmt: Any,
         company_cik: Any = None,
         analysis_types: list[AnalysisType] | None = None,
         created_from: datetime | None = None,
         created_to: datetime | None = None,
         min_confidence_score: float | None = None,
-    ) -> int:
-        """Count analyses with optional filters.
+    ) -> Any:
+        """Apply the listing filters to a select statement.
 
         Args:
+            stmt: Select statement over analyses
             company_cik: Filter by company CIK
             analysis_types: Filter by analysis types
             created_from: Filter by creation date (from)
@@ -198,10 +305,8 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             min_confidence_score: Filter by minimum confidence score
 
         Returns:
-            Count of analyses matching filters
+            Filtered select statement
         """
-        from sqlalchemy import func
-
         conditions = []
 
         if company_cik:
@@ -209,14 +314,10 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             from src.infrastructure.database.models import Company as CompanyModel
             from src.infrastructure.database.models import Filing as FilingModel
 
-            stmt = (
-                select(func.count(AnalysisModel.id))
-                .join(FilingModel, AnalysisModel.filing_id == FilingModel.id)
-                .join(CompanyModel, FilingModel.company_id == CompanyModel.id)
-            )
+            stmt = stmt.join(
+                FilingModel, AnalysisModel.filing_id == FilingModel.id
+            ).join(CompanyModel, FilingModel.company_id == CompanyModel.id)
             conditions.append(CompanyModel.cik == str(company_cik))
-        else:
-            stmt = select(func.count(AnalysisModel.id))
 
         if analysis_types:
             type_values = [at.value for at in analysis_types]
@@ -233,6 +334,93 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
 
         if conditions:
             stmt = stmt.where(and_(*conditions))
+        return stmt
+
+    def _listing(
+        self,
+        stmt: Any,
+        company_cik: Any,
+        analysis_types: list[AnalysisType] | None,
+        created_from: datetime | None,
+        created_to: datetime | None,
+        min_confidence_score: float | None,
+        sort_by: Any,
+        sort_direction: Any,
+        page: int,
+        page_size: int,
+        cursor: str | None,
+    ) -> Any:
+        """Filter, sort and paginate a select statement over analyses.
+
+        Args:
+            stmt: Select statement over analyses
+            company_cik: Filter by company CIK
+            analysis_types: Filter by analysis types
+            created_from: Filter by creation date (from)
+            created_to: Filter by creation date (to)
+            min_confidence_score: Filter by minimum confidence score
+            sort_by: Field to sort by
+            sort_direction: Sort direction
+            page: Page number (1-based), ignored with a cursor
+            page_size: Items per page
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Listing select statement
+
+        Raises:
+            InvalidCursorError: If the cursor does not match the sort order
+        """
+        stmt = self._filtered(
+            stmt,
+            company_cik=company_cik,
+            analysis_types=analysis_types,
+            created_from=created_from,
+            created_to=created_to,
+            min_confidence_score=min_confidence_score,
+        )
+
+        sort_key, sort_column = _analysis_sort_column(sort_by)
+        direction = sort_direction if sort_by and sort_direction else "desc"
+        stmt = stmt.order_by(*keyset_order_by(sort_column, AnalysisModel.id, direction))
+
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_key, direction)
+            stmt = stmt.where(
+                keyset_after(sort_column, AnalysisModel.id, direction, value, last_id)
+            )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        return stmt.limit(page_size)
+
+    async def count_with_filters(
+        self,
+        company_cik: Any = None,
+        analysis_types: list[AnalysisType] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        min_confidence_score: float | None = None,
+    ) -> int:
+        """Count analyses with optional filters.
+
+        Args:
+            company_cik: Filter by company CIK
+            analysis_types: Filter by analysis types
+            created_from: Filter by creation date (from)
+            created_to: Filter by creation date (to)
+            min_confidence_score: Filter by minimum confidence score
+
+        Returns:
+            Count of analyses matching filters
+        """
+        stmt = self._filtered(
+            select(func.count(AnalysisModel.id)),
+            company_cik=company_cik,
+            analysis_types=analysis_types,
+            created_from=created_from,
+            created_to=created_to,
+            min_confidence_score=min_confidence_score,
+        )
 
         result = await self.session.execute(stmt)
         return result.scalar() or 0
@@ -248,9 +436,15 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
         sort_direction: Any = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
     ) -> list[Analysis]:
         """Find analyses with optional filters, sorting, and pagination.
 
+        Results are ordered by the sort field with the analysis ID as
+        tie-breaker. With a cursor the page continues after the cursor
+        position (keyset pagination) and ``page`` is ignored; otherwise the
+        page is selected by offset.
+
         Args:
             company_cik: Filter by company CIK
             analysis_types: Filter by analysis types
@@ -261,73 +455,187 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             sort_direction: Sort direction
             page: Page number (1-based)
             page_size: Items per page
+            cursor: Cursor returned with the previous page
 
         Returns:
             List of Analysis entities matching filters
+
+        Raises:
+            InvalidCursorError: If the cursor does not match the sort order
         """
-        from src.application.schemas.queries.list_analyses import (
-            AnalysisSortField,
-            SortDirection,
+        stmt = self._listing(
+            select(AnalysisModel).options(WITHOUT_FILING),
+            company_cik=company_cik,
+            analysis_types=analysis_types,
+            created_from=created_from,
+            created_to=created_to,
+            min_confidence_score=min_confidence_score,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
         )
 
-        conditions = []
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        return [self.to_entity(model) for model in models]
 
-        if company_cik:
-            # Join with Filing and Company tables to filter by company CIK
-            from src.infrastructure.database.models import Company as CompanyModel
-            from src.infrastructure.database.models import Filing as FilingModel
+    async def find_summaries_with_filters(
+        self,
+        company_cik: Any = None,
+        analysis_types: list[AnalysisType] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        min_confidence_score: float | None = None,
+        sort_by: Any = None,
+        sort_direction: Any = None,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+    ) -> list[AnalysisSummary]:
+        """Find analysis summaries for list views.
 
-            stmt = (
-                select(AnalysisModel)
-                .join(FilingModel, AnalysisModel.filing_id == FilingModel.id)
-                .join(CompanyModel, FilingModel.company_id == CompanyModel.id)
+        Same filters, order and pagination as ``find_with_filters``, but only
+        the summary columns are selected and mapped, without building
+        entities.
+
+        Args:
+            company_cik: Filter by company CIK
+            analysis_types: Filter by analysis types
+            created_from: Filter by creation date (from)
+            created_to: Filter by creation date (to)
+            min_confidence_score: Filter by minimum confidence score
+            sort_by: Field to sort by
+            sort_direction: Sort direction
+            page: Page number (1-based)
+            page_size: Items per page
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            List of analysis summaries matching filters
+
+        Raises:
+            InvalidCursorError: If the cursor does not match the sort order
+        """
+        columns = select(
+            AnalysisModel.id,
+            AnalysisModel.filing_id,
+            AnalysisModel.analysis_type,
+            AnalysisModel.created_by,
+            AnalysisModel.created_at,
+            AnalysisModel.llm_provider,
+            AnalysisModel.llm_model,
+            AnalysisModel.confidence_score,
+            AnalysisModel.meta_data["processing_time_seconds"].as_float(),
+        )
+        stmt = self._listing(
+            columns,
+            company_cik=company_cik,
+            analysis_types=analysis_types,
+            created_from=created_from,
+            created_to=created_to,
+            min_confidence_score=min_confidence_score,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+
+        result = await self.session.execute(stmt)
+        return [
+            AnalysisSummary(
+                id=row[0],
+                filing_id=row[1],
+                analysis_type=AnalysisType(row[2]),
+                created_by=row[3],
+                created_at=row[4],
+                llm_provider=row[5],
+                llm_model=row[6],
+                confidence_score=row[7],
+                processing_time_seconds=row[8],
             )
-            conditions.append(CompanyModel.cik == str(company_cik))
-        else:
-            stmt = select(AnalysisModel)
+            for row in result.all()
+        ]
 
-        if analysis_types:
-            type_values = [at.value for at in analysis_types]
-            conditions.append(AnalysisModel.analysis_type.in_(type_values))
+    async def get_version(self, analysis_id: UUID) -> tuple[datetime, str] | None:
+        """Get what an analysis's representation depends on, without loading it.
 
-        if created_from:
-            conditions.append(AnalysisModel.created_at >= created_from)
+        Args:
+            analysis_id: Analysis ID
 
-        if created_to:
-            conditions.append(AnalysisModel.created_at <= created_to)
+        Returns:
+            Last update time of the analysis and processing status of its
+            filing, None if the analysis is not found
+        """
+        from src.infrastructure.database.models import Filing as FilingModel
 
-        if min_confidence_score is not None:
-            conditions.append(AnalysisModel.confidence_score >= min_confidence_score)
+        stmt = (
+            select(AnalysisModel.updated_at, FilingModel.processing_status)
+            .join(FilingModel, AnalysisModel.filing_id == FilingModel.id)
+            .where(AnalysisModel.id == analysis_id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return (row[0], row[1]) if row is not None else None
 
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+    async def get_by_ids(self, analysis_ids: Sequence[UUID]) -> list[Analysis]:
+        """Get many analyses by ID with a single query.
 
-        # Apply sorting
-        if sort_by and sort_direction:
-            sort_field: Any = None
-            if sort_by == AnalysisSortField.CREATED_AT:
-                sort_field = AnalysisModel.created_at
-            elif sort_by == AnalysisSortField.CONFIDENCE_SCORE:
-                sort_field = AnalysisModel.confidence_score
-            elif sort_by == AnalysisSortField.ANALYSIS_TYPE:
-                sort_field = AnalysisModel.analysis_type
-
-            if sort_field is not None:
-                if sort_direction == SortDirection.DESC:
-                    stmt = stmt.order_by(sort_field.desc())
-                else:
-                    stmt = stmt.order_by(sort_field.asc())
-        else:
-            # Default sort by created_at desc
-            stmt = stmt.order_by(AnalysisModel.created_at.desc())
+        Analyses already loaded in the session are not queried again.
 
-        # Apply pagination
-        page_offset = (page - 1) * page_size
-        stmt = stmt.offset(page_offset).limit(page_size)
+        Args:
+            analysis_ids: Analysis IDs
+
+        Returns:
+            Analyses found, in no particular order
+        """
+        analyses = []
+        missing = []
+        for analysis_id in dict.fromkeys(analysis_ids):
+            tracked = self.identity_map.get(AnalysisModel, analysis_id)
+            if tracked is not None:
+                analyses.append(cast("Analysis", tracked))
+            else:
+                missing.append(analysis_id)
+
+        if missing:
+            stmt = (
+                select(AnalysisModel)
+                .options(WITHOUT_FILING)
+                .where(AnalysisModel.id.in_(missing))
+            )
+            result = await self.session.execute(stmt)
+            analyses.extend(
+                self._track(self.to_entity(model)) for model in result.scalars()
+            )
+        return analyses
+
+    async def get_latest_version_by_accession(
+        self, accession_number: AccessionNumber
+    ) -> tuple[UUID, datetime] | None:
+        """Get the latest analysis of a filing and when it was last written.
+
+        Args:
+            accession_number: SEC accession number of the filing
 
+        Returns:
+            ID and last update time of the newest analysis, None if the
+            filing has no analyses
+        """
+        from src.infrastructure.database.models import Filing as FilingModel
+
+        stmt = (
+            select(AnalysisModel.id, AnalysisModel.updated_at)
+            .join(FilingModel, AnalysisModel.filing_id == FilingModel.id)
+            .where(FilingModel.accession_number == str(accession_number))
+            .order_by(AnalysisModel.created_at.desc())
+            .limit(1)
+        )
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self.to_entity(model) for model in models]
+        row = result.first()
+        return (row.id, row.updated_at) if row else None
 
     async def get_analysis_results_from_storage(
         self, analysis_id: UUID, company_cik: CIK, accession_number: AccessionNumber
@@ -362,7 +670,44 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
         if not analysis:
             return None, None
 
-        # Get filing info to retrieve results from storage
+        location = await self._get_storage_location(analysis_id)
+        if location is None:
+            return analysis, None
+
+        # Get results from storage
+        results = await self.get_analysis_results_from_storage(analysis_id, *location)
+
+        return analysis, results
+
+    async def open_results_by_id(self, analysis_id: UUID) -> StoredObject | None:
+        """Open the stored results of an analysis for streaming.
+
+        Args:
+            analysis_id: Analysis ID
+
+        Returns:
+            Handle to the stored JSON of the results, None if the analysis or
+            its results are not found
+        """
+        location = await self._get_storage_location(analysis_id)
+        if location is None:
+            return None
+
+        from src.infrastructure.tasks.analysis_tasks import open_analysis_results
+
+        return await open_analysis_results(analysis_id, *location)
+
+    async def _get_storage_location(
+        self, analysis_id: UUID
+    ) -> tuple[CIK, AccessionNumber] | None:
+        """Get the company CIK and accession number the results are stored under.
+
+        Args:
+            analysis_id: Analysis ID
+
+        Returns:
+            Company CIK and filing accession number, None if not found
+        """
         from src.infrastructure.database.models import Company as CompanyModel
         from src.infrastructure.database.models import Filing as FilingModel
 
@@ -378,17 +723,41 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
         row = result.first()
 
         if not row:
-            return analysis, None
+            return None
 
-        company_cik = CIK(row.cik)
-        accession_number = AccessionNumber(row.accession_number)
+        return CIK(row.cik), AccessionNumber(row.accession_number)
 
-        # Get results from storage
-        results = await self.get_analysis_results_from_storage(
-            analysis_id, company_cik, accession_number
+    async def get_storage_locations(
+        self, analysis_ids: Sequence[UUID]
+    ) -> dict[UUID, tuple[CIK, AccessionNumber]]:
+        """Get where the results of many analyses are stored, with a single query.
+
+        Args:
+            analysis_ids: Analysis IDs
+
+        Returns:
+            Company CIK and filing accession number by analysis ID, for the
+            analyses found
+        """
+        if not analysis_ids:
+            return {}
+
+        from src.infrastructure.database.models import Company as CompanyModel
+        from src.infrastructure.database.models import Filing as FilingModel
+
+        stmt = (
+            select(AnalysisModel.id, CompanyModel.cik, FilingModel.accession_number)
+            .select_from(CompanyModel)
+            .join(FilingModel, FilingModel.company_id == CompanyModel.id)
+            .join(AnalysisModel, AnalysisModel.filing_id == FilingModel.id)
+            .where(AnalysisModel.id.in_(list(analysis_ids)))
         )
 
-        return analysis, results
+        result = await self.session.execute(stmt)
+        return {
+            row.id: (CIK(row.cik), AccessionNumber(row.accession_number))
+            for row in result.all()
+        }
 
     async def get_by_filing_id_with_results(
         self, filing_id: UUID, analysis_type: AnalysisType | None = None
@@ -437,3 +806,41 @@ class AnalysisRepository(CachedRepository[AnalysisModel, Analysis]):
             analyses_with_results.append((analysis, results))
 
         return analyses_with_results
+
+    async def backfill_summaries(self, batch_size: int = 100) -> int:
+        """Record the summary of analyses stored before summaries were kept.
+
+        Analyses whose results are missing from storage keep no summary and
+        are still summarized from storage on read.
+
+        Args:
+            batch_size: Number of analyses loaded per batch
+
+        Returns:
+            Number of analyses given a summary
+        """
+        backfilled = 0
+        last_id: UUID | None = None
+        while True:
+            stmt = (
+                select(AnalysisModel.id)
+                .where(AnalysisModel.summary.is_(None))
+                .order_by(AnalysisModel.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(AnalysisModel.id > last_id)
+            analysis_ids = list((await self.session.execute(stmt)).scalars().all())
+            if not analysis_ids:
+                break
+
+            for analysis_id in analysis_ids:
+                analysis, results = await self.get_by_id_with_results(analysis_id)
+                if analysis is None or not results:
+                    continue
+                analysis.update_summary(results)
+                await self.update(analysis)
+                backfilled += 1
+            last_id = analysis_ids[-1]
+
+        return backfilled
@@ -1,9 +1,12 @@
 """Base repository with common database operations."""
 
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from collections.abc import Sequence
+from typing import Any, TypeVar, cast
 from uuid import UUID
 
+from sqlalchemy import CursorResult, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.base import Base
@@ -11,6 +14,9 @@ from src.infrastructure.database.base import Base
 ModelType = TypeVar("ModelType", bound=Base)
 EntityType = TypeVar("EntityType")
 
+# Rows per multi-row INSERT statement of a bulk create
+BULK_INSERT_CHUNK_SIZE = 1000
+
 
 class BaseRepository[ModelType: Base, EntityType](ABC):
     """Base repository with common CRUD operations."""
@@ -49,6 +55,39 @@ class BaseRepository[ModelType: Base, EntityType](ABC):
         """
         ...
 
+    # Unique columns on which bulk creates skip rows that already exist
+    conflict_columns: Sequence[str] = ("id",)
+
+    def _column_values(self, model: ModelType) -> dict[str, Any]:
+        """Get the column values set on a model instance.
+
+        Args:
+            model: Database model instance
+
+        Returns:
+            Mapping of column attribute names to values
+        """
+        state = inspect(model).dict
+        return {
+            attr.key: state[attr.key]
+            for attr in inspect(self.model_class).column_attrs
+            if attr.key in state
+        }
+
+    def _insert(self, model_class: type[Base] | None = None) -> Any:
+        """Get the dialect-specific INSERT construct supporting ON CONFLICT.
+
+        Args:
+            model_class: Model to insert into; the repository's by default
+
+        Returns:
+            INSERT construct
+        """
+        table = model_class or self.model_class
+        if self.session.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(table)
+        return sqlite.insert(table)
+
     async def get_by_id(self, entity_id: UUID) -> EntityType | None:
         """Get entity by ID.
 
@@ -75,9 +114,44 @@ class BaseRepository[ModelType: Base, EntityType](ABC):
         await self.session.flush()
         return self.to_entity(model)
 
+    async def bulk_create(self, entities: Sequence[EntityType]) -> int:
+        """Create many entities with multi-row INSERT statements.
+
+        Rows conflicting with an existing row on ``conflict_columns`` are
+        skipped, so re-importing the same entities is a no-op.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            Number of entities inserted
+        """
+        rows = [self._column_values(self.to_model(entity)) for entity in entities]
+        if not rows:
+            return 0
+
+        # Pending ORM changes must reach the database before the core INSERTs
+        await self.session.flush()
+
+        mapper = inspect(self.model_class)
+        inserted = 0
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            stmt = (
+                self._insert()
+                .values(rows[start : start + BULK_INSERT_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=list(self.conflict_columns))
+                .returning(*mapper.primary_key)
+            )
+            result = await self.session.execute(stmt)
+            inserted += len(result.all())
+        return inserted
+
     async def update(self, entity: EntityType) -> EntityType:
         """Update existing entity.
 
+        Issues a single UPDATE by primary key instead of loading the row
+        first. An entity that does not exist yet is inserted.
+
         Args:
             entity: Entity to update
 
@@ -85,10 +159,34 @@ class BaseRepository[ModelType: Base, EntityType](ABC):
             Updated entity
         """
         model: ModelType = self.to_model(entity)
-        await self.session.merge(model)
-        await self.session.flush()
+        await self._update_columns(model, self._column_values(model))
         return entity
 
+    async def _update_columns(self, model: ModelType, values: dict[str, Any]) -> None:
+        """Write column values to the row of a model by primary key.
+
+        Args:
+            model: Database model instance identifying the row, inserted if
+                the row does not exist
+            values: Column values to write
+        """
+        # Mapped table columns always have a key
+        keys = {
+            cast("str", column.key): column
+            for column in inspect(self.model_class).primary_key
+        }
+        primary_key = [column == getattr(model, key) for key, column in keys.items()]
+
+        stmt = (
+            update(self.model_class)
+            .where(*primary_key)
+            .values({key: value for key, value in values.items() if key not in keys})
+        )
+        result = cast("CursorResult[Any]", await self.session.execute(stmt))
+        if result.rowcount == 0:
+            self.session.add(model)
+        await self.session.flush()
+
     async def delete(self, entity_id: UUID) -> bool:
         """Delete entity by ID.
 
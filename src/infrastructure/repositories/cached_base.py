@@ -1,7 +1,9 @@
 """Base repository with caching support."""
 
 import logging
-from typing import Protocol, cast, runtime_checkable
+from collections.abc import Collection, Iterable, Sequence
+from copy import deepcopy
+from typing import Any, Protocol, cast, runtime_checkable
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.database.base import Base
 from src.infrastructure.database.cache import CacheRegionName, cache_manager
 from src.infrastructure.repositories.base import BaseRepository
+from src.infrastructure.repositories.identity_map import IdentityMap, identity_map
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,12 @@ class HasId(Protocol):
 class CachedRepository[ModelType: Base, EntityType: HasId](
     BaseRepository[ModelType, EntityType]
 ):
-    """Base repository with caching capabilities."""
+    """Base repository with caching capabilities.
+
+    Entities loaded by ID or by a unique key are tracked in the identity map
+    of the session, so repeated lookups within a request return the same
+    instance and updates only write the columns that changed.
+    """
 
     def __init__(
         self,
@@ -45,6 +53,37 @@ class CachedRepository[ModelType: Base, EntityType: HasId](
         self.cache_region = cache_region
         self.cache_manager = cache_manager
 
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Identity map of the repository's session."""
+        return identity_map(self.session)
+
+    def _track(self, entity: EntityType, *keys: str) -> EntityType:
+        """Track a loaded entity in the session's identity map.
+
+        A copy of the entity is tracked, since loaded entities may be shared
+        with the cache and changes to the tracked instance must not leak
+        into it.
+
+        Args:
+            entity: Loaded entity
+            *keys: Other unique keys the entity was looked up by
+
+        Returns:
+            The instance already tracked for the entity's ID, or a copy of
+            ``entity``
+        """
+        tracked = self.identity_map.get(self.model_class, entity.id)
+        if tracked is not None:
+            return cast(
+                "EntityType", self.identity_map.add(self.model_class, tracked, {}, keys)
+            )
+        values = self._column_values(self.to_model(entity))
+        return cast(
+            "EntityType",
+            self.identity_map.add(self.model_class, deepcopy(entity), values, keys),
+        )
+
     def _entity_cache_key(self, entity_id: UUID) -> str:
         """Generate cache key for an entity by ID.
 
@@ -56,6 +95,66 @@ class CachedRepository[ModelType: Base, EntityType: HasId](
         """
         return f"{self.cache_region.value}:id:{entity_id}"
 
+    def _cache_keys(self, entity: EntityType) -> list[str]:
+        """Get the keys under which the entity itself may be cached.
+
+        Repositories that cache lookups by other unique fields override this
+        to add those keys.
+
+        Args:
+            entity: Updated or deleted entity
+
+        Returns:
+            Cache keys in the repository's region
+        """
+        return [self._entity_cache_key(entity.id)]
+
+    def _invalidate(self, entities: Iterable[EntityType]) -> None:
+        """Invalidate the cached entries and lists of written entities.
+
+        Keys and tags of all entities are collected first so a batch write
+        costs one delete and one tag bump, not one per entity.
+
+        Args:
+            entities: Written entities
+        """
+        keys: list[str] = []
+        tags: list[str] = []
+        for entity in entities:
+            keys.extend(self._cache_keys(entity))
+            tags.extend(self._invalidation_tags(entity))
+        self.cache_manager.invalidate_keys(self.cache_region, keys)
+        self.cache_manager.invalidate_tags(*tags)
+
+    def _invalidation_tags(self, entity: EntityType) -> list[str]:
+        """Get the cache tags a write to the entity invalidates.
+
+        Repositories that cache list queries override this to return the
+        tags of the lists the entity appears in.
+
+        Args:
+            entity: Created, updated or deleted entity
+
+        Returns:
+            Cache tags
+        """
+        return []
+
+    async def _after_write(
+        self, entities: Sequence[EntityType], columns: Collection[str] | None = None
+    ) -> None:
+        """Update data derived from written entities.
+
+        Called in the same transaction after entities are created, updated
+        or deleted. Repositories that maintain denormalized data override
+        this.
+
+        Args:
+            entities: Written entities
+            columns: Columns written by an update, None for creates and
+                deletes
+        """
+
     async def get_by_id(self, entity_id: UUID) -> EntityType | None:
         """Get entity by ID with caching.
 
@@ -65,6 +164,10 @@ class CachedRepository[ModelType: Base, EntityType: HasId](
         Returns:
             Entity if found, None otherwise
         """
+        tracked = self.identity_map.get(self.model_class, entity_id)
+        if tracked is not None:
+            return cast("EntityType", tracked)
+
         cache_key = self._entity_cache_key(entity_id)
 
         async def fetch_from_db() -> EntityType | None:
@@ -73,7 +176,7 @@ class CachedRepository[ModelType: Base, EntityType: HasId](
         result = await self.cache_manager.get_or_create_async(
             self.cache_region, cache_key, fetch_from_db
         )
-        return cast("EntityType | None", result)
+        return self._track(result) if result else None
 
     async def create(self, entity: EntityType) -> EntityType:
         """Create entity and invalidate relevant cache.
@@ -84,13 +187,29 @@ class CachedRepository[ModelType: Base, EntityType: HasId](
         Returns:
             Created entity
         """
-        created = await super().create(entity)
+        created = self._track(await super().create(entity))
+        await self._after_write([created])
 
-        # Invalidate query cache since new entity affects list queries
-        self.cache_manager.invalidate_region(CacheRegionName.QUERY)
+        # Invalidate only the cached list queries the new entity affects
+        self.cache_manager.invalidate_tags(*self._invalidation_tags(created))
 
         return created
 
+    async def bulk_create(self, entities: Sequence[EntityType]) -> int:
+        """Create many entities and invalidate the lists they appear in.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            Number of entities inserted
+        """
+        inserted = await super().bulk_create(entities)
+        if inserted:
+            await self._after_write(entities)
+            self._invalidate(entities)
+        return inserted
+
     async def update(self, entity: EntityType) -> EntityType:
         """Update entity and invalidate its cache.
 
@@ -100,16 +219,36 @@ class CachedRepository[ModelType: Base, EntityType: HasId](
         Returns:
             Updated entity
         """
-        updated = await super().update(entity)
+        await self._update_changed(entity)
+        return entity
+
+    async def _update_changed(self, entity: EntityType) -> dict[str, Any]:
+        """Write the columns of an entity that changed since it was loaded.
+
+        Entities not tracked in the session are written in full. Nothing is
+        written, nor any cache invalidated, if a tracked entity is unchanged.
+
+        Args:
+            entity: Entity to update
+
+        Returns:
+            Column values written
+        """
+        model = self.to_model(entity)
+        values = self._column_values(model)
+        changed = self.identity_map.changes(self.model_class, entity.id, values)
+        if changed is None:
+            changed = values
 
-        # Invalidate specific entity cache
-        cache_key = self._entity_cache_key(updated.id)
-        self.cache_manager.invalidate_key(self.cache_region, cache_key)
+        if changed:
+            await self._update_columns(model, changed)
+            await self._after_write([entity], changed)
 
-        # Invalidate query cache
-        self.cache_manager.invalidate_region(CacheRegionName.QUERY)
+            # Invalidate the entity and the cached list queries it appears in
+            self._invalidate([entity])
 
-        return updated
+        self.identity_map.refresh(self.model_class, entity, values)
+        return changed
 
     async def delete(self, entity_id: UUID) -> bool:
         """Delete entity and invalidate its cache.
@@ -120,14 +259,18 @@ class CachedRepository[ModelType: Base, EntityType: HasId](
         Returns:
             True if deleted, False otherwise
         """
-        result = await super().delete(entity_id)
+        model = await self.session.get(self.model_class, entity_id)
+        if not model:
+            return False
 
-        if result:
-            # Invalidate specific entity cache
-            cache_key = self._entity_cache_key(entity_id)
-            self.cache_manager.invalidate_key(self.cache_region, cache_key)
+        # Keep the entity to know which cached list queries it appeared in
+        entity = self.to_entity(model)
+        await self.session.delete(model)
+        await self.session.flush()
+        self.identity_map.discard(self.model_class, [entity_id])
+        await self._after_write([entity])
 
-            # Invalidate query cache
-            self.cache_manager.invalidate_region(CacheRegionName.QUERY)
+        # Invalidate the entity and the cached list queries it appeared in
+        self._invalidate([entity])
 
-        return result
+        return True
@@ -1,21 +1,30 @@
 """Repository for Company entities."""
 
+from collections.abc import Sequence
 from typing import cast
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.company import Company
 from src.domain.value_objects.cik import CIK
 from src.domain.value_objects.ticker import Ticker
-from src.infrastructure.database.cache import CacheRegionName, cache_manager
+from src.infrastructure.database.cache import (
+    COMPANY_SEARCH_TAG,
+    CacheRegionName,
+    cache_manager,
+)
 from src.infrastructure.database.models import Company as CompanyModel
+from src.infrastructure.database.models import CompanyTicker as CompanyTickerModel
+from src.infrastructure.database.ticker_map import company_tickers, ticker_cik_map
 from src.infrastructure.repositories.cached_base import CachedRepository
 
 
 class CompanyRepository(CachedRepository[CompanyModel, Company]):
     """Repository for managing Company entities with caching."""
 
+    conflict_columns = ("cik",)
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize CompanyRepository.
 
@@ -54,7 +63,118 @@ class CompanyRepository(CachedRepository[CompanyModel, Company]):
             cik=str(entity.cik),
             name=entity.name,
             meta_data=entity.metadata,
+            tickers=[
+                CompanyTickerModel(
+                    company_id=entity.id, ticker=ticker, is_primary=index == 0
+                )
+                for index, ticker in enumerate(company_tickers(entity.metadata))
+            ],
+        )
+
+    def _cache_keys(self, entity: Company) -> list[str]:
+        """Get the keys under which the company may be cached."""
+        return (
+            super()._cache_keys(entity)
+            + [f"company:cik:{entity.cik}"]
+            + [f"company:ticker:{t}" for t in company_tickers(entity.metadata)]
+        )
+
+    def _invalidation_tags(self, entity: Company) -> list[str]:
+        """Get the cached company searches a write to the company invalidates."""
+        return [COMPANY_SEARCH_TAG]
+
+    async def _insert_tickers(self, companies: Sequence[Company]) -> None:
+        """Insert the ticker rows of companies, keeping rows already stored.
+
+        Args:
+            companies: Companies whose tickers to store
+        """
+        rows = [
+            {"company_id": company.id, "ticker": ticker, "is_primary": index == 0}
+            for company in companies
+            for index, ticker in enumerate(company_tickers(company.metadata))
+        ]
+        if not rows:
+            return
+
+        stmt = self._insert(CompanyTickerModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["company_id", "ticker"],
+            set_={"is_primary": stmt.excluded.is_primary},
+        )
+        await self.session.execute(stmt)
+
+    async def create(self, entity: Company) -> Company:
+        """Create company and map its tickers.
+
+        Args:
+            entity: Company to create
+
+        Returns:
+            Created company
+        """
+        created = await super().create(entity)
+        ticker_cik_map.register(str(created.cik), company_tickers(created.metadata))
+        return created
+
+    async def update(self, entity: Company) -> Company:
+        """Update company and map its tickers.
+
+        Args:
+            entity: Company to update
+
+        Returns:
+            Updated company
+        """
+        changed = await self._update_changed(entity)
+        if "meta_data" not in changed:
+            return entity
+
+        # The UPDATE only covers the companies row; sync its ticker rows
+        tickers = company_tickers(entity.metadata)
+        result = await self.session.execute(
+            delete(CompanyTickerModel)
+            .where(
+                CompanyTickerModel.company_id == entity.id,
+                CompanyTickerModel.ticker.not_in(tickers),
+            )
+            .returning(CompanyTickerModel.ticker)
+        )
+        await self._insert_tickers([entity])
+
+        # Lookups by tickers the company no longer trades under must miss
+        removed = [f"company:ticker:{row.ticker}" for row in result]
+        self.cache_manager.invalidate_keys(self.cache_region, removed)
+        self.identity_map.discard_keys(CompanyModel, removed)
+
+        ticker_cik_map.register(str(entity.cik), tickers)
+        return entity
+
+    async def bulk_create(self, entities: Sequence[Company]) -> int:
+        """Create many companies with their tickers.
+
+        Companies whose CIK is already stored are skipped.
+
+        Args:
+            entities: Companies to create
+
+        Returns:
+            Number of companies inserted
+        """
+        inserted = await super().bulk_create(entities)
+        if not inserted:
+            return 0
+
+        stmt = select(CompanyModel.id).where(
+            CompanyModel.id.in_([entity.id for entity in entities])
         )
+        stored = set((await self.session.execute(stmt)).scalars().all())
+        companies = [entity for entity in entities if entity.id in stored]
+        await self._insert_tickers(companies)
+
+        for company in companies:
+            ticker_cik_map.register(str(company.cik), company_tickers(company.metadata))
+        return inserted
 
     async def get_by_cik(self, cik: CIK) -> Company | None:
         """Get company by CIK with caching.
@@ -66,6 +186,9 @@ class CompanyRepository(CachedRepository[CompanyModel, Company]):
             Company if found, None otherwise
         """
         cache_key = f"company:cik:{cik}"
+        tracked = self.identity_map.get_by_key(CompanyModel, cache_key)
+        if tracked is not None:
+            return cast("Company", tracked)
 
         async def fetch_from_db() -> Company | None:
             stmt = select(CompanyModel).where(CompanyModel.cik == str(cik))
@@ -76,7 +199,7 @@ class CompanyRepository(CachedRepository[CompanyModel, Company]):
         result = await cache_manager.get_or_create_async(
             CacheRegionName.COMPANY, cache_key, fetch_from_db
         )
-        return cast("Company | None", result)
+        return self._track(result, cache_key) if result else None
 
     async def get_by_ticker(self, ticker: Ticker) -> Company | None:
         """Get company by ticker symbol with caching.
@@ -87,12 +210,28 @@ class CompanyRepository(CachedRepository[CompanyModel, Company]):
         Returns:
             Company if found, None otherwise
         """
+        # Hot path: resolve the CIK in memory and share the CIK cache entry
+        cik = ticker_cik_map.get(str(ticker))
+        if cik is not None:
+            company = await self.get_by_cik(CIK(cik))
+            if company and str(ticker) in company_tickers(company.metadata):
+                return company
+
         cache_key = f"company:ticker:{ticker}"
+        tracked = self.identity_map.get_by_key(CompanyModel, cache_key)
+        if tracked is not None:
+            return cast("Company", tracked)
 
         async def fetch_from_db() -> Company | None:
-            # Search for ticker in the meta_data JSON field
-            stmt = select(CompanyModel).where(
-                CompanyModel.meta_data["ticker"].as_string() == str(ticker)
+            stmt = (
+                select(CompanyModel)
+                .join(
+                    CompanyTickerModel,
+                    CompanyTickerModel.company_id == CompanyModel.id,
+                )
+                .where(CompanyTickerModel.ticker == str(ticker))
+                .order_by(CompanyTickerModel.is_primary.desc())
+                .limit(1)
             )
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
@@ -101,7 +240,7 @@ class CompanyRepository(CachedRepository[CompanyModel, Company]):
         result = await cache_manager.get_or_create_async(
             CacheRegionName.COMPANY, cache_key, fetch_from_db
         )
-        return cast("Company | None", result)
+        return self._track(result, cache_key) if result else None
 
     async def find_by_name(self, name: str) -> list[Company]:
         """Find companies by name (case-insensitive partial match) with caching.
@@ -128,5 +267,6 @@ class CompanyRepository(CachedRepository[CompanyModel, Company]):
             CacheRegionName.QUERY,  # Use query cache for search results
             cache_key,
             fetch_from_db,
+            tags=[COMPANY_SEARCH_TAG],
         )
         return cast("list[Company]", result)
@@ -0,0 +1,293 @@
+"""Repository for denormalized per-company statistics."""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.value_objects.ticker import Ticker
+from src.infrastructure.database.models import Analysis as AnalysisModel
+from src.infrastructure.database.models import Company as CompanyModel
+from src.infrastructure.database.models import CompanyStats as CompanyStatsModel
+from src.infrastructure.database.models import CompanyTicker as CompanyTickerModel
+from src.infrastructure.database.models import Filing as FilingModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompanyStatistics:
+    """Filing and analysis summary of a company."""
+
+    company_id: UUID
+    filing_count: int = 0
+    filing_counts_by_type: dict[str, int] = field(default_factory=dict)
+    latest_filing_date: date | None = None
+    analysis_count: int = 0
+    latest_analysis_id: UUID | None = None
+    latest_analysis_confidence: float | None = None
+    latest_analysis_at: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-compatible dictionary.
+
+        Returns:
+            Statistics without the company ID
+        """
+        return {
+            "filing_count": self.filing_count,
+            "filing_counts_by_type": dict(self.filing_counts_by_type),
+            "latest_filing_date": (
+                self.latest_filing_date.isoformat() if self.latest_filing_date else None
+            ),
+            "analysis_count": self.analysis_count,
+            "latest_analysis_id": (
+                str(self.latest_analysis_id) if self.latest_analysis_id else None
+            ),
+            "latest_analysis_confidence": self.latest_analysis_confidence,
+            "latest_analysis_at": (
+                self.latest_analysis_at.isoformat() if self.latest_analysis_at else None
+            ),
+        }
+
+
+class CompanyStatsRepository:
+    """Maintains the ``company_stats`` table.
+
+    Writes to filings and analyses refresh the rows of the companies they
+    belong to from two indexed aggregate queries; ``rebuild`` recomputes
+    every row. A refresh locks the rows it recomputes until the transaction
+    ends, so concurrent writers to a company's filings or analyses refresh
+    its row one after the other and each one counts the rows committed by
+    the previous one.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize CompanyStatsRepository.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+
+    async def get_by_company_id(self, company_id: UUID) -> CompanyStatistics | None:
+        """Get the statistics of a company.
+
+        Args:
+            company_id: Company ID
+
+        Returns:
+            Statistics if computed for the company, None otherwise
+        """
+        # Rows are upserted with Core statements, so bypass the identity map
+        model = await self.session.get(
+            CompanyStatsModel, company_id, populate_existing=True
+        )
+        return self._to_statistics(model) if model is not None else None
+
+    async def get_by_ticker(self, ticker: Ticker) -> CompanyStatistics | None:
+        """Get the statistics of a company by one of its tickers.
+
+        Args:
+            ticker: Company ticker symbol
+
+        Returns:
+            Statistics if computed for the company, None otherwise
+        """
+        stmt = (
+            select(CompanyStatsModel)
+            .join(
+                CompanyTickerModel,
+                CompanyTickerModel.company_id == CompanyStatsModel.company_id,
+            )
+            .where(CompanyTickerModel.ticker == str(ticker))
+            .order_by(CompanyTickerModel.is_primary.desc())
+            .limit(1)
+            .execution_options(populate_existing=True)
+        )
+        model = (await self.session.execute(stmt)).scalar_one_or_none()
+        return self._to_statistics(model) if model is not None else None
+
+    @staticmethod
+    def _to_statistics(model: CompanyStatsModel) -> CompanyStatistics:
+        """Convert a statistics row to its value object."""
+        return CompanyStatistics(
+            company_id=model.company_id,
+            filing_count=model.filing_count,
+            filing_counts_by_type=dict(model.filing_counts_by_type or {}),
+            latest_filing_date=model.latest_filing_date,
+            analysis_count=model.analysis_count,
+            latest_analysis_id=model.latest_analysis_id,
+            latest_analysis_confidence=model.latest_analysis_confidence,
+            latest_analysis_at=model.latest_analysis_at,
+        )
+
+    async def refresh(self, company_ids: Iterable[UUID]) -> None:
+        """Recompute the statistics of companies.
+
+        Args:
+            company_ids: IDs of the companies whose filings or analyses changed
+        """
+        ids = sorted(dict.fromkeys(company_ids))
+        if not ids:
+            return
+        await self._lock(ids)
+
+        stats: dict[UUID, dict[str, Any]] = {
+            company_id: {
+                "company_id": company_id,
+                "filing_count": 0,
+                "filing_counts_by_type": {},
+                "latest_filing_date": None,
+                "analysis_count": 0,
+                "latest_analysis_id": None,
+                "latest_analysis_confidence": None,
+                "latest_analysis_at": None,
+            }
+            for company_id in ids
+        }
+
+        filing_stmt = (
+            select(
+                FilingModel.company_id,
+                FilingModel.filing_type,
+                func.count(FilingModel.id),
+                func.max(FilingModel.filing_date),
+            )
+            .where(FilingModel.company_id.in_(ids))
+            .group_by(FilingModel.company_id, FilingModel.filing_type)
+        )
+        result = await self.session.execute(filing_stmt)
+        for company_id, filing_type, count, latest in result.all():
+            row = stats[company_id]
+            row["filing_count"] += count
+            row["filing_counts_by_type"][filing_type] = count
+            if row["latest_filing_date"] is None or latest > row["latest_filing_date"]:
+                row["latest_filing_date"] = latest
+
+        # Analysis count and latest analysis of each company in one pass
+        ranked = (
+            select(
+                FilingModel.company_id,
+                AnalysisModel.id,
+                AnalysisModel.confidence_score,
+                AnalysisModel.created_at,
+                func.count()
+                .over(partition_by=FilingModel.company_id)
+                .label("analysis_count"),
+                func.row_number()
+                .over(
+                    partition_by=FilingModel.company_id,
+                    order_by=(AnalysisModel.created_at.desc(), AnalysisModel.id.desc()),
+                )
+                .label("position"),
+            )
+            .join(FilingModel, AnalysisModel.filing_id == FilingModel.id)
+            .where(FilingModel.company_id.in_(ids))
+            .subquery()
+        )
+        analysis_stmt = select(
+            ranked.c.company_id,
+            ranked.c.id,
+            ranked.c.confidence_score,
+            ranked.c.created_at,
+            ranked.c.analysis_count,
+        ).where(ranked.c.position == 1)
+        result = await self.session.execute(analysis_stmt)
+        for company_id, analysis_id, confidence, created_at, count in result.all():
+            row = stats[company_id]
+            row["analysis_count"] = count
+            row["latest_analysis_id"] = analysis_id
+            row["latest_analysis_confidence"] = confidence
+            row["latest_analysis_at"] = created_at
+
+        await self._upsert(list(stats.values()))
+
+    async def refresh_for_filings(self, filing_ids: Iterable[UUID]) -> None:
+        """Recompute the statistics of the companies of filings.
+
+        Args:
+            filing_ids: IDs of filings whose analyses changed
+        """
+        ids = list(dict.fromkeys(filing_ids))
+        if not ids:
+            return
+        stmt = select(FilingModel.company_id).where(FilingModel.id.in_(ids)).distinct()
+        result = await self.session.execute(stmt)
+        await self.refresh(result.scalars().all())
+
+    async def rebuild(self, batch_size: int = 500) -> int:
+        """Recompute the statistics of every company.
+
+        Args:
+            batch_size: Number of companies refreshed per batch
+
+        Returns:
+            Number of companies refreshed
+        """
+        refreshed = 0
+        last_id: UUID | None = None
+        while True:
+            stmt = select(CompanyModel.id).order_by(CompanyModel.id).limit(batch_size)
+            if last_id is not None:
+                stmt = stmt.where(CompanyModel.id > last_id)
+            company_ids = list((await self.session.execute(stmt)).scalars().all())
+            if not company_ids:
+                break
+
+            await self.refresh(company_ids)
+            refreshed += len(company_ids)
+            last_id = company_ids[-1]
+
+        logger.info(f"Rebuilt company statistics of {refreshed} companies")
+        return refreshed
+
+    def _insert(self) -> Any:
+        """Get an INSERT into the statistics table with ON CONFLICT support."""
+        if self.session.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(CompanyStatsModel)
+        return sqlite.insert(CompanyStatsModel)
+
+    async def _lock(self, company_ids: list[UUID]) -> None:
+        """Lock the statistics rows of companies until the transaction ends.
+
+        Missing rows are created first so there is a row to lock; creating
+        one waits for a concurrent transaction creating the same row. Rows
+        are locked in ID order so concurrent refreshes cannot deadlock.
+
+        Args:
+            company_ids: Sorted IDs of the companies to lock
+        """
+        await self.session.execute(
+            self._insert()
+            .values([{"company_id": company_id} for company_id in company_ids])
+            .on_conflict_do_nothing(index_elements=["company_id"])
+        )
+        await self.session.execute(
+            select(CompanyStatsModel.company_id)
+            .where(CompanyStatsModel.company_id.in_(company_ids))
+            .order_by(CompanyStatsModel.company_id)
+            .with_for_update()
+        )
+
+    async def _upsert(self, rows: list[dict[str, Any]]) -> None:
+        """Insert or replace statistics rows."""
+        stmt = self._insert().values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["company_id"],
+            set_={
+                **{
+                    column: getattr(stmt.excluded, column)
+                    for column in rows[0]
+                    if column != "company_id"
+                },
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
@@ -1,26 +1,83 @@
 """Repository for Filing entities."""
 
-from datetime import date
+from collections.abc import Collection, Sequence
+from datetime import date, datetime
 from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from src.domain.entities.filing import Filing
 from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
 from src.domain.value_objects.filing_type import FilingType
 from src.domain.value_objects.processing_status import ProcessingStatus
 from src.domain.value_objects.ticker import Ticker
-from src.infrastructure.database.cache import CacheRegionName, cache_manager
+from src.infrastructure.database.cache import (
+    CacheRegionName,
+    cache_manager,
+    filing_list_tag,
+    filing_write_tags,
+)
+from src.infrastructure.database.models import Analysis as AnalysisModel
 from src.infrastructure.database.models import Company as CompanyModel
+from src.infrastructure.database.models import CompanyTicker as CompanyTickerModel
 from src.infrastructure.database.models import Filing as FilingModel
+from src.infrastructure.database.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_order_by,
+)
+from src.infrastructure.messaging.interfaces import StoredObject
 from src.infrastructure.repositories.cached_base import CachedRepository
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
+
+# Filing columns the company statistics are derived from
+STATISTICS_COLUMNS = frozenset({"company_id", "filing_type", "filing_date"})
+
+# Loader option for queries that only map filing columns: skips the joined
+# eager load of the company configured on the model
+WITHOUT_COMPANY = lazyload(FilingModel.company)
+
+
+def _filing_sort_column(sort_field: str) -> tuple[str, Any]:
+    """Get the name and column of a filing sort field.
+
+    Fields that are not filing columns fall back to the filing date.
+    """
+    if sort_field == "filing_type":
+        return "filing_type", FilingModel.filing_type
+    return "filing_date", FilingModel.filing_date
+
+
+def filing_cursor(filing: Filing, sort_field: str, sort_direction: str) -> str:
+    """Build the cursor of the page following a filing.
+
+    Args:
+        filing: Last filing of a page
+        sort_field: Field the page is sorted by
+        sort_direction: Sort direction of the page
+
+    Returns:
+        Opaque cursor for the ``get_by_ticker_with_filters`` methods
+    """
+    sort_key, _ = _filing_sort_column(sort_field)
+    value = (
+        filing.filing_type.value if sort_key == "filing_type" else filing.filing_date
+    )
+    return encode_cursor(sort_key, sort_direction, value, filing.id)
 
 
 class FilingRepository(CachedRepository[FilingModel, Filing]):
     """Repository for managing Filing entities with caching."""
 
+    conflict_columns = ("accession_number",)
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize FilingRepository.
 
@@ -28,6 +85,7 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
             session: Async database session
         """
         super().__init__(session, FilingModel, CacheRegionName.FILING)
+        self.company_stats = CompanyStatsRepository(session)
 
     def to_entity(self, model: FilingModel) -> Filing:
         """Convert FilingModel to Filing entity.
@@ -69,6 +127,47 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
             meta_data=entity.metadata,
         )
 
+    def _cache_keys(self, entity: Filing) -> list[str]:
+        """Get the keys under which the filing may be cached."""
+        return super()._cache_keys(entity) + [
+            f"filing:accession:{entity.accession_number}"
+        ]
+
+    async def _after_write(
+        self, entities: Sequence[Filing], columns: Collection[str] | None = None
+    ) -> None:
+        """Refresh the statistics of the companies of written filings.
+
+        Updates that leave the columns the statistics are derived from
+        unchanged, such as processing status changes, skip the refresh.
+        """
+        if columns is not None and STATISTICS_COLUMNS.isdisjoint(columns):
+            return
+        await self.company_stats.refresh(filing.company_id for filing in entities)
+
+    def _invalidation_tags(self, entity: Filing) -> list[str]:
+        """Get the cached filing lists a write to the filing invalidates."""
+        return filing_write_tags(entity.company_id, entity.filing_type.value)
+
+    async def get_existing_accession_numbers(
+        self, accession_numbers: list[AccessionNumber]
+    ) -> set[str]:
+        """Get which accession numbers are already stored.
+
+        Args:
+            accession_numbers: Accession numbers to check
+
+        Returns:
+            Stored accession numbers
+        """
+        if not accession_numbers:
+            return set()
+        stmt = select(FilingModel.accession_number).where(
+            FilingModel.accession_number.in_([str(a) for a in accession_numbers])
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def get_by_accession_number(
         self, accession_number: AccessionNumber
     ) -> Filing | None:
@@ -81,10 +180,15 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
             Filing if found, None otherwise
         """
         cache_key = f"filing:accession:{accession_number}"
+        tracked = self.identity_map.get_by_key(FilingModel, cache_key)
+        if tracked is not None:
+            return cast("Filing", tracked)
 
         async def fetch_from_db() -> Filing | None:
-            stmt = select(FilingModel).where(
-                FilingModel.accession_number == str(accession_number)
+            stmt = (
+                select(FilingModel)
+                .options(WITHOUT_COMPANY)
+                .where(FilingModel.accession_number == str(accession_number))
             )
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
@@ -93,7 +197,135 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
         result = await cache_manager.get_or_create_async(
             CacheRegionName.FILING, cache_key, fetch_from_db
         )
-        return cast("Filing | None", result)
+        return self._track(result, cache_key) if result else None
+
+    async def get_many_by_accession_numbers(
+        self, accession_numbers: Sequence[AccessionNumber]
+    ) -> list[tuple[Filing, int, datetime | None]]:
+        """Get many filings with their analysis counts, with a single query.
+
+        Args:
+            accession_numbers: SEC accession numbers
+
+        Returns:
+            Filings found, in no particular order, with the number of their
+            analyses and when the latest one was created
+        """
+        if not accession_numbers:
+            return []
+
+        stmt = (
+            select(
+                FilingModel,
+                func.count(AnalysisModel.id),
+                func.max(AnalysisModel.created_at),
+            )
+            .options(WITHOUT_COMPANY)
+            .outerjoin(AnalysisModel, AnalysisModel.filing_id == FilingModel.id)
+            .where(
+                FilingModel.accession_number.in_([str(a) for a in accession_numbers])
+            )
+            .group_by(FilingModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return [
+            (
+                self._track(
+                    self.to_entity(model),
+                    f"filing:accession:{model.accession_number}",
+                ),
+                analyses_count,
+                latest_analysis_at,
+            )
+            for model, analyses_count, latest_analysis_at in result.all()
+        ]
+
+    async def get_version_by_accession(
+        self, accession_number: AccessionNumber
+    ) -> tuple[UUID, datetime, str, int, datetime | None] | None:
+        """Get what a filing's representation depends on, without loading it.
+
+        Args:
+            accession_number: SEC accession number
+
+        Returns:
+            ID, last update time and processing status of the filing, with
+            the number of its analyses and when they were last written; None
+            if the filing is not found
+        """
+        stmt = (
+            select(
+                FilingModel.id,
+                FilingModel.updated_at,
+                FilingModel.processing_status,
+                func.count(AnalysisModel.id),
+                func.max(AnalysisModel.updated_at),
+            )
+            .outerjoin(AnalysisModel, AnalysisModel.filing_id == FilingModel.id)
+            .where(FilingModel.accession_number == str(accession_number))
+            .group_by(FilingModel.id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        return tuple(row) if row else None
+
+    async def open_content_by_accession(
+        self, accession_number: AccessionNumber
+    ) -> StoredObject | None:
+        """Open the stored content of a filing for streaming.
+
+        Args:
+            accession_number: SEC accession number
+
+        Returns:
+            Handle to the stored JSON of the filing content, None if the
+            filing or its content is not found
+        """
+        company_cik = await self._get_company_cik(accession_number)
+        if company_cik is None:
+            return None
+
+        from src.infrastructure.tasks.analysis_tasks import open_filing_content
+
+        return await open_filing_content(accession_number, company_cik)
+
+    async def open_sections_by_accession(
+        self, accession_number: AccessionNumber
+    ) -> StoredObject | None:
+        """Open the stored sections of a filing for streaming.
+
+        Args:
+            accession_number: SEC accession number
+
+        Returns:
+            Handle to the newline-delimited JSON of the filing sections, None
+            if the filing or its content is not found
+        """
+        company_cik = await self._get_company_cik(accession_number)
+        if company_cik is None:
+            return None
+
+        from src.infrastructure.tasks.analysis_tasks import open_filing_sections
+
+        return await open_filing_sections(accession_number, company_cik)
+
+    async def _get_company_cik(self, accession_number: AccessionNumber) -> CIK | None:
+        """Get the CIK of the company that made a filing.
+
+        Args:
+            accession_number: SEC accession number
+
+        Returns:
+            Company CIK, None if the filing is not found
+        """
+        stmt = (
+            select(CompanyModel.cik)
+            .join(FilingModel, FilingModel.company_id == CompanyModel.id)
+            .where(FilingModel.accession_number == str(accession_number))
+        )
+        result = await self.session.execute(stmt)
+        cik = result.scalar_one_or_none()
+        return CIK(cik) if cik else None
 
     async def get_by_company_id(
         self,
@@ -137,6 +369,7 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
 
             stmt = (
                 select(FilingModel)
+                .options(WITHOUT_COMPANY)
                 .where(and_(*conditions))
                 .order_by(FilingModel.filing_date.desc())
             )
@@ -149,6 +382,9 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
             CacheRegionName.QUERY,  # Use query cache for filtered lists
             cache_key,
             fetch_from_db,
+            tags=[
+                filing_list_tag(company_id, filing_type.value if filing_type else None)
+            ],
         )
         return cast("list[Filing]", result)
 
@@ -166,6 +402,7 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
         """
         stmt = (
             select(FilingModel)
+            .options(WITHOUT_COMPANY)
             .where(FilingModel.processing_status == status.value)
             .order_by(FilingModel.created_at)
         )
@@ -220,7 +457,7 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
     async def batch_update_status(
         self, filing_ids: list[UUID], status: ProcessingStatus
     ) -> int:
-        """Update status for multiple filings.
+        """Update status for multiple filings with a single UPDATE.
 
         Args:
             filing_ids: List of filing IDs
@@ -229,15 +466,114 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
         Returns:
             Number of filings updated
         """
-        stmt = select(FilingModel).where(FilingModel.id.in_(filing_ids))
+        if not filing_ids:
+            return 0
+
+        await self.session.flush()
+        stmt = (
+            update(FilingModel)
+            .where(FilingModel.id.in_(filing_ids))
+            .values(processing_status=status.value)
+            .returning(
+                FilingModel.id,
+                FilingModel.company_id,
+                FilingModel.accession_number,
+                FilingModel.filing_type,
+            )
+        )
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
+        rows = result.all()
+        # Tracked instances no longer hold the stored status
+        self.identity_map.discard(FilingModel, [row[0] for row in rows])
+
+        keys: list[str] = []
+        tags: list[str] = []
+        for filing_id, company_id, accession_number, filing_type in rows:
+            keys.append(self._entity_cache_key(filing_id))
+            keys.append(f"filing:accession:{accession_number}")
+            tags.extend(filing_write_tags(company_id, filing_type))
+        self.cache_manager.invalidate_keys(self.cache_region, keys)
+        self.cache_manager.invalidate_tags(*dict.fromkeys(tags))
+
+        return len(rows)
+
+    def _filter_by_ticker(
+        self,
+        stmt: Any,
+        ticker: Ticker,
+        filing_type: FilingType | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> Any:
+        """Filter a select statement over filings by ticker and filters.
 
-        for model in models:
-            model.processing_status = status.value
+        Args:
+            stmt: Select statement over filings
+            ticker: Company ticker symbol
+            filing_type: Optional filing type filter
+            start_date: Optional start date filter
+            end_date: Optional end date filter
 
-        await self.session.flush()
-        return len(models)
+        Returns:
+            Filtered select statement
+        """
+        # Filter by ticker through the indexed company tickers table
+        conditions = [CompanyTickerModel.ticker == str(ticker)]
+
+        if filing_type:
+            conditions.append(FilingModel.filing_type == filing_type.value)
+
+        if start_date:
+            conditions.append(FilingModel.filing_date >= start_date)
+
+        if end_date:
+            conditions.append(FilingModel.filing_date <= end_date)
+
+        return stmt.join(
+            CompanyTickerModel,
+            FilingModel.company_id == CompanyTickerModel.company_id,
+        ).where(and_(*conditions))
+
+    def _paginate(
+        self,
+        stmt: Any,
+        sort_field: str,
+        sort_direction: str,
+        page: int,
+        page_size: int,
+        cursor: str | None,
+    ) -> Any:
+        """Sort and paginate a select statement over filings.
+
+        Args:
+            stmt: Select statement over filings
+            sort_field: Field to sort by
+            sort_direction: Sort direction ("asc" or "desc")
+            page: Page number (1-based), ignored with a cursor
+            page_size: Number of items per page
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Sorted and paginated select statement
+
+        Raises:
+            InvalidCursorError: If the cursor does not match the sort order
+        """
+        sort_key, sort_column = _filing_sort_column(sort_field)
+        stmt = stmt.order_by(
+            *keyset_order_by(sort_column, FilingModel.id, sort_direction)
+        )
+
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_key, sort_direction)
+            stmt = stmt.where(
+                keyset_after(
+                    sort_column, FilingModel.id, sort_direction, value, last_id
+                )
+            )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        return stmt.limit(page_size)
 
     async def get_by_ticker_with_filters(
         self,
@@ -249,9 +585,14 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
         sort_direction: str = "desc",
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
     ) -> list[Filing]:
         """Get filings by ticker with optional filters, sorting, and pagination.
 
+        Results are ordered by the sort field with the filing ID as
+        tie-breaker. With a cursor the page continues after the cursor
+        position (keyset pagination) and ``page`` is ignored.
+
         Args:
             ticker: Company ticker symbol
             filing_type: Optional filing type filter
@@ -261,38 +602,19 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
             sort_direction: Sort direction ("asc" or "desc")
             page: Page number (1-based)
             page_size: Number of items per page
+            cursor: Cursor returned with the previous page
 
         Returns:
             List of filings matching criteria
         """
-        # Join with Company table to filter by ticker in meta_data JSON field
-        conditions = [CompanyModel.meta_data["ticker"].as_string() == str(ticker)]
-
-        if filing_type:
-            conditions.append(FilingModel.filing_type == filing_type.value)
-
-        if start_date:
-            conditions.append(FilingModel.filing_date >= start_date)
-
-        if end_date:
-            conditions.append(FilingModel.filing_date <= end_date)
-
-        # Determine sort column
-        sort_column = getattr(FilingModel, sort_field)
-        if sort_direction.lower() == "desc":
-            sort_column = desc(sort_column)
-
-        # Calculate offset
-        offset = (page - 1) * page_size
-
-        stmt = (
-            select(FilingModel)
-            .join(CompanyModel, FilingModel.company_id == CompanyModel.id)
-            .where(and_(*conditions))
-            .order_by(sort_column)
-            .offset(offset)
-            .limit(page_size)
+        stmt = self._filter_by_ticker(
+            select(FilingModel).options(WITHOUT_COMPANY),
+            ticker,
+            filing_type,
+            start_date,
+            end_date,
         )
+        stmt = self._paginate(stmt, sort_field, sort_direction, page, page_size, cursor)
 
         result = await self.session.execute(stmt)
         models = result.scalars().all()
@@ -308,6 +630,7 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
         sort_direction: str = "desc",
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
     ) -> list[tuple[Filing, dict[str, Any]]]:
         """Get filings by ticker with company information.
 
@@ -320,38 +643,15 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
             sort_direction: Sort direction ("asc" or "desc")
             page: Page number (1-based)
             page_size: Number of items per page
+            cursor: Cursor returned with the previous page (keyset pagination)
 
         Returns:
             List of tuples containing (Filing entity, company_info dict)
         """
-        # Join with Company table to filter by ticker in meta_data JSON field
-        conditions = [CompanyModel.meta_data["ticker"].as_string() == str(ticker)]
-
-        if filing_type:
-            conditions.append(FilingModel.filing_type == filing_type.value)
-
-        if start_date:
-            conditions.append(FilingModel.filing_date >= start_date)
-
-        if end_date:
-            conditions.append(FilingModel.filing_date <= end_date)
-
-        # Determine sort column
-        sort_column = getattr(FilingModel, sort_field)
-        if sort_direction.lower() == "desc":
-            sort_column = desc(sort_column)
-
-        # Calculate offset
-        offset = (page - 1) * page_size
-
-        stmt = (
-            select(FilingModel)
-            .join(CompanyModel, FilingModel.company_id == CompanyModel.id)
-            .where(and_(*conditions))
-            .order_by(sort_column)
-            .offset(offset)
-            .limit(page_size)
+        stmt = self._filter_by_ticker(
+            select(FilingModel), ticker, filing_type, start_date, end_date
         )
+        stmt = self._paginate(stmt, sort_field, sort_direction, page, page_size, cursor)
 
         result = await self.session.execute(stmt)
         models = result.scalars().all()
@@ -390,22 +690,12 @@ class FilingRepository(CachedRepository[FilingModel, Filing]):
         Returns:
             Total count of filings matching criteria
         """
-        # Join with Company table to filter by ticker in meta_data JSON field
-        conditions = [CompanyModel.meta_data["ticker"].as_string() == str(ticker)]
-
-        if filing_type:
-            conditions.append(FilingModel.filing_type == filing_type.value)
-
-        if start_date:
-            conditions.append(FilingModel.filing_date >= start_date)
-
-        if end_date:
-            conditions.append(FilingModel.filing_date <= end_date)
-
-        stmt = (
-            select(func.count(FilingModel.id))
-            .join(CompanyModel, FilingModel.company_id == CompanyModel.id)
-            .where(and_(*conditions))
+        stmt = self._filter_by_ticker(
+            select(func.count(FilingModel.id)),
+            ticker,
+            filing_type,
+            start_date,
+            end_date,
         )
 
         result = await self.session.execute(stmt)
@@ -0,0 +1,173 @@
+"""Session-scoped identity map of domain entities."""
+
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class _Entry:
+    """A tracked entity and its column values as last read or written."""
+
+    entity: Any
+    snapshot: dict[str, Any]
+
+
+class IdentityMap:
+    """Domain entities materialized in one database session.
+
+    Lookups of an entity already loaded in the session return the same
+    instance instead of mapping the row again. The column values of each
+    entity are snapshotted when it is loaded or written, so updates only
+    write the columns that changed since.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty identity map."""
+        self._entries: dict[tuple[type, UUID], _Entry] = {}
+        self._keys: dict[tuple[type, str], UUID] = {}
+
+    def __len__(self) -> int:
+        """Number of tracked entities."""
+        return len(self._entries)
+
+    def get(self, model_class: type, entity_id: UUID) -> Any | None:
+        """Get a tracked entity by ID.
+
+        Args:
+            model_class: Model class the entity is stored as
+            entity_id: Entity ID
+
+        Returns:
+            Tracked entity, None if not loaded in the session
+        """
+        entry = self._entries.get((model_class, entity_id))
+        return entry.entity if entry else None
+
+    def get_by_key(self, model_class: type, key: str) -> Any | None:
+        """Get a tracked entity by another unique key.
+
+        Args:
+            model_class: Model class the entity is stored as
+            key: Unique key the entity was tracked under
+
+        Returns:
+            Tracked entity, None if not loaded in the session
+        """
+        entity_id = self._keys.get((model_class, key))
+        return self.get(model_class, entity_id) if entity_id else None
+
+    def add(
+        self,
+        model_class: type,
+        entity: Any,
+        values: dict[str, Any],
+        keys: tuple[str, ...] = (),
+    ) -> Any:
+        """Track a loaded entity unless an instance is already tracked.
+
+        Args:
+            model_class: Model class the entity is stored as
+            entity: Loaded entity
+            values: Column values of the entity
+            keys: Other unique keys the entity is looked up by
+
+        Returns:
+            The tracked instance, which is ``entity`` if it was not tracked
+        """
+        entry = self._entries.get((model_class, entity.id))
+        if entry is None:
+            entry = _Entry(entity, deepcopy(values))
+            self._entries[(model_class, entity.id)] = entry
+        for key in keys:
+            self._keys[(model_class, key)] = entity.id
+        return entry.entity
+
+    def refresh(self, model_class: type, entity: Any, values: dict[str, Any]) -> None:
+        """Track a written entity with the column values now stored.
+
+        Args:
+            model_class: Model class the entity is stored as
+            entity: Written entity
+            values: Column values written
+        """
+        self._entries[(model_class, entity.id)] = _Entry(entity, deepcopy(values))
+
+    def changes(
+        self, model_class: type, entity_id: UUID, values: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Get the column values that differ from the tracked snapshot.
+
+        Args:
+            model_class: Model class the entity is stored as
+            entity_id: Entity ID
+            values: Current column values of the entity
+
+        Returns:
+            Changed column values, None if the entity is not tracked
+        """
+        entry = self._entries.get((model_class, entity_id))
+        if entry is None:
+            return None
+        return {
+            column: value
+            for column, value in values.items()
+            if column not in entry.snapshot or entry.snapshot[column] != value
+        }
+
+    def discard(self, model_class: type, entity_ids: list[UUID]) -> None:
+        """Stop tracking entities whose rows were changed or deleted.
+
+        Args:
+            model_class: Model class the entities are stored as
+            entity_ids: Entity IDs
+        """
+        for entity_id in entity_ids:
+            self._entries.pop((model_class, entity_id), None)
+
+    def discard_keys(self, model_class: type, keys: list[str]) -> None:
+        """Stop resolving unique keys an entity no longer has.
+
+        Args:
+            model_class: Model class the entities are stored as
+            keys: Unique keys entities were tracked under
+        """
+        for key in keys:
+            self._keys.pop((model_class, key), None)
+
+    def clear(self) -> None:
+        """Stop tracking all entities."""
+        self._entries.clear()
+        self._keys.clear()
+
+
+_identity_maps: WeakKeyDictionary[Any, IdentityMap] = WeakKeyDictionary()
+
+
+def identity_map(session: Any) -> IdentityMap:
+    """Get the identity map of a database session.
+
+    The map lives as long as the session and is cleared when a transaction
+    of the session commits or rolls back: afterwards other sessions may change
+    the rows, and after a rollback tracked entities may hold values that were
+    never stored.
+
+    Args:
+        session: Async database session
+
+    Returns:
+        Identity map shared by all repositories using the session
+    """
+    tracked = _identity_maps.get(session)
+    if tracked is None:
+        tracked = _identity_maps[session] = IdentityMap()
+        sync_session = getattr(session, "sync_session", None)
+        if isinstance(sync_session, Session):
+            for name in ("after_commit", "after_rollback"):
+                event.listen(sync_session, name, lambda _: tracked.clear())
+    return tracked
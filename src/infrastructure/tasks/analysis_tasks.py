@@ -21,10 +21,11 @@ from src.infrastructure.database.base import async_session_maker
 from src.infrastructure.edgar.service import EdgarService
 from src.infrastructure.llm import BaseLLMProvider, GoogleProvider, OpenAIProvider
 from src.infrastructure.messaging import TaskPriority, task
-from src.infrastructure.messaging.interfaces import IStorageService
+from src.infrastructure.messaging.interfaces import IStorageService, StoredObject
 from src.infrastructure.repositories.analysis_repository import AnalysisRepository
 from src.infrastructure.repositories.company_repository import CompanyRepository
 from src.infrastructure.repositories.filing_repository import FilingRepository
+from src.shared import serialization, telemetry
 from src.shared.config.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,9 @@ MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB limit for filing files
 # Storage service (replaces direct file operations)
 _local_storage_service: IStorageService | None = None
 
+# Connected S3 storage services by key prefix, shared across tasks and requests
+_s3_storage_services: dict[str, IStorageService] = {}
+
 
 async def get_local_storage_service() -> IStorageService:
     """Get local storage service instance."""
@@ -55,6 +59,26 @@ async def get_local_storage_service() -> IStorageService:
     return _local_storage_service
 
 
+async def get_s3_storage_service(prefix: str) -> IStorageService:
+    """Get the S3 storage service of a key prefix, connecting it once."""
+    storage_service = _s3_storage_services.get(prefix)
+    if storage_service is None:
+        from src.infrastructure.messaging.implementations.s3_storage import (
+            S3StorageService,
+        )
+
+        _validate_s3_configuration()
+        settings = Settings()
+        storage_service = S3StorageService(
+            bucket_name=settings.aws_s3_bucket,
+            aws_region=settings.aws_region,
+            prefix=prefix,
+        )
+        await storage_service.connect()
+        _s3_storage_services[prefix] = storage_service
+    return storage_service
+
+
 def _validate_s3_configuration() -> None:
     """Validate S3 configuration when S3 storage is enabled.
 
@@ -81,6 +105,7 @@ def _validate_s3_configuration() -> None:
         logger.info("Using local storage service (development mode)")
 
 
+@telemetry.timed(telemetry.STORAGE_OPERATION_DURATION, operation="get_filing")
 async def get_filing_content(
     accession_number: AccessionNumber, company_cik: CIK
 ) -> dict[str, Any] | None:
@@ -105,23 +130,12 @@ async def get_filing_content(
         if USE_S3_STORAGE:
             # Production: Try S3 storage first
             try:
-                from src.infrastructure.messaging.implementations.s3_storage import (
-                    S3StorageService,
-                )
-
-                # Validate S3 configuration before creating service
-                _validate_s3_configuration()
-
-                settings = Settings()
-                s3_service = S3StorageService(
-                    bucket_name=settings.aws_s3_bucket,
-                    aws_region=settings.aws_region,
-                    prefix=f"filings/{company_cik}/",
-                )
-                await s3_service.connect()
+                s3_service = await get_s3_storage_service("filings/")
 
                 # Add .json extension for S3 retrieval (migrated files have .json extension)
-                filing_content = await s3_service.get(f"{clean_accession}.json")
+                filing_content = await s3_service.get(
+                    f"{company_cik}/{clean_accession}.json"
+                )
                 if filing_content:
                     logger.info(f"Retrieved filing {accession_number} from S3 storage")
                     return filing_content  # type: ignore[no-any-return]
@@ -151,7 +165,9 @@ async def get_filing_content(
         edgar_service = EdgarService()
 
         # Get filing data
-        filing_data = edgar_service.get_filing_by_accession(accession_number)
+        filing_data = await edgar_service.get_filing_by_accession_async(
+            accession_number
+        )
 
         if filing_data:
             # Prepare filing content for storage
@@ -200,6 +216,36 @@ async def get_filing_content(
         return None
 
 
+async def _get_analysis_storage(
+    analysis_id: UUID, company_cik: CIK, accession_number: AccessionNumber
+) -> tuple[IStorageService, str]:
+    """Get the storage backend holding analysis results and their key.
+
+    Args:
+        analysis_id: Analysis ID
+        company_cik: Company CIK for storage path
+        accession_number: Accession number for storage path
+
+    Returns:
+        Connected storage service and the storage key of the results
+    """
+    # Create storage key for analysis results
+    analysis_key = f"analysis_{analysis_id}"
+    clean_accession = accession_number.value.replace("-", "")
+
+    if USE_S3_STORAGE:
+        # Production: S3 storage, with one client shared by every read
+        s3_service = await get_s3_storage_service("analyses/")
+
+        # Add .json extension for S3 retrieval (migrated files have .json extension)
+        return s3_service, f"{company_cik}/{clean_accession}/{analysis_key}.json"
+
+    # Development: local storage service
+    storage_service = await get_local_storage_service()
+    return storage_service, f"analysis:{company_cik}/{clean_accession}/{analysis_key}"
+
+
+@telemetry.timed(telemetry.STORAGE_OPERATION_DURATION, operation="get_analysis")
 async def get_analysis_results(
     analysis_id: UUID, company_cik: CIK, accession_number: AccessionNumber
 ) -> dict[str, Any] | None:
@@ -214,59 +260,163 @@ async def get_analysis_results(
         Analysis results dictionary or None if not found
     """
     try:
-        # Create storage key for analysis results
-        analysis_key = f"analysis_{analysis_id}"
+        storage_service, key = await _get_analysis_storage(
+            analysis_id, company_cik, accession_number
+        )
+        analysis_results = await storage_service.get(key)
+        if analysis_results:
+            logger.debug(f"Retrieved analysis {analysis_id} from storage")
+            return analysis_results  # type: ignore[no-any-return]
+        return None
 
-        if USE_S3_STORAGE:
-            # Production: Try S3 storage first
-            try:
-                from src.infrastructure.messaging.implementations.s3_storage import (
-                    S3StorageService,
-                )
+    except Exception as e:
+        logger.warning(f"Failed to retrieve analysis {analysis_id} from storage: {e}")
+        return None
 
-                _validate_s3_configuration()
-                settings = Settings()
-                s3_service = S3StorageService(
-                    bucket_name=settings.aws_s3_bucket,
-                    aws_region=settings.aws_region,
-                    prefix=f"analyses/{company_cik}/{accession_number.value.replace('-', '')}/",
-                )
-                await s3_service.connect()
 
-                # Add .json extension for S3 retrieval (migrated files have .json extension)
-                analysis_results = await s3_service.get(f"{analysis_key}.json")
-                if analysis_results:
-                    logger.debug(f"Retrieved analysis {analysis_id} from S3 storage")
-                    return analysis_results  # type: ignore[no-any-return]
-            except Exception as e:
-                logger.warning(f"Failed to retrieve analysis from S3: {e}")
-        else:
-            # Development: Try local storage service
-            try:
-                storage_service = await get_local_storage_service()
-                clean_accession = accession_number.value.replace("-", "")
-                analysis_storage_key = (
-                    f"analysis:{company_cik}/{clean_accession}/{analysis_key}"
-                )
-                analysis_results = await storage_service.get(analysis_storage_key)
+async def open_analysis_results(
+    analysis_id: UUID, company_cik: CIK, accession_number: AccessionNumber
+) -> StoredObject | None:
+    """Open stored analysis results for streaming, without loading them.
 
-                if analysis_results:
-                    logger.debug(
-                        f"Retrieved analysis {analysis_id} from local storage service"
-                    )
-                    return analysis_results  # type: ignore[no-any-return]
-            except Exception as e:
-                logger.warning(
-                    f"Failed to retrieve analysis from local storage service: {e}"
-                )
+    Args:
+        analysis_id: Analysis ID
+        company_cik: Company CIK for storage path
+        accession_number: Accession number for storage path
+
+    Returns:
+        Handle to the stored JSON of the results or None if not found
+    """
+    try:
+        storage_service, key = await _get_analysis_storage(
+            analysis_id, company_cik, accession_number
+        )
+        return await storage_service.open(key)
 
+    except Exception as e:
+        logger.warning(f"Failed to open analysis {analysis_id} in storage: {e}")
         return None
 
+
+async def _get_filing_storage(
+    accession_number: AccessionNumber, company_cik: CIK
+) -> tuple[IStorageService, str]:
+    """Get the storage backend holding filing content and its key.
+
+    Args:
+        accession_number: SEC accession number
+        company_cik: Company CIK
+
+    Returns:
+        Connected storage service and the storage key of the filing content
+    """
+    clean_accession = str(accession_number).replace("-", "")
+
+    if USE_S3_STORAGE:
+        s3_service = await get_s3_storage_service("filings/")
+        return s3_service, f"{company_cik}/{clean_accession}.json"
+
+    storage_service = await get_local_storage_service()
+    return storage_service, f"filing:{company_cik}/{clean_accession}"
+
+
+def serialize_filing_sections(sections: dict[str, str]) -> bytes:
+    """Serialize filing sections as newline-delimited JSON.
+
+    Args:
+        sections: Section text by section name
+
+    Returns:
+        One ``{"section": ..., "content": ...}`` object per line
+    """
+    return b"".join(
+        serialization.dumps({"section": name, "content": content}) + b"\n"
+        for name, content in sections.items()
+    )
+
+
+def _filing_sections_key(filing_key: str) -> str:
+    """Get the storage key of the sections kept next to filing content."""
+    return f"{filing_key.removesuffix('.json')}/sections"
+
+
+async def _store_filing_sections(
+    storage_service: IStorageService, filing_key: str, filing_content: dict[str, Any]
+) -> bool:
+    """Store the sections of filing content as newline-delimited JSON.
+
+    Args:
+        storage_service: Storage backend holding the filing content
+        filing_key: Storage key of the filing content
+        filing_content: Filing content whose sections to store
+
+    Returns:
+        True if successfully stored, False otherwise
+    """
+    sections = serialize_filing_sections(filing_content.get("sections") or {})
+    return await storage_service.set_raw(_filing_sections_key(filing_key), sections)
+
+
+async def open_filing_content(
+    accession_number: AccessionNumber, company_cik: CIK
+) -> StoredObject | None:
+    """Open stored filing content for streaming, without loading it.
+
+    Args:
+        accession_number: SEC accession number
+        company_cik: Company CIK
+
+    Returns:
+        Handle to the stored JSON of the filing or None if not stored
+    """
+    try:
+        storage_service, key = await _get_filing_storage(accession_number, company_cik)
+        return await storage_service.open(key)
+
     except Exception as e:
-        logger.error(f"Error retrieving analysis results: {e}")
+        logger.warning(f"Failed to open filing {accession_number} in storage: {e}")
         return None
 
 
+async def open_filing_sections(
+    accession_number: AccessionNumber, company_cik: CIK
+) -> StoredObject | None:
+    """Open the sections of stored filing content for streaming.
+
+    Sections are kept as newline-delimited JSON next to the filing content,
+    so they are streamed without the raw HTML and full text. Filings stored
+    before sections were written alongside them get their sections written
+    from the filing content the first time they are requested.
+
+    Args:
+        accession_number: SEC accession number
+        company_cik: Company CIK
+
+    Returns:
+        Handle to the newline-delimited sections or None if not stored
+    """
+    try:
+        storage_service, key = await _get_filing_storage(accession_number, company_cik)
+        sections_key = _filing_sections_key(key)
+
+        stored = await storage_service.open(sections_key)
+        if stored is None:
+            filing_content = await storage_service.get(key)
+            if not filing_content:
+                return None
+            if not await _store_filing_sections(storage_service, key, filing_content):
+                return None
+            stored = await storage_service.open(sections_key)
+        return stored
+
+    except Exception as e:
+        logger.warning(
+            f"Failed to open sections of filing {accession_number} in storage: {e}"
+        )
+        return None
+
+
+@telemetry.timed(telemetry.STORAGE_OPERATION_DURATION, operation="store_analysis")
 async def store_analysis_results(
     analysis_id: UUID,
     company_cik: CIK,
@@ -291,20 +441,11 @@ async def store_analysis_results(
         if USE_S3_STORAGE:
             # Production: Store in S3
             try:
-                from src.infrastructure.messaging.implementations.s3_storage import (
-                    S3StorageService,
-                )
-
-                _validate_s3_configuration()
-                settings = Settings()
-                s3_service = S3StorageService(
-                    bucket_name=settings.aws_s3_bucket,
-                    aws_region=settings.aws_region,
-                    prefix=f"analyses/{company_cik}/{accession_number.value.replace('-', '')}/",
+                s3_service = await get_s3_storage_service("analyses/")
+                clean_accession = accession_number.value.replace("-", "")
+                success = await s3_service.set(
+                    f"{company_cik}/{clean_accession}/{analysis_key}", analysis_results
                 )
-                await s3_service.connect()
-
-                success = await s3_service.set(analysis_key, analysis_results)
                 if success:
                     logger.info(f"Stored analysis {analysis_id} to S3 storage")
                 return success
@@ -337,6 +478,7 @@ async def store_analysis_results(
         return False
 
 
+@telemetry.timed(telemetry.STORAGE_OPERATION_DURATION, operation="store_filing")
 async def store_filing_content(
     accession_number: AccessionNumber,
     company_cik: CIK,
@@ -359,24 +501,17 @@ async def store_filing_content(
         if USE_S3_STORAGE:
             # Production: Store in S3
             try:
-                from src.infrastructure.messaging.implementations.s3_storage import (
-                    S3StorageService,
-                )
-
-                # Validate S3 configuration before creating service
-                _validate_s3_configuration()
-
-                settings = Settings()
-                s3_service = S3StorageService(
-                    bucket_name=settings.aws_s3_bucket,
-                    aws_region=settings.aws_region,
-                    prefix=f"filings/{company_cik}/",
-                )
-                await s3_service.connect()
-
-                success = await s3_service.set(clean_accession, filing_content)
+                s3_service = await get_s3_storage_service("filings/")
+                filing_key = f"{company_cik}/{clean_accession}"
+                success = await s3_service.set(filing_key, filing_content)
                 if success:
                     logger.info(f"Stored filing {accession_number} to S3 storage")
+                    if not await _store_filing_sections(
+                        s3_service, filing_key, filing_content
+                    ):
+                        logger.warning(
+                            f"Failed to store sections of filing {accession_number}"
+                        )
                 return success
             except Exception as e:
                 logger.error(f"Failed to store to S3: {e}")
@@ -392,6 +527,12 @@ async def store_filing_content(
                     logger.info(
                         f"Stored filing {accession_number} to local storage service"
                     )
+                    if not await _store_filing_sections(
+                        storage_service, filing_key, filing_content
+                    ):
+                        logger.warning(
+                            f"Failed to store sections of filing {accession_number}"
+                        )
                 return success
             except Exception as e:
                 logger.error(f"Failed to store to local storage service: {e}")
@@ -541,7 +682,9 @@ async def retrieve_and_analyze_filing(
                 )
                 try:
                     # Fetch company data from SEC EDGAR
-                    company_data = edgar_service.get_company_by_cik(company_cik)
+                    company_data = await edgar_service.get_company_by_cik_async(
+                        company_cik
+                    )
 
                     # Create new company entity
                     from src.domain.entities.company import Company
@@ -3,12 +3,13 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from src.presentation.api.dependencies import service_lifecycle
-from src.presentation.api.middleware import RateLimitMiddleware
+from src.presentation.api.middleware import MetricsMiddleware, RateLimitMiddleware
 from src.presentation.api.routers import analyses, companies, filings, health, tasks
 from src.shared.config.settings import settings
 
@@ -105,6 +106,8 @@ app = FastAPI(
     debug=settings.debug,
     description="SEC Filing Analysis Engine",
     lifespan=lifespan,
+    # Large analysis results serialize several times faster with orjson
+    default_response_class=ORJSONResponse,
 )
 
 # Add exception handlers
@@ -123,6 +126,22 @@ app.add_middleware(
 # Add rate limiting middleware
 app.add_middleware(RateLimitMiddleware, rate_limiter=None, excluded_paths=None)
 
+# Add request metrics middleware, outermost so rate limited requests are timed
+if settings.prometheus_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# Trace requests when OpenTelemetry is enabled
+if settings.opentelemetry_enabled:
+    try:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+        FastAPIInstrumentor.instrument_app(app, excluded_urls="metrics,health")
+    except ImportError:
+        logger.warning(
+            "opentelemetry-instrumentation-fastapi is not installed, "
+            "API requests will not be traced"
+        )
+
 # Include routers
 # API v1 routers with /api prefix
 app.include_router(health.router, prefix="/api")
@@ -140,3 +159,11 @@ async def root() -> dict[str, Any]:
         "version": settings.app_version,
         "environment": settings.environment,
     }
+
+
+if settings.prometheus_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Prometheus metrics endpoint."""
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
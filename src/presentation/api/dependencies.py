@@ -15,12 +15,14 @@ from src.application.services.background_task_coordinator import (
     BackgroundTaskCoordinator,
 )
 from src.application.services.task_service import TaskService
+from src.infrastructure.database.ticker_map import ticker_cik_map
 from src.infrastructure.messaging import (
     cleanup_services,
     get_queue_service,
     get_storage_service,
     get_worker_service,
 )
+from src.presentation.api.health_monitor import health_monitor
 from src.shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -103,7 +105,8 @@ class ServiceLifecycle:
     async def startup(self) -> None:
         """Initialize services during application startup.
 
-        Creates the service factory and initializes messaging services.
+        Creates the service factory, initializes messaging services, loads
+        the ticker to CIK map and starts the health monitor.
         """
         logger.info("Starting service lifecycle management")
         logger.info(
@@ -138,6 +141,17 @@ class ServiceLifecycle:
             # Don't fail startup completely - some endpoints might still work
             logger.warning("Continuing startup with limited functionality")
 
+        try:
+            # Resolve tickers in memory on the hot company lookup path
+            await ticker_cik_map.load()
+        except Exception as e:
+            logger.warning(
+                f"Failed to load ticker map, ticker lookups use the database: {e}"
+            )
+
+        # Refresh dependency health in the background for the health endpoints
+        await health_monitor.start()
+
     async def shutdown(self) -> None:
         """Clean up services during application shutdown.
 
@@ -145,6 +159,11 @@ class ServiceLifecycle:
         """
         logger.info("Shutting down service lifecycle management")
 
+        try:
+            await health_monitor.stop()
+        except Exception as e:
+            logger.error(f"Error stopping health monitor: {e}")
+
         try:
             # Cleanup messaging services
             await cleanup_services()
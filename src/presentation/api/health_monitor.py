@@ -0,0 +1,265 @@
+"""Background health monitoring of the services the API depends on.
+
+Queue and storage health checks are remote calls, and load balancers probe
+the health endpoints every few seconds on every replica. Rather than check
+dependencies on each probe, the monitor refreshes each one in the
+background on its own interval, with a timeout, and the endpoints serve the
+last snapshot. Each result records how long its check took and how old it
+is, and is marked stale once refreshes have been missed.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.infrastructure.messaging import (
+    get_queue_service,
+    get_storage_service,
+    get_worker_service,
+)
+from src.shared.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HealthStatus(BaseModel):
+    """Health status response model."""
+
+    status: str
+    message: str | None = None
+    timestamp: str
+    details: dict[str, Any] | None = None
+    latency_ms: float | None = None
+    age_seconds: float | None = None
+    stale: bool | None = None
+
+
+@dataclass(frozen=True)
+class HealthCheck:
+    """Health check of a dependency, refreshed on its own interval."""
+
+    name: str
+    check: Callable[[], Awaitable[HealthStatus]]
+    interval: float
+    timeout: float
+
+    @property
+    def stale_after(self) -> float:
+        """Seconds after which a result is stale, once two refreshes are missed."""
+        return 2 * self.interval + self.timeout
+
+
+class HealthMonitor:
+    """Refreshes dependency health in the background and serves snapshots."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the monitor.
+
+        Args:
+            clock: Monotonic clock measuring the age of results
+        """
+        self._clock = clock
+        self._checks: dict[str, HealthCheck] = {}
+        self._results: dict[str, tuple[HealthStatus, float]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def register(
+        self,
+        name: str,
+        check: Callable[[], Awaitable[HealthStatus]],
+        interval: float,
+        timeout: float,
+    ) -> None:
+        """Register a dependency health check.
+
+        Args:
+            name: Name of the dependency
+            check: Coroutine function checking the dependency
+            interval: Seconds between refreshes
+            timeout: Seconds a check may take before it is reported degraded
+        """
+        self._checks[name] = HealthCheck(name, check, interval, timeout)
+
+    @property
+    def running(self) -> bool:
+        """Whether the checks are being refreshed in the background."""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start refreshing each check in the background.
+
+        Returns immediately; dependencies report ``unknown`` until their
+        first check completes.
+        """
+        if self.running:
+            return
+
+        self._tasks = [
+            asyncio.create_task(self._run(check), name=f"health-check-{check.name}")
+            for check in self._checks.values()
+        ]
+        logger.info(f"Health monitor started for {', '.join(self._checks)}")
+
+    async def stop(self) -> None:
+        """Stop refreshing checks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Health monitor stopped")
+
+    async def refresh(self) -> None:
+        """Run every check now, concurrently."""
+        await asyncio.gather(*(self._refresh(check) for check in self._checks.values()))
+
+    def snapshot(self) -> dict[str, HealthStatus]:
+        """Get the last result of each check.
+
+        Returns:
+            Health status by dependency name, with the age of the result
+        """
+        now = self._clock()
+        snapshot = {}
+        for name, check in self._checks.items():
+            if name not in self._results:
+                snapshot[name] = HealthStatus(
+                    status="unknown",
+                    message="Health check has not completed yet",
+                    timestamp=datetime.now(UTC).isoformat(),
+                )
+                continue
+
+            status, checked_at = self._results[name]
+            age = now - checked_at
+            snapshot[name] = status.model_copy(
+                update={
+                    "age_seconds": round(age, 3),
+                    "stale": age > check.stale_after,
+                }
+            )
+        return snapshot
+
+    async def _run(self, check: HealthCheck) -> None:
+        """Refresh a check on its interval until cancelled."""
+        while True:
+            await self._refresh(check)
+            await asyncio.sleep(check.interval)
+
+    async def _refresh(self, check: HealthCheck) -> None:
+        """Run a check once and record its result."""
+        started = self._clock()
+        try:
+            status = await asyncio.wait_for(check.check(), timeout=check.timeout)
+        except TimeoutError:
+            logger.warning(f"Health check of {check.name} timed out")
+            status = HealthStatus(
+                status="degraded",
+                message="Health check timed out - service may be under load",
+                timestamp=datetime.now(UTC).isoformat(),
+                details={"error": "TimeoutError", "timeout_seconds": check.timeout},
+            )
+        except Exception as e:
+            logger.error(f"Health check of {check.name} failed: {e}")
+            status = HealthStatus(
+                status="unhealthy",
+                message=f"Health check failed: {str(e)}",
+                timestamp=datetime.now(UTC).isoformat(),
+                details={"error": str(e)},
+            )
+
+        finished = self._clock()
+        self._results[check.name] = (
+            status.model_copy(
+                update={"latency_ms": round((finished - started) * 1000, 1)}
+            ),
+            finished,
+        )
+
+
+async def _check_service(
+    get_service: Callable[[], Awaitable[Any]], name: str
+) -> HealthStatus:
+    """Check a messaging service.
+
+    Args:
+        get_service: Getter of the service from the messaging registry
+        name: Name of the service
+
+    Returns:
+        Health status of the service
+    """
+    timestamp = datetime.now(UTC).isoformat()
+    try:
+        service = await get_service()
+    except RuntimeError as e:
+        # Registry not initialized
+        return HealthStatus(
+            status="not_configured",
+            message="Messaging services not initialized",
+            timestamp=timestamp,
+            details={"error": str(e), "initialized": False},
+        )
+
+    healthy = await service.health_check()
+    details: dict[str, Any] = {"service_type": type(service).__name__}
+    if hasattr(service, "get_circuit_breaker_status"):
+        details["circuit_breaker"] = service.get_circuit_breaker_status()
+
+    if healthy:
+        return HealthStatus(
+            status="healthy",
+            message=f"{name.capitalize()} service is healthy",
+            timestamp=timestamp,
+            details=details,
+        )
+    return HealthStatus(
+        status="unhealthy",
+        message=f"{name.capitalize()} service is unhealthy",
+        timestamp=timestamp,
+        details=details,
+    )
+
+
+async def check_queue() -> HealthStatus:
+    """Check the health of the task queue."""
+    return await _check_service(get_queue_service, "queue")
+
+
+async def check_worker() -> HealthStatus:
+    """Check the health of the worker service."""
+    return await _check_service(get_worker_service, "worker")
+
+
+async def check_storage() -> HealthStatus:
+    """Check the health of the storage service."""
+    return await _check_service(get_storage_service, "storage")
+
+
+def create_health_monitor() -> HealthMonitor:
+    """Create the monitor of the messaging services the API depends on.
+
+    Returns:
+        Health monitor with the queue, worker and storage checks registered
+    """
+    monitor = HealthMonitor()
+    timeout = settings.health_check_timeout
+    monitor.register(
+        "queue", check_queue, settings.health_check_queue_interval, timeout
+    )
+    monitor.register(
+        "worker", check_worker, settings.health_check_worker_interval, timeout
+    )
+    monitor.register(
+        "storage", check_storage, settings.health_check_storage_interval, timeout
+    )
+    return monitor
+
+
+# Global health monitor, started and stopped with the application
+health_monitor = create_health_monitor()
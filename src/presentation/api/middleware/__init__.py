@@ -1,5 +1,6 @@
 """FastAPI middleware implementations."""
 
+from .metrics import MetricsMiddleware
 from .rate_limit import RateLimitMiddleware
 
-__all__ = ["RateLimitMiddleware"]
+__all__ = ["MetricsMiddleware", "RateLimitMiddleware"]
@@ -0,0 +1,63 @@
+"""Request metrics middleware for FastAPI."""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import BaseRoute
+
+from src.shared import telemetry
+
+logger = logging.getLogger(__name__)
+
+# Route label of requests no route matched, to keep the label set bounded
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """FastAPI middleware observing the latency of API requests.
+
+    Requests are labelled with the template of the route that handled them,
+    such as ``/api/filings/{accession_number}``, rather than their path, so
+    each route is a single series whatever its path parameters.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Time the request and record it by route, method and status.
+
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/endpoint in the chain
+
+        Returns:
+            HTTP response of the endpoint
+        """
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            telemetry.HTTP_REQUEST_DURATION.labels(
+                method=request.method,
+                route=self._route_template(request),
+                status=str(status_code),
+            ).observe(time.perf_counter() - started)
+
+    @staticmethod
+    def _route_template(request: Request) -> str:
+        """Get the template of the route that handled a request.
+
+        Args:
+            request: Handled HTTP request
+
+        Returns:
+            Path template of the matched route, or ``unmatched``
+        """
+        route: BaseRoute | None = request.scope.get("route")
+        return getattr(route, "path", None) or UNMATCHED_ROUTE
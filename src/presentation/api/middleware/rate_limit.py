@@ -73,8 +73,15 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if self._is_path_excluded(request.url.path):
             return await call_next(request)
 
-        # Check rate limits
-        rate_limit_result = self.rate_limiter.check_request(request)
+        # Check rate limits, failing open if the counter storage is unavailable
+        try:
+            rate_limit_result = await self.rate_limiter.check_request(request)
+        except Exception as e:
+            logger.warning(
+                f"Rate limit check failed, allowing request: {e}",
+                extra={"path": str(request.url.path)},
+            )
+            return await call_next(request)
 
         # Create headers for all responses
         rate_limit_headers = self.rate_limiter.get_rate_limit_headers(rate_limit_result)
@@ -144,12 +151,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             Number of expired clients cleaned up
         """
-        return self.rate_limiter.cleanup_expired_clients()
+        return await self.rate_limiter.cleanup_expired_clients()
 
-    def get_rate_limiter_stats(self) -> dict[str, int]:
+    async def get_rate_limiter_stats(self) -> dict[str, int]:
         """Get rate limiter statistics.
 
         Returns:
             Dictionary with rate limiter statistics
         """
-        return self.rate_limiter.get_stats()
+        return await self.rate_limiter.get_stats()
@@ -0,0 +1,194 @@
+"""HTTP response caching with ETags for immutable resources.
+
+Filings and analyses are not rewritten once stored, so a response is fully
+identified by the resource and the version it was rendered from. Endpoints
+look up the version cheaply, derive a strong ETag from it and either answer
+``304 Not Modified``, serve the serialized body cached for the ETag, or run
+their handler once to render it.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from threading import Lock
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from src.shared.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache-Control of responses that may change, such as a filing whose
+# processing status advances: shared caches store them but revalidate the
+# ETag on every request
+REVALIDATE = "public, no-cache"
+
+
+def max_age(seconds: int) -> str:
+    """Cache-Control of responses clients and CDNs may reuse unchecked.
+
+    Args:
+        seconds: Seconds the response stays fresh
+
+    Returns:
+        Cache-Control header value
+    """
+    return f"public, max-age={seconds}"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the identity and version of a resource.
+
+    Args:
+        *parts: Values identifying the representation, such as the kind of
+            resource, its ID and when it was last updated
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag.
+
+    Uses the weak comparison RFC 9110 specifies for If-None-Match.
+
+    Args:
+        if_none_match: If-None-Match request header, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's representation is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ResponseCache:
+    """Serialized response bodies by ETag, evicted least recently used.
+
+    The total size of cached bodies is kept within a byte budget. Since an
+    ETag changes with the version of its resource, outdated bodies are never
+    served and simply age out.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty response cache.
+
+        Args:
+            max_bytes: Maximum total size of cached bodies (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self._bodies: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached bodies."""
+        return len(self._bodies)
+
+    @property
+    def size(self) -> int:
+        """Total size of cached bodies in bytes."""
+        return self._size
+
+    def get(self, etag: str) -> bytes | None:
+        """Get the body cached for an ETag.
+
+        Args:
+            etag: ETag of the response
+
+        Returns:
+            Serialized body, None if not cached
+        """
+        with self._lock:
+            body = self._bodies.get(etag)
+            if body is None:
+                self.misses += 1
+                return None
+            self._bodies.move_to_end(etag)
+            self.hits += 1
+            return body
+
+    def set(self, etag: str, body: bytes) -> None:
+        """Cache the body of a response, evicting the least recently used.
+
+        Bodies larger than the whole budget are not cached.
+
+        Args:
+            etag: ETag of the response
+            body: Serialized body
+        """
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._bodies.pop(etag, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._bodies[etag] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._bodies.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Remove all cached bodies."""
+        with self._lock:
+            self._bodies.clear()
+            self._size = 0
+
+
+response_cache = ResponseCache(settings.response_cache_max_bytes)
+
+_adapters: dict[type, TypeAdapter[Any]] = {}
+
+
+def _serialize(result: Any) -> bytes:
+    """Serialize a response DTO to JSON as FastAPI would."""
+    adapter = _adapters.get(type(result))
+    if adapter is None:
+        adapter = _adapters[type(result)] = TypeAdapter(type(result))
+    return adapter.dump_json(result)
+
+
+async def conditional_response(
+    request: Request,
+    etag: str,
+    render: Callable[[], Awaitable[Any]],
+    cache_control: str = REVALIDATE,
+) -> Response:
+    """Respond to a GET of a resource identified by an ETag.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        etag: Current ETag of the resource
+        render: Runs the handler producing the response DTO, only awaited
+            when the body is not cached
+        cache_control: Cache-Control header of the response
+
+    Returns:
+        ``304 Not Modified`` if the client's copy is current, otherwise the
+        JSON body
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = response_cache.get(etag)
+    if body is None:
+        body = _serialize(await render())
+        response_cache.set(etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -5,21 +5,43 @@ from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.factory import ServiceFactory
 from src.application.schemas.commands.analyze_filing import AnalysisTemplate
+from src.application.schemas.queries.batch_get_analyses import BatchGetAnalysesQuery
 from src.application.schemas.queries.get_analysis import GetAnalysisQuery
 from src.application.schemas.queries.get_templates import GetTemplatesQuery
 from src.application.schemas.queries.list_analyses import ListAnalysesQuery
 from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.application.schemas.responses.batch_response import BatchResponse
 from src.application.schemas.responses.paginated_response import PaginatedResponse
 from src.application.schemas.responses.templates_response import TemplatesResponse
 from src.domain.entities.analysis import AnalysisType
 from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.processing_status import ProcessingStatus
 from src.infrastructure.database.base import get_db
+from src.infrastructure.database.pagination import InvalidCursorError
 from src.presentation.api.dependencies import get_service_factory
+from src.presentation.api.response_cache import (
+    REVALIDATE,
+    conditional_response,
+    make_etag,
+    max_age,
+)
+from src.presentation.api.streaming import stream_response
+from src.shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +60,34 @@ router = APIRouter(
 SessionDep = Annotated[AsyncSession, Depends(get_db)]
 ServiceFactoryDep = Annotated[ServiceFactory, Depends(get_service_factory)]
 AnalysisIdPath = Annotated[UUID, Path(description="Analysis ID")]
+IncludeFullResultsQuery = Annotated[
+    bool,
+    Query(
+        description="Include the complete results; summaries are served "
+        "without loading them from storage"
+    ),
+]
+SectionQuery = Annotated[
+    str | None,
+    Query(description="Only include this section analysis in the full results"),
+]
+
+
+def _cache_control(processing_status: str) -> str:
+    """Cache-Control of an analysis given the processing status of its filing.
+
+    Only analyses of completed filings are final; others are revalidated
+    against their ETag so shared caches never serve them stale.
+
+    Args:
+        processing_status: Processing status of the analyzed filing
+
+    Returns:
+        Cache-Control header value
+    """
+    if processing_status == ProcessingStatus.COMPLETED.value:
+        return max_age(settings.response_cache_max_age)
+    return REVALIDATE
 
 
 @router.get(
@@ -49,6 +99,8 @@ AnalysisIdPath = Annotated[UUID, Path(description="Analysis ID")]
 
     Supports filtering by company CIK, analysis type, analysis template, date range, and confidence score.
     Results are ordered by creation date (newest first) and support pagination.
+    Each page returns a `next_cursor`; pass it as `cursor` to fetch the next
+    page without an offset scan. Set `include_total=false` to skip counting.
 
     Note: analysis_template and analysis_type filters can be used independently or together.
     """,
@@ -84,6 +136,13 @@ async def list_analyses(
     page_size: Annotated[
         int, Query(ge=1, le=100, description="Number of analyses per page (max 100)")
     ] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="Cursor of the next page from a previous response"),
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="Count the total number of matching analyses")
+    ] = True,
 ) -> PaginatedResponse[AnalysisResponse]:
     """List analyses with filtering and pagination.
 
@@ -98,12 +157,14 @@ async def list_analyses(
         created_to: Optional end date filter
         page: Page number for pagination (1-based)
         page_size: Number of results per page
+        cursor: Optional cursor of the next page, takes precedence over page
+        include_total: Whether to count the total number of matching analyses
 
     Returns:
         List of AnalysisResponse objects matching the filters
 
     Raises:
-        HTTPException: 422 if query parameters are invalid
+        HTTPException: 422 if query parameters or the cursor are invalid
         HTTPException: 500 if listing fails
     """
     logger.info(
@@ -130,9 +191,6 @@ async def list_analyses(
                     detail=f"Invalid CIK format: {str(e)}",
                 ) from e
 
-        # Calculate offset for pagination
-        (page - 1) * page_size
-
         # Create query
         # Convert single analysis_type to list for schema compatibility
         analysis_types = [analysis_type] if analysis_type else None
@@ -149,6 +207,8 @@ async def list_analyses(
             min_confidence_score=min_confidence_score,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         # Get dependencies and dispatcher
@@ -175,6 +235,11 @@ async def list_analyses(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
     except Exception:
         logger.error(
             "Failed to list analyses",
@@ -263,6 +328,89 @@ async def get_analysis_templates(
         ) from None
 
 
+class BatchGetAnalysesRequest(BaseModel):
+    """Request body of a batch get of analyses."""
+
+    ids: list[UUID] = Field(min_length=1, description="IDs of the analyses")
+    include_full_results: bool = Field(
+        default=False,
+        description="Include the complete results, which are read from storage",
+    )
+    section: str | None = Field(
+        default=None,
+        description="Only include this section analysis in the full results",
+    )
+
+
+@router.post(
+    ":batchGet",
+    response_model=BatchResponse[AnalysisResponse],
+    summary="Get many analyses by ID",
+    description="""
+    Retrieve up to `BATCH_GET_MAX_IDS` analyses in one request.
+
+    Analyses are returned in the order requested. Analyses that are not
+    found or whose results cannot be read are listed in `errors` with the
+    status they would have had if requested alone, so one bad ID does not
+    fail the whole batch.
+    """,
+)
+async def batch_get_analyses(
+    body: BatchGetAnalysesRequest,
+    session: SessionDep,
+    factory: ServiceFactoryDep,
+) -> BatchResponse[AnalysisResponse]:
+    """Get many analyses by ID.
+
+    Args:
+        body: IDs of the analyses and the detail level to return
+        session: Database session for repository operations
+        factory: Service factory for dependency injection
+
+    Returns:
+        BatchResponse with the analyses found and per-item errors
+
+    Raises:
+        HTTPException: 422 if more IDs are requested than allowed
+        HTTPException: 500 if retrieval fails
+    """
+    if len(body.ids) > settings.batch_get_max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.batch_get_max_ids} IDs may be requested",
+        )
+
+    logger.info("Batch retrieving analyses", extra={"analysis_count": len(body.ids)})
+
+    try:
+        query = BatchGetAnalysesQuery(
+            analysis_ids=tuple(body.ids),
+            include_full_results=body.include_full_results,
+            section_name=body.section,
+            max_concurrency=settings.batch_get_storage_concurrency,
+        )
+
+        # Get dependencies and dispatcher
+        dispatcher = factory.create_dispatcher()
+        dependencies = await factory.get_handler_dependencies(session)
+
+        result: BatchResponse[AnalysisResponse] = await dispatcher.dispatch_query(
+            query, dependencies
+        )
+        return result
+
+    except Exception:
+        logger.error(
+            "Failed to batch retrieve analyses",
+            extra={"analysis_count": len(body.ids)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve analyses",
+        ) from None
+
+
 @router.get(
     "/{analysis_id}",
     response_model=AnalysisResponse,
@@ -271,20 +419,33 @@ async def get_analysis_templates(
     Retrieve a specific analysis by its unique ID.
 
     Returns complete analysis results including AI insights, key findings,
-    and metadata about the analysis process.
+    and metadata about the analysis process. Set `include_full_results=false`
+    for the summary only, or pass `section` to limit the full results to one
+    section analysis.
     """,
 )
 async def get_analysis(
     analysis_id: AnalysisIdPath,
+    request: Request,
     session: SessionDep,
     factory: ServiceFactoryDep,
-) -> AnalysisResponse:
+    include_full_results: IncludeFullResultsQuery = True,
+    section: SectionQuery = None,
+) -> AnalysisResponse | Response:
     """Get a specific analysis by ID.
 
+    Responses carry an ETag derived from the analysis version. A request
+    whose If-None-Match matches gets ``304 Not Modified``, and the
+    serialized body of a version is cached so the handler runs once.
+
     Args:
         analysis_id: Unique analysis identifier
+        request: Incoming request, checked for If-None-Match
         session: Database session for repository operations
         factory: Service factory for dependency injection
+        include_full_results: Whether to include the complete results, which
+            are read from storage
+        section: Only include this section analysis in the full results
 
     Returns:
         AnalysisResponse with complete analysis information
@@ -297,20 +458,50 @@ async def get_analysis(
 
     try:
         # Create query
-        query = GetAnalysisQuery(analysis_id=analysis_id)
+        query = GetAnalysisQuery(
+            analysis_id=analysis_id,
+            include_full_results=include_full_results,
+            section_name=section,
+        )
 
         # Get dependencies and dispatcher
         dispatcher = factory.create_dispatcher()
         dependencies = await factory.get_handler_dependencies(session)
 
-        # Dispatch query
-        result: AnalysisResponse = await dispatcher.dispatch_query(query, dependencies)
+        async def render() -> AnalysisResponse:
+            # Dispatch query
+            result: AnalysisResponse = await dispatcher.dispatch_query(
+                query, dependencies
+            )
 
-        logger.info(
-            "Analysis retrieved successfully", extra={"analysis_id": str(analysis_id)}
-        )
+            logger.info(
+                "Analysis retrieved successfully",
+                extra={"analysis_id": str(analysis_id)},
+            )
 
-        return result
+            return result
+
+        version = await factory.create_analysis_repository(session).get_version(
+            analysis_id
+        )
+        if version is None:
+            # Let the handler report the missing analysis
+            return await render()
+
+        updated_at, processing_status = version
+        return await conditional_response(
+            request,
+            make_etag(
+                "analysis",
+                analysis_id,
+                updated_at,
+                processing_status,
+                include_full_results,
+                section,
+            ),
+            render,
+            _cache_control(processing_status),
+        )
 
     except Exception:
         logger.error(
@@ -322,3 +513,78 @@ async def get_analysis(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve analysis",
         ) from None
+
+
+@router.get(
+    "/{analysis_id}/results",
+    response_class=Response,
+    responses={200: {"content": {"application/json": {}}}},
+    summary="Download analysis results",
+    description="""
+    Download the complete results of an analysis exactly as stored.
+
+    The stored JSON is streamed in chunks without being parsed and
+    serialized again, which makes this the fastest way to download full
+    results. Send a `Range` header to download part of them.
+    """,
+)
+async def get_analysis_results(
+    analysis_id: AnalysisIdPath,
+    request: Request,
+    session: SessionDep,
+    factory: ServiceFactoryDep,
+) -> Response:
+    """Stream the stored results of an analysis without parsing them.
+
+    Args:
+        analysis_id: Unique analysis identifier
+        request: Incoming request, checked for If-None-Match and Range
+        session: Database session for repository operations
+        factory: Service factory for dependency injection
+
+    Returns:
+        Streaming JSON response with the stored analysis results
+
+    Raises:
+        HTTPException: 404 if the analysis or its results are not found
+        HTTPException: 500 if retrieval fails
+    """
+    logger.info("Streaming analysis results", extra={"analysis_id": str(analysis_id)})
+
+    try:
+        repository = factory.create_analysis_repository(session)
+        version = await repository.get_version(analysis_id)
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Analysis {analysis_id} not found",
+            )
+
+        stored = await repository.open_results_by_id(analysis_id)
+        if stored is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Results of analysis {analysis_id} not found",
+            )
+
+        updated_at, processing_status = version
+        return stream_response(
+            request,
+            stored,
+            make_etag("analysis-results", analysis_id, updated_at, processing_status),
+            cache_control=_cache_control(processing_status),
+        )
+
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except Exception:
+        logger.error(
+            "Failed to retrieve analysis results",
+            extra={"analysis_id": str(analysis_id)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve analysis results",
+        ) from None
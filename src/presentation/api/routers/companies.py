@@ -17,6 +17,7 @@ from src.application.schemas.responses.paginated_response import PaginatedRespon
 from src.domain.entities.analysis import AnalysisType
 from src.domain.value_objects.filing_type import FilingType
 from src.infrastructure.database.base import get_db
+from src.infrastructure.database.pagination import InvalidCursorError
 from src.presentation.api.dependencies import get_service_factory
 
 logger = logging.getLogger(__name__)
@@ -158,6 +159,7 @@ async def get_company(
 
     Returns analyses ordered by creation date (newest first) with optional
     filtering by analysis type, confidence score, and pagination support.
+    Pass the `next_cursor` of a page as `cursor` to fetch the next page.
     """,
 )
 async def list_company_analyses(
@@ -177,6 +179,13 @@ async def list_company_analyses(
     page_size: Annotated[
         int, Query(ge=1, le=100, description="Number of analyses per page (max 100)")
     ] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="Cursor of the next page from a previous response"),
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="Count the total number of matching analyses")
+    ] = True,
 ) -> PaginatedResponse[AnalysisResponse]:
     """List all analyses for a specific company.
 
@@ -188,12 +197,14 @@ async def list_company_analyses(
         min_confidence: Optional minimum confidence score filter
         page: Page number for pagination (1-based)
         page_size: Number of results per page
+        cursor: Optional cursor of the next page, takes precedence over page
+        include_total: Whether to count the total number of matching analyses
 
     Returns:
         PaginatedResponse containing AnalysisResponse objects for the company
 
     Raises:
-        HTTPException: 422 if ticker format is invalid
+        HTTPException: 422 if ticker format or the cursor is invalid
         HTTPException: 404 if company not found
         HTTPException: 500 if listing fails
     """
@@ -255,6 +266,8 @@ async def list_company_analyses(
             min_confidence_score=min_confidence,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         # Dispatch analyses query
@@ -279,6 +292,11 @@ async def list_company_analyses(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
     except ValueError as e:
         logger.warning(
             "Invalid ticker format", extra={"ticker": ticker, "error": str(e)}
@@ -5,12 +5,23 @@ from datetime import date
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.base.exceptions import ResourceNotFoundError
 from src.application.factory import ServiceFactory
 from src.application.schemas.commands.analyze_filing import AnalyzeFilingCommand
+from src.application.schemas.queries.batch_get_filings import BatchGetFilingsQuery
 from src.application.schemas.queries.get_analysis_by_accession import (
     GetAnalysisByAccessionQuery,
 )
@@ -24,6 +35,7 @@ from src.application.schemas.queries.search_filings import (
     SortDirection,
 )
 from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.application.schemas.responses.batch_response import BatchResponse
 from src.application.schemas.responses.filing_response import FilingResponse
 from src.application.schemas.responses.filing_search_response import FilingSearchResult
 from src.application.schemas.responses.paginated_response import PaginatedResponse
@@ -33,6 +45,13 @@ from src.domain.value_objects.cik import CIK
 from src.domain.value_objects.filing_type import FilingType
 from src.infrastructure.database.base import get_db
 from src.presentation.api.dependencies import get_service_factory
+from src.presentation.api.response_cache import (
+    conditional_response,
+    make_etag,
+    max_age,
+)
+from src.presentation.api.streaming import NDJSON, stream_response
+from src.shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +97,9 @@ FilingIdPath = Annotated[UUID, Path(description="Filing UUID identifier")]
     - page_size: Items per page (default: 20, max: 100)
     - sort_by: Sort field (filing_date, filing_type, company_name)
     - sort_direction: Sort direction (asc, desc)
+    - cursor: `next_cursor` of a previous page, fetches the next page
+      without an offset scan (takes precedence over page)
+    - include_total: Count the total number of matching filings (default: true)
     """,
 )
 async def search_filings(
@@ -97,6 +119,13 @@ async def search_filings(
     page_size: Annotated[int, Query(description="Items per page", ge=1, le=100)] = 20,
     sort_by: Annotated[str, Query(description="Sort field")] = "filing_date",
     sort_direction: Annotated[str, Query(description="Sort direction")] = "desc",
+    cursor: Annotated[
+        str | None,
+        Query(description="Cursor of the next page from a previous response"),
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="Count the total number of matching filings")
+    ] = True,
 ) -> PaginatedResponse[FilingSearchResult]:
     """Search for SEC filings using various criteria.
 
@@ -111,6 +140,8 @@ async def search_filings(
         page_size: Number of items per page
         sort_by: Field to sort results by
         sort_direction: Sort direction (asc/desc)
+        cursor: Optional cursor of the next page, takes precedence over page
+        include_total: Whether to count the total number of matching filings
 
     Returns:
         PaginatedResponse[FilingSearchResult]: Paginated search results
@@ -170,6 +201,8 @@ async def search_filings(
             page_size=page_size,
             sort_by=sort_by_enum,
             sort_direction=sort_direction_enum,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         # Get dependencies and dispatcher
@@ -316,6 +349,84 @@ async def analyze_filing(
         ) from None
 
 
+class BatchGetFilingsRequest(BaseModel):
+    """Request body of a batch get of filings."""
+
+    accession_numbers: list[str] = Field(
+        min_length=1, description="SEC accession numbers of the filings"
+    )
+
+
+@router.post(
+    ":batchGet",
+    response_model=BatchResponse[FilingResponse],
+    summary="Get many filings by accession number",
+    description="""
+    Retrieve up to `BATCH_GET_MAX_IDS` filings in one request.
+
+    Filings are returned in the order requested, with their analysis counts.
+    Accession numbers that are invalid or not found are listed in `errors`
+    with the status they would have had if requested alone, so one bad
+    accession number does not fail the whole batch.
+    """,
+)
+async def batch_get_filings(
+    body: BatchGetFilingsRequest,
+    session: SessionDep,
+    factory: ServiceFactoryDep,
+) -> BatchResponse[FilingResponse]:
+    """Get many filings by accession number.
+
+    Args:
+        body: Accession numbers of the filings
+        session: Database session for repository operations
+        factory: Service factory for dependency injection
+
+    Returns:
+        BatchResponse with the filings found and per-item errors
+
+    Raises:
+        HTTPException: 422 if more accession numbers are requested than allowed
+        HTTPException: 500 if retrieval fails
+    """
+    if len(body.accession_numbers) > settings.batch_get_max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"At most {settings.batch_get_max_ids} accession numbers "
+                "may be requested"
+            ),
+        )
+
+    logger.info(
+        "Batch retrieving filings",
+        extra={"filing_count": len(body.accession_numbers)},
+    )
+
+    try:
+        query = BatchGetFilingsQuery(accession_numbers=tuple(body.accession_numbers))
+
+        # Get dependencies and dispatcher
+        dispatcher = factory.create_dispatcher()
+        dependencies = await factory.get_handler_dependencies(session)
+
+        result: BatchResponse[FilingResponse] = await dispatcher.dispatch_query(
+            query, dependencies
+        )
+        return result
+
+    except Exception:
+        logger.error(
+            "Failed to batch retrieve filings",
+            extra={"filing_count": len(body.accession_numbers)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve filings",
+        ) from None
+
+
 @router.get(
     "/by-id/{filing_id}",
     response_model=FilingResponse,
@@ -421,13 +532,18 @@ async def get_filing_by_id(
 )
 async def get_filing(
     accession_number: AccessionNumberPath,
+    request: Request,
     session: SessionDep,
     factory: ServiceFactoryDep,
-) -> FilingResponse:
+) -> FilingResponse | Response:
     """Get information about a specific SEC filing.
 
+    Responses carry an ETag derived from the filing and its analyses, which
+    clients revalidate with If-None-Match.
+
     Args:
         accession_number: SEC filing accession number (e.g., "0000320193-23-000077")
+        request: Incoming request, checked for If-None-Match
         session: Database session for repository operations
         factory: Service factory for dependency injection
 
@@ -458,20 +574,34 @@ async def get_filing(
         dispatcher = factory.create_dispatcher()
         dependencies = await factory.get_handler_dependencies(session)
 
-        # Dispatch query
-        result: FilingResponse = await dispatcher.dispatch_query(query, dependencies)
+        async def render() -> FilingResponse:
+            # Dispatch query
+            result: FilingResponse = await dispatcher.dispatch_query(
+                query, dependencies
+            )
 
-        logger.info(
-            "Filing retrieved successfully",
-            extra={
-                "accession_number": accession_number,
-                "filing_id": str(result.filing_id),
-                "filing_type": result.filing_type,
-                "processing_status": result.processing_status,
-            },
-        )
+            logger.info(
+                "Filing retrieved successfully",
+                extra={
+                    "accession_number": accession_number,
+                    "filing_id": str(result.filing_id),
+                    "filing_type": result.filing_type,
+                    "processing_status": result.processing_status,
+                },
+            )
 
-        return result
+            return result
+
+        version = await factory.create_filing_repository(
+            session
+        ).get_version_by_accession(accession_num)
+        if version is None:
+            # Let the handler report the missing filing
+            return await render()
+
+        return await conditional_response(
+            request, make_etag("filing", *version), render
+        )
 
     except ResourceNotFoundError as e:
         logger.info(
@@ -511,20 +641,42 @@ async def get_filing(
     Retrieve analysis results for a specific SEC filing.
 
     Returns the most recent completed analysis for the filing, including
-    AI-generated insights, key findings, and confidence scores.
+    AI-generated insights, key findings, and confidence scores. Set
+    `include_full_results=false` for the summary only, or pass `section` to
+    limit the full results to one section analysis.
     """,
 )
 async def get_filing_analysis(
     accession_number: AccessionNumberPath,
+    request: Request,
     session: SessionDep,
     factory: ServiceFactoryDep,
-) -> AnalysisResponse:
+    include_full_results: Annotated[
+        bool,
+        Query(
+            description="Include the complete results; summaries are served "
+            "without loading them from storage"
+        ),
+    ] = True,
+    section: Annotated[
+        str | None,
+        Query(description="Only include this section analysis in the full results"),
+    ] = None,
+) -> AnalysisResponse | Response:
     """Get analysis results for a specific SEC filing.
 
+    Responses carry an ETag derived from the latest analysis of the filing,
+    which clients revalidate with If-None-Match. The serialized results of
+    an analysis version are cached, so storage is only read once.
+
     Args:
         accession_number: SEC filing accession number (e.g., "0000320193-23-000077")
+        request: Incoming request, checked for If-None-Match
         session: Database session for repository operations
         factory: Service factory for dependency injection
+        include_full_results: Whether to include the complete results, which
+            are read from storage
+        section: Only include this section analysis in the full results
 
     Returns:
         AnalysisResponse with complete analysis results
@@ -546,29 +698,48 @@ async def get_filing_analysis(
         # Create query using our new GetAnalysisByAccessionQuery
         query = GetAnalysisByAccessionQuery(
             accession_number=accession_num,
-            include_full_results=True,
+            include_full_results=include_full_results,
             include_section_details=False,
             include_processing_metadata=False,
+            section_name=section,
         )
 
         # Get dependencies and dispatcher
         dispatcher = factory.create_dispatcher()
         dependencies = await factory.get_handler_dependencies(session)
 
-        # Dispatch query
-        result: AnalysisResponse = await dispatcher.dispatch_query(query, dependencies)
+        async def render() -> AnalysisResponse:
+            # Dispatch query
+            result: AnalysisResponse = await dispatcher.dispatch_query(
+                query, dependencies
+            )
 
-        logger.info(
-            "Filing analysis retrieved successfully",
-            extra={
-                "accession_number": accession_number,
-                "analysis_id": str(result.analysis_id),
-                "analysis_type": result.analysis_type,
-                "confidence_score": result.confidence_score,
-            },
-        )
+            logger.info(
+                "Filing analysis retrieved successfully",
+                extra={
+                    "accession_number": accession_number,
+                    "analysis_id": str(result.analysis_id),
+                    "analysis_type": result.analysis_type,
+                    "confidence_score": result.confidence_score,
+                },
+            )
 
-        return result
+            return result
+
+        version = await factory.create_analysis_repository(
+            session
+        ).get_latest_version_by_accession(accession_num)
+        if version is None:
+            # Let the handler report the missing filing or analysis
+            return await render()
+
+        # A newer analysis of the filing changes the ETag, so shared caches
+        # revalidate instead of reusing the response for a fixed time
+        return await conditional_response(
+            request,
+            make_etag("filing-analysis", *version, include_full_results, section),
+            render,
+        )
 
     except ResourceNotFoundError as e:
         logger.info(
@@ -598,3 +769,143 @@ async def get_filing_analysis(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve filing analysis results",
         ) from None
+
+
+@router.get(
+    "/{accession_number}/content",
+    response_class=Response,
+    responses={200: {"content": {"application/json": {}}}},
+    summary="Download filing content",
+    description="""
+    Download the stored content of a SEC filing, including its full text,
+    sections and raw HTML.
+
+    The stored JSON is streamed in chunks. Send a `Range` header to download
+    part of it, e.g. to resume an interrupted download.
+    """,
+)
+async def get_filing_content(
+    accession_number: AccessionNumberPath,
+    request: Request,
+    session: SessionDep,
+    factory: ServiceFactoryDep,
+) -> Response:
+    """Stream the stored content of a SEC filing.
+
+    Args:
+        accession_number: SEC filing accession number (e.g., "0000320193-23-000077")
+        request: Incoming request, checked for If-None-Match and Range
+        session: Database session for repository operations
+        factory: Service factory for dependency injection
+
+    Returns:
+        Streaming JSON response with the filing content
+
+    Raises:
+        HTTPException: 422 if accession number format is invalid
+        HTTPException: 404 if the filing or its content is not found
+        HTTPException: 500 if retrieval fails
+    """
+    return await _stream_filing(
+        accession_number, request, session, factory, sections=False
+    )
+
+
+@router.get(
+    "/{accession_number}/sections",
+    response_class=Response,
+    responses={200: {"content": {NDJSON: {}}}},
+    summary="Download filing sections",
+    description="""
+    Download the sections of a SEC filing as newline-delimited JSON, one
+    `{"section": ..., "content": ...}` object per line.
+
+    Sections are streamed in chunks without the filing's raw HTML. Send a
+    `Range` header to download part of them.
+    """,
+)
+async def get_filing_sections(
+    accession_number: AccessionNumberPath,
+    request: Request,
+    session: SessionDep,
+    factory: ServiceFactoryDep,
+) -> Response:
+    """Stream the sections of a SEC filing as newline-delimited JSON.
+
+    Args:
+        accession_number: SEC filing accession number (e.g., "0000320193-23-000077")
+        request: Incoming request, checked for If-None-Match and Range
+        session: Database session for repository operations
+        factory: Service factory for dependency injection
+
+    Returns:
+        Streaming NDJSON response with the filing sections
+
+    Raises:
+        HTTPException: 422 if accession number format is invalid
+        HTTPException: 404 if the filing or its content is not found
+        HTTPException: 500 if retrieval fails
+    """
+    return await _stream_filing(
+        accession_number, request, session, factory, sections=True
+    )
+
+
+async def _stream_filing(
+    accession_number: str,
+    request: Request,
+    session: AsyncSession,
+    factory: ServiceFactory,
+    sections: bool,
+) -> Response:
+    """Stream the stored content or sections of a SEC filing."""
+    logger.info(
+        "Streaming filing sections" if sections else "Streaming filing content",
+        extra={"accession_number": accession_number},
+    )
+
+    try:
+        accession_num = AccessionNumber(accession_number)
+        repository = factory.create_filing_repository(session)
+        if sections:
+            stored = await repository.open_sections_by_accession(accession_num)
+        else:
+            stored = await repository.open_content_by_accession(accession_num)
+        if stored is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Content of filing {accession_number} not found",
+            )
+
+        # Stored filing content is not rewritten, so its size identifies it
+        kind = "filing-sections" if sections else "filing-content"
+        return stream_response(
+            request,
+            stored,
+            make_etag(kind, accession_number, stored.size),
+            NDJSON if sections else "application/json",
+            max_age(settings.response_cache_max_age),
+        )
+
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except ValueError as e:
+        logger.warning(
+            "Invalid accession number format",
+            extra={"accession_number": accession_number, "error": str(e)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid accession number format: {str(e)}",
+        ) from e
+    except Exception:
+        logger.error(
+            "Failed to stream filing content",
+            extra={"accession_number": accession_number},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve filing content",
+        ) from None
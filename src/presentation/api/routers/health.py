@@ -1,6 +1,5 @@
 """Health check endpoints for monitoring service status."""
 
-import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -9,8 +8,9 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from src.application.factory import ServiceFactory
-from src.infrastructure.messaging import get_registry
+from src.infrastructure.database.base import get_pool_stats
 from src.presentation.api.dependencies import get_service_factory
+from src.presentation.api.health_monitor import HealthStatus, health_monitor
 from src.shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -29,15 +29,6 @@ async def health_check() -> dict[str, Any]:
     }
 
 
-class HealthStatus(BaseModel):
-    """Health status response model."""
-
-    status: str
-    message: str | None = None
-    timestamp: str
-    details: dict[str, Any] | None = None
-
-
 class DetailedHealthResponse(BaseModel):
     """Detailed health response with service status."""
 
@@ -49,12 +40,6 @@ class DetailedHealthResponse(BaseModel):
     configuration: dict[str, Any]
 
 
-# Health status cache
-_health_status_cache: HealthStatus | None = None
-_cache_timestamp: datetime | None = None
-_cache_duration_seconds = 30  # Cache for 30 seconds
-
-
 @router.get("/detailed", response_model=DetailedHealthResponse)
 async def detailed_health_check(
     factory: ServiceFactory = Depends(get_service_factory),
@@ -66,14 +51,18 @@ async def detailed_health_check(
     - Cache manager
     - Configuration status
     - Service factory status
+
+    Messaging services are served from the last snapshot of the health
+    monitor, with the latency and age of each check, rather than checked on
+    the request.
     """
     timestamp = datetime.now(UTC).isoformat()
-    services = {}
     overall_status = "healthy"
 
-    # Check messaging services health
-    messaging_status = await _check_messaging_health()
-    services["messaging"] = messaging_status
+    # Summarize the last messaging services health checks
+    dependencies = health_monitor.snapshot()
+    messaging_status = _summarize_messaging_health(dependencies)
+    services = {"messaging": messaging_status, **dependencies}
     if messaging_status.status != "healthy":
         overall_status = "degraded"
 
@@ -83,6 +72,13 @@ async def detailed_health_check(
     if factory_status.status != "healthy":
         overall_status = "degraded"
 
+    # Report connection pool usage (informational, does not affect status)
+    services["database"] = HealthStatus(
+        status="healthy",
+        timestamp=timestamp,
+        details={"pool_mode": settings.database_pool_mode, **get_pool_stats()},
+    )
+
     # Determine current environment
     env_name = getattr(settings, "ENVIRONMENT", "development").lower()
     environment_type = "production" if env_name in ["prod", "production"] else env_name
@@ -105,169 +101,57 @@ async def detailed_health_check(
 @router.get("/messaging", response_model=HealthStatus)
 async def messaging_health_check() -> HealthStatus:
     """Check messaging services (queue, worker, storage) health."""
-    return await _check_messaging_health()
+    return _summarize_messaging_health(health_monitor.snapshot())
+
 
+def _summarize_messaging_health(dependencies: dict[str, HealthStatus]) -> HealthStatus:
+    """Summarize the last health status of the messaging services.
 
-async def _check_messaging_health() -> HealthStatus:
-    """Check messaging services health with caching.
+    Args:
+        dependencies: Last health status of each messaging service
 
     Returns:
-        Health status for messaging services
+        Healthy if every service is healthy and its status is current
     """
-    global _health_status_cache, _cache_timestamp
-
-    now = datetime.now(UTC)
-    timestamp = now.isoformat()
+    timestamp = datetime.now(UTC).isoformat()
+    services = {
+        name: status.status == "healthy" for name, status in dependencies.items()
+    }
+    unhealthy_services = [name for name, healthy in services.items() if not healthy]
+    stale_services = [name for name, status in dependencies.items() if status.stale]
 
-    # Check if we have a valid cached result
-    if (
-        _health_status_cache is not None
-        and _cache_timestamp is not None
-        and (now - _cache_timestamp).total_seconds() < _cache_duration_seconds
+    if dependencies and all(
+        status.status == "not_configured" for status in dependencies.values()
     ):
-        logger.debug("Returning cached messaging health status")
-        # Update timestamp but keep cached status
-        cached_result = _health_status_cache.model_copy()
-        cached_result.timestamp = timestamp
-        cached_result.details = cached_result.details or {}
-        cached_result.details["cached"] = True
-        cached_result.details["cache_age_seconds"] = int(
-            (now - _cache_timestamp).total_seconds()
-        )
-        return cached_result
-
-    # Perform actual health check with timeout
-    try:
-        logger.debug("Performing fresh messaging health check")
-        health_status = await asyncio.wait_for(
-            _perform_messaging_health_check(),
-            timeout=10.0,  # 10 second timeout for health check
-        )
-
-        # Cache the successful result
-        _health_status_cache = health_status
-        _cache_timestamp = now
-
-        return health_status
-
-    except TimeoutError:
-        logger.warning("Messaging health check timed out")
-        degraded_status = HealthStatus(
-            status="degraded",
-            message="Health check timed out - services may be under load",
+        return HealthStatus(
+            status="not_configured",
+            message="Messaging services not initialized",
             timestamp=timestamp,
-            details={
-                "error": "TimeoutError",
-                "timeout_seconds": 10.0,
-            },
+            details={"services": services, "initialized": False},
         )
-        # Cache the timeout result for a shorter time
-        _health_status_cache = degraded_status
-        _cache_timestamp = now
-        return degraded_status
 
-    except asyncio.CancelledError:
-        logger.warning("Messaging health check was cancelled")
+    if unhealthy_services:
         return HealthStatus(
             status="degraded",
-            message="Health check was cancelled - service may be under load",
+            message=f"Some messaging services are unhealthy: {', '.join(unhealthy_services)}",
             timestamp=timestamp,
-            details={
-                "error": "CancelledError",
-                "reason": "Health check operation cancelled",
-            },
+            details={"services": services, "unhealthy_services": unhealthy_services},
         )
-    except Exception as e:
-        logger.error(f"Messaging health check failed: {e}")
-        error_status = HealthStatus(
-            status="unhealthy",
-            message=f"Messaging health check failed: {str(e)}",
-            timestamp=timestamp,
-            details={
-                "error": str(e),
-            },
-        )
-        # Don't cache error results
-        return error_status
-
-
-async def _perform_messaging_health_check() -> HealthStatus:
-    """Perform the actual messaging health check without caching."""
-    timestamp = datetime.now(UTC).isoformat()
-
-    try:
-        # Get the messaging registry
-        registry = await get_registry()
-
-        # Check health of all services
-        health_results = await registry.health_check()
-
-        all_healthy = all(health_results.values())
-        unhealthy_services = [
-            name for name, healthy in health_results.items() if not healthy
-        ]
-
-        # Try to get circuit breaker status if available
-        circuit_breaker_info = {}
-        try:
-            from src.infrastructure.messaging import get_queue_service
-
-            queue_service = await get_queue_service()
-            if hasattr(queue_service, "get_circuit_breaker_status"):
-                circuit_breaker_info = {
-                    "circuit_breaker": queue_service.get_circuit_breaker_status()
-                }
-        except Exception as e:
-            # Don't fail health check if circuit breaker status unavailable
-            logger.debug(f"Circuit breaker status unavailable: {e}")
-
-        if all_healthy:
-            return HealthStatus(
-                status="healthy",
-                message="All messaging services are healthy",
-                timestamp=timestamp,
-                details={
-                    "environment": registry.settings.environment,
-                    "services": health_results,
-                    "connected": registry.is_connected,
-                    "cached": False,
-                },
-            )
-        else:
-            return HealthStatus(
-                status="degraded",
-                message=f"Some messaging services are unhealthy: {', '.join(unhealthy_services)}",
-                timestamp=timestamp,
-                details={
-                    "environment": registry.settings.environment,
-                    "services": health_results,
-                    "unhealthy_services": unhealthy_services,
-                    "connected": registry.is_connected,
-                    "cached": False,
-                    **circuit_breaker_info,
-                },
-            )
 
-    except RuntimeError as e:
-        # Registry not initialized
+    if stale_services:
         return HealthStatus(
-            status="not_configured",
-            message="Messaging services not initialized",
+            status="degraded",
+            message=f"Health of some messaging services is stale: {', '.join(stale_services)}",
             timestamp=timestamp,
-            details={
-                "error": str(e),
-                "initialized": False,
-                "cached": False,
-            },
+            details={"services": services, "stale_services": stale_services},
         )
 
-
-def clear_health_cache() -> None:
-    """Clear health status cache - useful for testing or manual refresh."""
-    global _health_status_cache, _cache_timestamp
-    _health_status_cache = None
-    _cache_timestamp = None
-    logger.info("Health status cache cleared")
+    return HealthStatus(
+        status="healthy",
+        message="All messaging services are healthy",
+        timestamp=timestamp,
+        details={"services": services},
+    )
 
 
 def _check_factory_configuration(factory: ServiceFactory) -> HealthStatus:
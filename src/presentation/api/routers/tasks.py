@@ -1,9 +1,13 @@
 """Task management endpoints for background task status tracking."""
 
+import json
 import logging
+from collections.abc import AsyncIterator
+from dataclasses import asdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
 from starlette.status import HTTP_404_NOT_FOUND, HTTP_500_INTERNAL_SERVER_ERROR
 
 from src.application.schemas.responses.task_response import TaskResponse
@@ -11,6 +15,7 @@ from src.application.services.background_task_coordinator import (
     BackgroundTaskCoordinator,
 )
 from src.presentation.api.dependencies import get_background_task_coordinator
+from src.shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,33 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 # Path parameter type for task IDs
 TaskIdPath = Annotated[str, Path(description="Task ID for background task tracking")]
 
+# Long-poll parameters for task status
+WaitQuery = Annotated[
+    float,
+    Query(
+        ge=0,
+        description=(
+            "Seconds to wait for the task to change before responding "
+            "(long-poll, capped server-side). 0 returns immediately."
+        ),
+    ),
+]
+SinceQuery = Annotated[
+    str | None,
+    Query(
+        description=(
+            "updated_at value already seen by the client; return immediately "
+            "if the task changed since then"
+        ),
+    ),
+]
+
+
+def _format_sse(task_response: TaskResponse) -> str:
+    """Format a task status snapshot as a server-sent event."""
+    payload = json.dumps(asdict(task_response), default=str)
+    return f"event: status\ndata: {payload}\n\n"
+
 
 @router.get(
     "/{task_id}/status",
@@ -29,12 +61,16 @@ TaskIdPath = Annotated[str, Path(description="Task ID for background task tracki
 async def get_task_status(
     task_id: TaskIdPath,
     coordinator: BackgroundTaskCoordinator = Depends(get_background_task_coordinator),
+    wait: WaitQuery = 0,
+    since: SinceQuery = None,
 ) -> TaskResponse:
     """Get status of a background task.
 
     Args:
         task_id: ID of the task to check
         coordinator: Background task coordinator dependency
+        wait: Seconds to long-poll for a change before responding
+        since: updated_at value already seen by the client
 
     Returns:
         TaskResponse with current task status
@@ -45,7 +81,12 @@ async def get_task_status(
     logger.info(f"Getting status for task {task_id}")
 
     try:
-        task_status = await coordinator.get_task_status(task_id)
+        if wait > 0:
+            task_status = await coordinator.wait_for_task_update(
+                task_id, timeout=min(wait, settings.task_events_max_wait), since=since
+            )
+        else:
+            task_status = await coordinator.get_task_status(task_id)
 
         if task_status is None:
             logger.warning(f"Task {task_id} not found")
@@ -67,6 +108,69 @@ async def get_task_status(
         ) from e
 
 
+@router.get(
+    "/{task_id}/events",
+    summary="Stream Task Status",
+    description=(
+        "Stream status changes of a background task as server-sent events until "
+        "the task completes, fails or is cancelled."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_task_events(
+    task_id: TaskIdPath,
+    coordinator: BackgroundTaskCoordinator = Depends(get_background_task_coordinator),
+) -> StreamingResponse:
+    """Stream status of a background task as server-sent events.
+
+    Args:
+        task_id: ID of the task to follow
+        coordinator: Background task coordinator dependency
+
+    Returns:
+        StreamingResponse emitting one ``status`` event per task update
+
+    Raises:
+        HTTPException: 404 if task not found, 500 if coordinator fails
+    """
+    logger.info(f"Streaming status events for task {task_id}")
+
+    try:
+        updates = coordinator.stream_task_updates(
+            task_id, keepalive_interval=settings.task_events_keepalive_interval
+        )
+        first = await anext(updates)
+    except Exception as e:
+        logger.error(f"Failed to stream task status for {task_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve task status",
+        ) from e
+
+    if first is None or first.status == "not_found":
+        await updates.aclose()
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND, detail=f"Task {task_id} not found"
+        )
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            yield _format_sse(first)
+            async for update in updates:
+                if update is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield _format_sse(update)
+        finally:
+            await updates.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/{task_id}/retry",
     response_model=TaskResponse,
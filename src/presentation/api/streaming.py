@@ -0,0 +1,117 @@
+"""Streaming responses of stored content with byte ranges.
+
+Filing content and analysis results can be tens of megabytes. Instead of
+loading them into memory, endpoints stream the stored bytes in chunks, so
+memory per request stays constant regardless of their size. Clients may
+request a single byte range to resume or split downloads.
+"""
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.infrastructure.messaging.interfaces import StoredObject
+from src.presentation.api.response_cache import REVALIDATE, etag_matches
+
+NDJSON = "application/x-ndjson"
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse the Range header of a request for a single byte range.
+
+    Headers that are missing, malformed, in other units or request several
+    ranges are ignored, and the whole content is served.
+
+    Args:
+        header: Range request header, if any
+        size: Size of the content in bytes
+
+    Returns:
+        First and last byte of the range (inclusive), None to serve the
+        whole content
+
+    Raises:
+        ValueError: If the range lies outside of the content
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header.removeprefix("bytes=").strip()
+    if "," in spec or "-" not in spec:
+        return None
+
+    first, last = (part.strip() for part in spec.split("-", 1))
+    if not (first or last) or not (first or "0").isdigit():
+        return None
+    if last and not last.isdigit():
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(f"Range {header} not satisfiable")
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(f"Range {header} not satisfiable")
+    return start, end
+
+
+def stream_response(
+    request: Request,
+    stored: StoredObject,
+    etag: str,
+    media_type: str = "application/json",
+    cache_control: str = REVALIDATE,
+) -> Response:
+    """Respond to a GET of stored content by streaming it.
+
+    Args:
+        request: Incoming request, checked for If-None-Match, Range and
+            If-Range
+        stored: Stored content to send
+        etag: Current ETag of the content
+        media_type: Media type of the stored content
+        cache_control: Cache-Control header of the response
+
+    Returns:
+        ``304 Not Modified`` if the client's copy is current, ``206 Partial
+        Content`` for a byte range, ``416 Range Not Satisfiable`` for a range
+        outside of the content, otherwise the whole content
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    # A range is only served if the client's partial copy is still current
+    if request.headers.get("if-range", etag) == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), stored.size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{stored.size}"},
+            )
+
+    if byte_range is None:
+        return StreamingResponse(
+            stored.stream(),
+            media_type=media_type,
+            headers={**headers, "Content-Length": str(stored.size)},
+        )
+
+    start, end = byte_range
+    return StreamingResponse(
+        stored.stream(start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers={
+            **headers,
+            "Content-Length": str(end - start + 1),
+            "Content-Range": f"bytes {start}-{end}/{stored.size}",
+        },
+    )
@@ -56,6 +56,41 @@ class Settings(BaseSettings):
         default="sqlite:///:memory:" if _is_testing() else "",
         validation_alias="DATABASE_URL",
     )
+    database_pool_mode: str = Field(
+        default="null",
+        validation_alias="DATABASE_POOL_MODE",
+        description="Connection pooling: null (serverless) or queue (long-running)",
+    )
+    database_pool_size: int = Field(
+        default=10,
+        validation_alias="DATABASE_POOL_SIZE",
+        description="Connections kept open in queue pool mode",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        validation_alias="DATABASE_MAX_OVERFLOW",
+        description="Extra connections allowed beyond the pool size under load",
+    )
+    database_pool_timeout: float = Field(
+        default=30.0,
+        validation_alias="DATABASE_POOL_TIMEOUT",
+        description="Seconds to wait for a pooled connection before failing",
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        validation_alias="DATABASE_POOL_RECYCLE",
+        description="Seconds after which pooled connections are replaced",
+    )
+    database_pool_pre_ping: bool = Field(
+        default=True,
+        validation_alias="DATABASE_POOL_PRE_PING",
+        description="Check pooled connections are alive before handing them out",
+    )
+    database_statement_cache_size: int | None = Field(
+        default=None,
+        validation_alias="DATABASE_STATEMENT_CACHE_SIZE",
+        description="asyncpg prepared statement cache size (0 for PgBouncer)",
+    )
 
     # Messaging Service Configuration
     queue_service_type: str = Field(
@@ -77,6 +112,18 @@ class Settings(BaseSettings):
         validation_alias="RABBITMQ_URL",
     )
 
+    rabbitmq_prefetch_count: int = Field(
+        default=10,
+        validation_alias="RABBITMQ_PREFETCH_COUNT",
+        description="Unacknowledged deliveries a consumer may hold for batch receives",
+    )
+
+    rabbitmq_fair_share_lanes: int = Field(
+        default=4,
+        validation_alias="RABBITMQ_FAIR_SHARE_LANES",
+        description="Sub-queues per priority that users are hashed onto and drained in turn",
+    )
+
     # AWS Configuration (Production)
     # WARN: Same region as buckets to avoid latency
     aws_region: "BucketLocationConstraintType" = Field(
@@ -118,6 +165,12 @@ class Settings(BaseSettings):
         validation_alias="WORKER_BACKOFF_FACTOR",
     )
 
+    worker_batch_size: int = Field(
+        default=1,
+        validation_alias="WORKER_BATCH_SIZE",
+        description="Tasks a worker fetches from a queue per receive call",
+    )
+
     # Task Retry Configuration
     task_retry_base_delay: float = Field(
         default=2.0,
@@ -131,6 +184,99 @@ class Settings(BaseSettings):
         default=3,
         validation_alias="TASK_DEFAULT_MAX_RETRIES",
     )
+    task_visibility_timeout: int = Field(
+        default=300,  # 5 minutes
+        validation_alias="TASK_VISIBILITY_TIMEOUT",
+        description="Seconds a running task stays invisible per heartbeat extension",
+    )
+    task_heartbeat_interval: float = Field(
+        default=60.0,
+        validation_alias="TASK_HEARTBEAT_INTERVAL",
+        description="Seconds between visibility extensions for running tasks",
+    )
+
+    # Task Event Configuration
+    result_backend_poll_interval: float = Field(
+        default=2.0,
+        validation_alias="RESULT_BACKEND_POLL_INTERVAL",
+        description="Seconds between storage polls for the SQS result backend",
+    )
+    task_events_keepalive_interval: float = Field(
+        default=15.0,
+        validation_alias="TASK_EVENTS_KEEPALIVE_INTERVAL",
+        description="Seconds between keep-alive comments on task event streams",
+    )
+    task_events_max_wait: float = Field(
+        default=60.0,
+        validation_alias="TASK_EVENTS_MAX_WAIT",
+        description="Upper bound for long-poll waits on task status",
+    )
+
+    # Task State Store Configuration
+    task_retention_seconds: int = Field(
+        default=604800,  # 7 days
+        validation_alias="TASK_RETENTION_SECONDS",
+        description="Seconds finished tasks are kept before compaction",
+    )
+    task_compaction_interval: float = Field(
+        default=3600.0,
+        validation_alias="TASK_COMPACTION_INTERVAL",
+        description="Minimum seconds between compactions of finished tasks",
+    )
+
+    # Cache Configuration
+    cache_max_entries: int = Field(
+        default=10000,
+        validation_alias="CACHE_MAX_ENTRIES",
+        description="Maximum entries per cache region in the in-process tier",
+    )
+    cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        validation_alias="CACHE_MAX_BYTES",
+        description="Approximate maximum bytes per cache region (0 disables)",
+    )
+    cache_shared_backend: str = Field(
+        default="none",
+        validation_alias="CACHE_SHARED_BACKEND",
+        description="Shared cache tier used by API and workers: none, file or redis",
+    )
+    cache_shared_path: str = Field(
+        default="./data/cache",
+        validation_alias="CACHE_SHARED_PATH",
+        description="Directory of the file-backed shared cache tier",
+    )
+    cache_redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        validation_alias="CACHE_REDIS_URL",
+        description="Redis URL of the shared cache tier",
+    )
+    cache_shared_sync_interval: float = Field(
+        default=1.0,
+        validation_alias="CACHE_SHARED_SYNC_INTERVAL",
+        description="Seconds between checks for other processes' region invalidations",
+    )
+    response_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        validation_alias="RESPONSE_CACHE_MAX_BYTES",
+        description="Maximum bytes of serialized API responses cached in process",
+    )
+    response_cache_max_age: int = Field(
+        default=300,
+        validation_alias="RESPONSE_CACHE_MAX_AGE",
+        description="Seconds clients and CDNs may reuse analysis responses unchecked",
+    )
+
+    # Batch Reads
+    batch_get_max_ids: int = Field(
+        default=100,
+        validation_alias="BATCH_GET_MAX_IDS",
+        description="Maximum IDs a single batch get request may ask for",
+    )
+    batch_get_storage_concurrency: int = Field(
+        default=10,
+        validation_alias="BATCH_GET_STORAGE_CONCURRENCY",
+        description="Storage reads a batch get request runs concurrently",
+    )
 
     # Feature Flags
     analysis_enabled: bool = Field(
@@ -194,6 +340,38 @@ class Settings(BaseSettings):
     opentelemetry_enabled: bool = Field(
         default=False, validation_alias="OPENTELEMETRY_ENABLED"
     )
+    worker_metrics_port: int = Field(
+        default=9100,
+        validation_alias="WORKER_METRICS_PORT",
+        description="Port a worker process serves /metrics on, 0 to not serve it",
+    )
+    queue_depth_sample_interval: float = Field(
+        default=15.0,
+        validation_alias="QUEUE_DEPTH_SAMPLE_INTERVAL",
+        description="Seconds between the queue depth samples taken by workers",
+    )
+
+    # Health Checks
+    health_check_timeout: float = Field(
+        default=10.0,
+        validation_alias="HEALTH_CHECK_TIMEOUT",
+        description="Seconds a dependency health check may take before it is degraded",
+    )
+    health_check_queue_interval: float = Field(
+        default=15.0,
+        validation_alias="HEALTH_CHECK_QUEUE_INTERVAL",
+        description="Seconds between background health checks of the queue",
+    )
+    health_check_worker_interval: float = Field(
+        default=15.0,
+        validation_alias="HEALTH_CHECK_WORKER_INTERVAL",
+        description="Seconds between background health checks of the worker service",
+    )
+    health_check_storage_interval: float = Field(
+        default=60.0,
+        validation_alias="HEALTH_CHECK_STORAGE_INTERVAL",
+        description="Seconds between background health checks of storage",
+    )
 
     # Rate Limiting
     rate_limiting_enabled: bool = Field(
@@ -206,9 +384,19 @@ class Settings(BaseSettings):
         default=None, validation_alias="RATE_LIMIT_REQUESTS_PER_DAY"
     )
     rate_limit_excluded_paths: list[str] = Field(
-        default=["/health", "/", "/docs", "/openapi.json", "/redoc"],
+        default=["/health", "/", "/docs", "/openapi.json", "/redoc", "/metrics"],
         validation_alias="RATE_LIMIT_EXCLUDED_PATHS",
     )
+    rate_limit_backend: str = Field(
+        default="memory",
+        validation_alias="RATE_LIMIT_BACKEND",
+        description="Rate limit counter storage: memory (per process) or redis",
+    )
+    rate_limit_redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        validation_alias="RATE_LIMIT_REDIS_URL",
+        description="Redis URL of the rate limit counters shared by API replicas",
+    )
 
     @field_validator("encryption_key")
     @classmethod
@@ -235,6 +423,30 @@ class Settings(BaseSettings):
             raise ValueError(f"storage_service_type must be one of {valid_types}")
         return v
 
+    @field_validator("database_pool_mode")
+    @classmethod
+    def validate_database_pool_mode(cls, v: str) -> str:
+        valid_modes = ["null", "queue"]
+        if v not in valid_modes:
+            raise ValueError(f"database_pool_mode must be one of {valid_modes}")
+        return v
+
+    @field_validator("cache_shared_backend")
+    @classmethod
+    def validate_cache_shared_backend(cls, v: str) -> str:
+        valid_types = ["none", "file", "redis"]
+        if v not in valid_types:
+            raise ValueError(f"cache_shared_backend must be one of {valid_types}")
+        return v
+
+    @field_validator("rate_limit_backend")
+    @classmethod
+    def validate_rate_limit_backend(cls, v: str) -> str:
+        valid_types = ["memory", "redis"]
+        if v not in valid_types:
+            raise ValueError(f"rate_limit_backend must be one of {valid_types}")
+        return v
+
     @field_validator("worker_service_type")
     @classmethod
     def validate_worker_service_type(cls, v: str) -> str:
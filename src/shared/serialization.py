@@ -0,0 +1,40 @@
+"""Fast JSON serialization of stored content and API responses.
+
+Analysis results and filing content are deeply nested dicts of several
+megabytes. orjson encodes and decodes them many times faster than the
+standard library and handles datetimes, UUIDs, enums and dataclasses
+natively; any other value is serialized as its string, as
+``json.dumps(default=str)`` did.
+"""
+
+from typing import Any
+
+import orjson
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(value: Any, indent: bool = False) -> bytes:
+    """Serialize a value to JSON.
+
+    Args:
+        value: Value to serialize
+        indent: Whether to indent by two spaces, for files read by people
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    options = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+    return orjson.dumps(value, default=str, option=options)
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Deserialized value
+    """
+    return orjson.loads(data)
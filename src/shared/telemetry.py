@@ -0,0 +1,287 @@
+"""Prometheus metrics and OpenTelemetry tracing.
+
+Metrics are registered in the default ``prometheus_client`` registry and
+served on ``/metrics`` by the API and by each worker process. Spans are
+created through the OpenTelemetry API and exported by whichever SDK the
+deployment configures; the trace context travels in the metadata of task
+messages so one analysis is a single trace across API, queue and worker.
+
+``prometheus_enabled`` and ``opentelemetry_enabled`` turn either off, in
+which case the helpers here record nothing.
+"""
+
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, TypeVar
+
+from opentelemetry import propagate, trace
+from opentelemetry.context import Context
+from opentelemetry.trace import Span, SpanKind, Tracer
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Key of the trace context in TaskMessage.metadata
+TRACE_CONTEXT_KEY = "trace_context"
+
+# LLM calls and analysis stages take from seconds to several minutes
+LONG_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "aperilex_http_request_duration_seconds",
+    "Latency of API requests by route template",
+    ["method", "route", "status"],
+)
+HANDLER_DURATION = Histogram(
+    "aperilex_handler_duration_seconds",
+    "Latency of command and query handlers run by the dispatcher",
+    ["kind", "handler", "outcome"],
+    buckets=LONG_BUCKETS,
+)
+ANALYSIS_STAGE_DURATION = Histogram(
+    "aperilex_analysis_stage_duration_seconds",
+    "Latency of the stages of a filing analysis",
+    ["stage"],
+    buckets=LONG_BUCKETS,
+)
+LLM_REQUEST_DURATION = Histogram(
+    "aperilex_llm_request_duration_seconds",
+    "Latency of LLM provider calls",
+    ["provider", "model", "schema"],
+    buckets=LONG_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "aperilex_llm_tokens",
+    "Tokens used by LLM provider calls",
+    ["provider", "model", "schema", "kind"],
+)
+LLM_ERRORS = Counter(
+    "aperilex_llm_errors",
+    "LLM provider calls that raised",
+    ["provider", "model", "schema", "error"],
+)
+STORAGE_OPERATION_DURATION = Histogram(
+    "aperilex_storage_operation_duration_seconds",
+    "Latency of filing and analysis storage operations",
+    ["operation"],
+)
+EDGAR_REQUEST_DURATION = Histogram(
+    "aperilex_edgar_request_duration_seconds",
+    "Latency of SEC EDGAR lookups",
+    ["operation", "outcome"],
+    buckets=LONG_BUCKETS,
+)
+QUEUE_DEPTH = Gauge(
+    "aperilex_queue_depth",
+    "Messages waiting in a task queue, as last sampled by a worker",
+    ["queue"],
+)
+WORKER_BUSY_SECONDS = Counter(
+    "aperilex_worker_busy_seconds",
+    "Time workers spent running tasks",
+    ["task"],
+)
+WORKER_TASKS = Counter(
+    "aperilex_worker_tasks",
+    "Tasks run by workers by final status",
+    ["task", "status"],
+)
+
+_NOOP_TRACER = trace.NoOpTracer()
+
+
+class timed:
+    """Observe the duration of a block or function in a histogram.
+
+    Works as a context manager and as a decorator of sync and async
+    functions. Nothing is recorded when Prometheus is disabled.
+
+    Example:
+        with timed(STORAGE_OPERATION_DURATION, operation="get_filing"):
+            ...
+
+        @timed(EDGAR_REQUEST_DURATION, track_outcome=True, operation="company")
+        def get_company(...): ...
+    """
+
+    def __init__(
+        self, histogram: Histogram, track_outcome: bool = False, **labels: str
+    ) -> None:
+        """Initialize the timer.
+
+        Args:
+            histogram: Histogram observing the duration
+            track_outcome: Whether to label the duration with an ``outcome``
+                of ``success`` or ``error``, by whether the block raised
+            **labels: Other label values of the histogram
+        """
+        self.histogram = histogram
+        self.track_outcome = track_outcome
+        self.labels = labels
+        self._started = 0.0
+
+    def __enter__(self) -> "timed":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if not settings.prometheus_enabled:
+            return
+        labels = dict(self.labels)
+        if self.track_outcome:
+            labels["outcome"] = "error" if exc_type else "success"
+        self.histogram.labels(**labels).observe(time.perf_counter() - self._started)
+
+    def __call__(self, func: F) -> F:
+        # Each call gets its own timer so concurrent calls don't share a start
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with timed(self.histogram, self.track_outcome, **self.labels):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with timed(self.histogram, self.track_outcome, **self.labels):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+def get_tracer() -> Tracer:
+    """Get the tracer of the application.
+
+    Returns:
+        The OpenTelemetry tracer, or a no-op tracer if tracing is disabled
+    """
+    if not settings.opentelemetry_enabled:
+        return _NOOP_TRACER
+    return trace.get_tracer("aperilex")
+
+
+@contextmanager
+def span(
+    name: str,
+    kind: SpanKind = SpanKind.INTERNAL,
+    context: Context | None = None,
+    **attributes: Any,
+) -> Iterator[Span]:
+    """Run a block in a new span, the current span while it runs.
+
+    Args:
+        name: Name of the span
+        kind: Kind of the span
+        context: Parent context, by default the current one
+        **attributes: Attributes of the span
+
+    Yields:
+        The span
+    """
+    with get_tracer().start_as_current_span(
+        name, context=context, kind=kind, attributes=attributes
+    ) as current:
+        yield current
+
+
+@contextmanager
+def analysis_stage(stage: str) -> Iterator[None]:
+    """Trace and time a stage of a filing analysis.
+
+    Args:
+        stage: Name of the stage, e.g. ``llm_analysis``
+    """
+    with span(f"analysis.{stage}"), timed(ANALYSIS_STAGE_DURATION, stage=stage):
+        yield
+
+
+@contextmanager
+def observe_llm_call(provider: str, model: str, schema: str) -> Iterator[None]:
+    """Time an LLM provider call and count it as an error if it raises.
+
+    Args:
+        provider: Name of the provider, e.g. ``openai``
+        model: Model called
+        schema: Name of the schema the call is for
+    """
+    try:
+        with timed(LLM_REQUEST_DURATION, provider=provider, model=model, schema=schema):
+            yield
+    except Exception as e:
+        if settings.prometheus_enabled:
+            LLM_ERRORS.labels(
+                provider=provider, model=model, schema=schema, error=type(e).__name__
+            ).inc()
+        raise
+
+
+def record_llm_tokens(
+    provider: str, model: str, schema: str, prompt_tokens: Any, output_tokens: Any
+) -> None:
+    """Count the tokens used by an LLM provider call.
+
+    Token counts that aren't numbers, as some providers report when usage
+    is unavailable, are ignored.
+
+    Args:
+        provider: Name of the provider, e.g. ``openai``
+        model: Model called
+        schema: Name of the schema the call was for
+        prompt_tokens: Tokens of the prompt
+        output_tokens: Tokens of the output
+    """
+    if not settings.prometheus_enabled:
+        return
+    for kind, tokens in (("prompt", prompt_tokens), ("output", output_tokens)):
+        try:
+            count = int(tokens)
+        except (TypeError, ValueError):
+            continue
+        LLM_TOKENS.labels(provider=provider, model=model, schema=schema, kind=kind).inc(
+            max(count, 0)
+        )
+
+
+def inject_trace_context(metadata: dict[str, Any]) -> None:
+    """Add the current trace context to the metadata of a task message.
+
+    Args:
+        metadata: Metadata of the task message
+    """
+    if not settings.opentelemetry_enabled:
+        return
+    carrier: dict[str, str] = {}
+    propagate.inject(carrier)
+    if carrier:
+        metadata[TRACE_CONTEXT_KEY] = carrier
+
+
+def extract_trace_context(metadata: dict[str, Any] | None) -> Context | None:
+    """Get the trace context the producer of a task message added to it.
+
+    Args:
+        metadata: Metadata of the task message
+
+    Returns:
+        Context continuing the producer's trace, or None if there is none
+    """
+    carrier = (metadata or {}).get(TRACE_CONTEXT_KEY)
+    if not settings.opentelemetry_enabled or not isinstance(carrier, dict):
+        return None
+    return propagate.extract(carrier)
@@ -25,7 +25,8 @@ class TestRateLimitingIntegration:
             hourly_limit=5, daily_limit=20, storage=self.storage
         )
 
-    def test_api_rate_limiter_with_storage_integration(self):
+    @pytest.mark.asyncio
+    async def test_api_rate_limiter_with_storage_integration(self):
         """Test APIRateLimiter properly integrates with storage."""
         # Arrange
         request = Mock(spec=Request)
@@ -36,7 +37,7 @@ class TestRateLimitingIntegration:
         # Act - make multiple requests
         results = []
         for _ in range(7):  # Over the hourly limit of 5
-            result = self.api_rate_limiter.check_request(request)
+            result = await self.api_rate_limiter.check_request(request)
             results.append(result.allowed)
 
         # Assert
@@ -45,11 +46,14 @@ class TestRateLimitingIntegration:
         assert results == expected
 
         # Verify storage state
-        hourly_count, daily_count = self.storage.get_current_counts("192.168.1.100")
+        hourly_count, daily_count = await self.storage.get_current_counts(
+            "192.168.1.100"
+        )
         assert hourly_count == 5  # Should stop at limit
         assert daily_count == 5  # Same for daily
 
-    def test_multiple_clients_isolation(self):
+    @pytest.mark.asyncio
+    async def test_multiple_clients_isolation(self):
         """Test that different clients are rate limited independently."""
         # Arrange
         request1 = Mock(spec=Request)
@@ -64,27 +68,28 @@ class TestRateLimitingIntegration:
 
         # Act - exhaust limit for client 1
         for _ in range(5):
-            result1 = self.api_rate_limiter.check_request(request1)
+            result1 = await self.api_rate_limiter.check_request(request1)
             assert result1.allowed is True
 
         # Client 1 should be denied
-        result1_denied = self.api_rate_limiter.check_request(request1)
+        result1_denied = await self.api_rate_limiter.check_request(request1)
         assert result1_denied.allowed is False
 
         # Client 2 should still be allowed
-        result2_allowed = self.api_rate_limiter.check_request(request2)
+        result2_allowed = await self.api_rate_limiter.check_request(request2)
         assert result2_allowed.allowed is True
 
         # Assert - verify individual client states
-        count1_h, count1_d = self.storage.get_current_counts("192.168.1.100")
-        count2_h, count2_d = self.storage.get_current_counts("192.168.1.101")
+        count1_h, count1_d = await self.storage.get_current_counts("192.168.1.100")
+        count2_h, count2_d = await self.storage.get_current_counts("192.168.1.101")
 
         assert count1_h == 5  # At limit
         assert count2_h == 1  # Just started
         assert count1_d == 5
         assert count2_d == 1
 
-    def test_rate_limit_headers_reflect_current_state(self):
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_reflect_current_state(self):
         """Test that rate limit headers accurately reflect current state."""
         # Arrange
         request = Mock(spec=Request)
@@ -94,14 +99,14 @@ class TestRateLimitingIntegration:
 
         # Act - make some requests and check headers
         # First request
-        result1 = self.api_rate_limiter.check_request(request)
+        result1 = await self.api_rate_limiter.check_request(request)
         headers1 = self.api_rate_limiter.get_rate_limit_headers(result1)
 
         # Third request
         for _ in range(2):
-            self.api_rate_limiter.check_request(request)
+            await self.api_rate_limiter.check_request(request)
 
-        result3 = self.api_rate_limiter.check_request(request)
+        result3 = await self.api_rate_limiter.check_request(request)
         headers3 = self.api_rate_limiter.get_rate_limit_headers(result3)
 
         # Assert - headers should reflect consumption
@@ -111,7 +116,8 @@ class TestRateLimitingIntegration:
         assert headers3["X-RateLimit-Remaining-Hourly"] == "1"  # 5-4
         assert headers3["X-RateLimit-Remaining-Daily"] == "16"  # 20-4
 
-    def test_client_reset_clears_limits(self):
+    @pytest.mark.asyncio
+    async def test_client_reset_clears_limits(self):
         """Test that resetting a client clears their rate limits."""
         # Arrange
         request = Mock(spec=Request)
@@ -121,25 +127,28 @@ class TestRateLimitingIntegration:
 
         # Exhaust the limit
         for _ in range(5):
-            self.api_rate_limiter.check_request(request)
+            await self.api_rate_limiter.check_request(request)
 
         # Verify limited
-        result_before = self.api_rate_limiter.check_request(request)
+        result_before = await self.api_rate_limiter.check_request(request)
         assert result_before.allowed is False
 
         # Act - reset client limits
-        self.api_rate_limiter.reset_client_limits(request)
+        await self.api_rate_limiter.reset_client_limits(request)
 
         # Assert - should be allowed again
-        result_after = self.api_rate_limiter.check_request(request)
+        result_after = await self.api_rate_limiter.check_request(request)
         assert result_after.allowed is True
 
         # Verify counts reset
-        hourly_count, daily_count = self.api_rate_limiter.get_current_usage(request)
+        hourly_count, daily_count = await self.api_rate_limiter.get_current_usage(
+            request
+        )
         assert hourly_count == 1  # New request after reset
         assert daily_count == 1
 
-    def test_expired_client_cleanup_integration(self):
+    @pytest.mark.asyncio
+    async def test_expired_client_cleanup_integration(self):
         """Test that expired client cleanup works across components."""
         # Arrange
         request = Mock(spec=Request)
@@ -149,22 +158,23 @@ class TestRateLimitingIntegration:
 
         # Make some requests
         for _ in range(3):
-            self.api_rate_limiter.check_request(request)
+            await self.api_rate_limiter.check_request(request)
 
         # Verify client exists
-        stats_before = self.api_rate_limiter.get_stats()
+        stats_before = await self.api_rate_limiter.get_stats()
         assert stats_before["total_clients"] == 1
 
         # Act - cleanup with very short idle time
-        _ = self.api_rate_limiter.cleanup_expired_clients()
+        _ = await self.api_rate_limiter.cleanup_expired_clients()
 
         # Assert - client should be removed if they have no recent activity
         # (depends on implementation details of cleanup logic)
-        stats_after = self.api_rate_limiter.get_stats()
+        stats_after = await self.api_rate_limiter.get_stats()
         # Client might still exist if requests were recent enough
         assert stats_after["total_clients"] >= 0
 
-    def test_ip_extraction_integration_with_headers(self):
+    @pytest.mark.asyncio
+    async def test_ip_extraction_integration_with_headers(self):
         """Test IP extraction works correctly with various header combinations."""
         # Test cases with different header combinations
         test_cases = [
@@ -187,15 +197,17 @@ class TestRateLimitingIntegration:
             request.client.host = client_ip
 
             # Act
-            _ = self.api_rate_limiter.check_request(request)
+            _ = await self.api_rate_limiter.check_request(request)
 
             # Assert - verify that the correct IP is being tracked
             # We can verify this by checking the storage directly
-            hourly_count, daily_count = self.storage.get_current_counts(expected_ip)
+            hourly_count, daily_count = await self.storage.get_current_counts(
+                expected_ip
+            )
             assert hourly_count > 0  # Should have requests recorded for this IP
 
             # Clean up for next test
-            self.storage.reset_client_limits(expected_ip)
+            await self.storage.reset_client_limits(expected_ip)
 
     @pytest.mark.asyncio
     async def test_sec_rate_limiter_integration(self):
@@ -485,7 +497,8 @@ class TestRateLimitingPerformanceIntegration:
             hourly_limit=100, daily_limit=1000, storage=self.storage
         )
 
-    def test_high_volume_requests_performance(self):
+    @pytest.mark.asyncio
+    async def test_high_volume_requests_performance(self):
         """Test rate limiting performance under high volume."""
         # Arrange
         request = Mock(spec=Request)
@@ -498,7 +511,7 @@ class TestRateLimitingPerformanceIntegration:
 
         results = []
         for _ in range(50):  # Under limit, so all should be allowed
-            result = self.api_rate_limiter.check_request(request)
+            result = await self.api_rate_limiter.check_request(request)
             results.append(result.allowed)
 
         end_time = time.time()
@@ -509,11 +522,14 @@ class TestRateLimitingPerformanceIntegration:
         assert elapsed < 1.0  # Should complete quickly (adjust as needed)
 
         # Verify final state
-        hourly_count, daily_count = self.storage.get_current_counts("192.168.1.100")
+        hourly_count, daily_count = await self.storage.get_current_counts(
+            "192.168.1.100"
+        )
         assert hourly_count == 50
         assert daily_count == 50
 
-    def test_concurrent_clients_performance(self):
+    @pytest.mark.asyncio
+    async def test_concurrent_clients_performance(self):
         """Test rate limiting performance with multiple concurrent clients."""
         # Arrange - create multiple clients
         clients = []
@@ -530,7 +546,7 @@ class TestRateLimitingPerformanceIntegration:
         all_results = []
         for _ in range(5):  # 5 requests per client
             for client_request in clients:
-                result = self.api_rate_limiter.check_request(client_request)
+                result = await self.api_rate_limiter.check_request(client_request)
                 all_results.append(result.allowed)
 
         end_time = time.time()
@@ -541,7 +557,7 @@ class TestRateLimitingPerformanceIntegration:
         assert elapsed < 2.0  # Should handle concurrent load efficiently
 
         # Verify storage stats
-        stats = self.storage.get_storage_stats()
+        stats = await self.storage.get_storage_stats()
         assert stats["total_clients"] == 10
         assert stats["total_hourly_requests"] == 50  # 5 requests × 10 clients
 
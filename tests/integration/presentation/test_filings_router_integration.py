@@ -519,6 +519,15 @@ class TestFilingsRouterIntegration:
         mock_factory.create_dispatcher.return_value = mock_dispatcher
         mock_factory.get_handler_dependencies = AsyncMock(return_value={})
 
+        # Without stored versions the handlers render responses uncached
+        filing_repository = mock_factory.create_filing_repository.return_value
+        filing_repository.get_version_by_accession = AsyncMock(return_value=None)
+        analysis_repository = mock_factory.create_analysis_repository.return_value
+        analysis_repository.get_version = AsyncMock(return_value=None)
+        analysis_repository.get_latest_version_by_accession = AsyncMock(
+            return_value=None
+        )
+
         # Create context manager using FastAPI dependency overrides
         app = self.app  # Capture app reference for closure
 
@@ -771,6 +780,15 @@ class TestFilingsRouterStressTest:
         mock_factory.create_dispatcher.return_value = mock_dispatcher
         mock_factory.get_handler_dependencies = AsyncMock(return_value={})
 
+        # Without stored versions the handlers render responses uncached
+        filing_repository = mock_factory.create_filing_repository.return_value
+        filing_repository.get_version_by_accession = AsyncMock(return_value=None)
+        analysis_repository = mock_factory.create_analysis_repository.return_value
+        analysis_repository.get_version = AsyncMock(return_value=None)
+        analysis_repository.get_latest_version_by_accession = AsyncMock(
+            return_value=None
+        )
+
         # Create context manager using FastAPI dependency overrides
         app = self.app  # Capture app reference for closure
 
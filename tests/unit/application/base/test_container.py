@@ -0,0 +1,109 @@
+"""Tests for lazy, request-scoped dependency resolution."""
+
+import asyncio
+
+import pytest
+
+from src.application.base.container import Container
+from src.application.base.dispatcher import Dispatcher
+from src.application.base.exceptions import DependencyError
+
+
+@pytest.fixture
+def built() -> list[str]:
+    """Names of the dependencies built during the test."""
+    return []
+
+
+@pytest.fixture
+def container(built) -> Container:
+    """Container with a scoped, a singleton and a dependent provider."""
+    container = Container()
+
+    def provider(name: str):
+        def provide(scope):
+            built.append(name)
+            return f"{name}:{scope.values['session']}"
+
+        return provide
+
+    async def dependent(scope):
+        built.append("dependent")
+        return f"uses {await scope.get('repository')}"
+
+    container.register("repository", provider("repository"))
+    container.register("service", provider("service"), singleton=True)
+    container.register("dependent", dependent)
+    return container
+
+
+class TestDependencyScope:
+    """Test dependencies are built lazily and reused within their lifetime."""
+
+    @pytest.mark.asyncio
+    async def test_only_requested_dependencies_are_built(self, container, built):
+        """Test resolving builds nothing but the requested dependencies."""
+        scope = container.scope(session="s1")
+
+        resolved = await scope.resolve(["repository", "unknown"])
+
+        assert resolved == {"repository": "repository:s1"}
+        assert built == ["repository"]
+
+    @pytest.mark.asyncio
+    async def test_scoped_dependencies_built_once_per_scope(self, container, built):
+        """Test a scope reuses what it built, and other scopes build their own."""
+        first = container.scope(session="s1")
+        second = container.scope(session="s2")
+
+        assert await first.get("dependent") == "uses repository:s1"
+        assert await first.get("repository") == "repository:s1"
+        assert await second.get("repository") == "repository:s2"
+
+        assert built == ["dependent", "repository", "repository"]
+
+    @pytest.mark.asyncio
+    async def test_singletons_shared_across_scopes(self, container, built):
+        """Test singletons are built once, even when requested concurrently."""
+        scopes = [container.scope(session=f"s{i}") for i in range(3)]
+
+        services = await asyncio.gather(*(scope.get("service") for scope in scopes))
+
+        assert services == ["service:s0"] * 3
+        assert built == ["service"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_dependency(self, container):
+        """Test getting a dependency without provider raises DependencyError."""
+        with pytest.raises(DependencyError, match="unknown"):
+            await container.scope(session="s1").get("unknown")
+
+
+class TestDispatcherScopedDependencies:
+    """Test the dispatcher constructs handlers from a dependency scope."""
+
+    @pytest.mark.asyncio
+    async def test_handler_built_from_declared_dependencies(
+        self, mock_query, mock_query_handler
+    ):
+        """Test only the handler's constructor parameters are built."""
+        built: list[str] = []
+        container = Container()
+        container.register("service", lambda scope: built.append("service") or "svc")
+        container.register("unused", lambda scope: built.append("unused"))
+
+        dispatcher = Dispatcher()
+        dispatcher.register_query_handler(mock_query_handler)
+
+        result = await dispatcher.dispatch_query(mock_query(), container.scope())
+
+        assert result["service"] == "svc"
+        assert built == ["service"]
+
+    def test_parameters_inspected_at_registration(self, mock_query_handler):
+        """Test handler constructor parameters are compiled when registering."""
+        dispatcher = Dispatcher()
+
+        dispatcher.register_query_handler(mock_query_handler)
+
+        assert dispatcher._handler_parameters[mock_query_handler] == ("service",)
@@ -197,7 +197,7 @@ class TestImportFilingsHandlerTickerResolution:
             import_strategy=ImportStrategy.BY_COMPANIES,
         )
 
-        self.mock_edgar_service.get_company_by_ticker.return_value = (
+        self.mock_edgar_service.get_company_by_ticker_async.return_value = (
             self.mock_company_data
         )
         self.mock_coordinator.return_value = TaskResponse(
@@ -208,7 +208,7 @@ class TestImportFilingsHandlerTickerResolution:
         result = await self.handler.handle(command)
 
         # Assert
-        self.mock_edgar_service.get_company_by_ticker.assert_called_once_with(
+        self.mock_edgar_service.get_company_by_ticker_async.assert_called_once_with(
             Ticker("AAPL")
         )
         assert isinstance(result, TaskResponse)
@@ -226,7 +226,7 @@ class TestImportFilingsHandlerTickerResolution:
         msft_company_data = Mock()
         msft_company_data.cik = "0000789019"
 
-        self.mock_edgar_service.get_company_by_ticker.side_effect = [
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = [
             self.mock_company_data,  # For AAPL
             msft_company_data,  # For MSFT
         ]
@@ -240,9 +240,13 @@ class TestImportFilingsHandlerTickerResolution:
 
         # Assert
         # Should resolve AAPL and MSFT tickers, but not the CIK
-        assert self.mock_edgar_service.get_company_by_ticker.call_count == 2
-        self.mock_edgar_service.get_company_by_ticker.assert_any_call(Ticker("AAPL"))
-        self.mock_edgar_service.get_company_by_ticker.assert_any_call(Ticker("MSFT"))
+        assert self.mock_edgar_service.get_company_by_ticker_async.call_count == 2
+        self.mock_edgar_service.get_company_by_ticker_async.assert_any_call(
+            Ticker("AAPL")
+        )
+        self.mock_edgar_service.get_company_by_ticker_async.assert_any_call(
+            Ticker("MSFT")
+        )
 
     @pytest.mark.asyncio
     async def test_ticker_resolution_failure_continues_processing(self):
@@ -254,7 +258,7 @@ class TestImportFilingsHandlerTickerResolution:
         )
 
         # Mock Edgar service to fail for ticker
-        self.mock_edgar_service.get_company_by_ticker.side_effect = Exception(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = Exception(
             "Ticker not found"
         )
 
@@ -267,7 +271,7 @@ class TestImportFilingsHandlerTickerResolution:
 
         # Assert
         # Should try to resolve the ticker and continue with valid CIK
-        self.mock_edgar_service.get_company_by_ticker.assert_called_once_with(
+        self.mock_edgar_service.get_company_by_ticker_async.assert_called_once_with(
             Ticker("AAPL")
         )
         assert isinstance(result, TaskResponse)
@@ -282,7 +286,7 @@ class TestImportFilingsHandlerTickerResolution:
         )
 
         # Mock Edgar service to fail for all tickers
-        self.mock_edgar_service.get_company_by_ticker.side_effect = Exception(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = Exception(
             "Ticker not found"
         )
 
@@ -306,7 +310,7 @@ class TestImportFilingsHandlerTickerResolution:
         )
 
         # Mock Edgar service to fail for the ticker
-        self.mock_edgar_service.get_company_by_ticker.side_effect = Exception(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = Exception(
             "Ticker not found"
         )
 
@@ -327,7 +331,7 @@ class TestImportFilingsHandlerTickerResolution:
             assert "Failed to resolve ticker BADTICK" in error_call
 
             # Should call Edgar service for the ticker
-            self.mock_edgar_service.get_company_by_ticker.assert_called_once_with(
+            self.mock_edgar_service.get_company_by_ticker_async.assert_called_once_with(
                 Ticker("BADTICK")
             )
 
@@ -349,7 +353,7 @@ class TestImportFilingsHandlerTickerResolution:
 
         # Assert
         # Should not call Edgar service for CIK identifiers
-        self.mock_edgar_service.get_company_by_ticker.assert_not_called()
+        self.mock_edgar_service.get_company_by_ticker_async.assert_not_called()
         assert isinstance(result, TaskResponse)
 
     @pytest.mark.asyncio
@@ -361,7 +365,7 @@ class TestImportFilingsHandlerTickerResolution:
             import_strategy=ImportStrategy.BY_COMPANIES,
         )
 
-        self.mock_edgar_service.get_company_by_ticker.return_value = (
+        self.mock_edgar_service.get_company_by_ticker_async.return_value = (
             self.mock_company_data
         )
         self.mock_coordinator.return_value = TaskResponse(
@@ -388,7 +392,7 @@ class TestImportFilingsHandlerTickerResolution:
         )
 
         error_message = "Company not found in Edgar database"
-        self.mock_edgar_service.get_company_by_ticker.side_effect = Exception(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = Exception(
             error_message
         )
         self.mock_coordinator.return_value = TaskResponse(
@@ -664,13 +668,15 @@ class TestImportFilingsHandlerEdgarIntegration:
 
         mock_company_data = Mock()
         mock_company_data.cik = "0000320193"
-        self.mock_edgar_service.get_company_by_ticker.return_value = mock_company_data
+        self.mock_edgar_service.get_company_by_ticker_async.return_value = (
+            mock_company_data
+        )
 
         # Act
         await self.handler.handle(command)
 
         # Assert
-        self.mock_edgar_service.get_company_by_ticker.assert_called_once_with(
+        self.mock_edgar_service.get_company_by_ticker_async.assert_called_once_with(
             Ticker("AAPL")
         )
 
@@ -686,7 +692,9 @@ class TestImportFilingsHandlerEdgarIntegration:
         # Mock company data with different CIK formats
         mock_company_data = Mock()
         mock_company_data.cik = "0000320193"
-        self.mock_edgar_service.get_company_by_ticker.return_value = mock_company_data
+        self.mock_edgar_service.get_company_by_ticker_async.return_value = (
+            mock_company_data
+        )
 
         # Act
         with patch(
@@ -707,7 +715,7 @@ class TestImportFilingsHandlerEdgarIntegration:
             import_strategy=ImportStrategy.BY_COMPANIES,
         )
 
-        self.mock_edgar_service.get_company_by_ticker.side_effect = Exception(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = Exception(
             "Company not found in SEC database"
         )
 
@@ -716,7 +724,7 @@ class TestImportFilingsHandlerEdgarIntegration:
 
         # Assert
         # Should handle error gracefully and continue with valid CIK
-        self.mock_edgar_service.get_company_by_ticker.assert_called_once_with(
+        self.mock_edgar_service.get_company_by_ticker_async.assert_called_once_with(
             Ticker("NOEXIST")
         )
         assert isinstance(result, TaskResponse)
@@ -730,7 +738,7 @@ class TestImportFilingsHandlerEdgarIntegration:
             import_strategy=ImportStrategy.BY_COMPANIES,
         )
 
-        self.mock_edgar_service.get_company_by_ticker.side_effect = TimeoutError(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = TimeoutError(
             "Request to SEC Edgar service timed out"
         )
 
@@ -739,7 +747,7 @@ class TestImportFilingsHandlerEdgarIntegration:
 
         # Assert
         # Should handle timeout gracefully and continue with valid CIK
-        self.mock_edgar_service.get_company_by_ticker.assert_called_once_with(
+        self.mock_edgar_service.get_company_by_ticker_async.assert_called_once_with(
             Ticker("AAPL")
         )
         assert isinstance(result, TaskResponse)
@@ -753,7 +761,7 @@ class TestImportFilingsHandlerEdgarIntegration:
             import_strategy=ImportStrategy.BY_COMPANIES,
         )
 
-        self.mock_edgar_service.get_company_by_ticker.side_effect = Exception(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = Exception(
             "Rate limit exceeded: 10 requests per second maximum"
         )
 
@@ -785,7 +793,9 @@ class TestImportFilingsHandlerEdgarIntegration:
         # Mock company data without CIK attribute
         mock_company_data = Mock(spec=[])
         # Don't add cik attribute to simulate invalid response
-        self.mock_edgar_service.get_company_by_ticker.return_value = mock_company_data
+        self.mock_edgar_service.get_company_by_ticker_async.return_value = (
+            mock_company_data
+        )
 
         # Act - Should handle error gracefully and continue with valid CIK
         with patch(
@@ -816,7 +826,7 @@ class TestImportFilingsHandlerEdgarIntegration:
         googl_data = Mock()
         googl_data.cik = "0001652044"
 
-        self.mock_edgar_service.get_company_by_ticker.side_effect = [
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = [
             aapl_data,
             msft_data,
             googl_data,
@@ -826,10 +836,16 @@ class TestImportFilingsHandlerEdgarIntegration:
         await self.handler.handle(command)
 
         # Assert
-        assert self.mock_edgar_service.get_company_by_ticker.call_count == 3
-        self.mock_edgar_service.get_company_by_ticker.assert_any_call(Ticker("AAPL"))
-        self.mock_edgar_service.get_company_by_ticker.assert_any_call(Ticker("MSFT"))
-        self.mock_edgar_service.get_company_by_ticker.assert_any_call(Ticker("GOOGL"))
+        assert self.mock_edgar_service.get_company_by_ticker_async.call_count == 3
+        self.mock_edgar_service.get_company_by_ticker_async.assert_any_call(
+            Ticker("AAPL")
+        )
+        self.mock_edgar_service.get_company_by_ticker_async.assert_any_call(
+            Ticker("MSFT")
+        )
+        self.mock_edgar_service.get_company_by_ticker_async.assert_any_call(
+            Ticker("GOOGL")
+        )
 
     @pytest.mark.asyncio
     async def test_edgar_service_partial_failure_scenario(self):
@@ -846,7 +862,7 @@ class TestImportFilingsHandlerEdgarIntegration:
         msft_data = Mock()
         msft_data.cik = "0000789019"
 
-        self.mock_edgar_service.get_company_by_ticker.side_effect = [
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = [
             aapl_data,  # Success for AAPL
             Exception("Ticker not found"),  # Failure for INVALID
             msft_data,  # Success for MSFT
@@ -856,7 +872,7 @@ class TestImportFilingsHandlerEdgarIntegration:
         result = await self.handler.handle(command)
 
         # Assert
-        assert self.mock_edgar_service.get_company_by_ticker.call_count == 3
+        assert self.mock_edgar_service.get_company_by_ticker_async.call_count == 3
         assert isinstance(result, TaskResponse)
 
 
@@ -1159,7 +1175,7 @@ class TestImportFilingsHandlerErrorHandling:
         )
 
         # Mock Edgar service to fail for all tickers
-        self.mock_edgar_service.get_company_by_ticker.side_effect = Exception(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = Exception(
             "Ticker not found in Edgar database"
         )
 
@@ -1180,8 +1196,8 @@ class TestImportFilingsHandlerErrorHandling:
         )
 
         # Mock connection error
-        self.mock_edgar_service.get_company_by_ticker.side_effect = ConnectionError(
-            "Unable to connect to SEC Edgar service"
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = (
+            ConnectionError("Unable to connect to SEC Edgar service")
         )
 
         # Act
@@ -1209,8 +1225,8 @@ class TestImportFilingsHandlerErrorHandling:
         )
 
         # Mock authentication error
-        self.mock_edgar_service.get_company_by_ticker.side_effect = PermissionError(
-            "Invalid API credentials for Edgar service"
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = (
+            PermissionError("Invalid API credentials for Edgar service")
         )
 
         # Act
@@ -1250,7 +1266,7 @@ class TestImportFilingsHandlerErrorHandling:
         )
 
         # Mock timeout for first ticker
-        self.mock_edgar_service.get_company_by_ticker.side_effect = TimeoutError(
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = TimeoutError(
             "Edgar service request timed out"
         )
 
@@ -1260,7 +1276,7 @@ class TestImportFilingsHandlerErrorHandling:
         # Assert
         # Should handle timeout and continue with valid CIK
         assert isinstance(result, TaskResponse)
-        self.mock_edgar_service.get_company_by_ticker.assert_called_once_with(
+        self.mock_edgar_service.get_company_by_ticker_async.assert_called_once_with(
             Ticker("SLOWTICK")
         )
 
@@ -1274,7 +1290,7 @@ class TestImportFilingsHandlerErrorHandling:
         )
 
         # Mock different types of failures
-        self.mock_edgar_service.get_company_by_ticker.side_effect = [
+        self.mock_edgar_service.get_company_by_ticker_async.side_effect = [
             ConnectionError("Network error"),
             TimeoutError("Request timeout"),
             ValueError("Invalid response"),
@@ -1288,7 +1304,7 @@ class TestImportFilingsHandlerErrorHandling:
 
             # Assert
             # Should handle all failures and continue with valid CIK
-            assert self.mock_edgar_service.get_company_by_ticker.call_count == 3
+            assert self.mock_edgar_service.get_company_by_ticker_async.call_count == 3
             assert mock_logger.error.call_count == 3
             assert isinstance(result, TaskResponse)
 
@@ -1316,7 +1332,7 @@ class TestImportFilingsHandlerErrorHandling:
             mock_validate.assert_called_once()
 
             # Verify Edgar service was never called due to validation failure
-            self.mock_edgar_service.get_company_by_ticker.assert_not_called()
+            self.mock_edgar_service.get_company_by_ticker_async.assert_not_called()
 
 
 @pytest.mark.unit
@@ -1391,7 +1407,9 @@ class TestImportFilingsHandlerEdgeCases:
         # Mock some ticker resolutions to succeed
         mock_company_data = Mock()
         mock_company_data.cik = "0000999999"
-        self.mock_edgar_service.get_company_by_ticker.return_value = mock_company_data
+        self.mock_edgar_service.get_company_by_ticker_async.return_value = (
+            mock_company_data
+        )
 
         # Act
         result = await self.handler.handle(command)
@@ -1399,7 +1417,7 @@ class TestImportFilingsHandlerEdgeCases:
         # Assert
         assert isinstance(result, TaskResponse)
         # Should call Edgar service for ticker identifiers (5 calls for odd indices)
-        assert self.mock_edgar_service.get_company_by_ticker.call_count == 5
+        assert self.mock_edgar_service.get_company_by_ticker_async.call_count == 5
 
     @pytest.mark.asyncio
     async def test_maximum_filing_types_handling(self):
@@ -1516,7 +1534,7 @@ class TestImportFilingsHandlerEdgeCases:
         # Assert
         assert isinstance(result, TaskResponse)
         # Should not call Edgar service for any CIK identifiers
-        self.mock_edgar_service.get_company_by_ticker.assert_not_called()
+        self.mock_edgar_service.get_company_by_ticker_async.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_mixed_strategy_parameter_scenarios(self):
@@ -0,0 +1,271 @@
+"""Tests for the batch get query handlers."""
+
+import asyncio
+import io
+import threading
+import time
+from datetime import UTC, date, datetime
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.application.queries.handlers.batch_get_analyses_handler import (
+    BatchGetAnalysesQueryHandler,
+)
+from src.application.queries.handlers.batch_get_filings_handler import (
+    BatchGetFilingsQueryHandler,
+)
+from src.application.schemas.queries.batch_get_analyses import BatchGetAnalysesQuery
+from src.application.schemas.queries.batch_get_filings import BatchGetFilingsQuery
+from src.application.schemas.responses.batch_response import BatchItemError
+from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.infrastructure.messaging.implementations.s3_storage import S3StorageService
+from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.repositories.filing_repository import FilingRepository
+from src.infrastructure.tasks.analysis_tasks import get_analysis_results
+from src.shared import serialization
+
+LOCATION = (CIK("320193"), AccessionNumber("0000320193-24-000001"))
+
+
+def make_analysis(summary=None) -> Analysis:
+    """Create an analysis, optionally with a recorded summary."""
+    return Analysis(
+        id=uuid4(),
+        filing_id=uuid4(),
+        analysis_type=AnalysisType.COMPREHENSIVE,
+        created_by="analyst@example.com",
+        llm_provider="openai",
+        llm_model="gpt-4",
+        created_at=datetime(2025, 1, 1, tzinfo=UTC),
+        summary=summary,
+    )
+
+
+@pytest.mark.unit
+class TestBatchGetAnalysesQueryHandler:
+    """Test retrieving many analyses at once."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.repository = Mock(spec=AnalysisRepository)
+        self.handler = BatchGetAnalysesQueryHandler(self.repository)
+
+    def test_query_requires_ids(self):
+        """Test a batch without IDs is rejected."""
+        with pytest.raises(ValueError, match="analysis_ids is required"):
+            BatchGetAnalysesQuery()
+
+    @pytest.mark.asyncio
+    async def test_summaries_served_without_storage(self):
+        """Test recorded summaries are returned without reading storage."""
+        # Arrange
+        analysis = make_analysis(summary={"executive_summary": "Strong year"})
+        missing_id = uuid4()
+        self.repository.get_by_ids.return_value = [analysis]
+
+        # Act
+        result = await self.handler.handle(
+            BatchGetAnalysesQuery(analysis_ids=(missing_id, analysis.id, missing_id))
+        )
+
+        # Assert
+        assert [item.analysis_id for item in result.items] == [analysis.id]
+        assert result.items[0].executive_summary == "Strong year"
+        assert result.errors == [
+            BatchItemError(str(missing_id), 404, f"Analysis {missing_id} not found")
+        ]
+        self.repository.get_by_ids.assert_awaited_once_with([missing_id, analysis.id])
+        self.repository.get_storage_locations.assert_not_awaited()
+        self.repository.get_analysis_results_from_storage.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_full_results_read_concurrently_with_bound(self):
+        """Test stored results are read concurrently, at most the bound at once."""
+        # Arrange
+        analyses = [make_analysis() for _ in range(6)]
+        self.repository.get_by_ids.return_value = analyses
+        self.repository.get_storage_locations.return_value = {
+            analysis.id: LOCATION for analysis in analyses
+        }
+        running = peak = 0
+
+        async def from_storage(analysis_id, company_cik, accession_number):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"executive_summary": str(analysis_id)}
+
+        self.repository.get_analysis_results_from_storage.side_effect = from_storage
+
+        # Act
+        result = await self.handler.handle(
+            BatchGetAnalysesQuery(
+                analysis_ids=tuple(analysis.id for analysis in analyses),
+                include_full_results=True,
+                max_concurrency=2,
+            )
+        )
+
+        # Assert
+        assert [item.analysis_id for item in result.items] == [
+            analysis.id for analysis in analyses
+        ]
+        assert all(item.full_results is not None for item in result.items)
+        assert result.errors == []
+        assert peak == 2
+        self.repository.get_storage_locations.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_blocking_s3_reads_overlap(self):
+        """Test slow S3 reads of a batch overlap on one shared client."""
+        # Arrange
+        analyses = [make_analysis() for _ in range(4)]
+        self.repository.get_by_ids.return_value = analyses
+        self.repository.get_storage_locations.return_value = {
+            analysis.id: LOCATION for analysis in analyses
+        }
+        self.repository.get_analysis_results_from_storage.side_effect = (
+            get_analysis_results
+        )
+        storage = S3StorageService(bucket_name="filings", prefix="analyses/")
+        storage._connected = True
+        lock = threading.Lock()
+        running = peak = 0
+
+        def get_object(Bucket, Key):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            body = serialization.dumps({"executive_summary": Key})
+            return {"Metadata": {}, "Body": io.BytesIO(body)}
+
+        storage.s3_client = Mock()
+        storage.s3_client.get_object.side_effect = get_object
+
+        # Act
+        with (
+            patch("src.infrastructure.tasks.analysis_tasks.USE_S3_STORAGE", True),
+            patch.dict(
+                "src.infrastructure.tasks.analysis_tasks._s3_storage_services",
+                {"analyses/": storage},
+            ),
+        ):
+            result = await self.handler.handle(
+                BatchGetAnalysesQuery(
+                    analysis_ids=tuple(analysis.id for analysis in analyses),
+                    include_full_results=True,
+                    max_concurrency=4,
+                )
+            )
+
+        # Assert
+        assert [item.analysis_id for item in result.items] == [
+            analysis.id for analysis in analyses
+        ]
+        assert result.items[0].full_results == {
+            "executive_summary": (
+                f"analyses/320193/000032019324000001/analysis_{analyses[0].id}.json"
+            )
+        }
+        assert peak > 1
+        storage.s3_client.head_bucket.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_storage_failures_reported_per_item(self):
+        """Test failed or missing results fail only their own analyses."""
+        # Arrange
+        ok, failing, missing = (make_analysis() for _ in range(3))
+        self.repository.get_by_ids.return_value = [ok, failing, missing]
+        self.repository.get_storage_locations.return_value = {
+            analysis.id: LOCATION for analysis in (ok, failing, missing)
+        }
+
+        async def from_storage(analysis_id, company_cik, accession_number):
+            if analysis_id == failing.id:
+                raise ConnectionError("storage unavailable")
+            return {"executive_summary": "ok"} if analysis_id == ok.id else None
+
+        self.repository.get_analysis_results_from_storage.side_effect = from_storage
+
+        # Act
+        result = await self.handler.handle(
+            BatchGetAnalysesQuery(analysis_ids=(ok.id, failing.id, missing.id))
+        )
+
+        # Assert
+        assert [item.analysis_id for item in result.items] == [ok.id]
+        assert [(error.id, error.status) for error in result.errors] == [
+            (str(failing.id), 500),
+            (str(missing.id), 404),
+        ]
+
+
+@pytest.mark.unit
+class TestBatchGetFilingsQueryHandler:
+    """Test retrieving many filings at once."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.repository = Mock(spec=FilingRepository)
+        self.handler = BatchGetFilingsQueryHandler(self.repository)
+
+    @pytest.mark.asyncio
+    async def test_found_missing_and_invalid_filings(self):
+        """Test filings are returned in order, others reported per item."""
+        # Arrange
+        filings = [
+            Filing(
+                id=uuid4(),
+                company_id=uuid4(),
+                accession_number=AccessionNumber(f"0000320193-24-00000{i}"),
+                filing_type=FilingType.FORM_10K,
+                filing_date=date(2024, 11, 1),
+                processing_status=ProcessingStatus.COMPLETED,
+            )
+            for i in (1, 2)
+        ]
+        self.repository.get_many_by_accession_numbers.return_value = [
+            (filings[1], 0, None),
+            (filings[0], 2, datetime(2025, 1, 2, tzinfo=UTC)),
+        ]
+        requested = (
+            "0000320193-24-000001",
+            "not-an-accession",
+            "0000320193-24-000009",
+            "0000320193-24-000002",
+        )
+
+        # Act
+        result = await self.handler.handle(
+            BatchGetFilingsQuery(accession_numbers=requested)
+        )
+
+        # Assert
+        assert [item.filing_id for item in result.items] == [
+            filings[0].id,
+            filings[1].id,
+        ]
+        assert result.items[0].analyses_count == 2
+        assert result.items[0].latest_analysis_date == date(2025, 1, 2)
+        assert result.items[1].latest_analysis_date is None
+        assert [(error.id, error.status) for error in result.errors] == [
+            ("not-an-accession", 422),
+            ("0000320193-24-000009", 404),
+        ]
+        (accession_numbers,) = (
+            self.repository.get_many_by_accession_numbers.await_args.args
+        )
+        assert len(accession_numbers) == 3
@@ -203,6 +203,8 @@ class TestGetAnalysisHandlerSuccessfulRetrieval:
         mock_repository.get_by_id_with_results = AsyncMock(
             return_value=(sample_analysis, sample_results)
         )
+        # Without a recorded summary, summaries fall back to storage
+        mock_repository.get_by_id = AsyncMock(return_value=sample_analysis)
 
         handler = GetAnalysisQueryHandler(analysis_repository=mock_repository)
 
@@ -286,6 +288,8 @@ class TestGetAnalysisHandlerSuccessfulRetrieval:
         mock_repository.get_by_id_with_results = AsyncMock(
             return_value=(sample_analysis, sample_results)
         )
+        # Without a recorded summary, summaries fall back to storage
+        mock_repository.get_by_id = AsyncMock(return_value=sample_analysis)
 
         handler = GetAnalysisQueryHandler(analysis_repository=mock_repository)
 
@@ -305,6 +309,65 @@ class TestGetAnalysisHandlerSuccessfulRetrieval:
         assert result_summary.filing_summary is not None  # Still includes summary data
         assert result_summary.sections_analyzed == 2
 
+    @pytest.mark.asyncio
+    async def test_summary_served_without_storage(
+        self, mock_repository, sample_analysis, sample_results
+    ):
+        """Test a recorded summary is served without loading the results."""
+        # Arrange
+        sample_analysis.update_summary(sample_results)
+        query = GetAnalysisQuery(
+            analysis_id=sample_analysis.id, include_full_results=False
+        )
+        mock_repository.get_by_id = AsyncMock(return_value=sample_analysis)
+        mock_repository.get_by_id_with_results = AsyncMock()
+
+        handler = GetAnalysisQueryHandler(analysis_repository=mock_repository)
+
+        # Act
+        result = await handler.handle(query)
+
+        # Assert
+        mock_repository.get_by_id_with_results.assert_not_awaited()
+        assert result.filing_summary == sample_results["filing_summary"]
+        assert result.key_insights == sample_results["key_insights"]
+        assert result.sections_analyzed == 2
+        assert result.full_results is None
+
+    @pytest.mark.asyncio
+    async def test_full_results_limited_to_section(
+        self, mock_repository, sample_analysis
+    ):
+        """Test full results only include the requested section analysis."""
+        # Arrange
+        results = {
+            "filing_summary": "Annual report",
+            "section_analyses": [
+                {"section_name": "Business", "overall_sentiment": 0.5},
+                {"section_name": "Risk Factors", "overall_sentiment": -0.2},
+            ],
+        }
+        query = GetAnalysisQuery(
+            analysis_id=sample_analysis.id,
+            include_full_results=True,
+            section_name="Risk Factors",
+        )
+        mock_repository.get_by_id_with_results = AsyncMock(
+            return_value=(sample_analysis, results)
+        )
+
+        handler = GetAnalysisQueryHandler(analysis_repository=mock_repository)
+
+        # Act
+        result = await handler.handle(query)
+
+        # Assert
+        assert result.full_results["section_analyses"] == [
+            {"section_name": "Risk Factors", "overall_sentiment": -0.2}
+        ]
+        assert result.full_results["filing_summary"] == "Annual report"
+        assert result.sections_analyzed == 2
+
 
 @pytest.mark.unit
 class TestGetAnalysisHandlerDataConsistency:
@@ -533,6 +596,8 @@ class TestGetAnalysisHandlerResponseTransformation:
         mock_repository.get_by_id_with_results = AsyncMock(
             return_value=(sample_analysis, comprehensive_results)
         )
+        # Without a recorded summary, summaries fall back to storage
+        mock_repository.get_by_id = AsyncMock(return_value=sample_analysis)
 
         handler = GetAnalysisQueryHandler(analysis_repository=mock_repository)
 
@@ -1107,6 +1172,8 @@ class TestGetAnalysisHandlerEdgeCases:
         )
 
         mock_repository.get_by_id_with_results = AsyncMock(return_value=(None, None))
+        # Without a recorded summary, summaries fall back to storage
+        mock_repository.get_by_id = AsyncMock(return_value=None)
 
         handler = GetAnalysisQueryHandler(analysis_repository=mock_repository)
 
@@ -1319,6 +1386,8 @@ class TestGetAnalysisHandlerIntegration:
         mock_repository.get_by_id_with_results = AsyncMock(
             return_value=(realistic_analysis, realistic_results)
         )
+        # Without a recorded summary, summaries fall back to storage
+        mock_repository.get_by_id = AsyncMock(return_value=realistic_analysis)
 
         handler = GetAnalysisQueryHandler(analysis_repository=mock_repository)
 
@@ -15,11 +15,18 @@ from src.application.schemas.queries.list_analyses import (
     ListAnalysesQuery,
     SortDirection,
 )
-from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.application.schemas.responses.analysis_response import (
+    AnalysisResponse,
+    AnalysisSummary,
+)
 from src.application.schemas.responses.paginated_response import PaginatedResponse
-from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.analysis import AnalysisType
 from src.domain.value_objects.cik import CIK
-from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.database.pagination import InvalidCursorError
+from src.infrastructure.repositories.analysis_repository import (
+    AnalysisRepository,
+    analysis_cursor,
+)
 
 
 @pytest.mark.unit
@@ -99,7 +106,7 @@ class TestListAnalysesHandlerBasicFiltering:
     def sample_analyses(self):
         """Create sample analyses for testing."""
         return [
-            Analysis(
+            AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=AnalysisType.FILING_ANALYSIS,
@@ -107,10 +114,9 @@ class TestListAnalysesHandlerBasicFiltering:
                 llm_provider="openai",
                 llm_model="gpt-4",
                 confidence_score=0.85,
-                metadata={"template": "comprehensive"},
                 created_at=datetime(2024, 3, 15, 10, 0, 0, tzinfo=UTC),
             ),
-            Analysis(
+            AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=AnalysisType.COMPREHENSIVE,
@@ -118,10 +124,9 @@ class TestListAnalysesHandlerBasicFiltering:
                 llm_provider="anthropic",
                 llm_model="claude-3",
                 confidence_score=0.92,
-                metadata={"template": "financial"},
                 created_at=datetime(2024, 3, 14, 15, 30, 0, tzinfo=UTC),
             ),
-            Analysis(
+            AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=AnalysisType.CUSTOM_QUERY,
@@ -129,7 +134,6 @@ class TestListAnalysesHandlerBasicFiltering:
                 llm_provider="google",
                 llm_model="gemini-pro",
                 confidence_score=0.78,
-                metadata={"template": "risk"},
                 created_at=datetime(2024, 3, 13, 8, 45, 0, tzinfo=UTC),
             ),
         ]
@@ -143,7 +147,9 @@ class TestListAnalysesHandlerBasicFiltering:
         query = ListAnalysesQuery()  # No filters applied
 
         mock_repository.count_with_filters = AsyncMock(return_value=3)
-        mock_repository.find_with_filters = AsyncMock(return_value=sample_analyses)
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=sample_analyses
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -169,7 +175,7 @@ class TestListAnalysesHandlerBasicFiltering:
             created_to=None,
             min_confidence_score=None,
         )
-        mock_repository.find_with_filters.assert_called_once_with(
+        mock_repository.find_summaries_with_filters.assert_called_once_with(
             company_cik=None,
             analysis_types=None,
             created_from=None,
@@ -192,7 +198,9 @@ class TestListAnalysesHandlerBasicFiltering:
         query = ListAnalysesQuery(company_cik=company_cik)
 
         mock_repository.count_with_filters = AsyncMock(return_value=2)
-        mock_repository.find_with_filters = AsyncMock(return_value=sample_analyses[:2])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=sample_analyses[:2]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -224,7 +232,9 @@ class TestListAnalysesHandlerBasicFiltering:
         query = ListAnalysesQuery(created_from=date_from, created_to=date_to)
 
         mock_repository.count_with_filters = AsyncMock(return_value=2)
-        mock_repository.find_with_filters = AsyncMock(return_value=sample_analyses[:2])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=sample_analyses[:2]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -252,7 +262,9 @@ class TestListAnalysesHandlerBasicFiltering:
         query = ListAnalysesQuery(analysis_types=analysis_types)
 
         mock_repository.count_with_filters = AsyncMock(return_value=2)
-        mock_repository.find_with_filters = AsyncMock(return_value=sample_analyses[:2])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=sample_analyses[:2]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -280,7 +292,7 @@ class TestListAnalysesHandlerBasicFiltering:
         query = ListAnalysesQuery(min_confidence_score=min_confidence)
 
         mock_repository.count_with_filters = AsyncMock(return_value=2)
-        mock_repository.find_with_filters = AsyncMock(
+        mock_repository.find_summaries_with_filters = AsyncMock(
             return_value=[
                 sample_analyses[0],
                 sample_analyses[1],
@@ -336,8 +348,8 @@ class TestListAnalysesHandlerBasicFiltering:
             "company: 9999999, min_confidence: 0.95" in result.filters_applied
         )  # CIK normalizes
 
-        # Repository should not call find_with_filters when count is 0
-        mock_repository.find_with_filters.assert_not_called()
+        # Repository should not call find_summaries_with_filters when count is 0
+        mock_repository.find_summaries_with_filters.assert_not_called()
 
 
 @pytest.mark.unit
@@ -360,7 +372,7 @@ class TestListAnalysesHandlerTemplateMapping:
     def comprehensive_analyses(self):
         """Create analyses matching comprehensive template."""
         return [
-            Analysis(
+            AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=AnalysisType.COMPREHENSIVE,
@@ -380,7 +392,7 @@ class TestListAnalysesHandlerTemplateMapping:
         query = ListAnalysesQuery(analysis_template=AnalysisTemplate.COMPREHENSIVE)
 
         mock_repository.count_with_filters = AsyncMock(return_value=3)
-        mock_repository.find_with_filters = AsyncMock(
+        mock_repository.find_summaries_with_filters = AsyncMock(
             return_value=comprehensive_analyses
         )
 
@@ -404,7 +416,7 @@ class TestListAnalysesHandlerTemplateMapping:
             created_to=None,
             min_confidence_score=None,
         )
-        mock_repository.find_with_filters.assert_called_once_with(
+        mock_repository.find_summaries_with_filters.assert_called_once_with(
             company_cik=None,
             analysis_types=expected_types,
             created_from=None,
@@ -436,7 +448,7 @@ class TestListAnalysesHandlerTemplateMapping:
         )
 
         mock_repository.count_with_filters = AsyncMock(return_value=1)
-        mock_repository.find_with_filters = AsyncMock(
+        mock_repository.find_summaries_with_filters = AsyncMock(
             return_value=comprehensive_analyses[:1]
         )
 
@@ -466,7 +478,7 @@ class TestListAnalysesHandlerTemplateMapping:
         query = ListAnalysesQuery(analysis_template=AnalysisTemplate.FINANCIAL_FOCUSED)
 
         mock_repository.count_with_filters = AsyncMock(return_value=5)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -494,7 +506,7 @@ class TestListAnalysesHandlerTemplateMapping:
         query = ListAnalysesQuery(analysis_template=AnalysisTemplate.RISK_FOCUSED)
 
         mock_repository.count_with_filters = AsyncMock(return_value=3)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -522,7 +534,7 @@ class TestListAnalysesHandlerTemplateMapping:
         query = ListAnalysesQuery(analysis_template=AnalysisTemplate.BUSINESS_FOCUSED)
 
         mock_repository.count_with_filters = AsyncMock(return_value=4)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -564,7 +576,7 @@ class TestListAnalysesHandlerPaginationAndSorting:
     def many_analyses(self):
         """Create many analyses for pagination testing."""
         return [
-            Analysis(
+            AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=AnalysisType.FILING_ANALYSIS,
@@ -584,7 +596,9 @@ class TestListAnalysesHandlerPaginationAndSorting:
         query = ListAnalysesQuery(page=1, page_size=10)
 
         mock_repository.count_with_filters = AsyncMock(return_value=25)
-        mock_repository.find_with_filters = AsyncMock(return_value=many_analyses[:10])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[:10]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -607,7 +621,9 @@ class TestListAnalysesHandlerPaginationAndSorting:
         query = ListAnalysesQuery(page=2, page_size=10)
 
         mock_repository.count_with_filters = AsyncMock(return_value=25)
-        mock_repository.find_with_filters = AsyncMock(return_value=many_analyses[10:20])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[10:20]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -630,7 +646,9 @@ class TestListAnalysesHandlerPaginationAndSorting:
         query = ListAnalysesQuery(page=3, page_size=10)
 
         mock_repository.count_with_filters = AsyncMock(return_value=25)
-        mock_repository.find_with_filters = AsyncMock(return_value=many_analyses[20:25])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[20:25]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -656,7 +674,9 @@ class TestListAnalysesHandlerPaginationAndSorting:
         )
 
         mock_repository.count_with_filters = AsyncMock(return_value=25)
-        mock_repository.find_with_filters = AsyncMock(return_value=many_analyses[:10])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[:10]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -664,7 +684,7 @@ class TestListAnalysesHandlerPaginationAndSorting:
         await handler.handle(query)
 
         # Assert
-        mock_repository.find_with_filters.assert_called_once_with(
+        mock_repository.find_summaries_with_filters.assert_called_once_with(
             company_cik=None,
             analysis_types=None,
             created_from=None,
@@ -686,7 +706,9 @@ class TestListAnalysesHandlerPaginationAndSorting:
         )
 
         mock_repository.count_with_filters = AsyncMock(return_value=25)
-        mock_repository.find_with_filters = AsyncMock(return_value=many_analyses[:10])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[:10]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -694,7 +716,7 @@ class TestListAnalysesHandlerPaginationAndSorting:
         await handler.handle(query)
 
         # Assert
-        mock_repository.find_with_filters.assert_called_once_with(
+        mock_repository.find_summaries_with_filters.assert_called_once_with(
             company_cik=None,
             analysis_types=None,
             created_from=None,
@@ -713,7 +735,9 @@ class TestListAnalysesHandlerPaginationAndSorting:
         query = ListAnalysesQuery(page=1, page_size=5)
 
         mock_repository.count_with_filters = AsyncMock(return_value=25)
-        mock_repository.find_with_filters = AsyncMock(return_value=many_analyses[:5])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[:5]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -726,6 +750,75 @@ class TestListAnalysesHandlerPaginationAndSorting:
         assert result.total_pages == 5  # 25 items / 5 per page
         assert len(result.items) == 5
 
+    @pytest.mark.asyncio
+    async def test_cursor_continues_after_position(
+        self, mock_repository, many_analyses
+    ):
+        """Test a cursor is passed to the repository instead of a page."""
+        # Arrange
+        cursor = analysis_cursor(
+            many_analyses[9], AnalysisSortField.CREATED_AT, SortDirection.DESC
+        )
+        query = ListAnalysesQuery(page_size=10, cursor=cursor)
+
+        mock_repository.count_with_filters = AsyncMock(return_value=25)
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[10:20]
+        )
+
+        handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
+
+        # Act
+        result = await handler.handle(query)
+
+        # Assert
+        kwargs = mock_repository.find_summaries_with_filters.call_args.kwargs
+        assert kwargs["cursor"] == cursor
+        assert "page" not in kwargs
+        assert result.has_next is True
+        assert result.next_cursor == analysis_cursor(
+            many_analyses[19], AnalysisSortField.CREATED_AT, SortDirection.DESC
+        )
+
+    @pytest.mark.asyncio
+    async def test_without_total_skips_count(self, mock_repository, many_analyses):
+        """Test the count is skipped and a short page has no successor."""
+        # Arrange
+        query = ListAnalysesQuery(page_size=10, include_total=False)
+
+        mock_repository.count_with_filters = AsyncMock()
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=many_analyses[:4]
+        )
+
+        handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
+
+        # Act
+        result = await handler.handle(query)
+
+        # Assert
+        mock_repository.count_with_filters.assert_not_called()
+        assert result.total_items is None
+        assert result.has_next is False
+        assert len(result.items) == 4
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_propagates(self, mock_repository):
+        """Test a malformed cursor rejected by the repository is raised."""
+        # Arrange
+        query = ListAnalysesQuery(cursor="not-a-cursor")
+
+        mock_repository.count_with_filters = AsyncMock(return_value=25)
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            side_effect=InvalidCursorError("Invalid pagination cursor")
+        )
+
+        handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
+
+        # Act & Assert
+        with pytest.raises(InvalidCursorError):
+            await handler.handle(query)
+
 
 @pytest.mark.unit
 class TestListAnalysesHandlerComplexFiltering:
@@ -768,7 +861,7 @@ class TestListAnalysesHandlerComplexFiltering:
         )
 
         mock_repository.count_with_filters = AsyncMock(return_value=50)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -815,7 +908,7 @@ class TestListAnalysesHandlerComplexFiltering:
         query = ListAnalysesQuery(created_from=date_from)
 
         mock_repository.count_with_filters = AsyncMock(return_value=10)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -840,7 +933,7 @@ class TestListAnalysesHandlerComplexFiltering:
         query = ListAnalysesQuery(created_to=date_to)
 
         mock_repository.count_with_filters = AsyncMock(return_value=10)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -878,7 +971,7 @@ class TestListAnalysesHandlerResponseTransformation:
         """Create detailed analyses for transformation testing."""
         analyses = []
         for i in range(3):
-            analysis = Analysis(
+            analysis = AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=AnalysisType.FILING_ANALYSIS,
@@ -886,15 +979,9 @@ class TestListAnalysesHandlerResponseTransformation:
                 llm_provider="openai",
                 llm_model="gpt-4",
                 confidence_score=0.8 + (i * 0.05),
-                metadata={
-                    "template": "comprehensive",
-                    "version": "1.0",
-                    "custom_field": f"value_{i}",
-                },
                 created_at=datetime.now(UTC) - timedelta(days=i),
+                processing_time_seconds=30.5 + i,
             )
-            # Mock processing time method
-            analysis.get_processing_time = Mock(return_value=30.5 + i)
             analyses.append(analysis)
         return analyses
 
@@ -907,13 +994,15 @@ class TestListAnalysesHandlerResponseTransformation:
         query = ListAnalysesQuery()
 
         mock_repository.count_with_filters = AsyncMock(return_value=3)
-        mock_repository.find_with_filters = AsyncMock(return_value=detailed_analyses)
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=detailed_analyses
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
         # Act
         with patch(
-            "src.application.schemas.responses.analysis_response.AnalysisResponse.summary_from_domain"
+            "src.application.schemas.responses.analysis_response.AnalysisResponse.from_summary"
         ) as mock_summary:
             # Mock the summary transformation
             mock_summary.side_effect = lambda a: AnalysisResponse(
@@ -925,11 +1014,7 @@ class TestListAnalysesHandlerResponseTransformation:
                 llm_model=a.llm_model,
                 confidence_score=a.confidence_score,
                 created_at=a.created_at,
-                processing_time_seconds=(
-                    a.get_processing_time()
-                    if hasattr(a, "get_processing_time")
-                    else None
-                ),
+                processing_time_seconds=a.processing_time_seconds,
                 # Summary version excludes full results
                 full_results=None,
             )
@@ -938,7 +1023,7 @@ class TestListAnalysesHandlerResponseTransformation:
 
         # Assert
         assert len(result.items) == 3
-        # Verify summary_from_domain was called for each analysis
+        # Verify from_summary was called for each analysis
         assert mock_summary.call_count == 3
         for analysis in detailed_analyses:
             mock_summary.assert_any_call(analysis)
@@ -954,7 +1039,9 @@ class TestListAnalysesHandlerResponseTransformation:
         query = ListAnalysesQuery(page=2, page_size=5)
 
         mock_repository.count_with_filters = AsyncMock(return_value=13)
-        mock_repository.find_with_filters = AsyncMock(return_value=detailed_analyses)
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=detailed_analyses
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -1035,7 +1122,9 @@ class TestListAnalysesHandlerErrorHandling:
 
         mock_repository.count_with_filters = AsyncMock(return_value=5)
         repository_error = Exception("Database timeout during find")
-        mock_repository.find_with_filters = AsyncMock(side_effect=repository_error)
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            side_effect=repository_error
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -1061,7 +1150,7 @@ class TestListAnalysesHandlerErrorHandling:
         query = ListAnalysesQuery()
 
         # Create analysis that will cause transformation error
-        bad_analysis = Analysis(
+        bad_analysis = AnalysisSummary(
             id=uuid4(),
             filing_id=uuid4(),
             analysis_type=AnalysisType.FILING_ANALYSIS,
@@ -1070,13 +1159,15 @@ class TestListAnalysesHandlerErrorHandling:
         )
 
         mock_repository.count_with_filters = AsyncMock(return_value=1)
-        mock_repository.find_with_filters = AsyncMock(return_value=[bad_analysis])
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=[bad_analysis]
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
-        # Mock AnalysisResponse.summary_from_domain to raise exception
+        # Mock AnalysisResponse.from_summary to raise exception
         with patch(
-            "src.application.schemas.responses.analysis_response.AnalysisResponse.summary_from_domain"
+            "src.application.schemas.responses.analysis_response.AnalysisResponse.from_summary"
         ) as mock_summary:
             mock_summary.side_effect = AttributeError("Missing required attribute")
 
@@ -1169,7 +1260,7 @@ class TestListAnalysesHandlerEdgeCases:
 
         # Create 100 analyses
         large_analyses = [
-            Analysis(
+            AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=AnalysisType.FILING_ANALYSIS,
@@ -1180,7 +1271,9 @@ class TestListAnalysesHandlerEdgeCases:
         ]
 
         mock_repository.count_with_filters = AsyncMock(return_value=1000)
-        mock_repository.find_with_filters = AsyncMock(return_value=large_analyses)
+        mock_repository.find_summaries_with_filters = AsyncMock(
+            return_value=large_analyses
+        )
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -1227,7 +1320,7 @@ class TestListAnalysesHandlerEdgeCases:
         ]
 
         mock_repository.count_with_filters = AsyncMock(return_value=1)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -1239,7 +1332,7 @@ class TestListAnalysesHandlerEdgeCases:
             await handler.handle(query)
 
             # Assert
-            find_call = mock_repository.find_with_filters.call_args
+            find_call = mock_repository.find_summaries_with_filters.call_args
             assert find_call[1]["sort_by"] == sort_field
 
     @pytest.mark.asyncio
@@ -1249,7 +1342,7 @@ class TestListAnalysesHandlerEdgeCases:
         query = ListAnalysesQuery(page=1, page_size=100)  # Max from BaseQuery
 
         mock_repository.count_with_filters = AsyncMock(return_value=500)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -1258,8 +1351,8 @@ class TestListAnalysesHandlerEdgeCases:
 
         # Assert
         assert result.page_size == 100  # Max allowed by BaseQuery
-        mock_repository.find_with_filters.assert_called_once()
-        call_args = mock_repository.find_with_filters.call_args[1]
+        mock_repository.find_summaries_with_filters.assert_called_once()
+        call_args = mock_repository.find_summaries_with_filters.call_args[1]
         assert call_args["page_size"] == 100
 
     @pytest.mark.asyncio
@@ -1269,7 +1362,7 @@ class TestListAnalysesHandlerEdgeCases:
         query = ListAnalysesQuery(min_confidence_score=0.0)
 
         mock_repository.count_with_filters = AsyncMock(return_value=10)
-        mock_repository.find_with_filters = AsyncMock(return_value=[])
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=[])
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -1323,11 +1416,10 @@ class TestListAnalysesHandlerIntegration:
     def realistic_analyses(self):
         """Create realistic analyses for integration testing."""
         analyses = []
-        companies = ["TSLA", "AAPL", "GOOGL", "MSFT", "AMZN"]
         types = list(AnalysisType)
 
         for i in range(15):
-            analysis = Analysis(
+            analysis = AnalysisSummary(
                 id=uuid4(),
                 filing_id=uuid4(),
                 analysis_type=types[i % len(types)],
@@ -1335,14 +1427,9 @@ class TestListAnalysesHandlerIntegration:
                 llm_provider=["openai", "anthropic", "google"][i % 3],
                 llm_model=["gpt-4", "claude-3", "gemini-pro"][i % 3],
                 confidence_score=0.6 + (i % 4) * 0.1,
-                metadata={
-                    "company": companies[i % 5],
-                    "template": ["comprehensive", "financial", "risk"][i % 3],
-                    "processing_version": "2.0.1",
-                },
                 created_at=datetime.now(UTC) - timedelta(days=i),
+                processing_time_seconds=45.0 + i * 2,
             )
-            analysis.get_processing_time = Mock(return_value=45.0 + i * 2)
             analyses.append(analysis)
 
         return analyses
@@ -1371,7 +1458,7 @@ class TestListAnalysesHandlerIntegration:
         filtered = [a for a in realistic_analyses if a.confidence_score >= 0.7][:5]
 
         mock_repository.count_with_filters = AsyncMock(return_value=8)
-        mock_repository.find_with_filters = AsyncMock(return_value=filtered)
+        mock_repository.find_summaries_with_filters = AsyncMock(return_value=filtered)
 
         handler = ListAnalysesQueryHandler(analysis_repository=mock_repository)
 
@@ -1456,7 +1543,7 @@ class TestListAnalysesHandlerIntegration:
         find_values = [realistic_analyses[: 10 - i] for i in range(len(queries))]
 
         mock_repository.count_with_filters = AsyncMock(side_effect=count_values)
-        mock_repository.find_with_filters = AsyncMock(side_effect=find_values)
+        mock_repository.find_summaries_with_filters = AsyncMock(side_effect=find_values)
 
         # Test each query
         for i, query in enumerate(queries):
@@ -1470,7 +1557,7 @@ class TestListAnalysesHandlerIntegration:
 
         # Verify repository was called for each query
         assert mock_repository.count_with_filters.call_count == len(queries)
-        assert mock_repository.find_with_filters.call_count == len(queries)
+        assert mock_repository.find_summaries_with_filters.call_count == len(queries)
 
 
 # Test coverage verification
@@ -158,7 +158,9 @@ class TestAnalysisOrchestratorValidation:
         """Test successful filing validation and data retrieval."""
         # Arrange
         accession_number = AccessionNumber("0000320193-23-000106")
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
 
         # Act
         result = await self.orchestrator.validate_filing_access_and_get_data(
@@ -167,7 +169,7 @@ class TestAnalysisOrchestratorValidation:
 
         # Assert
         assert result == self.valid_filing_data
-        self.edgar_service.get_filing_by_accession.assert_called_once_with(
+        self.edgar_service.get_filing_by_accession_async.assert_called_once_with(
             accession_number
         )
 
@@ -187,7 +189,9 @@ class TestAnalysisOrchestratorValidation:
             ticker="AAPL",
             sections={},
         )
-        self.edgar_service.get_filing_by_accession.return_value = invalid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            invalid_filing_data
+        )
 
         # Act & Assert
         with pytest.raises(
@@ -213,7 +217,9 @@ class TestAnalysisOrchestratorValidation:
             ticker="AAPL",
             sections={},
         )
-        self.edgar_service.get_filing_by_accession.return_value = invalid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            invalid_filing_data
+        )
 
         # Act & Assert
         with pytest.raises(
@@ -228,7 +234,7 @@ class TestAnalysisOrchestratorValidation:
         """Test filing validation failure due to Edgar service error."""
         # Arrange
         accession_number = AccessionNumber("0000320193-23-000106")
-        self.edgar_service.get_filing_by_accession.side_effect = ValueError(
+        self.edgar_service.get_filing_by_accession_async.side_effect = ValueError(
             "Filing not found"
         )
 
@@ -243,14 +249,16 @@ class TestAnalysisOrchestratorValidation:
         """Test legacy validate_filing_access method returns True on success."""
         # Arrange
         accession_number = AccessionNumber("0000320193-23-000106")
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
 
         # Act
         result = await self.orchestrator.validate_filing_access(accession_number)
 
         # Assert
         assert result is True
-        self.edgar_service.get_filing_by_accession.assert_called_once_with(
+        self.edgar_service.get_filing_by_accession_async.assert_called_once_with(
             accession_number
         )
 
@@ -259,7 +267,7 @@ class TestAnalysisOrchestratorValidation:
         """Test legacy validate_filing_access method propagates errors."""
         # Arrange
         accession_number = AccessionNumber("0000320193-23-000106")
-        self.edgar_service.get_filing_by_accession.side_effect = ValueError(
+        self.edgar_service.get_filing_by_accession_async.side_effect = ValueError(
             "Service error"
         )
 
@@ -272,7 +280,7 @@ class TestAnalysisOrchestratorValidation:
         """Test validate_filing_access handles unexpected errors."""
         # Arrange
         accession_number = AccessionNumber("0000320193-23-000106")
-        self.edgar_service.get_filing_by_accession.side_effect = RuntimeError(
+        self.edgar_service.get_filing_by_accession_async.side_effect = RuntimeError(
             "Unexpected error"
         )
 
@@ -359,7 +367,9 @@ class TestAnalysisOrchestratorHappyPath:
     async def test_orchestrate_filing_analysis_complete_success(self):
         """Test complete successful filing analysis workflow."""
         # Arrange
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = []  # No existing
@@ -399,7 +409,7 @@ class TestAnalysisOrchestratorHappyPath:
             assert isinstance(result, Analysis)
 
             # Verify key method calls
-            self.edgar_service.get_filing_by_accession.assert_called()
+            self.edgar_service.get_filing_by_accession_async.assert_called()
             self.filing_repository.get_by_accession_number.assert_called_once()
             self.template_service.get_schemas_for_template.assert_called_once_with(
                 AnalysisTemplate.COMPREHENSIVE
@@ -416,7 +426,9 @@ class TestAnalysisOrchestratorHappyPath:
         async def progress_callback(progress: float, message: str):
             progress_calls.append((progress, message))
 
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = []
@@ -482,7 +494,9 @@ class TestAnalysisOrchestratorHappyPath:
             force_reprocess=True,
         )
 
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = [existing_analysis]
@@ -717,7 +731,7 @@ class TestAnalysisOrchestratorWorkflowSteps:
             ticker="AAPL",
             sections={"Item 1 - Business": "Business from Edgar"},
         )
-        self.edgar_service.get_filing_by_accession.return_value = filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = filing_data
 
         # Act
         result = await self.orchestrator._extract_relevant_filing_sections(
@@ -726,7 +740,7 @@ class TestAnalysisOrchestratorWorkflowSteps:
 
         # Assert
         assert result == {"Item 1 - Business": "Business from Edgar"}
-        self.edgar_service.get_filing_by_accession.assert_called_once_with(
+        self.edgar_service.get_filing_by_accession_async.assert_called_once_with(
             accession_number
         )
 
@@ -861,7 +875,7 @@ class TestAnalysisOrchestratorErrorHandling:
     async def test_orchestrate_filing_analysis_filing_access_error(self):
         """Test workflow failure due to filing access error."""
         # Arrange
-        self.edgar_service.get_filing_by_accession.side_effect = ValueError(
+        self.edgar_service.get_filing_by_accession_async.side_effect = ValueError(
             "Filing not found"
         )
 
@@ -885,7 +899,7 @@ class TestAnalysisOrchestratorErrorHandling:
             sections={},
         )
 
-        self.edgar_service.get_filing_by_accession.return_value = filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = filing_data
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
 
         with patch(
@@ -923,7 +937,7 @@ class TestAnalysisOrchestratorErrorHandling:
             created_at=datetime.now(UTC),
         )
 
-        self.edgar_service.get_filing_by_accession.return_value = filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = filing_data
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = []
@@ -984,7 +998,7 @@ class TestAnalysisOrchestratorErrorHandling:
         mock_llm_response.model_dump.return_value = {"analysis": "Sample analysis"}
         mock_llm_response.section_analyses = [Mock(section_name="Item 1 - Business")]
 
-        self.edgar_service.get_filing_by_accession.return_value = filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = filing_data
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = []
@@ -1394,7 +1408,9 @@ class TestAnalysisOrchestratorDuplicateDetection:
         )
         existing_analysis._metadata = {"template_used": "comprehensive"}
 
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = [existing_analysis]
 
@@ -1446,7 +1462,9 @@ class TestAnalysisOrchestratorDuplicateDetection:
         mock_llm_response.model_dump.return_value = {"analysis": "New analysis"}
         mock_llm_response.section_analyses = [Mock(section_name="Item 1 - Business")]
 
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = [existing_analysis]
@@ -1524,7 +1542,9 @@ class TestAnalysisOrchestratorDuplicateDetection:
         mock_llm_response.model_dump.return_value = {"analysis": "Forced reprocess"}
         mock_llm_response.section_analyses = [Mock(section_name="Item 1 - Business")]
 
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = [existing_analysis]
@@ -1587,7 +1607,9 @@ class TestAnalysisOrchestratorDuplicateDetection:
         )
         existing_analysis_2._metadata = {"template_used": "comprehensive"}
 
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = [
             existing_analysis_1,
@@ -1630,7 +1652,9 @@ class TestAnalysisOrchestratorDuplicateDetection:
         mock_llm_response.model_dump.return_value = {"analysis": "New analysis"}
         mock_llm_response.section_analyses = [Mock(section_name="Item 1 - Business")]
 
-        self.edgar_service.get_filing_by_accession.return_value = self.valid_filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = (
+            self.valid_filing_data
+        )
         self.filing_repository.get_by_accession_number.return_value = self.valid_filing
         self.filing_repository.update.return_value = self.valid_filing
         self.analysis_repository.get_by_filing_id.return_value = []  # No existing
@@ -1709,7 +1733,7 @@ class TestAnalysisOrchestratorExternalIntegrations:
             sections={"Item 1 - Business": "Business content"},
         )
 
-        self.edgar_service.get_filing_by_accession.return_value = filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = filing_data
 
         # Act
         result = await self.orchestrator.validate_filing_access_and_get_data(
@@ -1718,7 +1742,7 @@ class TestAnalysisOrchestratorExternalIntegrations:
 
         # Assert
         assert result == filing_data
-        self.edgar_service.get_filing_by_accession.assert_called_once_with(
+        self.edgar_service.get_filing_by_accession_async.assert_called_once_with(
             accession_number
         )
 
@@ -1886,7 +1910,7 @@ class TestAnalysisOrchestratorExternalIntegrations:
         accession_number = AccessionNumber("0000320193-23-000106")
 
         # Test Edgar service error
-        self.edgar_service.get_filing_by_accession.side_effect = ValueError(
+        self.edgar_service.get_filing_by_accession_async.side_effect = ValueError(
             "Edgar API error"
         )
 
@@ -2050,7 +2074,7 @@ class TestAnalysisOrchestratorEdgeCases:
             sections={},  # Empty sections in Edgar data too
         )
 
-        self.edgar_service.get_filing_by_accession.return_value = filing_data
+        self.edgar_service.get_filing_by_accession_async.return_value = filing_data
 
         # Act
         result = await self.orchestrator._extract_relevant_filing_sections(
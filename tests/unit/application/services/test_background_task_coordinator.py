@@ -22,6 +22,7 @@ from src.application.services.task_service import TaskService
 from src.domain.entities.analysis import Analysis
 from src.domain.value_objects.accession_number import AccessionNumber
 from src.domain.value_objects.cik import CIK
+from src.infrastructure.messaging import TaskPriority
 
 
 @pytest.mark.unit
@@ -184,6 +185,8 @@ class TestBackgroundTaskCoordinatorBackgroundExecution:
                 },
                 queue="analysis_queue",
                 task_id=UUID(self.task_id),
+                priority=TaskPriority.HIGH,
+                metadata={"user_id": self.valid_command.user_id},
             )
 
             # Verify task status update
@@ -686,6 +689,93 @@ class TestBackgroundTaskCoordinatorTaskStatus:
         assert result.current_step == f"Task is {status}"
 
 
+@pytest.mark.unit
+class TestBackgroundTaskCoordinatorTaskUpdates:
+    """Test long-poll and streaming of task status updates."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        from src.infrastructure.messaging.implementations.event_bus import (
+            InProcessResultBackend,
+        )
+
+        self.backend = InProcessResultBackend()
+        self.task_service = AsyncMock(spec=TaskService)
+        self.coordinator = BackgroundTaskCoordinator(
+            analysis_orchestrator=Mock(spec=AnalysisOrchestrator),
+            task_service=self.task_service,
+            use_background=True,
+        )
+        self.task_id = "550e8400-e29b-41d4-a716-446655440000"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_task_update_maps_response(self):
+        """Test long-poll result is mapped to a TaskResponse."""
+        self.task_service.wait_for_task_update.return_value = {
+            "status": "completed",
+            "message": "Analysis completed successfully",
+            "progress_percent": 100.0,
+        }
+
+        result = await self.coordinator.wait_for_task_update(
+            self.task_id, timeout=5, since="t0"
+        )
+
+        assert result.status == "completed"
+        assert result.progress_percent == 100.0
+        self.task_service.wait_for_task_update.assert_called_once_with(
+            self.task_id, timeout=5, since="t0"
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_task_updates_follows_events(self):
+        """Test stream yields snapshots from published progress events."""
+        from src.infrastructure.messaging import TaskEvent
+
+        subscription = await self.backend.subscribe(self.task_id)
+        self.task_service.subscribe_task_events.return_value = subscription
+        self.task_service.get_task_status.return_value = {"status": "running"}
+
+        updates = self.coordinator.stream_task_updates(
+            self.task_id, keepalive_interval=0.01
+        )
+
+        first = await anext(updates)
+        assert first.status == "running"
+        assert await anext(updates) is None  # keep-alive tick
+
+        await self.backend.publish(
+            TaskEvent(
+                task_id=self.task_id,
+                kind="progress",
+                status="completed",
+                data={"status": "completed", "progress_percent": 100.0},
+                terminal=True,
+            )
+        )
+        last = await anext(updates)
+
+        assert last.status == "completed"
+        with pytest.raises(StopAsyncIteration):
+            await anext(updates)
+        assert subscription.closed
+
+    @pytest.mark.asyncio
+    async def test_stream_task_updates_stops_for_finished_task(self):
+        """Test stream ends after the first snapshot of a finished task."""
+        self.task_service.subscribe_task_events.return_value = None
+        self.task_service.get_task_status.return_value = {"status": "failed"}
+
+        updates = [
+            update
+            async for update in self.coordinator.stream_task_updates(
+                self.task_id, keepalive_interval=0.01
+            )
+        ]
+
+        assert [update.status for update in updates] == ["failed"]
+
+
 @pytest.mark.unit
 class TestBackgroundTaskCoordinatorTaskCancellation:
     """Test task cancellation workflows."""
@@ -0,0 +1,81 @@
+"""Unit tests for TaskService persistence and listing through the task store."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.services.task_service import TaskService
+from src.infrastructure.database.task_store import TaskStore
+
+
+@pytest.fixture
+def task_store(async_engine) -> TaskStore:
+    """Task store bound to the in-memory test database."""
+    return TaskStore(
+        async_sessionmaker(
+            bind=async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+    )
+
+
+class TestTaskServiceWithStore:
+    """Test TaskService persistence through the task store."""
+
+    @pytest.fixture(autouse=True)
+    def no_result_backend(self):
+        """Disable task event publishing."""
+        with patch(
+            "src.application.services.task_service.get_result_backend",
+            AsyncMock(side_effect=RuntimeError("no backend")),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_create_update_and_list(self, task_store):
+        """Test task lifecycle is persisted and listed per user."""
+        service = TaskService(task_store)
+        await service.create_task("task-1", "analyze_filing", user_id="alice")
+        await service.create_task("task-2", "analyze_filing", user_id="bob")
+
+        response = await service.update_task_status(
+            "task-1", "completed", progress=100, result={"ok": True}
+        )
+
+        assert response.status == "completed"
+        page = await service.list_user_tasks("alice")
+        assert [task.task_id for task in page.tasks] == ["task-1"]
+        assert page.tasks[0].result == {"ok": True}
+        assert page.tasks[0].completed_at is not None
+
+    @pytest.mark.asyncio
+    async def test_update_unknown_task(self, task_store):
+        """Test updating a missing task reports not found."""
+        service = TaskService(task_store)
+
+        response = await service.update_task_status("missing", "running")
+
+        assert response.status == "not_found"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_without_store(self):
+        """Test tasks are kept in memory when the store is unavailable."""
+        store = AsyncMock(spec=TaskStore)
+        store.upsert.side_effect = RuntimeError("no database")
+        store.list_user_tasks.side_effect = RuntimeError("no database")
+        store.compact.return_value = 0
+        service = TaskService(store)
+
+        for i in range(3):
+            await service.create_task(f"task-{i}", user_id="alice")
+
+        first = await service.list_user_tasks("alice", limit=2)
+        second = await service.list_user_tasks(
+            "alice", limit=2, cursor=first.next_cursor
+        )
+
+        assert len(first.tasks) == 2
+        assert first.next_cursor is not None
+        assert len(second.tasks) == 1
+        assert second.next_cursor is None
+        assert "task-0" in service.tasks
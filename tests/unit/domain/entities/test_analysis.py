@@ -7,7 +7,7 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.analysis import Analysis, AnalysisType, summarize_results
 
 
 @pytest.mark.unit
@@ -645,6 +645,47 @@ class TestAnalysisMetadata:
         assert analysis.metadata == expected_metadata
 
 
+@pytest.mark.unit
+class TestAnalysisSummary:
+    """Test the compact summary of results kept on the analysis."""
+
+    def test_summarize_results_omits_section_analyses(self):
+        """Test the summary keeps the summary fields and section names only."""
+        results = {
+            "filing_summary": "Annual report",
+            "key_insights": ["Revenue grew"],
+            "section_analyses": [
+                {"section_name": "Business", "sub_sections": [{"text": "..."}]},
+                {"section_name": "Risk Factors", "sub_sections": []},
+            ],
+        }
+
+        summary = summarize_results(results)
+
+        assert summary["filing_summary"] == "Annual report"
+        assert summary["key_insights"] == ["Revenue grew"]
+        assert summary["risk_factors"] is None
+        assert summary["sections_analyzed"] == 2
+        assert summary["section_names"] == ["Business", "Risk Factors"]
+        assert "section_analyses" not in summary
+
+    def test_update_summary(self):
+        """Test recording a summary, which is returned as a copy."""
+        analysis = Analysis(
+            id=uuid.uuid4(),
+            filing_id=uuid.uuid4(),
+            analysis_type=AnalysisType.FILING_ANALYSIS,
+            created_by="test-user",
+        )
+        assert analysis.summary is None
+
+        analysis.update_summary({"executive_summary": "Strong year"})
+        analysis.summary["executive_summary"] = "modified"
+
+        assert analysis.summary["executive_summary"] == "Strong year"
+        assert analysis.summary["sections_analyzed"] == 0
+
+
 @pytest.mark.unit
 class TestAnalysisAPIFormatting:
     """Test Analysis API response formatting methods."""
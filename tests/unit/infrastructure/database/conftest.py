@@ -0,0 +1,27 @@
+"""Shared fixtures for database tests."""
+
+import pytest
+from sqlalchemy import event
+
+from src.infrastructure.database.cache import cache_manager
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from cached lookups of other tests."""
+    cache_manager.clear_all()
+    yield
+    cache_manager.clear_all()
+
+
+@pytest.fixture
+def statements(async_engine):
+    """SQL statements executed on the engine during the test."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
@@ -0,0 +1,181 @@
+"""Unit tests for set-based bulk writes."""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.infrastructure.database.models import CompanyTicker as CompanyTickerModel
+from src.infrastructure.database.models import Filing as FilingModel
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.filing_repository import FilingRepository
+
+
+@pytest.fixture
+async def company(async_session) -> Company:
+    """Stored company the filings belong to."""
+    return await CompanyRepository(async_session).create(
+        Company(id=uuid4(), cik=CIK("320193"), name="Apple", metadata={})
+    )
+
+
+def make_filing(company_id, number: int, **kwargs) -> Filing:
+    """Create a filing entity with a unique accession number."""
+    return Filing(
+        id=uuid4(),
+        company_id=company_id,
+        accession_number=AccessionNumber(f"0000320193-24-{number:06d}"),
+        filing_type=FilingType.FORM_10K,
+        filing_date=date(2024, 1, 1),
+        processing_status=kwargs.pop("processing_status", ProcessingStatus.PENDING),
+        **kwargs,
+    )
+
+
+class TestBulkCreate:
+    """Test multi-row INSERTs of new entities."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_in_chunks(self, async_session, company, statements):
+        """Test thousands of filings are inserted with a handful of statements."""
+        repository = FilingRepository(async_session)
+        filings = [make_filing(company.id, i) for i in range(2500)]
+        statements.clear()
+
+        inserted = await repository.bulk_create(filings)
+
+        assert inserted == 2500
+        assert len([s for s in statements if s.startswith("INSERT INTO filings")]) == 3
+        assert await async_session.scalar(select(func.count(FilingModel.id))) == 2500
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_accession_numbers(self, async_session, company):
+        """Test re-importing filings leaves the stored rows untouched."""
+        repository = FilingRepository(async_session)
+        existing = await repository.create(make_filing(company.id, 1))
+        # Same accession number under a new id
+        duplicate = make_filing(company.id, 1)
+
+        inserted = await repository.bulk_create([duplicate, make_filing(company.id, 2)])
+
+        assert inserted == 1
+        stored = await repository.get_by_accession_number(existing.accession_number)
+        assert stored.id == existing.id
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_lists(self, async_session, company):
+        """Test cached filing lists include bulk-created filings."""
+        repository = FilingRepository(async_session)
+        assert await repository.get_by_company_id(company.id) == []
+
+        await repository.bulk_create([make_filing(company.id, 1)])
+
+        assert len(await repository.get_by_company_id(company.id)) == 1
+
+    @pytest.mark.asyncio
+    async def test_companies_with_tickers(self, async_session):
+        """Test bulk-created companies get their ticker rows."""
+        repository = CompanyRepository(async_session)
+        await repository.create(
+            Company(id=uuid4(), cik=CIK("320193"), name="Apple", metadata={})
+        )
+        companies = [
+            # Already stored under another id
+            Company(
+                id=uuid4(), cik=CIK("320193"), name="Apple", metadata={"ticker": "AAPL"}
+            ),
+            Company(
+                id=uuid4(),
+                cik=CIK("1067983"),
+                name="Berkshire Hathaway",
+                metadata={"ticker": "BRK.A", "tickers": ["BRK.B"]},
+            ),
+        ]
+
+        inserted = await repository.bulk_create(companies)
+
+        assert inserted == 1
+        rows = (await async_session.execute(select(CompanyTickerModel))).scalars()
+        assert {(row.company_id, row.ticker) for row in rows} == {
+            (companies[1].id, "BRK.A"),
+            (companies[1].id, "BRK.B"),
+        }
+
+
+class TestMergeFreeUpdate:
+    """Test updates issued as a single UPDATE by primary key."""
+
+    @pytest.mark.asyncio
+    async def test_updates_row(self, async_session, company, statements):
+        """Test an update is one UPDATE statement without a prior SELECT."""
+        repository = FilingRepository(async_session)
+        filing = await repository.create(make_filing(company.id, 1))
+        filing.mark_as_processing()
+        statements.clear()
+
+        await repository.update(filing)
+
+        writes = [s for s in statements if s.startswith("UPDATE filings")]
+        assert len(writes) == 1
+        # The company stats refresh aggregates, it does not reload the row
+        assert not any(
+            s.startswith("SELECT") and "filings.id = ?" in s for s in statements
+        )
+        stored = await async_session.get(FilingModel, filing.id)
+        await async_session.refresh(stored)
+        assert stored.processing_status == ProcessingStatus.PROCESSING.value
+
+    @pytest.mark.asyncio
+    async def test_inserts_missing_row(self, async_session, company):
+        """Test updating a filing that is not stored yet creates it."""
+        repository = FilingRepository(async_session)
+        filing = make_filing(company.id, 1)
+
+        await repository.update(filing)
+
+        assert (await repository.get_by_id(filing.id)).id == filing.id
+
+    @pytest.mark.asyncio
+    async def test_invalidates_accession_lookup(self, async_session, company):
+        """Test the cached lookup by accession number sees the update."""
+        repository = FilingRepository(async_session)
+        filing = await repository.create(make_filing(company.id, 1))
+        await repository.get_by_accession_number(filing.accession_number)
+
+        filing.mark_as_processing()
+        await repository.update(filing)
+
+        cached = await repository.get_by_accession_number(filing.accession_number)
+        assert cached.processing_status == ProcessingStatus.PROCESSING
+
+
+class TestBatchUpdateStatus:
+    """Test status updates of many filings at once."""
+
+    @pytest.mark.asyncio
+    async def test_single_update(self, async_session, company, statements):
+        """Test the statuses are set with one UPDATE and caches invalidated."""
+        repository = FilingRepository(async_session)
+        filings = [
+            await repository.create(make_filing(company.id, i)) for i in range(3)
+        ]
+        await repository.get_by_id(filings[0].id)
+        statements.clear()
+
+        updated = await repository.batch_update_status(
+            [filings[0].id, filings[1].id, uuid4()], ProcessingStatus.COMPLETED
+        )
+
+        assert updated == 2
+        assert len([s for s in statements if s.startswith("UPDATE filings")]) == 1
+        cached = await repository.get_by_id(filings[0].id)
+        assert cached.processing_status == ProcessingStatus.COMPLETED
+        untouched = await repository.get_by_id(filings[2].id)
+        assert untouched.processing_status == ProcessingStatus.PENDING
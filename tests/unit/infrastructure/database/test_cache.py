@@ -0,0 +1,121 @@
+"""Unit tests for tag-based invalidation in CacheManager."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.database.cache import (
+    CacheManager,
+    CacheRegionName,
+    filing_list_tag,
+    filing_write_tags,
+)
+
+
+class Creator:
+    """Counts how often a cached value is created."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class TestTagInvalidation:
+    """Test invalidating tagged query results."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = CacheManager()
+        self.company_a = uuid4()
+        self.company_b = uuid4()
+
+    def _cached_list(self, company_id, filing_type, creator):
+        return self.manager.get_or_create(
+            CacheRegionName.QUERY,
+            f"filing:company:{company_id}:type:{filing_type}",
+            creator,
+            tags=[filing_list_tag(company_id, filing_type)],
+        )
+
+    def test_write_invalidates_only_touched_company(self):
+        """Test a filing write keeps other companies' lists cached."""
+        list_a = Creator(["a"])
+        list_b = Creator(["b"])
+        self._cached_list(self.company_a, "10-K", list_a)
+        self._cached_list(self.company_b, "10-K", list_b)
+
+        self.manager.invalidate_tags(*filing_write_tags(self.company_a, "10-K"))
+        self._cached_list(self.company_a, "10-K", list_a)
+        self._cached_list(self.company_b, "10-K", list_b)
+
+        assert list_a.calls == 2
+        assert list_b.calls == 1
+
+    def test_write_invalidates_only_touched_filing_type(self):
+        """Test a 10-Q write keeps the company's 10-K list cached."""
+        annual = Creator(["10-K"])
+        quarterly = Creator(["10-Q"])
+        self._cached_list(self.company_a, "10-K", annual)
+        self._cached_list(self.company_a, "10-Q", quarterly)
+
+        self.manager.invalidate_tags(*filing_write_tags(self.company_a, "10-Q"))
+        self._cached_list(self.company_a, "10-K", annual)
+        self._cached_list(self.company_a, "10-Q", quarterly)
+
+        assert annual.calls == 1
+        assert quarterly.calls == 2
+
+    def test_unfiltered_list_invalidated_by_any_type(self):
+        """Test the company-wide list is invalidated by a write of any type."""
+        all_filings = Creator(["10-K", "10-Q"])
+        self._cached_list(self.company_a, None, all_filings)
+
+        self.manager.invalidate_tags(*filing_write_tags(self.company_a, "8-K"))
+        self._cached_list(self.company_a, None, all_filings)
+
+        assert all_filings.calls == 2
+
+    def test_unknown_type_invalidates_all_type_lists(self):
+        """Test invalidating a filing of unknown type covers every type list."""
+        annual = Creator(["10-K"])
+        self._cached_list(self.company_a, "10-K", annual)
+
+        self.manager.invalidate_filing(company_id=str(self.company_a))
+        self._cached_list(self.company_a, "10-K", annual)
+
+        assert annual.calls == 2
+
+    def test_stale_hits_do_not_count_towards_hit_ratio(self):
+        """Test hits on invalidated entries are reported as stale."""
+        creator = Creator(["a"])
+        self._cached_list(self.company_a, "10-K", creator)
+        self.manager.invalidate_tags(filing_list_tag(self.company_a, "10-K"))
+
+        self._cached_list(self.company_a, "10-K", creator)
+
+        stats = self.manager.get_stats()["query"]
+        assert stats["stale"] == 1
+        assert stats["hit_ratio"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_async_creator_with_tags(self):
+        """Test tagged values work with async creators."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return ["a"]
+
+        tags = [filing_list_tag(self.company_a)]
+        for _ in range(2):
+            value = await self.manager.get_or_create_async(
+                CacheRegionName.QUERY, "key", fetch, tags=tags
+            )
+
+        assert value == ["a"]
+        assert calls == 1
@@ -0,0 +1,191 @@
+"""Unit tests for the bounded, tiered cache backend."""
+
+import pickle
+
+import pytest
+from dogpile.cache import make_region
+from dogpile.cache.api import NO_VALUE
+
+from src.infrastructure.database.cache import CacheManager, CacheRegionName
+from src.infrastructure.database.cache_backends import (
+    TIERED_MEMORY_BACKEND,
+    TieredMemoryBackend,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_backend_region(**arguments):
+    """Create a region using the tiered backend."""
+    return make_region().configure(
+        TIERED_MEMORY_BACKEND,
+        expiration_time=arguments.get("expiration_time"),
+        arguments=arguments,
+    )
+
+
+class TestInProcessTier:
+    """Test bounds, TTLs and metrics of the in-process tier."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the coldest entry is evicted when the entry bound is hit."""
+        region = make_backend_region(max_entries=2)
+        region.set("a", 1)
+        region.set("b", 2)
+        region.get("a")
+
+        region.set("c", 3)
+
+        assert region.get("b") is NO_VALUE
+        assert region.get("a") == 1
+        assert region.get("c") == 3
+        assert region.backend.stats.evictions == 1
+
+    def test_byte_bound(self):
+        """Test entries are evicted to stay under the byte budget."""
+        region = make_backend_region(max_entries=100, max_bytes=3000)
+
+        for i in range(10):
+            region.set(f"key-{i}", "x" * 1000)
+
+        stats = region.backend.stats
+        assert stats.bytes <= 3000
+        assert stats.entries == len(region.backend._entries) < 10
+
+    def test_entries_expire(self):
+        """Test entries are dropped from memory once their TTL elapses."""
+        clock = FakeClock()
+        region = make_backend_region(max_entries=10, expiration_time=60, clock=clock)
+        region.set("a", 1)
+
+        clock.now += 61
+
+        assert region.backend.get("a") is NO_VALUE
+        assert region.backend.stats.expirations == 1
+        assert region.backend.stats.entries == 0
+
+    def test_hit_ratio(self):
+        """Test hits and misses are counted per region."""
+        region = make_backend_region()
+        region.set("a", 1)
+
+        region.get("a")
+        region.get("a")
+        region.get("a")
+        region.get("missing")
+
+        assert region.backend.stats.as_dict()["hit_ratio"] == 0.75
+
+
+class TestSharedTier:
+    """Test hits shared between processes through the shared tier."""
+
+    @pytest.fixture
+    def shared_arguments(self, tmp_path):
+        """File-backed shared tier arguments."""
+        return {
+            "namespace": "filing",
+            "sync_interval": 0,
+            "shared_backend": "dogpile.cache.dbm",
+            "shared_arguments": {"filename": str(tmp_path / "filing.dbm")},
+            "signing_key": "secret",
+        }
+
+    def test_hit_from_other_process(self, shared_arguments):
+        """Test a value cached by one process is served to another."""
+        api = make_backend_region(**shared_arguments)
+        worker = make_backend_region(**shared_arguments)
+
+        api.set("filing:id:1", {"status": "COMPLETED"})
+
+        assert worker.get("filing:id:1") == {"status": "COMPLETED"}
+        assert worker.backend.stats.shared_hits == 1
+        # The value is now held in the worker's in-process tier
+        assert worker.get("filing:id:1") == {"status": "COMPLETED"}
+        assert worker.backend.stats.shared_hits == 1
+
+    def test_delete_reaches_shared_tier(self, shared_arguments):
+        """Test deleting a key removes it for every process."""
+        api = make_backend_region(**shared_arguments)
+        worker = make_backend_region(**shared_arguments)
+        api.set("filing:id:1", "cached")
+        worker.get("filing:id:1")
+
+        worker.delete("filing:id:1")
+
+        fresh = make_backend_region(**shared_arguments)
+        assert fresh.get("filing:id:1") is NO_VALUE
+
+    def test_invalidate_propagates(self, shared_arguments):
+        """Test invalidating a region drops other processes' entries."""
+        api = make_backend_region(**shared_arguments)
+        worker = make_backend_region(**shared_arguments)
+        api.set("query", "stale")
+        assert worker.get("query") == "stale"
+
+        api.backend.invalidate()
+
+        assert worker.get("query") is NO_VALUE
+        assert worker.backend.stats.entries == 0
+
+    def test_unsigned_values_ignored(self, shared_arguments):
+        """Test values not signed with the key are never unpickled."""
+        api = make_backend_region(**shared_arguments)
+        api.set("filing:id:1", "cached")
+        other_key = make_backend_region(**{**shared_arguments, "signing_key": "x"})
+
+        assert other_key.get("filing:id:1") is NO_VALUE
+
+        key = api.backend._shared_key("filing:id:1")
+        forged = pickle.dumps(api.backend._shared_get(key))
+        api.backend.shared.set_serialized(key, forged)
+
+        assert make_backend_region(**shared_arguments).get("filing:id:1") is NO_VALUE
+
+    def test_shared_tier_requires_signing_key(self, shared_arguments):
+        """Test the shared tier is not used without a signing key."""
+        backend = TieredMemoryBackend({**shared_arguments, "signing_key": ""})
+
+        assert backend.shared is None
+
+    def test_unavailable_shared_backend_falls_back(self):
+        """Test a broken shared tier leaves the in-process tier working."""
+        backend = TieredMemoryBackend(
+            {"shared_backend": "no.such.backend", "signing_key": "secret"}
+        )
+
+        assert backend.shared is None
+
+
+class TestCacheManagerMetrics:
+    """Test CacheManager exposes region metrics."""
+
+    def test_get_stats(self):
+        """Test stats are reported for every region."""
+        manager = CacheManager()
+        manager.get_or_create(CacheRegionName.COMPANY, "company:id:1", lambda: "c")
+        manager.get_or_create(CacheRegionName.COMPANY, "company:id:1", lambda: "c")
+
+        stats = manager.get_stats()
+
+        assert set(stats) == {region.value for region in CacheRegionName} | {"tags"}
+        assert stats["company"]["hits"] == 1
+        assert stats["company"]["misses"] == 1
+        assert stats["company"]["entries"] == 1
+
+    def test_invalidate_region_frees_memory(self):
+        """Test invalidating a region releases its in-process entries."""
+        manager = CacheManager()
+        manager.get_or_create(CacheRegionName.QUERY, "q", lambda: [1, 2, 3])
+
+        manager.invalidate_region(CacheRegionName.QUERY)
+
+        assert manager.get_stats()["query"]["entries"] == 0
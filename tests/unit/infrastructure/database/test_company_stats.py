@@ -0,0 +1,260 @@
+"""Unit tests for the denormalized company statistics table."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from src.application.queries.handlers.list_company_filings_handler import (
+    ListCompanyFilingsQueryHandler,
+)
+from src.application.schemas.queries.list_company_filings import (
+    ListCompanyFilingsQuery,
+)
+from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.domain.value_objects.ticker import Ticker
+from src.infrastructure.database.models import CompanyStats as CompanyStatsModel
+from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatistics,
+    CompanyStatsRepository,
+)
+from src.infrastructure.repositories.filing_repository import FilingRepository
+
+
+@pytest.fixture
+async def company(async_session) -> Company:
+    """Stored company the filings belong to."""
+    return await CompanyRepository(async_session).create(
+        Company(
+            id=uuid4(), cik=CIK("320193"), name="Apple", metadata={"ticker": "AAPL"}
+        )
+    )
+
+
+@pytest.fixture
+async def filings(async_session, company) -> list[Filing]:
+    """Two annual and one quarterly filing of the company."""
+    repository = FilingRepository(async_session)
+    created = []
+    for i, (filing_type, filing_date) in enumerate(
+        [
+            (FilingType.FORM_10K, date(2023, 11, 3)),
+            (FilingType.FORM_10K, date(2024, 11, 1)),
+            (FilingType.FORM_10Q, date(2024, 8, 2)),
+        ]
+    ):
+        created.append(
+            await repository.create(
+                Filing(
+                    id=uuid4(),
+                    company_id=company.id,
+                    accession_number=AccessionNumber(f"0000320193-24-00000{i}"),
+                    filing_type=filing_type,
+                    filing_date=filing_date,
+                    processing_status=ProcessingStatus.COMPLETED,
+                )
+            )
+        )
+    return created
+
+
+def make_analysis(filing: Filing, day: int, confidence: float) -> Analysis:
+    """Create an analysis of a filing created on a day of January 2025."""
+    return Analysis(
+        id=uuid4(),
+        filing_id=filing.id,
+        analysis_type=AnalysisType.COMPREHENSIVE,
+        created_by="analyst@example.com",
+        llm_provider="openai",
+        llm_model="gpt-4",
+        confidence_score=confidence,
+        created_at=datetime(2025, 1, day, tzinfo=UTC),
+    )
+
+
+class TestIncrementalMaintenance:
+    """Test statistics follow filing and analysis writes."""
+
+    @pytest.mark.asyncio
+    async def test_filing_writes(self, async_session, company, filings):
+        """Test filing counts and the latest filing date track filing writes."""
+        stats = CompanyStatsRepository(async_session)
+
+        statistics = await stats.get_by_company_id(company.id)
+        assert statistics.filing_count == 3
+        assert statistics.filing_counts_by_type == {"10-K": 2, "10-Q": 1}
+        assert statistics.latest_filing_date == date(2024, 11, 1)
+
+        await FilingRepository(async_session).delete(filings[1].id)
+
+        statistics = await stats.get_by_company_id(company.id)
+        assert statistics.filing_count == 2
+        assert statistics.filing_counts_by_type == {"10-K": 1, "10-Q": 1}
+        assert statistics.latest_filing_date == date(2024, 8, 2)
+
+    @pytest.mark.asyncio
+    async def test_analysis_writes(self, async_session, company, filings):
+        """Test the analysis count and latest analysis track analysis writes."""
+        repository = AnalysisRepository(async_session)
+        stats = CompanyStatsRepository(async_session)
+        older = await repository.create(make_analysis(filings[0], 1, 0.7))
+        latest = await repository.create(make_analysis(filings[2], 2, 0.9))
+
+        statistics = await stats.get_by_company_id(company.id)
+        assert statistics.analysis_count == 2
+        assert statistics.latest_analysis_id == latest.id
+        assert statistics.latest_analysis_confidence == 0.9
+
+        await repository.delete(latest.id)
+
+        statistics = await stats.get_by_company_id(company.id)
+        assert statistics.analysis_count == 1
+        assert statistics.latest_analysis_id == older.id
+        assert statistics.latest_analysis_confidence == 0.7
+
+    @pytest.mark.asyncio
+    async def test_bulk_created_filings(self, async_session, company, filings):
+        """Test bulk-created filings are counted."""
+        await FilingRepository(async_session).bulk_create(
+            [
+                Filing(
+                    id=uuid4(),
+                    company_id=company.id,
+                    accession_number=AccessionNumber("0000320193-24-000010"),
+                    filing_type=FilingType.FORM_8K,
+                    filing_date=date(2025, 1, 2),
+                )
+            ]
+        )
+
+        statistics = await CompanyStatsRepository(async_session).get_by_company_id(
+            company.id
+        )
+        assert statistics.filing_count == 4
+        assert statistics.filing_counts_by_type["8-K"] == 1
+        assert statistics.latest_filing_date == date(2025, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_updates_outside_statistics_skip_refresh(
+        self, async_session, company, filings
+    ):
+        """Test summary and status updates do not recompute the statistics."""
+        analyses = AnalysisRepository(async_session)
+        filing_repository = FilingRepository(async_session)
+        analysis = await analyses.create(make_analysis(filings[0], 1, 0.7))
+        analyses.company_stats.refresh_for_filings = AsyncMock()
+        filing_repository.company_stats.refresh = AsyncMock()
+
+        analysis.update_summary({"filing_summary": "Summary"})
+        await analyses.update(analysis)
+        filings[2].mark_as_processing()
+        await filing_repository.update(filings[2])
+
+        analyses.company_stats.refresh_for_filings.assert_not_called()
+        filing_repository.company_stats.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_confidence_update_refreshes(self, async_session, company, filings):
+        """Test updating the confidence of the latest analysis is reflected."""
+        repository = AnalysisRepository(async_session)
+        analysis = await repository.create(make_analysis(filings[0], 1, 0.7))
+
+        analysis.update_confidence_score(0.95)
+        await repository.update(analysis)
+
+        statistics = await CompanyStatsRepository(async_session).get_by_company_id(
+            company.id
+        )
+        assert statistics.latest_analysis_confidence == 0.95
+
+
+class TestRebuild:
+    """Test recomputing the whole table."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_restores_rows(self, async_session, company, filings):
+        """Test rebuilding recreates rows lost outside the repositories."""
+        stats = CompanyStatsRepository(async_session)
+        expected = await stats.get_by_company_id(company.id)
+        await async_session.execute(delete(CompanyStatsModel))
+        async_session.expunge_all()
+
+        refreshed = await stats.rebuild(batch_size=1)
+
+        assert refreshed == 1
+        assert await stats.get_by_company_id(company.id) == expected
+
+    @pytest.mark.asyncio
+    async def test_company_without_filings(self, async_session, company):
+        """Test companies without filings get empty statistics."""
+        stats = CompanyStatsRepository(async_session)
+
+        await stats.rebuild()
+
+        assert await stats.get_by_company_id(company.id) == CompanyStatistics(
+            company_id=company.id
+        )
+
+
+class TestStatisticsReads:
+    """Test readers of the statistics."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_ticker(self, async_session, company, filings):
+        """Test statistics are found by the company's ticker."""
+        stats = CompanyStatsRepository(async_session)
+
+        statistics = await stats.get_by_ticker(Ticker("AAPL"))
+
+        assert statistics.company_id == company.id
+        assert await stats.get_by_ticker(Ticker("MSFT")) is None
+
+    def test_to_dict(self):
+        """Test statistics serialize to JSON-compatible values."""
+        analysis_id = uuid4()
+        statistics = CompanyStatistics(
+            company_id=uuid4(),
+            filing_count=1,
+            filing_counts_by_type={"10-K": 1},
+            latest_filing_date=date(2024, 11, 1),
+            analysis_count=1,
+            latest_analysis_id=analysis_id,
+            latest_analysis_confidence=0.9,
+            latest_analysis_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+
+        assert statistics.to_dict() == {
+            "filing_count": 1,
+            "filing_counts_by_type": {"10-K": 1},
+            "latest_filing_date": "2024-11-01",
+            "analysis_count": 1,
+            "latest_analysis_id": str(analysis_id),
+            "latest_analysis_confidence": 0.9,
+            "latest_analysis_at": "2025-01-01T00:00:00+00:00",
+        }
+
+    @pytest.mark.asyncio
+    async def test_filing_list_counts_from_statistics(
+        self, async_session, company, filings
+    ):
+        """Test unfiltered filing list totals match the aggregate count."""
+        handler = ListCompanyFilingsQueryHandler(
+            FilingRepository(async_session), CompanyStatsRepository(async_session)
+        )
+
+        response = await handler.handle(
+            ListCompanyFilingsQuery(ticker="AAPL", filing_type=FilingType.FORM_10K)
+        )
+
+        assert response.pagination.total_items == 2
+        assert len(response.items) == 2
@@ -0,0 +1,249 @@
+"""Unit tests for keyset (cursor) pagination."""
+
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.application.queries.handlers.list_analyses_handler import (
+    ListAnalysesQueryHandler,
+)
+from src.application.schemas.queries.list_analyses import (
+    AnalysisSortField,
+    ListAnalysesQuery,
+    SortDirection,
+)
+from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.domain.value_objects.ticker import Ticker
+from src.infrastructure.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from src.infrastructure.repositories.analysis_repository import (
+    AnalysisRepository,
+    analysis_cursor,
+)
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.filing_repository import (
+    FilingRepository,
+    filing_cursor,
+)
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+async def analyses(async_session) -> list[Analysis]:
+    """Analyses with tied creation dates and missing confidence scores."""
+    repository = AnalysisRepository(async_session)
+    created = []
+    for i in range(7):
+        analysis = Analysis(
+            id=uuid4(),
+            filing_id=uuid4(),
+            analysis_type=AnalysisType.FILING_ANALYSIS,
+            created_by="analyst@example.com",
+            llm_provider="openai",
+            llm_model="gpt-4",
+            confidence_score=None if i % 3 == 0 else 0.5 + (i % 2) / 10,
+            # Pairs of analyses share a creation date
+            created_at=BASE_TIME + timedelta(minutes=i // 2),
+        )
+        created.append(await repository.create(analysis))
+    await async_session.commit()
+    return created
+
+
+async def walk_analyses(repository, page_size, sort_by, direction):
+    """Collect every page of analyses by following cursors."""
+    pages = []
+    cursor = None
+    while True:
+        page = await repository.find_with_filters(
+            sort_by=sort_by,
+            sort_direction=direction,
+            page_size=page_size,
+            cursor=cursor,
+        )
+        if not page:
+            return pages
+        pages.append(page)
+        cursor = analysis_cursor(page[-1], sort_by, direction)
+
+
+class TestCursor:
+    """Test cursor encoding."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC), date(2025, 1, 2), 0.75, "10-K"],
+    )
+    def test_round_trip(self, value):
+        """Test a cursor decodes to the position it was built from."""
+        row_id = uuid4()
+
+        cursor = encode_cursor("field", "desc", value, row_id)
+
+        assert decode_cursor(cursor, "field", "desc") == (value, row_id)
+
+    def test_null_value(self):
+        """Test rows without a sort value can be cursor positions."""
+        row_id = uuid4()
+
+        cursor = encode_cursor("confidence_score", "asc", None, row_id)
+
+        assert decode_cursor(cursor, "confidence_score", "asc") == (None, row_id)
+
+    def test_malformed_cursor(self):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor", "created_at", "desc")
+
+    def test_cursor_for_other_sort_order(self):
+        """Test a cursor cannot be replayed with a different sort order."""
+        cursor = encode_cursor("created_at", "desc", BASE_TIME, uuid4())
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "created_at", "asc")
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "confidence_score", "desc")
+
+
+class TestAnalysisKeysetPagination:
+    """Test walking analyses with cursors."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("sort_by", "direction"),
+        [
+            (AnalysisSortField.CREATED_AT, SortDirection.DESC),
+            (AnalysisSortField.CREATED_AT, SortDirection.ASC),
+            (AnalysisSortField.CONFIDENCE_SCORE, SortDirection.DESC),
+            (AnalysisSortField.CONFIDENCE_SCORE, SortDirection.ASC),
+        ],
+    )
+    async def test_cursor_pages_match_offset_order(
+        self, async_session, analyses, sort_by, direction
+    ):
+        """Test cursor pages cover every row once, in offset order."""
+        repository = AnalysisRepository(async_session)
+        ordered = await repository.find_with_filters(
+            sort_by=sort_by, sort_direction=direction, page_size=100
+        )
+
+        pages = await walk_analyses(repository, 3, sort_by, direction)
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        walked = [analysis.id for page in pages for analysis in page]
+        assert walked == [analysis.id for analysis in ordered]
+        assert len(set(walked)) == len(analyses)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("direction", "nulls_first"),
+        [(SortDirection.ASC, True), (SortDirection.DESC, False)],
+    )
+    async def test_missing_scores_sort_lowest(
+        self, async_session, analyses, direction, nulls_first
+    ):
+        """Test analyses without a score come first ascending, last descending."""
+        repository = AnalysisRepository(async_session)
+
+        pages = await walk_analyses(
+            repository, 2, AnalysisSortField.CONFIDENCE_SCORE, direction
+        )
+
+        scores = [analysis.confidence_score for page in pages for analysis in page]
+        missing = scores[:3] if nulls_first else scores[-3:]
+        assert missing == [None, None, None]
+        assert None not in (scores[3:] if nulls_first else scores[:-3])
+
+
+class TestFilingKeysetPagination:
+    """Test walking a company's filings with cursors."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages(self, async_session):
+        """Test filings sharing a filing date are neither skipped nor repeated."""
+        company = await CompanyRepository(async_session).create(
+            Company(
+                id=uuid4(), cik=CIK("320193"), name="Apple", metadata={"ticker": "AAPL"}
+            )
+        )
+        repository = FilingRepository(async_session)
+        for i in range(5):
+            await repository.create(
+                Filing(
+                    id=uuid4(),
+                    company_id=company.id,
+                    accession_number=AccessionNumber(f"0000320193-24-00000{i}"),
+                    filing_type=FilingType.FORM_10Q,
+                    filing_date=date(2024, 1 + i // 2, 1),
+                    processing_status=ProcessingStatus.COMPLETED,
+                )
+            )
+
+        walked = []
+        cursor = None
+        while True:
+            page = await repository.get_by_ticker_with_filters(
+                Ticker("AAPL"), page_size=2, cursor=cursor
+            )
+            if not page:
+                break
+            walked.extend(page)
+            cursor = filing_cursor(page[-1], "filing_date", "desc")
+
+        ordered = await repository.get_by_ticker_with_filters(
+            Ticker("AAPL"), page_size=10
+        )
+        assert [f.id for f in walked] == [f.id for f in ordered]
+        assert len({f.id for f in walked}) == 5
+
+
+class TestListAnalysesCursorResponses:
+    """Test cursors in paginated list responses."""
+
+    @pytest.mark.asyncio
+    async def test_follow_next_cursor_without_counts(self, async_session, analyses):
+        """Test clients can page through results using next_cursor only."""
+        handler = ListAnalysesQueryHandler(AnalysisRepository(async_session))
+
+        seen = []
+        cursor = None
+        while True:
+            response = await handler.handle(
+                ListAnalysesQuery(page_size=3, cursor=cursor, include_total=False)
+            )
+            seen.extend(item.analysis_id for item in response.items)
+            assert response.pagination.total_items is None
+            if not response.pagination.has_next:
+                break
+            cursor = response.pagination.next_cursor
+
+        assert len(seen) == len(set(seen)) == len(analyses)
+
+    @pytest.mark.asyncio
+    async def test_first_page_has_cursor_and_total(self, async_session, analyses):
+        """Test an offset request also returns the cursor of the next page."""
+        handler = ListAnalysesQueryHandler(AnalysisRepository(async_session))
+
+        response = await handler.handle(ListAnalysesQuery(page_size=5))
+
+        assert response.pagination.total_items == 7
+        assert response.pagination.has_next
+        assert response.pagination.next_cursor is not None
+
+        last = await handler.handle(
+            ListAnalysesQuery(page_size=5, cursor=response.pagination.next_cursor)
+        )
+        assert len(last.items) == 2
+        assert not last.pagination.has_next
+        assert last.pagination.next_cursor is None
@@ -0,0 +1,111 @@
+"""Unit tests for column-projection list queries."""
+
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.domain.value_objects.ticker import Ticker
+from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.filing_repository import FilingRepository
+
+
+@pytest.fixture
+async def filing(async_session) -> Filing:
+    """Stored filing of a stored company."""
+    company = await CompanyRepository(async_session).create(
+        Company(
+            id=uuid4(), cik=CIK("320193"), name="Apple", metadata={"ticker": "AAPL"}
+        )
+    )
+    return await FilingRepository(async_session).create(
+        Filing(
+            id=uuid4(),
+            company_id=company.id,
+            accession_number=AccessionNumber("0000320193-24-000001"),
+            filing_type=FilingType.FORM_10K,
+            filing_date=date(2024, 1, 1),
+            processing_status=ProcessingStatus.COMPLETED,
+        )
+    )
+
+
+@pytest.fixture
+async def analysis(async_session, filing) -> Analysis:
+    """Stored analysis with a recorded processing time."""
+    analysis = Analysis(
+        id=uuid4(),
+        filing_id=filing.id,
+        analysis_type=AnalysisType.COMPREHENSIVE,
+        created_by="analyst@example.com",
+        llm_provider="openai",
+        llm_model="gpt-4",
+        confidence_score=0.9,
+        metadata={"processing_time_seconds": 12.5, "large": ["x"] * 100},
+        created_at=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+    await AnalysisRepository(async_session).create(analysis)
+    await async_session.commit()
+    return analysis
+
+
+class TestAnalysisSummaries:
+    """Test analysis summaries loaded by column projection."""
+
+    @pytest.mark.asyncio
+    async def test_summary_response_matches_entity_response(
+        self, async_session, analysis
+    ):
+        """Test summaries produce the same list response as full entities."""
+        repository = AnalysisRepository(async_session)
+
+        [summary] = await repository.find_summaries_with_filters()
+        [entity] = await repository.find_with_filters()
+
+        assert summary.processing_time_seconds == 12.5
+        expected = AnalysisResponse.summary_from_domain(entity)
+        assert AnalysisResponse.from_summary(summary) == expected
+
+    @pytest.mark.asyncio
+    async def test_company_filter(self, async_session, analysis):
+        """Test summaries can be filtered by company CIK."""
+        repository = AnalysisRepository(async_session)
+
+        assert len(await repository.find_summaries_with_filters(CIK("320193"))) == 1
+        assert await repository.find_summaries_with_filters(CIK("789019")) == []
+
+    @pytest.mark.asyncio
+    async def test_no_filing_or_company_join(self, async_session, analysis, statements):
+        """Test list queries no longer eager-load the filing and company."""
+        repository = AnalysisRepository(async_session)
+
+        await repository.find_summaries_with_filters()
+        await repository.find_with_filters()
+
+        assert len(statements) == 2
+        for statement in statements:
+            assert "JOIN" not in statement
+            assert "companies" not in statement
+
+
+class TestFilingListLoading:
+    """Test filing list queries skip the company eager load."""
+
+    @pytest.mark.asyncio
+    async def test_no_company_join(self, async_session, filing, statements):
+        """Test filings listed by ticker load without company rows."""
+        repository = FilingRepository(async_session)
+
+        filings = await repository.get_by_ticker_with_filters(Ticker("AAPL"))
+
+        assert [f.id for f in filings] == [filing.id]
+        assert "companies" not in statements[-1]
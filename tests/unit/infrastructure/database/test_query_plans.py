@@ -0,0 +1,300 @@
+"""Query-plan regression tests for hot repository queries.
+
+Each test records the statements a repository method executes against the
+seeded SQLite database and runs ``EXPLAIN QUERY PLAN`` on them. A plan that
+reads a table without an index fails the test.
+"""
+
+import re
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.application.schemas.queries.list_analyses import (
+    AnalysisSortField,
+    SortDirection,
+)
+from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.domain.value_objects.ticker import Ticker
+from src.infrastructure.database.base import Base
+from src.infrastructure.repositories.analysis_repository import (
+    AnalysisRepository,
+    analysis_cursor,
+)
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
+from src.infrastructure.repositories.filing_repository import FilingRepository
+
+# "SCAN <table>" reads every row of the table, or of one of its indexes,
+# where "SEARCH <table>" seeks a range of an index
+FULL_SCAN = re.compile(r"^SCAN (\w+)\b")
+
+
+@pytest.fixture
+async def seeded(async_session) -> dict:
+    """Companies with filings and analyses to plan queries against."""
+    companies = CompanyRepository(async_session)
+    filings = FilingRepository(async_session)
+    analyses = AnalysisRepository(async_session)
+
+    seeded: dict = {"companies": [], "filings": [], "analyses": []}
+    for c in range(3):
+        company = await companies.create(
+            Company(
+                id=uuid4(),
+                cik=CIK(str(320193 + c)),
+                name=f"Company {c}",
+                metadata={"ticker": f"TCK{c}"},
+            )
+        )
+        seeded["companies"].append(company)
+        for f in range(4):
+            filing = await filings.create(
+                Filing(
+                    id=uuid4(),
+                    company_id=company.id,
+                    accession_number=AccessionNumber(f"{320193 + c:010d}-24-{f:06d}"),
+                    filing_type=FilingType.FORM_10K if f % 2 else FilingType.FORM_10Q,
+                    filing_date=date(2024, 1 + f, 1),
+                    processing_status=(
+                        ProcessingStatus.PENDING
+                        if f == 0
+                        else ProcessingStatus.COMPLETED
+                    ),
+                )
+            )
+            seeded["filings"].append(filing)
+            seeded["analyses"].append(
+                await analyses.create(
+                    Analysis(
+                        id=uuid4(),
+                        filing_id=filing.id,
+                        analysis_type=AnalysisType.COMPREHENSIVE,
+                        created_by="analyst@example.com",
+                        llm_provider="openai",
+                        llm_model="gpt-4",
+                        confidence_score=0.8,
+                        created_at=datetime(2025, 1, 1 + f, tzinfo=UTC),
+                    )
+                )
+            )
+    await async_session.commit()
+    return seeded
+
+
+@pytest.fixture
+def explain(async_engine, async_session):
+    """Return the query plans of the SELECTs an awaitable executes."""
+    tables = set(Base.metadata.tables)
+    # Partial indexes only hold the rows a query asks for, so scanning them
+    # is not a full scan
+    partial_indexes = {
+        index.name
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+        if index.dialect_options["sqlite"]["where"] is not None
+    }
+
+    async def run(awaitable) -> list[list[str]]:
+        executed: list[tuple[str, tuple]] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                executed.append((statement, parameters))
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            await awaitable
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+        assert executed, "no query was executed"
+        connection = await async_session.connection()
+        plans = []
+        for statement, parameters in executed:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            plan = [row[-1] for row in result.all()]
+            scanned = [
+                match.group(1)
+                for step in plan
+                if (match := FULL_SCAN.match(step))
+                and match.group(1) in tables
+                and not any(index in step for index in partial_indexes)
+            ]
+            assert not scanned, f"full scan of {scanned} in:\n{statement}\n{plan}"
+            plans.append(plan)
+        return plans
+
+    return run
+
+
+def uses_index(plans: list[list[str]], index: str) -> bool:
+    """Whether any plan step reads through the index."""
+    return any(index in step for plan in plans for step in plan)
+
+
+class TestFilingQueryPlans:
+    """Test filing queries are served by indexes."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_company_id_with_type(self, async_session, seeded, explain):
+        """Test a company's filings of one type seek the composite index."""
+        repository = FilingRepository(async_session)
+        company = seeded["companies"][0]
+
+        plans = await explain(
+            repository.get_by_company_id(company.id, FilingType.FORM_10K)
+        )
+
+        assert uses_index(plans, "ix_filings_company_type_date_id")
+
+    @pytest.mark.asyncio
+    async def test_get_pending_filings(self, async_session, seeded, explain):
+        """Test the pending queue reads the status index in creation order."""
+        repository = FilingRepository(async_session)
+
+        plans = await explain(repository.get_pending_filings())
+
+        assert uses_index(plans, "ix_filings_status_created_at")
+        assert not any("TEMP B-TREE" in step for plan in plans for step in plan)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status",
+        [
+            ProcessingStatus.PROCESSING,
+            ProcessingStatus.COMPLETED,
+            ProcessingStatus.FAILED,
+        ],
+    )
+    async def test_get_by_other_status(self, async_session, seeded, explain, status):
+        """Test filings of any other status are read in creation order too."""
+        repository = FilingRepository(async_session)
+
+        plans = await explain(repository.get_by_status(status, limit=10))
+
+        assert uses_index(plans, "ix_filings_status_created_at")
+        assert not any("TEMP B-TREE" in step for plan in plans for step in plan)
+
+    @pytest.mark.asyncio
+    async def test_get_by_accession_number(self, async_session, seeded, explain):
+        """Test accession number lookups seek the unique index."""
+        repository = FilingRepository(async_session)
+        filing = seeded["filings"][0]
+
+        await explain(repository.get_by_accession_number(filing.accession_number))
+
+    @pytest.mark.asyncio
+    async def test_ticker_listing(self, async_session, seeded, explain):
+        """Test listing and counting a company's filings by ticker."""
+        repository = FilingRepository(async_session)
+
+        await explain(
+            repository.get_by_ticker_with_filters(
+                Ticker("TCK1"), filing_type=FilingType.FORM_10Q
+            )
+        )
+        await explain(repository.count_by_ticker_with_filters(Ticker("TCK1")))
+
+
+class TestAnalysisQueryPlans:
+    """Test analysis queries are served by indexes."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_filing_id_with_type(self, async_session, seeded, explain):
+        """Test a filing's analyses of one type seek the composite index."""
+        repository = AnalysisRepository(async_session)
+        filing = seeded["filings"][0]
+
+        plans = await explain(
+            repository.get_by_filing_id(filing.id, AnalysisType.COMPREHENSIVE)
+        )
+
+        assert uses_index(plans, "ix_analyses_filing_type_created_at")
+
+    @pytest.mark.asyncio
+    async def test_get_by_type(self, async_session, seeded, explain):
+        """Test analyses of a type are read newest first through an index."""
+        repository = AnalysisRepository(async_session)
+
+        await explain(repository.get_by_type(AnalysisType.COMPREHENSIVE, limit=5))
+
+    @pytest.mark.asyncio
+    async def test_get_by_user(self, async_session, seeded, explain):
+        """Test analyses of a user are found through an index."""
+        repository = AnalysisRepository(async_session)
+
+        await explain(repository.get_by_user("analyst@example.com"))
+
+    @pytest.mark.asyncio
+    async def test_company_listing(self, async_session, seeded, explain):
+        """Test the analyses of a company are listed and counted through indexes."""
+        repository = AnalysisRepository(async_session)
+        cik = seeded["companies"][0].cik
+
+        await explain(repository.find_summaries_with_filters(cik, page_size=5))
+        await explain(repository.count_with_filters(cik))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("sort_by", "index"),
+        [
+            (AnalysisSortField.CREATED_AT, "ix_analyses_created_at_id"),
+            (AnalysisSortField.CONFIDENCE_SCORE, "ix_analyses_confidence_id"),
+        ],
+    )
+    @pytest.mark.parametrize("direction", [SortDirection.DESC, SortDirection.ASC])
+    async def test_cursor_listing(
+        self, async_session, seeded, explain, sort_by, index, direction
+    ):
+        """Test cursor pages seek the keyset index in order instead of sorting."""
+        repository = AnalysisRepository(async_session)
+        first = await repository.find_summaries_with_filters(
+            sort_by=sort_by, sort_direction=direction, page_size=2
+        )
+        cursor = analysis_cursor(first[-1], sort_by, direction)
+
+        plans = await explain(
+            repository.find_summaries_with_filters(
+                sort_by=sort_by,
+                sort_direction=direction,
+                page_size=2,
+                cursor=cursor,
+            )
+        )
+
+        assert uses_index(plans, index)
+        assert not any("TEMP B-TREE" in step for plan in plans for step in plan)
+
+
+class TestCompanyQueryPlans:
+    """Test company queries are served by indexes."""
+
+    @pytest.mark.asyncio
+    async def test_lookups(self, async_session, seeded, explain):
+        """Test lookups by CIK and ticker seek indexes."""
+        repository = CompanyRepository(async_session)
+
+        await explain(repository.get_by_cik(seeded["companies"][0].cik))
+        await explain(repository.get_by_ticker(Ticker("TCK2")))
+
+    @pytest.mark.asyncio
+    async def test_statistics_refresh(self, async_session, seeded, explain):
+        """Test refreshing company statistics aggregates through indexes."""
+        repository = CompanyStatsRepository(async_session)
+        company = seeded["companies"][0]
+
+        await explain(repository.refresh([company.id]))
+        await explain(repository.get_by_ticker(Ticker("TCK0")))
@@ -0,0 +1,145 @@
+"""Unit tests for the database task state store."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.task_store import (
+    TaskStore,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def make_task_data(
+    task_id: str,
+    user_id: str = "alice",
+    status: str = "created",
+    created_at: datetime | None = None,
+    completed_at: datetime | None = None,
+) -> dict:
+    """Create a task snapshot as stored by TaskService."""
+    created_at = created_at or datetime.now(UTC)
+    return {
+        "task_id": task_id,
+        "task_type": "analyze_filing",
+        "status": status,
+        "parameters": {},
+        "user_id": user_id,
+        "created_at": created_at.isoformat(),
+        "updated_at": created_at.isoformat(),
+        "started_at": None,
+        "completed_at": completed_at.isoformat() if completed_at else None,
+        "message": "Task created",
+        "result": None,
+        "error": None,
+        "metadata": {},
+    }
+
+
+@pytest.fixture
+def task_store(async_engine) -> TaskStore:
+    """Task store bound to the in-memory test database."""
+    return TaskStore(
+        async_sessionmaker(
+            bind=async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+    )
+
+
+class TestCursor:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the position it was built from."""
+        created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+        assert decode_cursor(encode_cursor(created_at, "task-1")) == (
+            created_at,
+            "task-1",
+        )
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestTaskStore:
+    """Test upserts, indexed listing and compaction."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_inserts_then_updates(self, task_store):
+        """Test repeated upserts keep a single row with the latest state."""
+        task_data = make_task_data("task-1")
+        await task_store.upsert(task_data)
+
+        task_data = {**task_data, "status": "running", "progress_percent": 40.0}
+        await task_store.upsert(task_data)
+
+        stored = await task_store.get("task-1")
+        assert stored["status"] == "running"
+        assert stored["progress_percent"] == 40.0
+        page = await task_store.list_user_tasks("alice")
+        assert len(page.tasks) == 1
+
+    @pytest.mark.asyncio
+    async def test_list_filters_by_user_and_status(self, task_store):
+        """Test listing only returns the user's tasks in the requested status."""
+        await task_store.upsert(make_task_data("a-1", status="completed"))
+        await task_store.upsert(make_task_data("a-2", status="running"))
+        await task_store.upsert(make_task_data("b-1", user_id="bob"))
+
+        page = await task_store.list_user_tasks("alice", status="completed")
+
+        assert [task["task_id"] for task in page.tasks] == ["a-1"]
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_walks_all_tasks(self, task_store):
+        """Test pages are newest first and cover every task exactly once."""
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        for i in range(5):
+            await task_store.upsert(
+                make_task_data(f"task-{i}", created_at=base + timedelta(minutes=i))
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            page = await task_store.list_user_tasks("alice", limit=2, cursor=cursor)
+            seen.extend(task["task_id"] for task in page.tasks)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == [f"task-{i}" for i in reversed(range(5))]
+
+    @pytest.mark.asyncio
+    async def test_compact_removes_only_expired_finished_tasks(self, task_store):
+        """Test compaction keeps running and recently finished tasks."""
+        now = datetime.now(UTC)
+        old = now - timedelta(days=30)
+        await task_store.upsert(
+            make_task_data("old-done", status="completed", completed_at=old)
+        )
+        await task_store.upsert(
+            make_task_data("recent-done", status="failed", completed_at=now)
+        )
+        await task_store.upsert(make_task_data("running", status="running"))
+
+        deleted = await task_store.compact(timedelta(days=7))
+
+        assert deleted == 1
+        assert await task_store.get("old-done") is None
+        assert await task_store.get("recent-done") is not None
+        assert await task_store.get("running") is not None
+
+    @pytest.mark.asyncio
+    async def test_delete(self, task_store):
+        """Test deleting a task."""
+        await task_store.upsert(make_task_data("task-1"))
+
+        assert await task_store.delete("task-1") is True
+        assert await task_store.delete("task-1") is False
@@ -0,0 +1,179 @@
+"""Unit tests for the company tickers table and ticker to CIK map."""
+
+from datetime import date
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.domain.value_objects.ticker import Ticker
+from src.infrastructure.database.models import CompanyTicker as CompanyTickerModel
+from src.infrastructure.database.ticker_map import TickerCikMap, company_tickers
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.filing_repository import FilingRepository
+from src.infrastructure.repositories.identity_map import identity_map
+
+
+@pytest.fixture
+def ticker_map():
+    """Fresh ticker map used by the company repository."""
+    ticker_map = TickerCikMap()
+    with patch(
+        "src.infrastructure.repositories.company_repository.ticker_cik_map",
+        ticker_map,
+    ):
+        yield ticker_map
+
+
+def make_company(cik: str = "0001067983", **metadata) -> Company:
+    """Create a company entity."""
+    return Company(
+        id=uuid4(), cik=CIK(cik), name="Berkshire Hathaway", metadata=metadata
+    )
+
+
+class TestCompanyTickers:
+    """Test ticker extraction from company metadata."""
+
+    def test_primary_first_and_normalized(self):
+        """Test tickers are upper-cased, deduplicated, primary first."""
+        metadata = {"ticker": " brk.a ", "tickers": ["BRK.B", "BRK.A", 7]}
+
+        assert company_tickers(metadata) == ["BRK.A", "BRK.B"]
+
+    def test_no_ticker(self):
+        """Test companies without tickers map to none."""
+        assert company_tickers(None) == []
+        assert company_tickers({"sector": "Finance"}) == []
+
+
+class TestTickerLookups:
+    """Test ticker lookups through the company tickers table."""
+
+    @pytest.mark.asyncio
+    async def test_create_writes_ticker_rows(self, async_session, ticker_map):
+        """Test every ticker of a new company is stored."""
+        repository = CompanyRepository(async_session)
+        company = make_company(ticker="BRK.A", tickers=["BRK.B"])
+
+        await repository.create(company)
+
+        rows = (await async_session.execute(select(CompanyTickerModel))).scalars()
+        assert {(row.ticker, row.is_primary) for row in rows} == {
+            ("BRK.A", True),
+            ("BRK.B", False),
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_by_secondary_ticker(self, async_session, ticker_map):
+        """Test a company is found by any of its tickers."""
+        repository = CompanyRepository(async_session)
+        company = await repository.create(
+            make_company(ticker="BRK.A", tickers=["BRK.B"])
+        )
+
+        found = await repository.get_by_ticker(Ticker("BRK.B"))
+
+        assert found is not None
+        assert found.id == company.id
+
+    @pytest.mark.asyncio
+    async def test_update_replaces_tickers(self, async_session, ticker_map):
+        """Test tickers removed from the metadata are no longer matched."""
+        repository = CompanyRepository(async_session)
+        company = await repository.create(make_company(ticker="FB"))
+
+        company.add_metadata("ticker", "META")
+        await repository.update(company)
+
+        assert await repository.get_by_ticker(Ticker("FB")) is None
+        assert (await repository.get_by_ticker(Ticker("META"))).id == company.id
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_old_ticker_lookups(
+        self, async_session, ticker_map
+    ):
+        """Test a cached lookup by a ticker the company dropped is not served."""
+        repository = CompanyRepository(async_session)
+        company = await repository.create(make_company(ticker="FB"))
+        assert (await repository.get_by_ticker(Ticker("FB"))).id == company.id
+
+        company.add_metadata("ticker", "META")
+        await repository.update(company)
+
+        assert await repository.get_by_ticker(Ticker("FB")) is None
+        identity_map(async_session).clear()
+        assert await repository.get_by_ticker(Ticker("FB")) is None
+
+    @pytest.mark.asyncio
+    async def test_filing_queries_join_ticker_table(self, async_session, ticker_map):
+        """Test filing searches by ticker use the company tickers table."""
+        company = await CompanyRepository(async_session).create(
+            make_company(ticker="BRK.A", tickers=["BRK.B"])
+        )
+        filings = FilingRepository(async_session)
+        await filings.create(
+            Filing(
+                id=uuid4(),
+                company_id=company.id,
+                accession_number=AccessionNumber("0001067983-24-000001"),
+                filing_type=FilingType.FORM_10K,
+                filing_date=date(2024, 2, 26),
+                processing_status=ProcessingStatus.COMPLETED,
+            )
+        )
+
+        assert await filings.count_by_ticker_with_filters(Ticker("BRK.B")) == 1
+        assert await filings.count_by_ticker_with_filters(Ticker("AAPL")) == 0
+        results = await filings.get_by_ticker_with_filters_and_company(Ticker("BRK.A"))
+        assert [info["ticker"] for _, info in results] == ["BRK.A"]
+
+
+class TestTickerCikMap:
+    """Test the in-memory ticker to CIK map."""
+
+    @pytest.mark.asyncio
+    async def test_load_and_lookup(self, async_engine, async_session, ticker_map):
+        """Test the map is loaded from the tickers table."""
+        await CompanyRepository(async_session).create(
+            make_company(ticker="BRK.A", tickers=["BRK.B"])
+        )
+        await async_session.commit()
+        assert ticker_map.get("BRK.A") is None
+
+        loaded = await ticker_map.load(
+            async_sessionmaker(bind=async_engine, class_=AsyncSession)
+        )
+
+        assert loaded == 2
+        assert ticker_map.get("brk.b") == str(CIK("0001067983"))
+
+    @pytest.mark.asyncio
+    async def test_writes_update_loaded_map(self, async_session, ticker_map):
+        """Test company writes keep a loaded map current."""
+        ticker_map.loaded = True
+
+        await CompanyRepository(async_session).create(make_company(ticker="BRK.A"))
+
+        assert ticker_map.get("BRK.A") == str(CIK("0001067983"))
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_falls_back_to_database(self, async_session, ticker_map):
+        """Test a ticker mapped to the wrong company is resolved from the DB."""
+        repository = CompanyRepository(async_session)
+        company = await repository.create(make_company(ticker="BRK.A"))
+        await repository.create(make_company(cik="0000320193", ticker="AAPL"))
+        ticker_map.loaded = True
+        ticker_map.register(str(CIK("0000320193")), ["BRK.A"])
+
+        found = await repository.get_by_ticker(Ticker("BRK.A"))
+
+        assert found.id == company.id
@@ -10,7 +10,23 @@ from src.domain.value_objects import CIK, FilingType, Ticker
 from src.domain.value_objects.accession_number import AccessionNumber
 from src.infrastructure.edgar.schemas.company_data import CompanyData
 from src.infrastructure.edgar.schemas.filing_data import FilingData
-from src.infrastructure.edgar.service import EdgarService
+from src.infrastructure.edgar.service import (
+    UNKNOWN_CIK,
+    EdgarNotFoundError,
+    EdgarService,
+    _found_lookups,
+    _missing_lookups,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_lookup_caches():
+    """Isolate tests from lookups cached by other tests."""
+    _found_lookups.invalidate()
+    _missing_lookups.invalidate()
+    yield
+    _found_lookups.invalidate()
+    _missing_lookups.invalidate()
 
 
 @pytest.mark.unit
@@ -1386,3 +1402,122 @@ class TestEdgarServiceSectionExtraction:
             assert expected_section in result
 
         assert len(result) == len(expected_sections)
+
+
+@pytest.mark.unit
+class TestEdgarServiceLookupCaches:
+    """Test the caches of the async lookups."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with (
+            patch("src.infrastructure.edgar.service.set_identity"),
+            patch("src.infrastructure.edgar.service.settings") as mock_settings,
+        ):
+            mock_settings.edgar_identity = "test@example.com"
+            self.service = EdgarService()
+
+    @pytest.mark.asyncio
+    async def test_found_company_cached(self):
+        """Test a company is looked up once, by CIK and ticker separately."""
+        # Arrange
+        company_data = CompanyData(cik="0000320193", name="Apple Inc.", ticker="AAPL")
+
+        with (
+            patch.object(
+                self.service, "get_company_by_cik", return_value=company_data
+            ) as by_cik,
+            patch.object(
+                self.service, "get_company_by_ticker", return_value=company_data
+            ) as by_ticker,
+        ):
+            # Act
+            for _ in range(3):
+                assert (
+                    await self.service.get_company_by_cik_async(CIK("320193"))
+                    == company_data
+                )
+                assert (
+                    await self.service.get_company_by_ticker_async(Ticker("AAPL"))
+                    == company_data
+                )
+
+        # Assert
+        by_cik.assert_called_once_with(CIK("320193"))
+        by_ticker.assert_called_once_with(Ticker("AAPL"))
+
+    @pytest.mark.asyncio
+    async def test_missing_company_cached(self):
+        """Test a company SEC doesn't know is not looked up again."""
+        # Arrange
+        with patch("src.infrastructure.edgar.service.Company") as mock_company_class:
+            mock_company_class.return_value.cik = UNKNOWN_CIK
+
+            # Act & Assert
+            for _ in range(2):
+                with pytest.raises(EdgarNotFoundError, match="ticker ZZZZ"):
+                    await self.service.get_company_by_ticker_async(Ticker("ZZZZ"))
+
+        mock_company_class.assert_called_once_with("ZZZZ")
+
+    @pytest.mark.asyncio
+    async def test_lookups_shared_between_instances(self):
+        """Test a service created per task reuses lookups of earlier ones."""
+        # Arrange
+        with patch("src.infrastructure.edgar.service.set_identity"):
+            other = EdgarService()
+
+        with patch("src.infrastructure.edgar.service.Company") as mock_company_class:
+            mock_company_class.return_value.cik = UNKNOWN_CIK
+
+            # Act & Assert
+            for service in (self.service, other):
+                with pytest.raises(EdgarNotFoundError, match="ticker ZZZZ"):
+                    await service.get_company_by_ticker_async(Ticker("ZZZZ"))
+
+        mock_company_class.assert_called_once_with("ZZZZ")
+
+    @pytest.mark.asyncio
+    async def test_lookup_errors_not_cached(self):
+        """Test failed lookups are retried instead of cached as missing."""
+        # Arrange
+        with patch.object(
+            self.service, "get_company_by_cik", side_effect=ValueError("SEC down")
+        ) as by_cik:
+            # Act & Assert
+            for _ in range(2):
+                with pytest.raises(ValueError, match="SEC down"):
+                    await self.service.get_company_by_cik_async(CIK("320193"))
+
+        assert by_cik.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.edgar.service.get_by_accession_number")
+    async def test_only_missing_filings_cached(self, mock_get_by_accession):
+        """Test filings are fetched each time, but misses are cached."""
+        # Arrange
+        filing_data = Mock(spec=FilingData)
+        missing = AccessionNumber("0000999999-99-999999")
+        found = AccessionNumber("0000320193-23-000106")
+        mock_get_by_accession.side_effect = lambda value: (
+            None if value == missing.value else Mock()
+        )
+
+        with patch.object(
+            self.service, "_extract_filing_data", return_value=filing_data
+        ):
+            # Act
+            for _ in range(2):
+                assert (
+                    await self.service.get_filing_by_accession_async(found)
+                    == filing_data
+                )
+                with pytest.raises(EdgarNotFoundError):
+                    await self.service.get_filing_by_accession_async(missing)
+
+        # Assert
+        assert mock_get_by_accession.call_args_list == [
+            call(found.value),
+            call(missing.value),
+            call(found.value),
+        ]
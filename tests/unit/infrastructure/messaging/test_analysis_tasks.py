@@ -271,7 +271,7 @@ class TestRetrieveAndAnalyzeFiling:
             mock_filing_repo.get_by_accession_number.return_value = self.mock_filing
 
             # Mock Edgar service for company lookup
-            mock_edgar_instance = Mock()
+            mock_edgar_instance = AsyncMock()
             mock_edgar_service.return_value = mock_edgar_instance
 
             mock_company_data = Mock()
@@ -279,7 +279,9 @@ class TestRetrieveAndAnalyzeFiling:
             mock_company_data.ticker = "AAPL"
             mock_company_data.sic = "3571"
             mock_company_data.sector = "Technology"
-            mock_edgar_instance.get_company_by_cik.return_value = mock_company_data
+            mock_edgar_instance.get_company_by_cik_async.return_value = (
+                mock_company_data
+            )
 
             with (
                 patch(
@@ -315,7 +317,7 @@ class TestRetrieveAndAnalyzeFiling:
                 assert result["status"] == "success"
 
                 # Verify company creation was attempted
-                mock_edgar_instance.get_company_by_cik.assert_called_once_with(
+                mock_edgar_instance.get_company_by_cik_async.assert_called_once_with(
                     self.company_cik
                 )
                 mock_company_repo.update.assert_called_once()
@@ -344,9 +346,9 @@ class TestRetrieveAndAnalyzeFiling:
             mock_company_repo.get_by_cik.return_value = None  # Company not found
 
             # Mock Edgar service failure
-            mock_edgar_instance = Mock()
+            mock_edgar_instance = AsyncMock()
             mock_edgar_service.return_value = mock_edgar_instance
-            mock_edgar_instance.get_company_by_cik.side_effect = Exception(
+            mock_edgar_instance.get_company_by_cik_async.side_effect = Exception(
                 "Edgar service unavailable"
             )
 
@@ -890,7 +892,7 @@ class TestFilingContentStorage:
             mock_get_storage.return_value = mock_storage
             mock_storage.get.return_value = None  # Not in storage
 
-            mock_edgar = Mock()
+            mock_edgar = AsyncMock()
             mock_edgar_service.return_value = mock_edgar
 
             # Mock Edgar filing data
@@ -903,7 +905,7 @@ class TestFilingContentStorage:
             mock_filing_data.sections = {"section1": "content1"}
             mock_filing_data.raw_html = "<html>Raw HTML</html>"
 
-            mock_edgar.get_filing_by_accession.return_value = mock_filing_data
+            mock_edgar.get_filing_by_accession_async.return_value = mock_filing_data
             mock_store.return_value = True  # Storage succeeds
 
             # Act
@@ -918,7 +920,7 @@ class TestFilingContentStorage:
             assert result["metadata"]["source"] == "edgar_service"
 
             # Verify Edgar was called
-            mock_edgar.get_filing_by_accession.assert_called_once_with(
+            mock_edgar.get_filing_by_accession_async.assert_called_once_with(
                 self.accession_number
             )
 
@@ -942,9 +944,11 @@ class TestFilingContentStorage:
             mock_get_storage.return_value = mock_storage
             mock_storage.get.return_value = None  # Not in storage
 
-            mock_edgar = Mock()
+            mock_edgar = AsyncMock()
             mock_edgar_service.return_value = mock_edgar
-            mock_edgar.get_filing_by_accession.return_value = None  # Download failed
+            mock_edgar.get_filing_by_accession_async.return_value = (
+                None  # Download failed
+            )
 
             # Act
             result = await get_filing_content(self.accession_number, self.company_cik)
@@ -298,6 +298,9 @@ class TestIQueueServiceInterface:
             'purge_queue',
             'get_queue_size',
             'health_check',
+            'send_tasks',
+            'receive_tasks',
+            'ack_tasks',
         ]
 
         for method in required_methods:
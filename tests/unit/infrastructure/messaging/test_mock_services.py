@@ -355,6 +355,90 @@ class TestMockQueueService:
         assert health is True
         assert ("health_check", True) in self.queue_service.call_log
 
+    @pytest.mark.asyncio
+    async def test_send_tasks_batch(self):
+        """Test sending a batch of tasks in one call."""
+        await self.queue_service.connect()
+
+        messages = [
+            await create_test_task_message(task_name=f"task_{i}", queue="batch")
+            for i in range(3)
+        ]
+
+        task_ids = await self.queue_service.send_tasks(messages)
+
+        assert task_ids == [message.task_id for message in messages]
+        assert list(self.queue_service.queues["batch"]) == messages
+        assert all(
+            self.queue_service.task_statuses[task_id] == TaskStatus.PENDING
+            for task_id in task_ids
+        )
+        assert ("send_tasks", messages) in self.queue_service.call_log
+
+    @pytest.mark.asyncio
+    async def test_receive_tasks_respects_max_messages(self):
+        """Test batch receive returns at most max_messages in FIFO order."""
+        await self.queue_service.connect()
+
+        messages = [
+            await create_test_task_message(task_name=f"task_{i}", queue="batch")
+            for i in range(5)
+        ]
+        await self.queue_service.send_tasks(messages)
+
+        received = await self.queue_service.receive_tasks("batch", max_messages=3)
+
+        assert received == messages[:3]
+        assert await self.queue_service.get_queue_size("batch") == 2
+        assert all(
+            self.queue_service.task_statuses[message.task_id] == TaskStatus.RUNNING
+            for message in received
+        )
+
+    @pytest.mark.asyncio
+    async def test_receive_tasks_from_empty_queue(self):
+        """Test batch receive from an empty queue."""
+        await self.queue_service.connect()
+
+        assert await self.queue_service.receive_tasks("missing") == []
+
+    @pytest.mark.asyncio
+    async def test_ack_tasks_batch(self):
+        """Test acknowledging several tasks at once."""
+        await self.queue_service.connect()
+        task_ids = [uuid4(), uuid4()]
+
+        acknowledged = await self.queue_service.ack_tasks(task_ids)
+
+        assert acknowledged == task_ids
+        assert all(
+            self.queue_service.task_statuses[task_id] == TaskStatus.SUCCESS
+            for task_id in task_ids
+        )
+        assert ("ack_tasks", task_ids) in self.queue_service.call_log
+
+    @pytest.mark.asyncio
+    async def test_default_batch_methods_fall_back_to_single_operations(self):
+        """Test IQueueService batch defaults delegate to the single-task methods."""
+
+        class SingleOnlyQueueService(MockQueueService):
+            send_tasks = IQueueService.send_tasks
+            receive_tasks = IQueueService.receive_tasks
+            ack_tasks = IQueueService.ack_tasks
+
+        service = SingleOnlyQueueService()
+        await service.connect()
+        messages = [await create_test_task_message(queue="q") for _ in range(3)]
+
+        assert await service.send_tasks(messages) == [m.task_id for m in messages]
+        received = await service.receive_tasks("q", max_messages=2)
+        assert received == messages[:2]
+        assert await service.ack_tasks([m.task_id for m in received]) == [
+            m.task_id for m in received
+        ]
+        assert [entry[0] for entry in service.call_log].count("send_task") == 3
+        assert [entry[0] for entry in service.call_log].count("ack_task") == 2
+
 
 class TestMockWorkerService:
     """Test MockWorkerService implementation."""
@@ -0,0 +1,170 @@
+"""Unit tests for receiving prefetched deliveries from RabbitMQ."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.messaging.implementations.rabbitmq_queue import (
+    RabbitMQQueueService,
+)
+from src.infrastructure.messaging.interfaces import TaskMessage, TaskPriority
+from src.infrastructure.messaging.scheduling import (
+    fair_share_lane,
+    fair_share_queue_name,
+)
+
+
+def make_task(user_id: str | None = None) -> TaskMessage:
+    """Create a task message for a user."""
+    return TaskMessage(
+        task_id=uuid4(),
+        task_name="analyze_filing",
+        args=[],
+        kwargs={},
+        metadata={"user_id": user_id} if user_id else {},
+    )
+
+
+def make_delivery(
+    service: RabbitMQQueueService, delivery_tag: int, message: TaskMessage | None = None
+) -> Mock:
+    """Create an incoming AMQP delivery of a task."""
+    message = message or make_task()
+    delivery = Mock()
+    delivery.delivery_tag = delivery_tag
+    delivery.body = json.dumps(service._task_to_message_body(message)).encode()
+    delivery.ack = AsyncMock()
+    return delivery
+
+
+@pytest.mark.unit
+class TestRabbitMQReceiveTasks:
+    """Test receiving deliveries buffered by consumers."""
+
+    def setup_method(self):
+        """Set up a service whose consumers are already started."""
+        self.service = RabbitMQQueueService()
+        self.service._connected = True
+        self.service._deliveries_ready["default"] = asyncio.Event()
+        for queue_name in self.service._sub_queue_names("default"):
+            self.service._consumer_buffers[queue_name] = asyncio.Queue()
+
+    def buffer(self, priority: TaskPriority, lane: int = 0) -> asyncio.Queue:
+        """Get the consumer buffer of a priority and lane sub-queue."""
+        return self.service._consumer_buffers[
+            fair_share_queue_name("default", priority, lane)
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("timeout", [None, 0])
+    async def test_no_timeout_does_not_block_when_empty(self, timeout):
+        """Test receiving without a timeout returns at once from empty buffers."""
+        # Act
+        task = await asyncio.wait_for(
+            self.service.receive_task(timeout=timeout), timeout=1
+        )
+        tasks = await asyncio.wait_for(
+            self.service.receive_tasks(timeout=timeout), timeout=1
+        )
+
+        # Assert
+        assert task is None
+        assert tasks == []
+
+    @pytest.mark.asyncio
+    async def test_no_timeout_returns_buffered_deliveries(self):
+        """Test receiving without a timeout returns what is already buffered."""
+        # Arrange
+        self.buffer(TaskPriority.NORMAL).put_nowait(make_delivery(self.service, 1))
+        self.buffer(TaskPriority.HIGH).put_nowait(make_delivery(self.service, 2))
+
+        # Act
+        tasks = await self.service.receive_tasks(max_messages=10, timeout=None)
+
+        # Assert
+        assert len(tasks) == 2
+        assert self.service._unacked_tags == {1, 2}
+
+    @pytest.mark.asyncio
+    async def test_timeout_waits_for_delivery(self):
+        """Test receiving with a timeout waits for the next delivery."""
+
+        # Arrange
+        async def deliver_later():
+            await asyncio.sleep(0.01)
+            self.buffer(TaskPriority.LOW).put_nowait(make_delivery(self.service, 3))
+            self.service._deliveries_ready["default"].set()
+
+        # Act
+        delivery = asyncio.create_task(deliver_later())
+        task = await self.service.receive_task(timeout=1)
+        await delivery
+
+        # Assert
+        assert task is not None
+        assert task.task_name == "analyze_filing"
+
+
+@pytest.mark.unit
+class TestRabbitMQFairShare:
+    """Test routing users onto fair-share lanes and draining them in turn."""
+
+    def setup_method(self):
+        """Set up a service whose consumers are already started."""
+        self.service = RabbitMQQueueService(fair_share_lanes=4)
+        self.service._connected = True
+        self.service._deliveries_ready["default"] = asyncio.Event()
+        for queue_name in self.service._sub_queue_names("default"):
+            self.service._consumer_buffers[queue_name] = asyncio.Queue()
+
+    def test_tasks_routed_by_priority_and_user(self):
+        """Test a task is routed to the lane of its user within its priority."""
+        # Arrange
+        task = make_task("alice")
+        task.priority = TaskPriority.HIGH
+
+        # Act
+        queue_name = self.service._route(task)
+
+        # Assert
+        assert queue_name == fair_share_queue_name(
+            "default", TaskPriority.HIGH, fair_share_lane(task, 4)
+        )
+        assert len(self.service._sub_queue_names("default")) == 16
+
+    @pytest.mark.asyncio
+    async def test_single_request_not_stuck_behind_batch(self):
+        """Test a user's single task is received ahead of another's backlog."""
+        # Arrange
+        batch_user, single_user = self.users_on_different_lanes()
+        batch_lane = fair_share_lane(make_task(batch_user), 4)
+        single_lane = fair_share_lane(make_task(single_user), 4)
+        for tag in range(1, 21):
+            self.service._consumer_buffers[
+                fair_share_queue_name("default", TaskPriority.NORMAL, batch_lane)
+            ].put_nowait(make_delivery(self.service, tag, make_task(batch_user)))
+        self.service._consumer_buffers[
+            fair_share_queue_name("default", TaskPriority.NORMAL, single_lane)
+        ].put_nowait(make_delivery(self.service, 21, make_task(single_user)))
+
+        # Act
+        first = await self.service.receive_tasks(max_messages=1, timeout=None)
+        second = await self.service.receive_tasks(max_messages=1, timeout=None)
+
+        # Assert
+        users = {task.metadata["user_id"] for task in first + second}
+        assert users == {batch_user, single_user}
+
+    @staticmethod
+    def users_on_different_lanes() -> tuple[str, str]:
+        """Find two users hashed onto different lanes."""
+        lane = fair_share_lane(make_task("user-0"), 4)
+        other = next(
+            f"user-{i}"
+            for i in range(1, 100)
+            if fair_share_lane(make_task(f"user-{i}"), 4) != lane
+        )
+        return "user-0", other
@@ -0,0 +1,266 @@
+"""Unit tests for task result backends and push-based AsyncResult waiting."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.messaging.implementations.event_bus import (
+    InProcessResultBackend,
+)
+from src.infrastructure.messaging.implementations.mock_services import (
+    MockStorageService,
+)
+from src.infrastructure.messaging.implementations.storage_result_backend import (
+    StorageResultBackend,
+)
+from src.infrastructure.messaging.interfaces import (
+    IQueueService,
+    IResultBackend,
+    TaskEvent,
+    TaskResult,
+    TaskStatus,
+)
+from src.infrastructure.messaging.task_service import (
+    AsyncResult,
+    TaskFailure,
+    TaskTimeout,
+)
+
+
+class TestTaskEvent:
+    """Test TaskEvent serialization helpers."""
+
+    def test_round_trip(self):
+        """Test event survives to_dict/from_dict."""
+        event = TaskEvent(
+            task_id="task-1",
+            kind="progress",
+            status="running",
+            data={"progress_percent": 50.0},
+        )
+
+        restored = TaskEvent.from_dict(event.to_dict())
+
+        assert restored == event
+
+    def test_from_task_result_marks_terminal_statuses(self):
+        """Test only final worker statuses produce terminal events."""
+        task_id = uuid4()
+
+        success = TaskEvent.from_task_result(
+            TaskResult(task_id=task_id, status=TaskStatus.SUCCESS, result={"a": 1})
+        )
+        retry = TaskEvent.from_task_result(
+            TaskResult(task_id=task_id, status=TaskStatus.RETRY, error="boom")
+        )
+
+        assert success.kind == "result"
+        assert success.terminal
+        assert success.data["result"] == {"a": 1}
+        assert not retry.terminal
+
+
+class TestInProcessResultBackend:
+    """Test in-process event bus."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.backend = InProcessResultBackend(max_retained_results=2)
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_subscribers_of_task_only(self):
+        """Test events are delivered to subscribers of the same task."""
+        await self.backend.connect()
+        assert isinstance(self.backend, IResultBackend)
+
+        subscription = await self.backend.subscribe("task-1")
+        other = await self.backend.subscribe("task-2")
+
+        await self.backend.publish(
+            TaskEvent(task_id="task-1", kind="progress", status="running")
+        )
+
+        event = await subscription.next_event(timeout=0.1)
+        assert event is not None
+        assert event.status == "running"
+        assert await other.next_event(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_closed_subscription_is_removed(self):
+        """Test closing a subscription unregisters it."""
+        async with await self.backend.subscribe("task-1"):
+            assert self.backend.get_subscriber_count("task-1") == 1
+
+        assert self.backend.get_subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_terminal_events_are_retained_with_bound(self):
+        """Test terminal events are retained and the oldest evicted."""
+        for task_id in ("a", "b", "c"):
+            await self.backend.publish(
+                TaskEvent(
+                    task_id=task_id, kind="result", status="success", terminal=True
+                )
+            )
+        await self.backend.publish(
+            TaskEvent(task_id="d", kind="progress", status="running")
+        )
+
+        assert await self.backend.get_result("a") is None
+        assert await self.backend.get_result("c") is not None
+        assert await self.backend.get_result("d") is None
+
+
+class TestStorageResultBackend:
+    """Test storage-backed result backend."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.storage = MockStorageService()
+        self.publisher = StorageResultBackend(self.storage, poll_interval=0.01)
+        self.subscriber = StorageResultBackend(self.storage, poll_interval=0.01)
+
+    @pytest.mark.asyncio
+    async def test_events_from_other_process_are_polled(self):
+        """Test subscriber sees events published by another backend instance."""
+        subscription = await self.subscriber.subscribe("task-1")
+
+        await self.publisher.publish(
+            TaskEvent(task_id="task-1", kind="result", status="success", terminal=True)
+        )
+
+        event = await subscription.next_event(timeout=1)
+        await subscription.close()
+
+        assert event is not None
+        assert event.status == "success"
+        assert (await self.subscriber.get_result("task-1")) is not None
+
+    @pytest.mark.asyncio
+    async def test_events_before_subscribe_are_not_replayed(self):
+        """Test a stored event is not delivered again to a new subscription."""
+        await self.publisher.publish(
+            TaskEvent(task_id="task-1", kind="progress", status="running")
+        )
+
+        subscription = await self.subscriber.subscribe("task-1")
+        event = await subscription.next_event(timeout=0.05)
+        await subscription.close()
+
+        assert event is None
+
+    @pytest.mark.asyncio
+    async def test_local_events_are_delivered_once(self):
+        """Test locally published events are not duplicated by polling."""
+        subscription = await self.publisher.subscribe("task-1")
+
+        await self.publisher.publish(
+            TaskEvent(task_id="task-1", kind="progress", status="running")
+        )
+
+        assert await subscription.next_event(timeout=0.1) is not None
+        assert await subscription.next_event(timeout=0.05) is None
+        await subscription.close()
+
+
+class TestAsyncResultPushNotifications:
+    """Test AsyncResult waiting on the result backend."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.task_id = uuid4()
+        self.backend = InProcessResultBackend()
+        self.queue_service = AsyncMock(spec=IQueueService)
+        self.queue_service.get_task_status.return_value = TaskStatus.RUNNING
+
+    def _patch_services(self):
+        return (
+            patch(
+                'src.infrastructure.messaging.task_service.get_queue_service',
+                return_value=self.queue_service,
+            ),
+            patch(
+                'src.infrastructure.messaging.task_service.get_result_backend',
+                return_value=self.backend,
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_wakes_on_result_event(self):
+        """Test get returns as soon as the worker publishes the result."""
+        result = AsyncResult(self.task_id)
+        queue_patch, backend_patch = self._patch_services()
+
+        async def publish_later():
+            await asyncio.sleep(0.01)
+            await self.backend.publish(
+                TaskEvent.from_task_result(
+                    TaskResult(
+                        task_id=self.task_id,
+                        status=TaskStatus.SUCCESS,
+                        result={"analysis_id": "abc"},
+                    )
+                )
+            )
+
+        with queue_patch, backend_patch:
+            publisher = asyncio.create_task(publish_later())
+            value = await asyncio.wait_for(result.get(timeout=5), timeout=1)
+            await publisher
+
+        assert value == {"analysis_id": "abc"}
+        assert self.backend.get_subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_get_uses_retained_result(self):
+        """Test get resolves immediately for already finished tasks."""
+        await self.backend.publish(
+            TaskEvent.from_task_result(
+                TaskResult(task_id=self.task_id, status=TaskStatus.FAILURE, error="bad")
+            )
+        )
+        result = AsyncResult(self.task_id)
+        queue_patch, backend_patch = self._patch_services()
+
+        with queue_patch, backend_patch:
+            with pytest.raises(TaskFailure, match="bad"):
+                await result.get(timeout=1)
+
+        self.queue_service.get_task_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_refetches_result_published_before_status(self):
+        """Test a result published between the fetch and status check is used."""
+        result = AsyncResult(self.task_id)
+        queue_patch, backend_patch = self._patch_services()
+
+        async def finish_task(task_id):
+            await self.backend.publish(
+                TaskEvent.from_task_result(
+                    TaskResult(
+                        task_id=self.task_id,
+                        status=TaskStatus.SUCCESS,
+                        result={"analysis_id": "abc"},
+                    )
+                )
+            )
+            return TaskStatus.SUCCESS
+
+        self.queue_service.get_task_status.side_effect = finish_task
+
+        with queue_patch, backend_patch:
+            value = await result.get(timeout=1)
+
+        assert value == {"analysis_id": "abc"}
+
+    @pytest.mark.asyncio
+    async def test_get_times_out_without_events(self):
+        """Test get still honours its timeout while subscribed."""
+        result = AsyncResult(self.task_id)
+        queue_patch, backend_patch = self._patch_services()
+
+        with queue_patch, backend_patch:
+            with pytest.raises(TaskTimeout):
+                await result.get(timeout=0.05)
@@ -0,0 +1,288 @@
+"""Unit tests for delayed retries, visibility heartbeats and dead-lettering."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.messaging.implementations.local_worker import (
+    LocalWorkerService,
+)
+from src.infrastructure.messaging.implementations.mock_services import (
+    MockQueueService,
+    create_test_task_message,
+)
+from src.infrastructure.messaging.interfaces import TaskStatus
+from src.infrastructure.messaging.retry import (
+    TimerWheel,
+    compute_retry_delay,
+    retry_delay_bucket,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryDelay:
+    """Test backoff calculation and delay bucketing."""
+
+    def test_delay_grows_exponentially_with_jitter(self):
+        """Test delay doubles per attempt within the jitter band."""
+        with patch("src.infrastructure.messaging.retry.settings") as mock_settings:
+            mock_settings.task_retry_base_delay = 2.0
+            mock_settings.task_retry_max_delay = 300.0
+
+            for retry_count, expected in [(1, 2.0), (2, 4.0), (3, 8.0)]:
+                delay = compute_retry_delay(retry_count)
+                assert expected * 0.8 <= delay <= expected * 1.2
+
+    def test_delay_is_capped(self):
+        """Test delay never exceeds the configured maximum plus jitter."""
+        with patch("src.infrastructure.messaging.retry.settings") as mock_settings:
+            mock_settings.task_retry_base_delay = 2.0
+            mock_settings.task_retry_max_delay = 300.0
+
+            assert compute_retry_delay(20) <= 300.0 * 1.2
+
+    def test_delay_buckets_are_powers_of_two(self):
+        """Test delays round up to power-of-two seconds."""
+        assert retry_delay_bucket(0.3) == 1
+        assert retry_delay_bucket(1.0) == 1
+        assert retry_delay_bucket(2.4) == 4
+        assert retry_delay_bucket(8.0) == 8
+        assert retry_delay_bucket(300.0) == 512
+
+
+class TestTimerWheel:
+    """Test the hashed timer wheel."""
+
+    def test_items_released_when_due(self):
+        """Test items only come out once their delay elapsed."""
+        clock = FakeClock()
+        wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=8, clock=clock)
+        wheel.schedule("soon", 2)
+        wheel.schedule("later", 5)
+
+        assert wheel.advance() == []
+        clock.now += 2
+        assert wheel.advance() == ["soon"]
+        clock.now += 3
+        assert wheel.advance() == ["later"]
+        assert len(wheel) == 0
+
+    def test_delays_longer_than_one_revolution(self):
+        """Test items due after several wheel revolutions wait their turn."""
+        clock = FakeClock()
+        wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=4, clock=clock)
+        wheel.schedule("far", 10)
+
+        for _ in range(9):
+            clock.now += 1
+            assert wheel.advance() == []
+
+        clock.now += 1
+        assert wheel.advance() == ["far"]
+
+    def test_long_pause_releases_everything_due(self):
+        """Test advancing after a long gap still releases overdue items."""
+        clock = FakeClock()
+        wheel: TimerWheel[int] = TimerWheel(tick=1.0, slots=4, clock=clock)
+        for delay in range(6):
+            wheel.schedule(delay, delay)
+
+        clock.now += 100
+
+        assert sorted(wheel.advance()) == list(range(6))
+
+
+class TestMockQueueRetryAndDeadLetters:
+    """Test delayed redelivery and dead-lettering on the mock queue."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.queue_service = MockQueueService()
+        self.queue_service.delayed = TimerWheel(tick=0.1, clock=self.clock)
+
+    @pytest.mark.asyncio
+    async def test_retry_is_redelivered_after_delay(self):
+        """Test a retried task is invisible until its delay elapses."""
+        await self.queue_service.connect()
+        message = await create_test_task_message()
+        await self.queue_service.send_task(message)
+        received = await self.queue_service.receive_task()
+
+        received.retry_count += 1
+        assert await self.queue_service.retry_task(received, delay=5.0)
+        assert self.queue_service.task_statuses[message.task_id] == TaskStatus.RETRY
+        assert await self.queue_service.receive_task() is None
+
+        self.clock.now += 5.0
+        redelivered = await self.queue_service.receive_task()
+
+        assert redelivered.task_id == message.task_id
+        assert redelivered.retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_visibility_extension_only_for_in_flight_tasks(self):
+        """Test heartbeats succeed only for tasks the worker still holds."""
+        await self.queue_service.connect()
+        message = await create_test_task_message()
+        await self.queue_service.send_task(message)
+        await self.queue_service.receive_task()
+
+        assert await self.queue_service.extend_visibility(message.task_id, 300)
+        await self.queue_service.ack_task(message.task_id)
+        assert not await self.queue_service.extend_visibility(message.task_id, 300)
+
+    @pytest.mark.asyncio
+    async def test_dead_letter_inspection_and_requeue(self):
+        """Test rejected tasks can be inspected and requeued."""
+        await self.queue_service.connect()
+        message = await create_test_task_message(queue="analysis_queue")
+        await self.queue_service.send_task(message)
+        await self.queue_service.receive_task("analysis_queue")
+
+        await self.queue_service.nack_task(message.task_id, requeue=False)
+
+        dead_letters = await self.queue_service.get_dead_letter_tasks("analysis_queue")
+        assert [task.task_id for task in dead_letters] == [message.task_id]
+        # Inspection does not consume
+        assert (
+            len(await self.queue_service.get_dead_letter_tasks("analysis_queue")) == 1
+        )
+
+        assert await self.queue_service.requeue_dead_letter_tasks("analysis_queue") == 1
+        assert await self.queue_service.get_dead_letter_tasks("analysis_queue") == []
+        assert await self.queue_service.get_queue_size("analysis_queue") == 1
+
+
+class TestLocalWorkerRetries:
+    """Test the local worker hands retries and heartbeats to the queue."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.queue_service = MockQueueService()
+        self.worker = LocalWorkerService(self.queue_service, worker_id="test")
+        self.worker._publish_result = self._noop_publish
+
+    @staticmethod
+    async def _noop_publish(result):
+        return None
+
+    @pytest.mark.asyncio
+    async def test_failed_task_scheduled_for_delayed_retry(self):
+        """Test failures schedule a delayed retry without blocking the worker."""
+        await self.queue_service.connect()
+
+        async def failing_handler():
+            raise RuntimeError("LLM unavailable")
+
+        self.worker.register_task("failing", failing_handler)
+        message = await create_test_task_message(task_name="failing")
+        await self.queue_service.send_task(message)
+        task = await self.queue_service.receive_task()
+
+        # The backoff delay (>= 1.6s) must not be slept by the worker
+        await asyncio.wait_for(self.worker._process_task(task), timeout=1.0)
+
+        retries = [
+            entry for entry in self.queue_service.call_log if entry[0] == "retry_task"
+        ]
+        assert len(retries) == 1
+        assert retries[0][1]["task_id"] == message.task_id
+        assert retries[0][1]["delay"] > 0
+        assert len(self.queue_service.delayed) == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_task_is_dead_lettered(self):
+        """Test a task past max_retries goes to the dead-letter queue."""
+        await self.queue_service.connect()
+
+        async def failing_handler():
+            raise RuntimeError("bad filing")
+
+        self.worker.register_task("failing", failing_handler)
+        message = await create_test_task_message(task_name="failing")
+        message.retry_count = message.max_retries
+        await self.queue_service.send_task(message)
+        task = await self.queue_service.receive_task()
+
+        await self.worker._process_task(task)
+
+        dead_letters = await self.queue_service.get_dead_letter_tasks()
+        assert [t.task_id for t in dead_letters] == [message.task_id]
+
+    @pytest.mark.asyncio
+    async def test_long_task_sends_heartbeats(self):
+        """Test visibility is extended while a long task is running."""
+        await self.queue_service.connect()
+        self.worker.heartbeat_interval = 0.01
+        self.worker.visibility_timeout = 120
+
+        async def slow_handler():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        self.worker.register_task("slow", slow_handler)
+        message = await create_test_task_message(task_name="slow")
+        await self.queue_service.send_task(message)
+        task = await self.queue_service.receive_task()
+
+        await self.worker._process_task(task)
+
+        heartbeats = [
+            entry[1]
+            for entry in self.queue_service.call_log
+            if entry[0] == "extend_visibility"
+        ]
+        assert heartbeats
+        assert heartbeats[0] == {"task_id": message.task_id, "timeout": 120}
+        assert self.queue_service.task_statuses[message.task_id] == TaskStatus.SUCCESS
+        assert message.task_id not in self.queue_service.in_flight
+
+    @pytest.mark.asyncio
+    async def test_batched_tasks_heartbeated_while_waiting(self):
+        """Test tasks waiting in a received batch are kept reserved."""
+        await self.queue_service.connect()
+        self.worker.heartbeat_interval = 0.01
+        self.worker.visibility_timeout = 120
+
+        async def slow_handler():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        self.worker.register_task("slow", slow_handler)
+        messages = [await create_test_task_message(task_name="slow") for _ in range(2)]
+        for message in messages:
+            await self.queue_service.send_task(message)
+        tasks = await self.queue_service.receive_tasks(max_messages=2)
+
+        await self.worker._process_tasks(tasks)
+
+        # The second task is heartbeated while the first one runs
+        heartbeats = [
+            entry[1]["task_id"]
+            for entry in self.queue_service.call_log
+            if entry[0] == "extend_visibility"
+        ]
+        first_acked = next(
+            i
+            for i, entry in enumerate(self.queue_service.call_log)
+            if entry[0] == "ack_task"
+        )
+        waiting = [
+            entry[1]["task_id"]
+            for entry in self.queue_service.call_log[:first_acked]
+            if entry[0] == "extend_visibility"
+        ]
+        assert tasks[1].task_id in waiting
+        assert set(heartbeats) == {message.task_id for message in messages}
+        assert self.worker._heartbeats == {}
@@ -0,0 +1,202 @@
+"""Unit tests for priority and fair-share task scheduling."""
+
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.messaging.implementations.mock_services import (
+    MockQueueService,
+)
+from src.infrastructure.messaging.interfaces import TaskMessage, TaskPriority
+from src.infrastructure.messaging.scheduling import (
+    DEFAULT_FAIR_SHARE_KEY,
+    FairShareQueue,
+    RoundRobin,
+    WeightedPriorityDrainer,
+    fair_share_key,
+    fair_share_lane,
+    fair_share_queue_name,
+    priority_queue_name,
+)
+
+
+def make_task(
+    user_id: str | None = None,
+    priority: TaskPriority = TaskPriority.NORMAL,
+    queue: str = "default",
+) -> TaskMessage:
+    """Create a task message for a user."""
+    return TaskMessage(
+        task_id=uuid4(),
+        task_name="analyze",
+        args=[],
+        kwargs={},
+        priority=priority,
+        queue=queue,
+        metadata={"user_id": user_id} if user_id else {},
+    )
+
+
+class TestSchedulingHelpers:
+    """Test queue naming and fair-share key helpers."""
+
+    def test_normal_priority_uses_base_queue(self):
+        """Test normal priority maps to the existing queue name."""
+        assert priority_queue_name("analysis_queue", TaskPriority.NORMAL) == (
+            "analysis_queue"
+        )
+
+    def test_other_priorities_use_sub_queues(self):
+        """Test non-normal priorities map to suffixed sub-queues."""
+        assert priority_queue_name("analysis_queue", TaskPriority.HIGH) == (
+            "analysis_queue.high"
+        )
+        assert priority_queue_name("q", TaskPriority.LOW, separator="-") == "q-low"
+
+    def test_fair_share_key(self):
+        """Test fair-share key comes from the task's user_id."""
+        assert fair_share_key(make_task("alice")) == "alice"
+        assert fair_share_key(make_task()) == DEFAULT_FAIR_SHARE_KEY
+
+    def test_fair_share_lane_is_stable_per_user(self):
+        """Test every task of a user is routed to the same lane."""
+        lanes = {fair_share_lane(make_task("alice"), 4) for _ in range(5)}
+
+        assert len(lanes) == 1
+        assert lanes <= set(range(4))
+        assert fair_share_lane(make_task("alice"), 1) == 0
+
+    def test_users_spread_across_lanes(self):
+        """Test users are hashed onto every lane."""
+        lanes = {fair_share_lane(make_task(f"user-{i}"), 4) for i in range(50)}
+
+        assert lanes == {0, 1, 2, 3}
+
+    def test_first_lane_uses_priority_queue(self):
+        """Test lane 0 keeps the priority sub-queue name."""
+        assert fair_share_queue_name("q", TaskPriority.NORMAL, 0) == "q"
+        assert fair_share_queue_name("q", TaskPriority.HIGH, 0) == "q.high"
+        assert fair_share_queue_name("q", TaskPriority.HIGH, 2) == "q.high.lane2"
+
+
+class TestRoundRobin:
+    """Test rotating service order over fair-share lanes."""
+
+    def test_order_starts_after_last_served(self):
+        """Test the item after the last one served comes first."""
+        rotation = RoundRobin(["a", "b", "c"])
+
+        assert rotation.order() == ["a", "b", "c"]
+        rotation.served("b")
+        assert rotation.order() == ["c", "a", "b"]
+        rotation.served("c")
+        assert rotation.order() == ["a", "b", "c"]
+
+
+class TestWeightedPriorityDrainer:
+    """Test weighted draining order across priority sub-queues."""
+
+    def test_selection_follows_weights(self):
+        """Test each priority is picked first in proportion to its weight."""
+        drainer = WeightedPriorityDrainer()
+
+        firsts = Counter(drainer.next_order()[0] for _ in range(150))
+
+        assert firsts == {
+            TaskPriority.CRITICAL: 80,
+            TaskPriority.HIGH: 40,
+            TaskPriority.NORMAL: 20,
+            TaskPriority.LOW: 10,
+        }
+
+    def test_order_contains_every_priority(self):
+        """Test the fallback order covers all levels, highest first."""
+        drainer = WeightedPriorityDrainer()
+
+        for _ in range(15):
+            selected, *rest = drainer.next_order()
+            assert {selected, *rest} == set(TaskPriority)
+            assert rest == sorted(rest, reverse=True)
+
+
+class TestFairShareQueue:
+    """Test heap-based priority and fair-share ordering."""
+
+    def test_higher_priority_first(self):
+        """Test tasks are popped by priority regardless of arrival order."""
+        queue = FairShareQueue()
+        low = make_task(priority=TaskPriority.LOW)
+        critical = make_task(priority=TaskPriority.CRITICAL)
+        normal = make_task()
+        for task in (low, critical, normal):
+            queue.push(task)
+
+        assert queue.pop_many(3) == [critical, normal, low]
+        assert queue.pop() is None
+
+    def test_fifo_within_user_and_priority(self):
+        """Test a single user's tasks keep submission order."""
+        queue = FairShareQueue()
+        tasks = [make_task("alice") for _ in range(5)]
+        for task in tasks:
+            queue.push(task)
+
+        assert list(queue) == tasks
+        assert queue.pop_many(10) == tasks
+
+    def test_single_request_not_stuck_behind_batch(self):
+        """Test another user's request is interleaved into a large batch."""
+        queue = FairShareQueue()
+        batch = [make_task("batch-user") for _ in range(500)]
+        for task in batch:
+            queue.push(task)
+        assert queue.pop() is batch[0]
+
+        interactive = make_task("interactive-user")
+        queue.push(interactive)
+
+        assert queue.pop_many(2) == [batch[1], interactive]
+        assert len(queue) == 498
+
+    def test_users_share_equally(self):
+        """Test backlogged users are served round-robin."""
+        queue = FairShareQueue()
+        alice = [make_task("alice") for _ in range(3)]
+        bob = [make_task("bob") for _ in range(3)]
+        for task in alice + bob:
+            queue.push(task)
+
+        popped = [fair_share_key(task) for task in queue.pop_many(6)]
+
+        assert popped == ["alice", "bob"] * 3
+
+    def test_contains_and_clear(self):
+        """Test membership checks and clearing."""
+        queue = FairShareQueue()
+        task = make_task()
+        queue.push(task)
+
+        assert task in queue
+        queue.clear()
+        assert task not in queue
+        assert len(queue) == 0
+
+
+class TestMockQueuePriorityScheduling:
+    """Test the mock queue schedules by priority and fair share."""
+
+    @pytest.mark.asyncio
+    async def test_receive_respects_priority_and_fair_share(self):
+        """Test received order is priority first, then fair across users."""
+        queue_service = MockQueueService()
+        await queue_service.connect()
+
+        batch = [make_task("batch-user") for _ in range(3)]
+        interactive = make_task("interactive-user")
+        urgent = make_task(priority=TaskPriority.HIGH)
+        await queue_service.send_tasks([*batch, interactive, urgent])
+
+        received = await queue_service.receive_tasks("default", max_messages=5)
+
+        assert received == [urgent, batch[0], interactive, batch[1], batch[2]]
@@ -0,0 +1,118 @@
+"""Unit tests for delayed retries on SQS FIFO queues."""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.messaging.implementations.sqs_queue import SQSQueueService
+from src.infrastructure.messaging.interfaces import (
+    TaskMessage,
+    TaskPriority,
+    TaskStatus,
+)
+from src.infrastructure.messaging.scheduling import priority_queue_name
+
+QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123/aperilex-default.fifo"
+
+
+def make_task(user_id: str = "alice") -> TaskMessage:
+    """Create a task message for a user."""
+    return TaskMessage(
+        task_id=uuid4(),
+        task_name="analyze_filing",
+        args=[],
+        kwargs={},
+        metadata={"user_id": user_id},
+    )
+
+
+@pytest.mark.unit
+class TestSQSRetries:
+    """Test retries are delayed without blocking the user's message group."""
+
+    def setup_method(self):
+        """Set up a connected service with a stubbed SQS client."""
+        self.service = SQSQueueService()
+        self.service.sqs_client = Mock()
+        self.service.queue_urls = {"default": QUEUE_URL}
+        self.service._missing_queues = {
+            priority_queue_name("default", priority, separator="-")
+            for priority in TaskPriority
+        } - {"default"}
+        self.service._connected = True
+
+    def receive(self, task: TaskMessage, receive_count: int = 1) -> None:
+        """Make the stubbed queue deliver a task."""
+        self.service.sqs_client.receive_message.return_value = {
+            "Messages": [
+                {
+                    "Body": json.dumps(self.service._task_to_message_body(task)),
+                    "ReceiptHandle": f"receipt-{receive_count}",
+                    "Attributes": {"ApproximateReceiveCount": str(receive_count)},
+                }
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_retry_sent_in_own_group_and_original_deleted(self):
+        """Test a retry does not hold back the user's later tasks."""
+        # Arrange
+        task = make_task()
+        self.receive(task)
+        [received] = await self.service.receive_tasks()
+        received.retry_count = 1
+
+        # Act
+        scheduled = await self.service.retry_task(received, delay=30)
+
+        # Assert
+        assert scheduled
+        sent = self.service.sqs_client.send_message.call_args.kwargs
+        user_group = self.service._message_send_params(make_task())["MessageGroupId"]
+        assert sent["MessageGroupId"] == f"default:scheduled:{task.task_id}"
+        assert sent["MessageGroupId"] != user_group
+        assert sent["MessageDeduplicationId"] == f"{task.task_id}:1"
+        self.service.sqs_client.delete_message.assert_called_once_with(
+            QueueUrl=QUEUE_URL, ReceiptHandle="receipt-1"
+        )
+        self.service.sqs_client.change_message_visibility.assert_not_called()
+        assert self.service.task_statuses[task.task_id] == TaskStatus.RETRY
+
+    @pytest.mark.asyncio
+    async def test_retry_hidden_until_due(self):
+        """Test a retry received before its delay elapsed is hidden, not run."""
+        # Arrange
+        task = make_task()
+        task.retry_count = 1
+        task.eta = datetime.utcnow() + timedelta(seconds=30)
+        self.receive(task)
+
+        # Act
+        tasks = await self.service.receive_tasks()
+
+        # Assert
+        assert tasks == []
+        visibility = self.service.sqs_client.change_message_visibility.call_args.kwargs
+        assert visibility["ReceiptHandle"] == "receipt-1"
+        assert 29 <= visibility["VisibilityTimeout"] <= 30
+        assert self.service.task_statuses[task.task_id] == TaskStatus.RETRY
+
+    @pytest.mark.asyncio
+    async def test_due_retry_delivered(self):
+        """Test a retry received once due is delivered with its retry count."""
+        # Arrange
+        task = make_task()
+        task.retry_count = 2
+        task.eta = datetime.utcnow() - timedelta(seconds=1)
+        self.receive(task, receive_count=2)
+
+        # Act
+        [received] = await self.service.receive_tasks()
+
+        # Assert
+        assert received.task_id == task.task_id
+        assert received.retry_count == 2
+        self.service.sqs_client.change_message_visibility.assert_not_called()
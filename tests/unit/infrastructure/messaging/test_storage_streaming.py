@@ -0,0 +1,181 @@
+"""Tests for streaming stored values in chunks and byte ranges."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.infrastructure.messaging.implementations.local_file_storage import (
+    LocalFileStorageService,
+)
+from src.infrastructure.messaging.implementations.mock_services import (
+    MockStorageService,
+)
+from src.infrastructure.messaging.implementations.s3_storage import S3StorageService
+from src.infrastructure.tasks.analysis_tasks import (
+    open_filing_sections,
+    store_filing_content,
+)
+from src.shared import serialization
+
+
+async def read(stored, start=0, end=None, chunk_size=4):
+    """Collect the chunks streamed from a stored value."""
+    return [chunk async for chunk in stored.stream(start, end, chunk_size)]
+
+
+class TestLocalFileStreaming:
+    """Test streaming files of the local storage backend."""
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_and_ranges(self, tmp_path):
+        """Test files are streamed in chunks, whole or by range."""
+        storage = LocalFileStorageService(base_path=str(tmp_path))
+        await storage.set_raw("filing:320193/1", b"0123456789")
+
+        stored = await storage.open("filing:320193/1")
+
+        assert stored.size == 10
+        assert await read(stored) == [b"0123", b"4567", b"89"]
+        assert await read(stored, 3, 8) == [b"3456", b"78"]
+        assert await read(stored, 8) == [b"89"]
+
+    @pytest.mark.asyncio
+    async def test_open_missing_key(self, tmp_path):
+        """Test opening a missing key returns None."""
+        storage = LocalFileStorageService(base_path=str(tmp_path))
+
+        assert await storage.open("filing:missing") is None
+
+
+class TestS3Streaming:
+    """Test streaming objects of the S3 storage backend."""
+
+    def setup_method(self):
+        """Set up a storage service with a stubbed S3 client."""
+        self.storage = S3StorageService(bucket_name="filings", prefix="filings/")
+        self.storage._connected = True
+        self.storage.s3_client = Mock()
+
+    @pytest.mark.asyncio
+    async def test_empty_object_streamed_without_range(self):
+        """Test whole objects are read without a range, so empty ones work."""
+        # Arrange
+        self.storage.s3_client.head_object.return_value = {
+            "ContentLength": 0,
+            "Metadata": {},
+        }
+        body = Mock()
+        body.iter_chunks.return_value = iter(())
+        self.storage.s3_client.get_object.return_value = {"Body": body}
+
+        # Act
+        stored = await self.storage.open("320193/1/sections")
+        chunks = await read(stored)
+
+        # Assert
+        assert stored.size == 0
+        assert chunks == []
+        self.storage.s3_client.get_object.assert_called_once_with(
+            Bucket="filings", Key="filings/320193/1/sections"
+        )
+
+    @pytest.mark.asyncio
+    async def test_byte_range_streamed_with_range(self):
+        """Test byte ranges are read with a ranged GET."""
+        # Arrange
+        body = Mock()
+        body.iter_chunks.return_value = iter([b"3456"])
+        self.storage.s3_client.get_object.return_value = {"Body": body}
+
+        # Act
+        chunks = [chunk async for chunk in self.storage.stream("320193/1", 3, 6)]
+
+        # Assert
+        assert chunks == [b"3456"]
+        self.storage.s3_client.get_object.assert_called_once_with(
+            Bucket="filings", Key="filings/320193/1", Range="bytes=3-6"
+        )
+        body.close.assert_called_once()
+
+
+class TestDefaultStreaming:
+    """Test streaming from backends without native streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_serialized_value(self):
+        """Test values are serialized and sliced into chunks."""
+        storage = MockStorageService()
+        await storage.set("task:1", {"a": 1})
+        data = serialization.dumps({"a": 1})
+
+        stored = await storage.open("task:1")
+
+        assert stored.size == len(data)
+        assert b"".join(await read(stored)) == data
+        assert await read(stored, 1, 3) == [data[1:4]]
+        assert await storage.open("task:missing") is None
+
+
+class TestFilingSections:
+    """Test the newline-delimited sections kept next to filing content."""
+
+    @pytest.mark.asyncio
+    async def test_sections_written_on_first_open(self, tmp_path):
+        """Test sections are extracted from the filing content once."""
+        storage = LocalFileStorageService(base_path=str(tmp_path))
+        await storage.set(
+            "filing:320193/000032019324000001",
+            {
+                "raw_html": "<html>...</html>",
+                "sections": {"Item 1": "Business", "Item 1A": "Risks"},
+            },
+        )
+        accession_number = AccessionNumber("0000320193-24-000001")
+
+        with (
+            patch("src.infrastructure.tasks.analysis_tasks.USE_S3_STORAGE", False),
+            patch(
+                "src.infrastructure.tasks.analysis_tasks.get_local_storage_service",
+                AsyncMock(return_value=storage),
+            ),
+        ):
+            first = await open_filing_sections(accession_number, CIK("320193"))
+            with patch.object(storage, "get", AsyncMock()) as get:
+                second = await open_filing_sections(accession_number, CIK("320193"))
+
+        lines = b"".join(await read(first, chunk_size=1024)).splitlines()
+        assert [serialization.loads(line) for line in lines] == [
+            {"section": "Item 1", "content": "Business"},
+            {"section": "Item 1A", "content": "Risks"},
+        ]
+        assert second == first
+        get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sections_written_with_filing(self, tmp_path):
+        """Test storing a filing writes its sections, so opening doesn't load it."""
+        storage = LocalFileStorageService(base_path=str(tmp_path))
+        accession_number = AccessionNumber("0000320193-24-000001")
+
+        with (
+            patch("src.infrastructure.tasks.analysis_tasks.USE_S3_STORAGE", False),
+            patch(
+                "src.infrastructure.tasks.analysis_tasks.get_local_storage_service",
+                AsyncMock(return_value=storage),
+            ),
+        ):
+            assert await store_filing_content(
+                accession_number,
+                CIK("320193"),
+                {"raw_html": "<html>...</html>", "sections": {"Item 1": "Business"}},
+            )
+            with patch.object(storage, "get", AsyncMock()) as get:
+                stored = await open_filing_sections(accession_number, CIK("320193"))
+
+        lines = b"".join(await read(stored, chunk_size=1024)).splitlines()
+        assert [serialization.loads(line) for line in lines] == [
+            {"section": "Item 1", "content": "Business"}
+        ]
+        get.assert_not_awaited()
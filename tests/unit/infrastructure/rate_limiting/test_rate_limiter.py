@@ -178,7 +178,8 @@ class TestAPIRateLimiter:
         # Assert
         assert ip == "unknown"
 
-    def test_check_request_allowed_within_limits(self):
+    @pytest.mark.asyncio
+    async def test_check_request_allowed_within_limits(self):
         """Test check_request when client is within limits."""
         # Arrange
         request = Mock(spec=Request)
@@ -197,14 +198,15 @@ class TestAPIRateLimiter:
 
         with patch.object(self.storage, 'check_rate_limit', return_value=mock_result):
             # Act
-            result = self.rate_limiter.check_request(request)
+            result = await self.rate_limiter.check_request(request)
 
         # Assert
         assert result.allowed is True
         assert result.current_hourly_count == 3
         assert result.current_daily_count == 8
 
-    def test_check_request_denied_hourly_limit_exceeded(self):
+    @pytest.mark.asyncio
+    async def test_check_request_denied_hourly_limit_exceeded(self):
         """Test check_request when hourly limit is exceeded."""
         # Arrange
         request = Mock(spec=Request)
@@ -225,14 +227,15 @@ class TestAPIRateLimiter:
 
         with patch.object(self.storage, 'check_rate_limit', return_value=mock_result):
             # Act
-            result = self.rate_limiter.check_request(request)
+            result = await self.rate_limiter.check_request(request)
 
         # Assert
         assert result.allowed is False
         assert result.limit_type == "hourly"
         assert result.retry_after_seconds == 3600
 
-    def test_check_request_denied_daily_limit_exceeded(self):
+    @pytest.mark.asyncio
+    async def test_check_request_denied_daily_limit_exceeded(self):
         """Test check_request when daily limit is exceeded."""
         # Arrange
         request = Mock(spec=Request)
@@ -253,14 +256,15 @@ class TestAPIRateLimiter:
 
         with patch.object(self.storage, 'check_rate_limit', return_value=mock_result):
             # Act
-            result = self.rate_limiter.check_request(request)
+            result = await self.rate_limiter.check_request(request)
 
         # Assert
         assert result.allowed is False
         assert result.limit_type == "daily"
         assert result.retry_after_seconds == 86400
 
-    def test_check_request_calls_storage_with_correct_parameters(self):
+    @pytest.mark.asyncio
+    async def test_check_request_calls_storage_with_correct_parameters(self):
         """Test that check_request calls storage with correct parameters."""
         # Arrange
         request = Mock(spec=Request)
@@ -280,7 +284,7 @@ class TestAPIRateLimiter:
             self.storage, 'check_rate_limit', return_value=mock_result
         ) as mock_check:
             # Act
-            self.rate_limiter.check_request(request)
+            await self.rate_limiter.check_request(request)
 
             # Assert
             mock_check.assert_called_once_with(
@@ -391,7 +395,8 @@ class TestAPIRateLimiter:
         # Assert
         assert "Retry-After" not in headers
 
-    def test_get_current_usage_returns_tuple(self):
+    @pytest.mark.asyncio
+    async def test_get_current_usage_returns_tuple(self):
         """Test get_current_usage returns correct tuple."""
         # Arrange
         request = Mock(spec=Request)
@@ -401,13 +406,14 @@ class TestAPIRateLimiter:
 
         with patch.object(self.storage, 'get_current_counts', return_value=(3, 8)):
             # Act
-            hourly, daily = self.rate_limiter.get_current_usage(request)
+            hourly, daily = await self.rate_limiter.get_current_usage(request)
 
         # Assert
         assert hourly == 3
         assert daily == 8
 
-    def test_get_current_usage_calls_storage_with_correct_ip(self):
+    @pytest.mark.asyncio
+    async def test_get_current_usage_calls_storage_with_correct_ip(self):
         """Test get_current_usage calls storage with correct client IP."""
         # Arrange
         request = Mock(spec=Request)
@@ -419,12 +425,13 @@ class TestAPIRateLimiter:
             self.storage, 'get_current_counts', return_value=(2, 5)
         ) as mock_counts:
             # Act
-            self.rate_limiter.get_current_usage(request)
+            await self.rate_limiter.get_current_usage(request)
 
             # Assert
             mock_counts.assert_called_once_with("203.0.113.195")
 
-    def test_reset_client_limits_calls_storage_reset(self):
+    @pytest.mark.asyncio
+    async def test_reset_client_limits_calls_storage_reset(self):
         """Test reset_client_limits calls storage reset method."""
         # Arrange
         request = Mock(spec=Request)
@@ -434,25 +441,27 @@ class TestAPIRateLimiter:
 
         with patch.object(self.storage, 'reset_client_limits') as mock_reset:
             # Act
-            self.rate_limiter.reset_client_limits(request)
+            await self.rate_limiter.reset_client_limits(request)
 
             # Assert
             mock_reset.assert_called_once_with("192.168.1.100")
 
-    def test_cleanup_expired_clients_calls_storage_cleanup(self):
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_clients_calls_storage_cleanup(self):
         """Test cleanup_expired_clients calls storage cleanup method."""
         # Arrange
         with patch.object(
             self.storage, 'cleanup_expired_clients', return_value=5
         ) as mock_cleanup:
             # Act
-            result = self.rate_limiter.cleanup_expired_clients()
+            result = await self.rate_limiter.cleanup_expired_clients()
 
             # Assert
             assert result == 5
             mock_cleanup.assert_called_once()
 
-    def test_get_stats_calls_storage_stats(self):
+    @pytest.mark.asyncio
+    async def test_get_stats_calls_storage_stats(self):
         """Test get_stats calls storage stats method."""
         # Arrange
         expected_stats = {
@@ -465,7 +474,7 @@ class TestAPIRateLimiter:
             self.storage, 'get_storage_stats', return_value=expected_stats
         ) as mock_stats:
             # Act
-            result = self.rate_limiter.get_stats()
+            result = await self.rate_limiter.get_stats()
 
             # Assert
             assert result == expected_stats
@@ -523,7 +532,8 @@ class TestAPIRateLimiterEdgeCases:
         # Assert
         assert ip == ""  # First element after split and strip
 
-    def test_check_request_with_unknown_client_ip(self):
+    @pytest.mark.asyncio
+    async def test_check_request_with_unknown_client_ip(self):
         """Test check_request behavior with 'unknown' client IP."""
         # Arrange
         request = Mock(spec=Request)
@@ -531,7 +541,7 @@ class TestAPIRateLimiterEdgeCases:
         request.client = None
 
         # Act
-        result = self.rate_limiter.check_request(request)
+        result = await self.rate_limiter.check_request(request)
 
         # Assert - should still work with 'unknown' as client_id
         assert isinstance(result, RateLimitResult)
@@ -611,7 +621,8 @@ class TestAPIRateLimiterEdgeCases:
                 value, str
             ), f"Header {key} should be string, got {type(value)}"
 
-    def test_concurrent_request_handling_thread_safety(self):
+    @pytest.mark.asyncio
+    async def test_concurrent_request_handling_thread_safety(self):
         """Test that concurrent requests don't interfere with each other."""
         # This test verifies that the APIRateLimiter itself doesn't have
         # thread safety issues (the storage layer handles the actual thread safety)
@@ -628,14 +639,15 @@ class TestAPIRateLimiterEdgeCases:
         request2.client.host = "192.168.1.101"
 
         # Act - make concurrent requests (simulated)
-        result1 = self.rate_limiter.check_request(request1)
-        result2 = self.rate_limiter.check_request(request2)
+        result1 = await self.rate_limiter.check_request(request1)
+        result2 = await self.rate_limiter.check_request(request2)
 
         # Assert - both should be processed independently
         assert result1.allowed is True
         assert result2.allowed is True
 
-    def test_rate_limiter_preserves_original_request_object(self):
+    @pytest.mark.asyncio
+    async def test_rate_limiter_preserves_original_request_object(self):
         """Test that rate limiter doesn't modify the original request object."""
         # Arrange
         request = Mock(spec=Request)
@@ -645,7 +657,7 @@ class TestAPIRateLimiterEdgeCases:
         original_headers = request.headers.copy()
 
         # Act
-        self.rate_limiter.check_request(request)
+        await self.rate_limiter.check_request(request)
 
         # Assert - request should be unchanged
         assert request.headers == original_headers
@@ -0,0 +1,129 @@
+"""Tests for RedisRateLimitStorage against an in-process Redis stand-in."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.rate_limiting import (
+    InMemoryRateLimitStorage,
+    RedisRateLimitStorage,
+    create_rate_limit_storage,
+)
+from src.infrastructure.rate_limiting.storage import DAY, HOUR
+
+fakeredis = pytest.importorskip("fakeredis")
+
+START = 19676 * DAY
+
+
+@pytest.mark.unit
+class TestRedisRateLimitStorage:
+    """Test rate limits shared through Redis."""
+
+    def setup_method(self):
+        """Set up two replicas sharing one Redis server."""
+        self.now = START
+        server = fakeredis.FakeServer()
+        self.replicas = [
+            RedisRateLimitStorage(
+                fakeredis.FakeAsyncRedis(server=server), clock=lambda: self.now
+            )
+            for _ in range(2)
+        ]
+        self.redis = fakeredis.FakeAsyncRedis(server=server)
+
+    @pytest.mark.asyncio
+    async def test_limit_shared_across_replicas(self):
+        """Test requests to any replica count towards one limit."""
+        # Act
+        results = [
+            await self.replicas[i % 2].check_rate_limit("192.168.1.1", 5, 20)
+            for i in range(7)
+        ]
+
+        # Assert
+        assert [result.allowed for result in results] == [True] * 5 + [False] * 2
+        assert results[4].current_hourly_count == 5
+        assert results[5].limit_type == "hourly"
+        assert results[5].current_hourly_count == 5
+        assert await self.replicas[1].get_current_counts("192.168.1.1") == (5, 5)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_respect_limit(self):
+        """Test concurrent requests on several replicas cannot exceed a limit."""
+        # Act
+        results = await asyncio.gather(
+            *(
+                self.replicas[i % 2].check_rate_limit("192.168.1.1", 10, 50)
+                for i in range(15)
+            )
+        )
+
+        # Assert
+        assert sum(result.allowed for result in results) == 10
+
+    @pytest.mark.asyncio
+    async def test_previous_window_slides_out(self):
+        """Test requests of the previous hour count less as it slides out."""
+        # Arrange
+        for _ in range(8):
+            await self.replicas[0].check_rate_limit("192.168.1.1", 8, 24)
+
+        # Act
+        self.now += HOUR + HOUR / 2
+        results = [
+            await self.replicas[1].check_rate_limit("192.168.1.1", 8, 24)
+            for _ in range(5)
+        ]
+
+        # Assert
+        assert [result.allowed for result in results] == [True] * 4 + [False]
+        assert results[4].retry_after_seconds == 450
+
+    @pytest.mark.asyncio
+    async def test_counters_expire(self):
+        """Test counter keys expire once they no longer affect a count."""
+        # Act
+        await self.replicas[0].check_rate_limit("192.168.1.1", 8, 24)
+
+        # Assert
+        hourly_key = f"ratelimit:192.168.1.1:{HOUR}:{START // HOUR}"
+        daily_key = f"ratelimit:192.168.1.1:{DAY}:{START // DAY}"
+        assert await self.redis.ttl(hourly_key) == 2 * HOUR
+        assert await self.redis.ttl(daily_key) == 2 * DAY
+
+    @pytest.mark.asyncio
+    async def test_reset_and_cleanup(self):
+        """Test resetting a client and removing idle clients from the index."""
+        # Arrange
+        await self.replicas[0].check_rate_limit("idle", 8, 24)
+        self.now += DAY
+        for _ in range(3):
+            await self.replicas[0].check_rate_limit("active", 8, 24)
+
+        # Act
+        await self.replicas[1].reset_client_limits("active")
+        cleaned_count = await self.replicas[1].cleanup_expired_clients()
+
+        # Assert
+        assert cleaned_count == 1
+        assert await self.replicas[0].get_current_counts("active") == (0, 0)
+        assert await self.replicas[0].get_storage_stats() == {"total_clients": 0}
+
+
+@pytest.mark.unit
+class TestCreateRateLimitStorage:
+    """Test choosing the rate limit storage from settings."""
+
+    def test_backend_from_settings(self):
+        """Test the configured backend is created."""
+        with patch(
+            "src.infrastructure.rate_limiting.rate_limiter.settings"
+        ) as mock_settings:
+            mock_settings.rate_limit_backend = "memory"
+            assert isinstance(create_rate_limit_storage(), InMemoryRateLimitStorage)
+
+            mock_settings.rate_limit_backend = "redis"
+            mock_settings.rate_limit_redis_url = "redis://localhost:6379/0"
+            assert isinstance(create_rate_limit_storage(), RedisRateLimitStorage)
@@ -1,20 +1,30 @@
 """Comprehensive tests for AnalysisRepository targeting 95%+ coverage."""
 
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import Result, ScalarResult
+from sqlalchemy import Result, ScalarResult, Update, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
 from src.domain.value_objects.accession_number import AccessionNumber
 from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.infrastructure.database.cache import cache_manager
 from src.infrastructure.database.models import Analysis as AnalysisModel
 from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
+from src.infrastructure.repositories.filing_repository import FilingRepository
 
 
 @pytest.fixture
@@ -830,6 +840,54 @@ class TestAnalysisRepositoryStorageIntegration:
             assert results == sample_results
             mock_storage.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_open_results_by_id(
+        self, mock_session, repository, sample_analysis_id, sample_cik
+    ):
+        """Test open_results_by_id opens the results stored for the filing."""
+        # Arrange
+        mock_result = Mock(spec=Result)
+        mock_result.first.return_value = Mock(
+            cik="0000320193", accession_number="0000320193-23-000106"
+        )
+        mock_session.execute.return_value = mock_result
+        stored = Mock()
+
+        with patch(
+            "src.infrastructure.tasks.analysis_tasks.open_analysis_results",
+            return_value=stored,
+        ) as mock_open:
+            # Act
+            result = await repository.open_results_by_id(sample_analysis_id)
+
+            # Assert
+            assert result is stored
+            mock_open.assert_called_once_with(
+                sample_analysis_id,
+                sample_cik,
+                AccessionNumber("0000320193-23-000106"),
+            )
+
+    @pytest.mark.asyncio
+    async def test_open_results_by_id_analysis_not_found(
+        self, mock_session, repository, sample_analysis_id
+    ):
+        """Test open_results_by_id returns None for an unknown analysis."""
+        # Arrange
+        mock_result = Mock(spec=Result)
+        mock_result.first.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        with patch(
+            "src.infrastructure.tasks.analysis_tasks.open_analysis_results"
+        ) as mock_open:
+            # Act
+            result = await repository.open_results_by_id(sample_analysis_id)
+
+            # Assert
+            assert result is None
+            mock_open.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_by_id_with_results_analysis_not_found(
         self, mock_session, repository, sample_analysis_id
@@ -1601,7 +1659,9 @@ class TestAnalysisRepositoryInheritedMethods:
     @pytest.fixture
     def repository(self, mock_session):
         """Create AnalysisRepository instance."""
-        return AnalysisRepository(mock_session)
+        repository = AnalysisRepository(mock_session)
+        repository.company_stats = AsyncMock(spec=CompanyStatsRepository)
+        return repository
 
     @pytest.fixture
     def sample_entity(self, valid_analysis_for_repo):
@@ -1660,12 +1720,15 @@ class TestAnalysisRepositoryInheritedMethods:
         added_model = mock_session.add.call_args[0][0]
         assert isinstance(added_model, AnalysisModel)
         assert added_model.analysis_type == sample_entity.analysis_type.value
+        repository.company_stats.refresh_for_filings.assert_called_once()
+        (refreshed,) = repository.company_stats.refresh_for_filings.call_args[0]
+        assert list(refreshed) == [sample_entity.filing_id]
 
     @pytest.mark.asyncio
-    async def test_inherited_update_merges_analysis_model(
+    async def test_inherited_update_issues_analysis_update(
         self, mock_session, repository, sample_entity
     ):
-        """Test inherited update merges Analysis model."""
+        """Test inherited update issues an UPDATE of the Analysis row."""
         # Arrange - Create updated entity
         updated_entity = Analysis(
             id=sample_entity.id,
@@ -1685,13 +1748,14 @@ class TestAnalysisRepositoryInheritedMethods:
         # Assert
         assert result is updated_entity
         assert result.llm_provider == "updated-provider"
-        mock_session.merge.assert_called_once()
+        mock_session.merge.assert_not_called()
         mock_session.flush.assert_called_once()
 
-        # Verify AnalysisModel was merged
-        merged_model = mock_session.merge.call_args[0][0]
-        assert isinstance(merged_model, AnalysisModel)
-        assert merged_model.llm_provider == "updated-provider"
+        # Verify the analysis row was updated by primary key
+        stmt = mock_session.execute.call_args_list[0][0][0]
+        assert isinstance(stmt, Update)
+        assert stmt.table.name == AnalysisModel.__tablename__
+        assert stmt.compile().params["llm_provider"] == "updated-provider"
 
     @pytest.mark.asyncio
     async def test_inherited_delete_removes_analysis(
@@ -1830,3 +1894,144 @@ class TestAnalysisRepositoryCoverage:
         for method in storage_methods:
             assert hasattr(AnalysisRepository, method)
             assert callable(getattr(AnalysisRepository, method))
+
+
+class TestAnalysisRepositorySummaryBackfill:
+    """Test recording summaries of analyses stored without one."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Isolate tests from cached lookups of other tests."""
+        cache_manager.clear_all()
+        yield
+        cache_manager.clear_all()
+
+    @pytest.mark.asyncio
+    async def test_backfill_summaries(self, async_session):
+        """Test analyses with stored results get a summary, others keep none."""
+        company = await CompanyRepository(async_session).create(
+            Company(id=uuid4(), cik=CIK("320193"), name="Apple", metadata={})
+        )
+        filing = await FilingRepository(async_session).create(
+            Filing(
+                id=uuid4(),
+                company_id=company.id,
+                accession_number=AccessionNumber("0000320193-24-000001"),
+                filing_type=FilingType.FORM_10K,
+                filing_date=date(2024, 11, 1),
+                processing_status=ProcessingStatus.COMPLETED,
+            )
+        )
+        repository = AnalysisRepository(async_session)
+        stored, missing = [
+            await repository.create(
+                Analysis(
+                    id=uuid4(),
+                    filing_id=filing.id,
+                    analysis_type=AnalysisType.COMPREHENSIVE,
+                    created_by="analyst@example.com",
+                    llm_provider="openai",
+                    llm_model="gpt-4",
+                )
+            )
+            for _ in range(2)
+        ]
+        results = {
+            "executive_summary": "Strong year",
+            "section_analyses": [{"section_name": "Business"}],
+        }
+
+        async def from_storage(analysis_id, company_cik, accession_number):
+            return results if analysis_id == stored.id else None
+
+        with patch.object(
+            repository, "get_analysis_results_from_storage", side_effect=from_storage
+        ):
+            assert await repository.backfill_summaries(batch_size=1) == 1
+
+        summaries = dict(
+            (
+                await async_session.execute(
+                    select(AnalysisModel.id, AnalysisModel.summary)
+                )
+            ).all()
+        )
+        assert summaries[stored.id]["executive_summary"] == "Strong year"
+        assert summaries[stored.id]["section_names"] == ["Business"]
+        assert summaries[missing.id] is None
+
+
+class TestAnalysisRepositoryBatchLookups:
+    """Test looking up many analyses and filings with single queries."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Isolate tests from cached lookups of other tests."""
+        cache_manager.clear_all()
+        yield
+        cache_manager.clear_all()
+
+    @pytest.mark.asyncio
+    async def test_batch_lookups(self, async_session):
+        """Test analyses, their storage locations and filings are found by IDs."""
+        company = await CompanyRepository(async_session).create(
+            Company(id=uuid4(), cik=CIK("320193"), name="Apple", metadata={})
+        )
+        filing_repository = FilingRepository(async_session)
+        filings = [
+            await filing_repository.create(
+                Filing(
+                    id=uuid4(),
+                    company_id=company.id,
+                    accession_number=AccessionNumber(f"0000320193-24-00000{i}"),
+                    filing_type=FilingType.FORM_10K,
+                    filing_date=date(2024, 11, i),
+                    processing_status=ProcessingStatus.COMPLETED,
+                )
+            )
+            for i in (1, 2)
+        ]
+        repository = AnalysisRepository(async_session)
+        analyses = [
+            await repository.create(
+                Analysis(
+                    id=uuid4(),
+                    filing_id=filings[0].id,
+                    analysis_type=AnalysisType.COMPREHENSIVE,
+                    created_by="analyst@example.com",
+                    llm_provider="openai",
+                    llm_model="gpt-4",
+                )
+            )
+            for _ in range(2)
+        ]
+        ids = [analyses[0].id, uuid4(), analyses[1].id]
+
+        # Analyses are loaded in one query, including those not in the session
+        async_session.expunge_all()
+        repository.identity_map.clear()
+        found = await repository.get_by_ids(ids)
+        locations = await repository.get_storage_locations(ids)
+
+        assert {analysis.id for analysis in found} == {a.id for a in analyses}
+        assert locations == {
+            analysis.id: (CIK("320193"), AccessionNumber("0000320193-24-000001"))
+            for analysis in analyses
+        }
+        assert await repository.get_storage_locations([]) == {}
+
+        rows = await filing_repository.get_many_by_accession_numbers(
+            [
+                AccessionNumber("0000320193-24-000001"),
+                AccessionNumber("0000320193-24-000002"),
+                AccessionNumber("0000320193-24-000009"),
+            ]
+        )
+        counts = {
+            str(filing.accession_number): (count, latest is not None)
+            for filing, count, latest in rows
+        }
+        assert counts == {
+            "0000320193-24-000001": (2, True),
+            "0000320193-24-000002": (0, False),
+        }
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock, call
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import Update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -243,10 +244,10 @@ class TestBaseRepositorySuccessfulExecution:
         assert added_model.id == sample_entity.id
 
     @pytest.mark.asyncio
-    async def test_update_merges_model_and_returns_entity(
+    async def test_update_issues_single_update_and_returns_entity(
         self, mock_session, repository, sample_entity
     ):
-        """Test update merges model and returns entity."""
+        """Test update issues one UPDATE by primary key and returns entity."""
         # Arrange - entity with updated values
         updated_entity = Analysis(
             id=sample_entity.id,
@@ -269,13 +270,38 @@ class TestBaseRepositorySuccessfulExecution:
         assert result.confidence_score == 0.95
 
         # Verify session calls
-        mock_session.merge.assert_called_once()
+        mock_session.execute.assert_called_once()
         mock_session.flush.assert_called_once()
 
-        # Verify the merged model
-        merged_model = mock_session.merge.call_args[0][0]
-        assert isinstance(merged_model, AnalysisModel)
-        assert merged_model.confidence_score == 0.95
+        mock_session.merge.assert_not_called()
+        mock_session.add.assert_not_called()
+
+        # Verify the UPDATE statement
+        stmt = mock_session.execute.call_args[0][0]
+        assert isinstance(stmt, Update)
+        assert stmt.table.name == AnalysisModel.__tablename__
+        params = stmt.compile().params
+        assert params["confidence_score"] == 0.95
+        assert params["id_1"] == sample_entity.id
+
+    @pytest.mark.asyncio
+    async def test_update_inserts_missing_entity(
+        self, mock_session, repository, sample_entity
+    ):
+        """Test update inserts an entity that does not exist yet."""
+        # Arrange
+        mock_session.execute.return_value = Mock(rowcount=0)
+
+        # Act
+        result = await repository.update(sample_entity)
+
+        # Assert
+        assert result is sample_entity
+        mock_session.execute.assert_called_once()
+        added_model = mock_session.add.call_args[0][0]
+        assert isinstance(added_model, AnalysisModel)
+        assert added_model.id == sample_entity.id
+        mock_session.flush.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_delete_removes_existing_entity(
@@ -426,7 +452,7 @@ class TestBaseRepositoryErrorHandling:
         """Test update propagates database errors."""
         # Arrange
         database_error = SQLAlchemyError("Update failed")
-        mock_session.merge.side_effect = database_error
+        mock_session.execute.side_effect = database_error
 
         # Act & Assert
         with pytest.raises(SQLAlchemyError) as exc_info:
@@ -448,7 +474,7 @@ class TestBaseRepositoryErrorHandling:
             await repository.update(sample_entity)
 
         assert exc_info.value is flush_error
-        mock_session.merge.assert_called_once()
+        mock_session.execute.assert_called_once()
         mock_session.flush.assert_called_once()
 
     @pytest.mark.asyncio
@@ -697,7 +723,7 @@ class TestBaseRepositoryEdgeCases:
         assert result.confidence_score == 0.8
 
         # Verify session calls
-        mock_session.merge.assert_called_once()
+        mock_session.execute.assert_called_once()
         mock_session.flush.assert_called_once()
 
     @pytest.mark.asyncio
@@ -754,7 +780,7 @@ class TestBaseRepositoryEdgeCases:
         # Assert - verify flush called for each operation
         assert mock_session.flush.call_count == 4
         assert mock_session.add.call_count == 2
-        assert mock_session.merge.call_count == 1
+        assert mock_session.execute.call_count == 1
         assert mock_session.delete.call_count == 1
 
     @pytest.mark.asyncio
@@ -965,7 +991,7 @@ class TestBaseRepositoryIntegration:
         # Assert 3: Update
         assert update_result is updated_entity
         assert update_result.confidence_score == 0.95
-        mock_session.merge.assert_called_once()
+        mock_session.execute.assert_called_once()
         assert mock_session.flush.call_count == 2  # Create + Update
 
         # Act 4: Delete
@@ -1020,7 +1046,7 @@ class TestBaseRepositoryIntegration:
         assert mock_session.commit.call_count == 2
         assert mock_session.rollback.call_count == 1
         assert mock_session.add.call_count == 1
-        assert mock_session.merge.call_count == 2
+        assert mock_session.execute.call_count == 2
         assert mock_session.flush.call_count == 3  # create + 2 updates
 
     @pytest.mark.asyncio
@@ -1105,7 +1131,7 @@ class TestBaseRepositoryIntegration:
             await repository.update(updated_entity)
 
         # Assert: All updates completed
-        assert mock_session.merge.call_count == 5
+        assert mock_session.execute.call_count == 5
         assert mock_session.flush.call_count == 10  # 5 creates + 5 updates
 
     @pytest.mark.asyncio
@@ -1169,7 +1195,7 @@ class TestBaseRepositoryIntegration:
 
         # Verify complete lifecycle
         assert mock_session.add.call_count == 1
-        assert mock_session.merge.call_count == 1
+        assert mock_session.execute.call_count == 1
         assert mock_session.delete.call_count == 1
         assert (
             mock_session.get.call_count == 3
@@ -1227,7 +1253,7 @@ class TestBaseRepositoryIntegration:
             await repository.update(updated_entity)
 
         # Assert: Bulk update
-        assert mock_session.merge.call_count == 10
+        assert mock_session.execute.call_count == 10
         assert mock_session.flush.call_count == 20  # 10 creates + 10 updates
 
         # Act: Transaction commit for bulk operations
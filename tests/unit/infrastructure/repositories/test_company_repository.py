@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import Result, ScalarResult
+from sqlalchemy import Result, ScalarResult, Update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -1294,10 +1294,10 @@ class TestCompanyRepositoryInheritedMethods:
         assert added_model.cik == str(sample_entity.cik)
 
     @pytest.mark.asyncio
-    async def test_inherited_update_merges_company_model(
+    async def test_inherited_update_issues_company_update(
         self, mock_session, repository, sample_entity
     ):
-        """Test inherited update merges Company model."""
+        """Test inherited update issues an UPDATE of the Company row."""
         # Arrange - Create updated entity
         updated_entity = Company(
             id=sample_entity.id,
@@ -1312,13 +1312,14 @@ class TestCompanyRepositoryInheritedMethods:
         # Assert
         assert result is updated_entity
         assert result.name == "Updated Company Name"
-        mock_session.merge.assert_called_once()
+        mock_session.merge.assert_not_called()
         mock_session.flush.assert_called_once()
 
-        # Verify CompanyModel was merged
-        merged_model = mock_session.merge.call_args[0][0]
-        assert isinstance(merged_model, CompanyModel)
-        assert merged_model.name == "Updated Company Name"
+        # Verify the company row was updated by primary key
+        stmt = mock_session.execute.call_args_list[0][0][0]
+        assert isinstance(stmt, Update)
+        assert stmt.table.name == CompanyModel.__tablename__
+        assert stmt.compile().params["name"] == "Updated Company Name"
 
     @pytest.mark.asyncio
     async def test_inherited_delete_removes_company(
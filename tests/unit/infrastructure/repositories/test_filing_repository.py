@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import Result, ScalarResult
+from sqlalchemy import Result, ScalarResult, Update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,9 @@ from src.domain.value_objects.filing_type import FilingType
 from src.domain.value_objects.processing_status import ProcessingStatus
 from src.infrastructure.database.models import Company as CompanyModel
 from src.infrastructure.database.models import Filing as FilingModel
+from src.infrastructure.repositories.company_stats_repository import (
+    CompanyStatsRepository,
+)
 from src.infrastructure.repositories.filing_repository import FilingRepository
 
 
@@ -628,24 +631,13 @@ class TestFilingRepositorySuccessfulExecution:
         filing_ids = [uuid4(), uuid4(), uuid4()]
         status = ProcessingStatus.PROCESSING
 
-        filing_models = [
-            FilingModel(
-                id=filing_id,
-                company_id=uuid4(),
-                accession_number=f"0000320193-23-00{i:04d}",
-                filing_type="10-K",
-                filing_date=date(2023, 12, 31),
-                processing_status=ProcessingStatus.PENDING.value,
-                processing_error=None,
-                meta_data={},
-            )
+        updated_rows = [
+            (filing_id, uuid4(), f"0000320193-23-00{i:04d}", "10-K")
             for i, filing_id in enumerate(filing_ids)
         ]
 
-        mock_scalars = Mock(spec=ScalarResult)
-        mock_scalars.all.return_value = filing_models
         mock_result = Mock(spec=Result)
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = updated_rows
         mock_session.execute.return_value = mock_result
 
         # Act
@@ -656,9 +648,10 @@ class TestFilingRepositorySuccessfulExecution:
         mock_session.execute.assert_called_once()
         mock_session.flush.assert_called_once()
 
-        # Verify all models were updated
-        for model in filing_models:
-            assert model.processing_status == status.value
+        # Verify all filings were updated with a single UPDATE
+        stmt = mock_session.execute.call_args[0][0]
+        assert isinstance(stmt, Update)
+        assert stmt.compile().params["processing_status"] == status.value
 
     @pytest.mark.asyncio
     async def test_batch_update_status_with_empty_list(self, mock_session, repository):
@@ -667,19 +660,12 @@ class TestFilingRepositorySuccessfulExecution:
         filing_ids = []
         status = ProcessingStatus.PROCESSING
 
-        mock_scalars = Mock(spec=ScalarResult)
-        mock_scalars.all.return_value = []
-        mock_result = Mock(spec=Result)
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
         # Act
         count = await repository.batch_update_status(filing_ids, status)
 
         # Assert
         assert count == 0
-        mock_session.execute.assert_called_once()
-        mock_session.flush.assert_called_once()
+        mock_session.execute.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_by_ticker_with_filters_returns_filings(
@@ -1647,41 +1633,21 @@ class TestFilingRepositoryEdgeCases:
         filing_ids = [uuid4(), uuid4(), uuid4()]
         status = ProcessingStatus.PROCESSING
 
-        # Only return models for 2 out of 3 filing IDs
-        filing_models = [
-            FilingModel(
-                id=filing_ids[0],
-                company_id=uuid4(),
-                accession_number="0000320193-23-000106",
-                filing_type="10-K",
-                filing_date=date(2023, 12, 31),
-                processing_status=ProcessingStatus.PENDING.value,
-                processing_error=None,
-                meta_data={},
-            ),
-            FilingModel(
-                id=filing_ids[1],
-                company_id=uuid4(),
-                accession_number="0000320193-23-000058",
-                filing_type="10-Q",
-                filing_date=date(2023, 9, 30),
-                processing_status=ProcessingStatus.PENDING.value,
-                processing_error=None,
-                meta_data={},
-            ),
+        # Only 2 out of 3 filing IDs match a row
+        updated_rows = [
+            (filing_ids[0], uuid4(), "0000320193-23-000106", "10-K"),
+            (filing_ids[1], uuid4(), "0000320193-23-000058", "10-Q"),
         ]
 
-        mock_scalars = Mock(spec=ScalarResult)
-        mock_scalars.all.return_value = filing_models
         mock_result = Mock(spec=Result)
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = updated_rows
         mock_session.execute.return_value = mock_result
 
         # Act
         count = await repository.batch_update_status(filing_ids, status)
 
         # Assert
-        assert count == 2  # Only 2 models were found and updated
+        assert count == 2  # Only 2 rows were found and updated
         mock_session.execute.assert_called_once()
         mock_session.flush.assert_called_once()
 
@@ -1704,7 +1670,9 @@ class TestFilingRepositoryInheritedMethods:
     @pytest.fixture
     def repository(self, mock_session):
         """Create FilingRepository instance."""
-        return FilingRepository(mock_session)
+        repository = FilingRepository(mock_session)
+        repository.company_stats = AsyncMock(spec=CompanyStatsRepository)
+        return repository
 
     @pytest.fixture
     def sample_entity(self, valid_filing):
@@ -1762,12 +1730,15 @@ class TestFilingRepositoryInheritedMethods:
         added_model = mock_session.add.call_args[0][0]
         assert isinstance(added_model, FilingModel)
         assert added_model.accession_number == str(sample_entity.accession_number)
+        repository.company_stats.refresh.assert_called_once()
+        (refreshed,) = repository.company_stats.refresh.call_args[0]
+        assert list(refreshed) == [sample_entity.company_id]
 
     @pytest.mark.asyncio
-    async def test_inherited_update_merges_filing_model(
+    async def test_inherited_update_issues_filing_update(
         self, mock_session, repository, sample_entity
     ):
-        """Test inherited update merges Filing model."""
+        """Test inherited update issues an UPDATE of the Filing row."""
         # Arrange - Create updated entity
         updated_entity = Filing(
             id=sample_entity.id,
@@ -1786,13 +1757,17 @@ class TestFilingRepositoryInheritedMethods:
         # Assert
         assert result is updated_entity
         assert result.processing_status == ProcessingStatus.COMPLETED
-        mock_session.merge.assert_called_once()
+        mock_session.merge.assert_not_called()
         mock_session.flush.assert_called_once()
 
-        # Verify FilingModel was merged
-        merged_model = mock_session.merge.call_args[0][0]
-        assert isinstance(merged_model, FilingModel)
-        assert merged_model.processing_status == ProcessingStatus.COMPLETED.value
+        # Verify the filing row was updated by primary key
+        stmt = mock_session.execute.call_args_list[0][0][0]
+        assert isinstance(stmt, Update)
+        assert stmt.table.name == FilingModel.__tablename__
+        assert (
+            stmt.compile().params["processing_status"]
+            == ProcessingStatus.COMPLETED.value
+        )
 
     @pytest.mark.asyncio
     async def test_inherited_delete_removes_filing(
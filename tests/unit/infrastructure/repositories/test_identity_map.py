@@ -0,0 +1,226 @@
+"""Tests for the session-scoped identity map of repositories."""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.infrastructure.database.cache import cache_manager
+from src.infrastructure.database.models import CompanyTicker as CompanyTickerModel
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.filing_repository import FilingRepository
+from src.infrastructure.repositories.identity_map import IdentityMap, identity_map
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from cached lookups of other tests."""
+    cache_manager.clear_all()
+    yield
+    cache_manager.clear_all()
+
+
+@pytest.fixture
+def statements(async_engine):
+    """SQL statements executed on the engine during the test."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+async def filing(async_session) -> Filing:
+    """Stored filing, no longer tracked in the session."""
+    company = await CompanyRepository(async_session).create(
+        Company(id=uuid4(), cik=CIK("320193"), name="Apple", metadata={})
+    )
+    filing = await FilingRepository(async_session).create(
+        Filing(
+            id=uuid4(),
+            company_id=company.id,
+            accession_number=AccessionNumber("0000320193-24-000001"),
+            filing_type=FilingType.FORM_10K,
+            filing_date=date(2024, 11, 1),
+            processing_status=ProcessingStatus.PENDING,
+        )
+    )
+    await async_session.commit()
+    identity_map(async_session).clear()
+    cache_manager.clear_all()
+    return filing
+
+
+class TestIdentityMap:
+    """Test tracking entities and their changes."""
+
+    def test_changes_against_snapshot(self):
+        """Test only values that differ from the snapshot are changes."""
+        tracked = IdentityMap()
+        entity = Company(id=uuid4(), cik=CIK("320193"), name="Apple", metadata={})
+        values = {"id": entity.id, "name": "Apple", "meta_data": {"a": 1}}
+        tracked.add(object, entity, values)
+
+        # The snapshot is a copy, so in-place changes are detected
+        values["meta_data"]["a"] = 2
+
+        assert tracked.changes(object, entity.id, values) == {"meta_data": {"a": 2}}
+        assert tracked.changes(object, uuid4(), values) is None
+
+    def test_first_instance_wins(self):
+        """Test adding another instance of a tracked entity returns the first."""
+        tracked = IdentityMap()
+        entity_id = uuid4()
+        first = Company(id=entity_id, cik=CIK("320193"), name="Apple", metadata={})
+        second = Company(id=entity_id, cik=CIK("320193"), name="Apple", metadata={})
+
+        assert tracked.add(object, first, {}) is first
+        assert tracked.add(object, second, {}, ("cik:320193",)) is first
+        assert tracked.get_by_key(object, "cik:320193") is first
+
+
+class TestRepositoryIdentityMap:
+    """Test repositories return tracked entities and write only changes."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_load_once(self, async_session, filing, statements):
+        """Test lookups by accession number and ID share one instance."""
+        repository = FilingRepository(async_session)
+
+        by_accession = await repository.get_by_accession_number(filing.accession_number)
+        by_id = await FilingRepository(async_session).get_by_id(filing.id)
+        again = await repository.get_by_accession_number(filing.accession_number)
+
+        assert by_accession is by_id is again
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_isolated(self, async_engine, async_session, filing):
+        """Test another session does not see the entities of this one."""
+        loaded = await FilingRepository(async_session).get_by_id(filing.id)
+        cache_manager.clear_all()
+
+        async with AsyncSession(async_engine) as other:
+            assert await FilingRepository(other).get_by_id(filing.id) is not loaded
+
+    @pytest.mark.asyncio
+    async def test_unchanged_update_is_skipped(self, async_session, filing, statements):
+        """Test updating an unchanged tracked entity executes nothing."""
+        repository = FilingRepository(async_session)
+        loaded = await repository.get_by_id(filing.id)
+        statements.clear()
+
+        await repository.update(loaded)
+
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_update_writes_changed_columns(
+        self, async_session, filing, statements
+    ):
+        """Test an update only sets the columns that changed."""
+        repository = FilingRepository(async_session)
+        loaded = await repository.get_by_id(filing.id)
+        loaded.mark_as_processing()
+        statements.clear()
+
+        await repository.update(loaded)
+
+        [update] = [s for s in statements if s.startswith("UPDATE filings")]
+        assert update.startswith(
+            "UPDATE filings SET processing_status=?, updated_at=CURRENT_TIMESTAMP WHERE"
+        )
+
+        # Writing the same values again is a no-op
+        statements.clear()
+        await repository.update(loaded)
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_batch_status_update_evicts(self, async_session, filing):
+        """Test set-based status updates do not leave stale entities."""
+        repository = FilingRepository(async_session)
+        stale = await repository.get_by_id(filing.id)
+
+        await repository.batch_update_status([filing.id], ProcessingStatus.COMPLETED)
+
+        reloaded = await repository.get_by_id(filing.id)
+        assert reloaded is not stale
+        assert reloaded.processing_status == ProcessingStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_rollback_clears(self, async_session, filing):
+        """Test a rollback discards entities holding unsaved values."""
+        repository = FilingRepository(async_session)
+        await repository.get_by_id(filing.id)
+
+        await async_session.rollback()
+
+        assert len(identity_map(async_session)) == 0
+
+    @pytest.mark.asyncio
+    async def test_commits_clear(self, async_engine, async_session, filing):
+        """Test entities are not reused across commits of one session."""
+        repository = FilingRepository(async_session)
+        first = await repository.get_by_id(filing.id)
+        first.mark_as_processing()
+        await repository.update(first)
+        await async_session.commit()
+
+        assert len(identity_map(async_session)) == 0
+
+        # Another session changes the row between this session's commits
+        async with AsyncSession(async_engine) as other:
+            changed = await FilingRepository(other).get_by_id(filing.id)
+            changed.mark_as_completed()
+            await FilingRepository(other).update(changed)
+            await other.commit()
+        cache_manager.clear_all()
+
+        second = await repository.get_by_id(filing.id)
+        await async_session.commit()
+
+        assert second is not first
+        assert second.processing_status == ProcessingStatus.COMPLETED
+        assert len(identity_map(async_session)) == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_entity_not_tracked(self, async_engine, async_session, filing):
+        """Test changes to a tracked entity do not leak into the cache."""
+        loaded = await FilingRepository(async_session).get_by_id(filing.id)
+        loaded.mark_as_processing()
+
+        async with AsyncSession(async_engine) as other:
+            cached = await FilingRepository(other).get_by_id(filing.id)
+
+        assert cached.processing_status == ProcessingStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_company_tickers_synced_on_metadata_change(
+        self, async_session, filing, statements
+    ):
+        """Test company updates resync tickers only when the metadata changed."""
+        repository = CompanyRepository(async_session)
+        company = await repository.get_by_cik(CIK("320193"))
+        company.add_metadata("ticker", "AAPL")
+
+        await repository.update(company)
+
+        rows = await async_session.execute(select(CompanyTickerModel.ticker))
+        assert rows.scalars().all() == ["AAPL"]
+
+        statements.clear()
+        await repository.update(company)
+        assert statements == []
@@ -0,0 +1,79 @@
+"""Tests for MetricsMiddleware and the metrics endpoint."""
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.presentation.api.app import app
+from src.presentation.api.middleware.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+
+
+def request_count(method: str, route: str, status: str) -> float:
+    """Get the number of requests recorded for a route."""
+    return (
+        REGISTRY.get_sample_value(
+            "aperilex_http_request_duration_seconds_count",
+            {"method": method, "route": route, "status": status},
+        )
+        or 0.0
+    )
+
+
+@pytest.mark.unit
+class TestMetricsMiddleware:
+    """Test MetricsMiddleware functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        test_app = FastAPI()
+        test_app.add_middleware(MetricsMiddleware)
+
+        @test_app.get("/metered/{item_id}")
+        async def get_item(item_id: int) -> dict[str, int]:
+            if item_id == 0:
+                raise HTTPException(status_code=404, detail="Item not found")
+            return {"item_id": item_id}
+
+        self.client = TestClient(test_app)
+
+    def test_requests_recorded_by_route_template(self):
+        """Test requests to one route are one series whatever their parameters."""
+        before = request_count("GET", "/metered/{item_id}", "200")
+
+        self.client.get("/metered/1")
+        self.client.get("/metered/2")
+
+        assert request_count("GET", "/metered/{item_id}", "200") == before + 2
+
+    def test_status_of_failed_requests_recorded(self):
+        """Test error responses are recorded with their status."""
+        before = request_count("GET", "/metered/{item_id}", "404")
+
+        self.client.get("/metered/0")
+
+        assert request_count("GET", "/metered/{item_id}", "404") == before + 1
+
+    def test_unmatched_paths_share_one_series(self):
+        """Test requests no route matched are not labelled with their path."""
+        before = request_count("GET", UNMATCHED_ROUTE, "404")
+
+        self.client.get("/unknown/path")
+
+        assert request_count("GET", UNMATCHED_ROUTE, "404") == before + 1
+
+
+@pytest.mark.unit
+class TestMetricsEndpoint:
+    """Test the Prometheus metrics endpoint of the application."""
+
+    def test_metrics_exported(self):
+        """Test metrics are served in the Prometheus text format."""
+        client = TestClient(app)
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "aperilex_http_request_duration_seconds" in response.text
+        assert "aperilex_llm_tokens_total" in response.text
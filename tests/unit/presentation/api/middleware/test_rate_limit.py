@@ -7,7 +7,7 @@ from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.applications import Starlette
 
-from src.infrastructure.rate_limiting import APIRateLimiter
+from src.infrastructure.rate_limiting import APIRateLimiter, RateLimitStorage
 from src.infrastructure.rate_limiting.storage import RateLimitResult
 from src.presentation.api.middleware.rate_limit import RateLimitMiddleware
 
@@ -345,7 +345,8 @@ class TestRateLimitMiddleware:
         assert result == 5
         self.rate_limiter.cleanup_expired_clients.assert_called_once()
 
-    def test_get_rate_limiter_stats_delegates_to_rate_limiter(self):
+    @pytest.mark.asyncio
+    async def test_get_rate_limiter_stats_delegates_to_rate_limiter(self):
         """Test get_rate_limiter_stats delegates to rate limiter."""
         # Arrange
         expected_stats = {
@@ -356,7 +357,7 @@ class TestRateLimitMiddleware:
         self.rate_limiter.get_stats.return_value = expected_stats
 
         # Act
-        result = self.middleware.get_rate_limiter_stats()
+        result = await self.middleware.get_rate_limiter_stats()
 
         # Assert
         assert result == expected_stats
@@ -419,6 +420,36 @@ class TestRateLimitMiddleware:
         with pytest.raises(Exception, match="Downstream error"):
             await self.middleware.dispatch(request, call_next)
 
+    @pytest.mark.asyncio
+    async def test_dispatch_allows_request_when_storage_fails(self):
+        """Test requests are let through without headers if storage is down."""
+        # Arrange
+        request = Mock(spec=Request)
+        request.url.path = "/api/test"
+        request.headers = {}
+        request.client.host = "192.168.1.1"
+
+        storage = Mock(spec=RateLimitStorage)
+        storage.check_rate_limit = AsyncMock(
+            side_effect=ConnectionError("Connection refused")
+        )
+        self.middleware.rate_limiter = APIRateLimiter(storage=storage)
+
+        expected_response = Mock(spec=Response)
+        expected_response.headers = {}
+        call_next = AsyncMock(return_value=expected_response)
+
+        # Act
+        with patch('src.presentation.api.middleware.rate_limit.logger') as mock_logger:
+            response = await self.middleware.dispatch(request, call_next)
+
+        # Assert
+        assert response is expected_response
+        assert response.headers == {}
+        call_next.assert_called_once_with(request)
+        storage.check_rate_limit.assert_awaited_once()
+        mock_logger.warning.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_dispatch_rate_limit_headers_in_429_response(self):
         """Test that rate limit headers are included in 429 response."""
@@ -18,6 +18,7 @@ from src.presentation.api.dependencies import (
     get_task_service,
     service_lifecycle,
 )
+from src.presentation.api.health_monitor import HealthMonitor
 
 
 @pytest.mark.unit
@@ -188,6 +189,16 @@ class TestServiceLifecycle:
         """Set up test fixtures."""
         self.lifecycle = ServiceLifecycle()
 
+    @pytest.fixture(autouse=True)
+    def health_monitor(self):
+        """Replace the global health monitor so no checks run in the background."""
+        with patch(
+            'src.presentation.api.dependencies.health_monitor',
+            Mock(spec=HealthMonitor),
+        ) as monitor:
+            self.health_monitor = monitor
+            yield monitor
+
     def test_service_lifecycle_initialization(self):
         """Test ServiceLifecycle initializes correctly."""
         # Assert
@@ -240,6 +251,7 @@ class TestServiceLifecycle:
                             mock_queue_service.health_check.assert_called_once()
                             mock_storage_service.health_check.assert_called_once()
                             mock_worker_service.health_check.assert_called_once()
+                            self.health_monitor.start.assert_awaited_once()
 
                             # Verify logging
                             mock_logger.info.assert_called()
@@ -414,6 +426,7 @@ class TestServiceLifecycle:
                 # Assert
                 mock_cleanup.assert_called_once()
                 mock_factory.cleanup.assert_called_once()
+                self.health_monitor.stop.assert_awaited_once()
 
                 info_calls = [call[0][0] for call in mock_logger.info.call_args_list]
                 assert any(
@@ -0,0 +1,175 @@
+"""Tests for background health monitoring of API dependencies."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.presentation.api.health_monitor import (
+    HealthMonitor,
+    HealthStatus,
+    _check_service,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def healthy() -> HealthStatus:
+    """Create a healthy status."""
+    return HealthStatus(status="healthy", timestamp=datetime.now(UTC).isoformat())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHealthMonitor:
+    """Test refreshing checks and serving their snapshot."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.monitor = HealthMonitor(clock=self.clock)
+
+    async def test_unknown_until_checked(self):
+        """Test dependencies are unknown before their first check completes."""
+        # Arrange
+        check = AsyncMock(return_value=healthy())
+        self.monitor.register("queue", check, interval=15.0, timeout=1.0)
+
+        # Act
+        snapshot = self.monitor.snapshot()
+
+        # Assert
+        assert snapshot["queue"].status == "unknown"
+        check.assert_not_called()
+
+    async def test_refresh_records_latency_and_age(self):
+        """Test results record how long the check took and how old they are."""
+
+        # Arrange
+        async def check() -> HealthStatus:
+            self.clock.now += 0.25
+            return healthy()
+
+        self.monitor.register("queue", check, interval=15.0, timeout=1.0)
+
+        # Act
+        await self.monitor.refresh()
+        self.clock.now += 5.0
+        snapshot = self.monitor.snapshot()
+
+        # Assert
+        assert snapshot["queue"].status == "healthy"
+        assert snapshot["queue"].latency_ms == 250.0
+        assert snapshot["queue"].age_seconds == 5.0
+        assert snapshot["queue"].stale is False
+
+    async def test_stale_once_refreshes_missed(self):
+        """Test results are stale once two refreshes have been missed."""
+        # Arrange
+        self.monitor.register(
+            "storage", AsyncMock(return_value=healthy()), interval=10.0, timeout=1.0
+        )
+        await self.monitor.refresh()
+
+        # Act
+        self.clock.now += 21.0
+        fresh = self.monitor.snapshot()["storage"]
+        self.clock.now += 0.5
+        stale = self.monitor.snapshot()["storage"]
+
+        # Assert
+        assert fresh.stale is False
+        assert stale.stale is True
+
+    async def test_timed_out_check_degraded(self):
+        """Test a check that exceeds its timeout is reported degraded."""
+
+        # Arrange
+        async def check() -> HealthStatus:
+            await asyncio.sleep(10)
+            return healthy()
+
+        self.monitor.register("worker", check, interval=15.0, timeout=0.01)
+
+        # Act
+        await self.monitor.refresh()
+
+        # Assert
+        status = self.monitor.snapshot()["worker"]
+        assert status.status == "degraded"
+        assert status.details == {"error": "TimeoutError", "timeout_seconds": 0.01}
+
+    async def test_failed_check_unhealthy(self):
+        """Test a check that raises is reported unhealthy."""
+        # Arrange
+        check = AsyncMock(side_effect=ConnectionError("Connection refused"))
+        self.monitor.register("queue", check, interval=15.0, timeout=1.0)
+
+        # Act
+        await self.monitor.refresh()
+
+        # Assert
+        status = self.monitor.snapshot()["queue"]
+        assert status.status == "unhealthy"
+        assert "Connection refused" in status.message
+
+    async def test_checks_refreshed_in_background(self):
+        """Test started checks refresh on their interval until stopped."""
+        # Arrange
+        check = AsyncMock(return_value=healthy())
+        self.monitor.register("queue", check, interval=0.01, timeout=1.0)
+
+        # Act
+        await self.monitor.start()
+        await asyncio.sleep(0.05)
+        await self.monitor.stop()
+        calls = check.await_count
+        await asyncio.sleep(0.03)
+
+        # Assert
+        assert calls >= 2
+        assert check.await_count == calls
+        assert not self.monitor.running
+        assert self.monitor.snapshot()["queue"].status == "healthy"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCheckService:
+    """Test checking messaging services."""
+
+    async def test_registry_not_initialized(self):
+        """Test services are not configured before the registry is initialized."""
+        # Arrange
+        get_service = AsyncMock(side_effect=RuntimeError("Registry not initialized"))
+
+        # Act
+        status = await _check_service(get_service, "queue")
+
+        # Assert
+        assert status.status == "not_configured"
+        assert status.details["initialized"] is False
+
+    async def test_unhealthy_service(self):
+        """Test a service failing its health check is unhealthy."""
+        # Arrange
+        service = AsyncMock()
+        service.health_check.return_value = False
+        del service.get_circuit_breaker_status
+
+        # Act
+        status = await _check_service(AsyncMock(return_value=service), "storage")
+
+        # Assert
+        assert status.status == "unhealthy"
+        assert status.message == "Storage service is unhealthy"
+        assert status.details == {"service_type": "AsyncMock"}
@@ -0,0 +1,229 @@
+"""Tests for ETag-based caching of filing and analysis responses."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.domain.entities.analysis import Analysis, AnalysisType
+from src.domain.entities.company import Company
+from src.domain.entities.filing import Filing
+from src.domain.value_objects.accession_number import AccessionNumber
+from src.domain.value_objects.cik import CIK
+from src.domain.value_objects.filing_type import FilingType
+from src.domain.value_objects.processing_status import ProcessingStatus
+from src.infrastructure.database.base import get_db
+from src.infrastructure.database.cache import cache_manager
+from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.filing_repository import FilingRepository
+from src.presentation.api.dependencies import get_service_factory
+from src.presentation.api.response_cache import (
+    ResponseCache,
+    etag_matches,
+    make_etag,
+    response_cache,
+)
+from src.presentation.api.routers import analyses, filings
+
+ACCESSION = "0000320193-24-000001"
+
+
+class TestResponseCache:
+    """Test the size-bounded cache of serialized bodies."""
+
+    def test_evicts_least_recently_used(self):
+        """Test bodies beyond the byte budget evict the least recently used."""
+        cache = ResponseCache(max_bytes=10)
+        cache.set('"a"', b"aaaa")
+        cache.set('"b"', b"bbbb")
+        cache.get('"a"')
+
+        cache.set('"c"', b"cccc")
+
+        assert cache.get('"b"') is None
+        assert cache.get('"a"') == b"aaaa"
+        assert cache.get('"c"') == b"cccc"
+        assert cache.size == 8
+
+    def test_oversized_body_not_cached(self):
+        """Test a body larger than the budget is not cached."""
+        cache = ResponseCache(max_bytes=3)
+
+        cache.set('"a"', b"aaaa")
+
+        assert len(cache) == 0
+
+    def test_etag_matching(self):
+        """Test If-None-Match lists, wildcards and weak validators."""
+        etag = make_etag("analysis", 1)
+
+        assert etag == make_etag("analysis", 1) != make_etag("analysis", 2)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestConditionalEndpoints:
+    """Test endpoints answer from the ETag instead of re-running handlers."""
+
+    def setup_method(self):
+        """Set up an app whose resources have a stored version."""
+        response_cache.clear()
+        self.updated_at = datetime(2025, 1, 1, tzinfo=UTC)
+        self.response = AnalysisResponse(
+            analysis_id=uuid4(),
+            filing_id=uuid4(),
+            analysis_type="comprehensive",
+            created_by="analyst@example.com",
+            created_at=self.updated_at,
+            confidence_score=0.9,
+            llm_provider="openai",
+            llm_model="gpt-4",
+            processing_time_seconds=12.5,
+        )
+
+        self.factory = Mock()
+        self.dispatcher = self.factory.create_dispatcher.return_value
+        self.dispatcher.dispatch_query = AsyncMock(return_value=self.response)
+        self.factory.get_handler_dependencies = AsyncMock(return_value={})
+        repository = self.factory.create_analysis_repository.return_value
+        repository.get_version = AsyncMock(return_value=(self.updated_at, "completed"))
+        repository.get_latest_version_by_accession = AsyncMock(
+            return_value=(self.response.analysis_id, self.updated_at)
+        )
+
+        app = FastAPI()
+        app.include_router(analyses.router)
+        app.include_router(filings.router)
+        app.dependency_overrides[get_db] = lambda: AsyncMock()
+        app.dependency_overrides[get_service_factory] = lambda: self.factory
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        """Drop the bodies cached by the test."""
+        response_cache.clear()
+
+    def test_handler_runs_once_per_version(self):
+        """Test repeated requests are served from the cached body."""
+        path = f"/analyses/{self.response.analysis_id}"
+
+        first = self.client.get(path)
+        second = self.client.get(path)
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert first.json()["analysis_id"] == str(self.response.analysis_id)
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"].startswith("public, max-age=")
+        self.dispatcher.dispatch_query.assert_awaited_once()
+
+    def test_if_none_match_not_modified(self):
+        """Test a current ETag is answered with an empty 304."""
+        path = f"/filings/{ACCESSION}/analysis"
+        etag = self.client.get(path).headers["etag"]
+
+        response = self.client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == "public, no-cache"
+        self.dispatcher.dispatch_query.assert_awaited_once()
+
+    def test_unfinished_analysis_revalidated(self):
+        """Test an analysis of a filing still processing is not cached unchecked."""
+        path = f"/analyses/{self.response.analysis_id}"
+        repository = self.factory.create_analysis_repository.return_value
+        repository.get_version.return_value = (self.updated_at, "processing")
+
+        response = self.client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, no-cache"
+        etag = response.headers["etag"]
+        repository.get_version.return_value = (self.updated_at, "completed")
+        completed = self.client.get(path, headers={"If-None-Match": etag})
+        assert completed.status_code == 200
+        assert completed.headers["cache-control"].startswith("public, max-age=")
+
+    def test_new_version_rerenders(self):
+        """Test an updated resource gets a new ETag and a fresh body."""
+        path = f"/analyses/{self.response.analysis_id}"
+        etag = self.client.get(path).headers["etag"]
+        repository = self.factory.create_analysis_repository.return_value
+        repository.get_version.return_value = (
+            datetime(2025, 2, 1, tzinfo=UTC),
+            "completed",
+        )
+
+        response = self.client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert self.dispatcher.dispatch_query.await_count == 2
+
+
+class TestResourceVersions:
+    """Test the versions ETags are derived from follow writes."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Isolate tests from cached lookups of other tests."""
+        cache_manager.clear_all()
+        yield
+        cache_manager.clear_all()
+
+    @pytest.mark.asyncio
+    async def test_filing_version_covers_analyses(self, async_session):
+        """Test analysing a filing changes its version."""
+        company = await CompanyRepository(async_session).create(
+            Company(id=uuid4(), cik=CIK("320193"), name="Apple", metadata={})
+        )
+        filing_repository = FilingRepository(async_session)
+        filing = await filing_repository.create(
+            Filing(
+                id=uuid4(),
+                company_id=company.id,
+                accession_number=AccessionNumber(ACCESSION),
+                filing_type=FilingType.FORM_10K,
+                filing_date=date(2024, 11, 1),
+                processing_status=ProcessingStatus.PENDING,
+            )
+        )
+        analysis_repository = AnalysisRepository(async_session)
+        accession = AccessionNumber(ACCESSION)
+
+        before = await filing_repository.get_version_by_accession(accession)
+        assert before[0] == filing.id and before[3] == 0
+        assert (
+            await analysis_repository.get_latest_version_by_accession(accession) is None
+        )
+
+        analysis = await analysis_repository.create(
+            Analysis(
+                id=uuid4(),
+                filing_id=filing.id,
+                analysis_type=AnalysisType.COMPREHENSIVE,
+                created_by="analyst@example.com",
+                llm_provider="openai",
+                llm_model="gpt-4",
+            )
+        )
+
+        after = await filing_repository.get_version_by_accession(accession)
+        assert after[3] == 1 and after != before
+        latest_id, updated_at = (
+            await analysis_repository.get_latest_version_by_accession(accession)
+        )
+        assert latest_id == analysis.id
+        assert await analysis_repository.get_version(analysis.id) == (
+            updated_at,
+            ProcessingStatus.PENDING.value,
+        )
+        assert await analysis_repository.get_version(uuid4()) is None
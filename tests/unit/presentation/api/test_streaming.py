@@ -0,0 +1,165 @@
+"""Tests for streaming downloads of stored filing content and results."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.database.base import get_db
+from src.infrastructure.messaging.implementations.local_file_storage import (
+    LocalFileStorageService,
+)
+from src.presentation.api.dependencies import get_service_factory
+from src.presentation.api.routers import analyses, filings
+from src.presentation.api.streaming import parse_range
+
+ACCESSION = "0000320193-24-000001"
+
+
+class TestParseRange:
+    """Test parsing the Range header of a request."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("bytes=0-9", (0, 9)),
+            ("bytes=5-", (5, 99)),
+            ("bytes=90-200", (90, 99)),
+            ("bytes=-10", (90, 99)),
+            ("bytes=-500", (0, 99)),
+            (None, None),
+            ("items=0-9", None),
+            ("bytes=0-9,20-29", None),
+            ("bytes=9-0", None),
+            ("bytes=a-b", None),
+        ],
+    )
+    def test_parse_range(self, header, expected):
+        """Test single byte ranges are resolved against the content size."""
+        assert parse_range(header, 100) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=100-", "bytes=-0"])
+    def test_unsatisfiable_range(self, header):
+        """Test ranges outside of the content are rejected."""
+        with pytest.raises(ValueError, match="not satisfiable"):
+            parse_range(header, 100)
+
+
+class TestStreamingEndpoints:
+    """Test endpoints stream stored content with byte ranges."""
+
+    @pytest.fixture(autouse=True)
+    async def setup_app(self, tmp_path):
+        """Set up an app whose repositories open files in local storage."""
+        self.storage = LocalFileStorageService(base_path=str(tmp_path))
+        self.results = b'{"executive_summary": "Strong year"}' * 3000
+        await self.storage.set_raw("analysis:results", self.results)
+        await self.storage.set_raw("filing:sections", b'{"section": "Item 1"}\n')
+
+        self.factory = Mock()
+        analysis_repository = self.factory.create_analysis_repository.return_value
+        analysis_repository.get_version = AsyncMock(
+            return_value=(datetime(2025, 1, 1, tzinfo=UTC), "completed")
+        )
+        analysis_repository.open_results_by_id = AsyncMock(
+            return_value=await self.storage.open("analysis:results")
+        )
+        filing_repository = self.factory.create_filing_repository.return_value
+        filing_repository.open_sections_by_accession = AsyncMock(
+            return_value=await self.storage.open("filing:sections")
+        )
+        filing_repository.open_content_by_accession = AsyncMock(return_value=None)
+
+        app = FastAPI()
+        app.include_router(analyses.router)
+        app.include_router(filings.router)
+        app.dependency_overrides[get_db] = lambda: AsyncMock()
+        app.dependency_overrides[get_service_factory] = lambda: self.factory
+        self.client = TestClient(app)
+        self.results_path = f"/analyses/{uuid4()}/results"
+
+    def test_whole_content(self):
+        """Test stored results are streamed as stored."""
+        response = self.client.get(self.results_path)
+
+        assert response.status_code == 200
+        assert response.content == self.results
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == str(len(self.results))
+        assert response.headers["accept-ranges"] == "bytes"
+
+    def test_unfinished_analysis_revalidated(self):
+        """Test results of an unfinished analysis are not cached unchecked."""
+        analysis_repository = self.factory.create_analysis_repository.return_value
+        analysis_repository.get_version.return_value = (
+            datetime(2025, 1, 1, tzinfo=UTC),
+            "processing",
+        )
+
+        response = self.client.get(self.results_path)
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, no-cache"
+        assert response.headers["etag"]
+
+    def test_byte_range(self):
+        """Test a byte range is answered with partial content."""
+        response = self.client.get(
+            self.results_path, headers={"Range": "bytes=70000-70009"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == self.results[70000:70010]
+        assert response.headers["content-range"] == (
+            f"bytes 70000-70009/{len(self.results)}"
+        )
+
+    def test_stale_if_range_serves_whole_content(self):
+        """Test a range of an outdated copy gets the whole content."""
+        response = self.client.get(
+            self.results_path, headers={"Range": "bytes=0-9", "If-Range": '"old"'}
+        )
+
+        assert response.status_code == 200
+        assert response.content == self.results
+
+    def test_unsatisfiable_range(self):
+        """Test a range past the end of the content is rejected."""
+        response = self.client.get(
+            self.results_path, headers={"Range": f"bytes={len(self.results)}-"}
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(self.results)}"
+
+    def test_if_none_match_not_modified(self):
+        """Test a current ETag is answered without streaming."""
+        etag = self.client.get(self.results_path).headers["etag"]
+
+        response = self.client.get(self.results_path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_filing_sections_ndjson(self):
+        """Test filing sections are streamed as newline-delimited JSON."""
+        response = self.client.get(f"/filings/{ACCESSION}/sections")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.content == b'{"section": "Item 1"}\n'
+
+    def test_missing_content_not_found(self):
+        """Test filings without stored content are reported missing."""
+        response = self.client.get(f"/filings/{ACCESSION}/content")
+
+        assert response.status_code == 404
+
+    def test_invalid_accession_number(self):
+        """Test malformed accession numbers are rejected."""
+        response = self.client.get("/filings/invalid/content")
+
+        assert response.status_code == 422
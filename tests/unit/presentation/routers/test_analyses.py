@@ -9,10 +9,15 @@ from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
 
 from src.application.schemas.commands.analyze_filing import AnalysisTemplate
+from src.application.schemas.queries.batch_get_analyses import BatchGetAnalysesQuery
 from src.application.schemas.queries.get_analysis import GetAnalysisQuery
 from src.application.schemas.queries.get_templates import GetTemplatesQuery
 from src.application.schemas.queries.list_analyses import ListAnalysesQuery
 from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.application.schemas.responses.batch_response import (
+    BatchItemError,
+    BatchResponse,
+)
 from src.application.schemas.responses.paginated_response import (
     PaginatedResponse,
     PaginationMetadata,
@@ -20,6 +25,7 @@ from src.application.schemas.responses.paginated_response import (
 from src.application.schemas.responses.templates_response import TemplatesResponse
 from src.domain.entities.analysis import AnalysisType
 from src.domain.value_objects.cik import CIK
+from src.infrastructure.database.pagination import InvalidCursorError
 from src.presentation.api.routers.analyses import router
 
 
@@ -274,6 +280,57 @@ class TestListAnalysesEndpoint:
         assert query.page == page
         assert query.page_size == page_size
 
+    @pytest.mark.asyncio
+    async def test_list_analyses_with_cursor_without_total(self):
+        """Test the cursor and include_total parameters reach the query."""
+        # Arrange
+        from src.presentation.api.routers.analyses import list_analyses
+
+        expected_response = PaginatedResponse.create(
+            items=[self._create_sample_analysis_response()],
+            page=1,
+            page_size=20,
+            total_items=None,
+            next_cursor="next-cursor",
+            has_next=True,
+        )
+        self.mock_dispatcher.dispatch_query = AsyncMock(return_value=expected_response)
+
+        # Act
+        result = await list_analyses(
+            session=self.mock_session,
+            factory=self.mock_factory,
+            cursor="cursor",
+            include_total=False,
+        )
+
+        # Assert
+        assert result.next_cursor == "next-cursor"
+        query = self.mock_dispatcher.dispatch_query.call_args[0][0]
+        assert query.cursor == "cursor"
+        assert query.include_total is False
+
+    @pytest.mark.asyncio
+    async def test_list_analyses_invalid_cursor_raises_422(self):
+        """Test an invalid cursor raises 422 validation error."""
+        # Arrange
+        from src.presentation.api.routers.analyses import list_analyses
+
+        self.mock_dispatcher.dispatch_query = AsyncMock(
+            side_effect=InvalidCursorError("Invalid pagination cursor")
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await list_analyses(
+                session=self.mock_session,
+                factory=self.mock_factory,
+                cursor="not-a-cursor",
+            )
+
+        assert exc_info.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "Invalid pagination cursor" in str(exc_info.value.detail)
+
     @pytest.mark.asyncio
     async def test_list_analyses_with_all_filters(self):
         """Test listing analyses with all possible filters combined."""
@@ -503,6 +560,11 @@ class TestGetAnalysisEndpoint:
         self.mock_factory.get_handler_dependencies = AsyncMock(
             return_value=self.mock_dependencies
         )
+        self.mock_request = Mock(headers={})
+
+        # Without a stored version the handler renders the response uncached
+        repository = self.mock_factory.create_analysis_repository.return_value
+        repository.get_version = AsyncMock(return_value=None)
 
     @pytest.mark.asyncio
     async def test_get_analysis_success(self):
@@ -517,6 +579,7 @@ class TestGetAnalysisEndpoint:
         # Act
         result = await get_analysis(
             analysis_id=analysis_id,
+            request=self.mock_request,
             session=self.mock_session,
             factory=self.mock_factory,
         )
@@ -546,6 +609,7 @@ class TestGetAnalysisEndpoint:
         with pytest.raises(HTTPException) as exc_info:
             await get_analysis(
                 analysis_id=analysis_id,
+                request=self.mock_request,
                 session=self.mock_session,
                 factory=self.mock_factory,
             )
@@ -576,6 +640,76 @@ class TestGetAnalysisEndpoint:
         )
 
 
+@pytest.mark.unit
+class TestBatchGetAnalysesEndpoint:
+    """Test batch_get_analyses endpoint functionality."""
+
+    def setup_method(self):
+        """Set up test client with mocked dependencies."""
+        from fastapi import FastAPI
+
+        from src.infrastructure.database.base import get_db
+        from src.presentation.api.dependencies import get_service_factory
+
+        self.factory = Mock()
+        self.dispatcher = self.factory.create_dispatcher.return_value
+        self.factory.get_handler_dependencies = AsyncMock(return_value={})
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = lambda: AsyncMock()
+        app.dependency_overrides[get_service_factory] = lambda: self.factory
+        self.client = TestClient(app)
+
+    def test_batch_get_dispatches_one_query(self):
+        """Test the batch is dispatched as one query with partial errors."""
+        # Arrange
+        analysis_id, missing_id = uuid4(), uuid4()
+        self.dispatcher.dispatch_query = AsyncMock(
+            return_value=BatchResponse(
+                items=[],
+                errors=[BatchItemError(str(missing_id), 404, "not found")],
+            )
+        )
+
+        # Act
+        response = self.client.post(
+            "/analyses:batchGet",
+            json={"ids": [str(analysis_id), str(missing_id)], "section": "Business"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": [],
+            "errors": [{"id": str(missing_id), "status": 404, "detail": "not found"}],
+        }
+        query = self.dispatcher.dispatch_query.call_args[0][0]
+        assert isinstance(query, BatchGetAnalysesQuery)
+        assert query.analysis_ids == (analysis_id, missing_id)
+        assert query.include_full_results is False
+        assert query.section_name == "Business"
+
+    def test_batch_get_rejects_too_many_ids(self, monkeypatch):
+        """Test batches beyond the configured maximum are rejected."""
+        # Arrange
+        from src.presentation.api.routers import analyses
+
+        monkeypatch.setattr(analyses.settings, "batch_get_max_ids", 2)
+        self.dispatcher.dispatch_query = AsyncMock()
+
+        # Act
+        response = self.client.post(
+            "/analyses:batchGet", json={"ids": [str(uuid4()) for _ in range(3)]}
+        )
+        empty = self.client.post("/analyses:batchGet", json={"ids": []})
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert empty.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        self.dispatcher.dispatch_query.assert_not_called()
+
+
 @pytest.mark.unit
 class TestAnalysesRouterConfiguration:
     """Test analyses router configuration and setup."""
@@ -737,6 +871,9 @@ class TestAnalysesEndpointsIntegration:
 
         mock_factory.create_dispatcher.return_value = mock_dispatcher
         mock_factory.get_handler_dependencies = AsyncMock(return_value={})
+        mock_factory.create_analysis_repository.return_value.get_version = AsyncMock(
+            return_value=None
+        )
 
         # Create context manager using FastAPI dependency overrides
         app = self.app  # Capture app reference for closure
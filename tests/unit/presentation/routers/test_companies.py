@@ -21,6 +21,7 @@ from src.application.schemas.responses.paginated_response import (
 from src.domain.entities.analysis import AnalysisType
 from src.domain.value_objects.cik import CIK
 from src.domain.value_objects.filing_type import FilingType
+from src.infrastructure.database.pagination import InvalidCursorError
 from src.presentation.api.routers.companies import router
 
 
@@ -359,6 +360,35 @@ class TestListCompanyAnalysesEndpoint:
         assert analyses_query.page == page
         assert analyses_query.page_size == page_size
 
+    @pytest.mark.asyncio
+    async def test_list_company_analyses_invalid_cursor_raises_422(self):
+        """Test an invalid cursor raises 422 validation error."""
+        # Arrange
+        from src.presentation.api.routers.companies import list_company_analyses
+
+        company_response = self._create_sample_company_response()
+
+        def side_effect(*args, **kwargs):
+            query = args[0]
+            if isinstance(query, GetCompanyQuery):
+                return company_response
+            raise InvalidCursorError("Invalid pagination cursor")
+
+        self.mock_dispatcher.dispatch_query = AsyncMock(side_effect=side_effect)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await list_company_analyses(
+                ticker="AAPL",
+                session=self.mock_session,
+                factory=self.mock_factory,
+                cursor="not-a-cursor",
+                include_total=False,
+            )
+
+        assert exc_info.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "Invalid pagination cursor" in str(exc_info.value.detail)
+
     @pytest.mark.asyncio
     async def test_list_company_analyses_company_not_found_raises_404(self):
         """Test company not found during lookup raises 404 error."""
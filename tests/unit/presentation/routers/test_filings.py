@@ -10,6 +10,7 @@ from fastapi.testclient import TestClient
 
 from src.application.base.exceptions import ResourceNotFoundError
 from src.application.schemas.commands.analyze_filing import AnalyzeFilingCommand
+from src.application.schemas.queries.batch_get_filings import BatchGetFilingsQuery
 from src.application.schemas.queries.get_analysis_by_accession import (
     GetAnalysisByAccessionQuery,
 )
@@ -23,6 +24,10 @@ from src.application.schemas.queries.search_filings import (
     SortDirection,
 )
 from src.application.schemas.responses.analysis_response import AnalysisResponse
+from src.application.schemas.responses.batch_response import (
+    BatchItemError,
+    BatchResponse,
+)
 from src.application.schemas.responses.filing_response import FilingResponse
 from src.application.schemas.responses.filing_search_response import FilingSearchResult
 from src.application.schemas.responses.paginated_response import (
@@ -33,6 +38,7 @@ from src.application.schemas.responses.task_response import TaskResponse
 from src.domain.value_objects.accession_number import AccessionNumber
 from src.domain.value_objects.cik import CIK
 from src.domain.value_objects.filing_type import FilingType
+from src.infrastructure.database.pagination import InvalidCursorError
 from src.presentation.api.routers.filings import router
 
 
@@ -209,6 +215,53 @@ class TestSearchFilingsEndpoint:
         assert query.page == page
         assert query.page_size == page_size
 
+    @pytest.mark.asyncio
+    async def test_search_filings_with_cursor_without_total(self):
+        """Test the cursor and include_total parameters reach the query."""
+        # Arrange
+        from src.presentation.api.routers.filings import search_filings
+
+        expected_response = PaginatedResponse.create(
+            items=[], page=1, page_size=20, total_items=None, has_next=False
+        )
+        self.mock_dispatcher.dispatch_query = AsyncMock(return_value=expected_response)
+
+        # Act
+        _ = await search_filings(
+            ticker="AAPL",
+            session=self.mock_session,
+            factory=self.mock_factory,
+            cursor="cursor",
+            include_total=False,
+        )
+
+        # Assert
+        query = self.mock_dispatcher.dispatch_query.call_args[0][0]
+        assert query.cursor == "cursor"
+        assert query.include_total is False
+
+    @pytest.mark.asyncio
+    async def test_search_filings_invalid_cursor_raises_422(self):
+        """Test an invalid cursor raises 422 validation error."""
+        # Arrange
+        from src.presentation.api.routers.filings import search_filings
+
+        self.mock_dispatcher.dispatch_query = AsyncMock(
+            side_effect=InvalidCursorError("Invalid pagination cursor")
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await search_filings(
+                ticker="AAPL",
+                session=self.mock_session,
+                factory=self.mock_factory,
+                cursor="not-a-cursor",
+            )
+
+        assert exc_info.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "Invalid pagination cursor" in str(exc_info.value.detail)
+
     @pytest.mark.asyncio
     async def test_search_filings_invalid_form_type_raises_422(self):
         """Test invalid form type raises 422 validation error."""
@@ -540,6 +593,11 @@ class TestGetFilingEndpoint:
         self.mock_factory.get_handler_dependencies = AsyncMock(
             return_value=self.mock_dependencies
         )
+        self.mock_request = Mock(headers={})
+
+        # Without a stored version the handler renders the response uncached
+        repository = self.mock_factory.create_filing_repository.return_value
+        repository.get_version_by_accession = AsyncMock(return_value=None)
 
     @pytest.mark.asyncio
     async def test_get_filing_success(self):
@@ -554,6 +612,7 @@ class TestGetFilingEndpoint:
         # Act
         result = await get_filing(
             accession_number=accession_number,
+            request=self.mock_request,
             session=self.mock_session,
             factory=self.mock_factory,
         )
@@ -580,6 +639,7 @@ class TestGetFilingEndpoint:
         with pytest.raises(HTTPException) as exc_info:
             await get_filing(
                 accession_number=accession_number,
+                request=self.mock_request,
                 session=self.mock_session,
                 factory=self.mock_factory,
             )
@@ -602,6 +662,7 @@ class TestGetFilingEndpoint:
         with pytest.raises(HTTPException) as exc_info:
             await get_filing(
                 accession_number=accession_number,
+                request=self.mock_request,
                 session=self.mock_session,
                 factory=self.mock_factory,
             )
@@ -641,6 +702,11 @@ class TestGetFilingAnalysisEndpoint:
         self.mock_factory.get_handler_dependencies = AsyncMock(
             return_value=self.mock_dependencies
         )
+        self.mock_request = Mock(headers={})
+
+        # Without a stored version the handler renders the response uncached
+        repository = self.mock_factory.create_analysis_repository.return_value
+        repository.get_latest_version_by_accession = AsyncMock(return_value=None)
 
     @pytest.mark.asyncio
     async def test_get_filing_analysis_success(self):
@@ -655,6 +721,7 @@ class TestGetFilingAnalysisEndpoint:
         # Act
         result = await get_filing_analysis(
             accession_number=accession_number,
+            request=self.mock_request,
             session=self.mock_session,
             factory=self.mock_factory,
         )
@@ -682,6 +749,7 @@ class TestGetFilingAnalysisEndpoint:
         with pytest.raises(HTTPException) as exc_info:
             await get_filing_analysis(
                 accession_number=accession_number,
+                request=self.mock_request,
                 session=self.mock_session,
                 factory=self.mock_factory,
             )
@@ -704,6 +772,7 @@ class TestGetFilingAnalysisEndpoint:
         with pytest.raises(HTTPException) as exc_info:
             await get_filing_analysis(
                 accession_number=accession_number,
+                request=self.mock_request,
                 session=self.mock_session,
                 factory=self.mock_factory,
             )
@@ -728,6 +797,7 @@ class TestGetFilingAnalysisEndpoint:
         with pytest.raises(HTTPException) as exc_info:
             await get_filing_analysis(
                 accession_number=accession_number,
+                request=self.mock_request,
                 session=self.mock_session,
                 factory=self.mock_factory,
             )
@@ -756,6 +826,86 @@ class TestGetFilingAnalysisEndpoint:
         )
 
 
+@pytest.mark.unit
+class TestBatchGetFilingsEndpoint:
+    """Test batch_get_filings endpoint functionality."""
+
+    def setup_method(self):
+        """Set up test client with mocked dependencies."""
+        from fastapi import FastAPI
+
+        from src.infrastructure.database.base import get_db
+        from src.presentation.api.dependencies import get_service_factory
+
+        self.factory = Mock()
+        self.dispatcher = self.factory.create_dispatcher.return_value
+        self.factory.get_handler_dependencies = AsyncMock(return_value={})
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = lambda: AsyncMock()
+        app.dependency_overrides[get_service_factory] = lambda: self.factory
+        self.client = TestClient(app)
+
+    def test_batch_get_returns_filings_and_errors(self):
+        """Test the batch is dispatched as one query with partial errors."""
+        # Arrange
+        filing = FilingResponse(
+            filing_id=uuid4(),
+            company_id=uuid4(),
+            accession_number="0000320193-24-000001",
+            filing_type="10-K",
+            filing_date=date(2024, 11, 1),
+            processing_status="completed",
+            processing_error=None,
+            metadata={},
+            analyses_count=1,
+        )
+        self.dispatcher.dispatch_query = AsyncMock(
+            return_value=BatchResponse(
+                items=[filing],
+                errors=[BatchItemError("bad", 422, "Invalid accession number")],
+            )
+        )
+
+        # Act
+        response = self.client.post(
+            "/filings:batchGet",
+            json={"accession_numbers": ["0000320193-24-000001", "bad"]},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["accession_number"] for item in data["items"]] == [
+            "0000320193-24-000001"
+        ]
+        assert data["errors"] == [
+            {"id": "bad", "status": 422, "detail": "Invalid accession number"}
+        ]
+        query = self.dispatcher.dispatch_query.call_args[0][0]
+        assert isinstance(query, BatchGetFilingsQuery)
+        assert query.accession_numbers == ("0000320193-24-000001", "bad")
+
+    def test_batch_get_rejects_too_many_accession_numbers(self, monkeypatch):
+        """Test batches beyond the configured maximum are rejected."""
+        # Arrange
+        from src.presentation.api.routers import filings
+
+        monkeypatch.setattr(filings.settings, "batch_get_max_ids", 1)
+        self.dispatcher.dispatch_query = AsyncMock()
+
+        # Act
+        response = self.client.post(
+            "/filings:batchGet",
+            json={"accession_numbers": ["0000320193-24-000001"] * 2},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        self.dispatcher.dispatch_query.assert_not_called()
+
+
 @pytest.mark.unit
 class TestFilingsRouterConfiguration:
     """Test filings router configuration and setup."""
@@ -917,6 +1067,12 @@ class TestFilingsEndpointsIntegration:
 
         mock_factory.create_dispatcher.return_value = mock_dispatcher
         mock_factory.get_handler_dependencies = AsyncMock(return_value={})
+        filing_repository = mock_factory.create_filing_repository.return_value
+        filing_repository.get_version_by_accession = AsyncMock(return_value=None)
+        analysis_repository = mock_factory.create_analysis_repository.return_value
+        analysis_repository.get_latest_version_by_accession = AsyncMock(
+            return_value=None
+        )
 
         # Create context manager using FastAPI dependency overrides
         app = self.app  # Capture app reference for closure
@@ -1,8 +1,6 @@
 """Comprehensive tests for health router endpoints."""
 
-import asyncio
-from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -11,9 +9,7 @@ from src.presentation.api.routers.health import (
     DetailedHealthResponse,
     HealthStatus,
     _check_factory_configuration,
-    _check_messaging_health,
-    _perform_messaging_health_check,
-    clear_health_cache,
+    _summarize_messaging_health,
     detailed_health_check,
     messaging_health_check,
     router,
@@ -72,6 +68,9 @@ class TestHealthStatusModel:
             "message": "Service down",
             "timestamp": "2023-12-31T00:00:00Z",
             "details": {"error": "Connection failed"},
+            "latency_ms": None,
+            "age_seconds": None,
+            "stale": None,
         }
         assert data == expected
 
@@ -108,34 +107,6 @@ class TestDetailedHealthResponseModel:
         assert response.configuration["debug"] is True
 
 
-@pytest.mark.unit
-class TestHealthCacheUtilities:
-    """Test health cache management utilities."""
-
-    def test_clear_health_cache(self):
-        """Test clear_health_cache clears global cache variables."""
-        # Arrange - set some values in the cache
-        import src.presentation.api.routers.health as health_module
-
-        health_module._health_status_cache = HealthStatus(
-            status="healthy", timestamp="2023-12-31T00:00:00Z"
-        )
-        health_module._cache_timestamp = datetime.now(UTC)
-
-        # Act
-        clear_health_cache()
-
-        # Assert
-        assert health_module._health_status_cache is None
-        assert health_module._cache_timestamp is None
-
-    def test_cache_duration_configuration(self):
-        """Test cache duration is properly configured."""
-        import src.presentation.api.routers.health as health_module
-
-        assert health_module._cache_duration_seconds == 30
-
-
 @pytest.mark.unit
 class TestFactoryConfigurationCheck:
     """Test _check_factory_configuration function."""
@@ -210,275 +181,86 @@ class TestFactoryConfigurationCheck:
 
 
 @pytest.mark.unit
-class TestMessagingHealthCheckFunction:
-    """Test _perform_messaging_health_check function."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_registry = Mock()
-
-    @pytest.mark.asyncio
-    async def test_perform_messaging_health_check_all_healthy(self):
-        """Test messaging health check when all services are healthy."""
-        # Arrange
-        health_results = {"queue": True, "worker": True, "storage": True}
-        self.mock_registry.health_check = AsyncMock(return_value=health_results)
-        self.mock_registry.environment.value = "test"
-        self.mock_registry.is_connected = True
-
-        with patch(
-            "src.presentation.api.routers.health.get_registry",
-            return_value=self.mock_registry,
-        ):
-            # Act
-            result = await _perform_messaging_health_check()
-
-            # Assert
-            assert result.status == "healthy"
-            assert "All messaging services are healthy" in result.message
-            assert result.details["services"] == health_results
-            assert result.details["environment"] == "test"
-            assert result.details["connected"] is True
-            assert result.details["cached"] is False
-
-    @pytest.mark.asyncio
-    async def test_perform_messaging_health_check_some_unhealthy(self):
-        """Test messaging health check when some services are unhealthy."""
-        # Arrange
-        health_results = {"queue": True, "worker": False, "storage": True}
-        self.mock_registry.health_check = AsyncMock(return_value=health_results)
-        self.mock_registry.environment.value = "test"
-        self.mock_registry.is_connected = True
-
-        with patch(
-            "src.presentation.api.routers.health.get_registry",
-            return_value=self.mock_registry,
-        ):
-            # Act
-            result = await _perform_messaging_health_check()
-
-            # Assert
-            assert result.status == "degraded"
-            assert "Some messaging services are unhealthy: worker" in result.message
-            assert result.details["unhealthy_services"] == ["worker"]
-            assert result.details["services"] == health_results
-
-    @pytest.mark.asyncio
-    async def test_perform_messaging_health_check_with_circuit_breaker(self):
-        """Test messaging health check includes circuit breaker status when available."""
-        # Arrange
-        health_results = {"queue": True, "worker": True, "storage": True}
-        self.mock_registry.health_check = AsyncMock(return_value=health_results)
-        self.mock_registry.environment.value = "test"
-        self.mock_registry.is_connected = True
-
-        mock_queue_service = Mock()
-        mock_queue_service.get_circuit_breaker_status.return_value = {
-            "state": "CLOSED",
-            "failures": 0,
-        }
-
-        # Mock the get_queue_service function that's imported dynamically
-        mock_get_queue_service = AsyncMock(return_value=mock_queue_service)
-
-        with patch(
-            "src.presentation.api.routers.health.get_registry",
-            return_value=self.mock_registry,
-        ):
-            with patch(
-                "src.infrastructure.messaging.get_queue_service", mock_get_queue_service
-            ):
-                # Act
-                result = await _perform_messaging_health_check()
-
-                # Assert
-                assert result.status == "healthy"
-                # Circuit breaker info might be included, but not required for the health check
-
-    @pytest.mark.asyncio
-    async def test_perform_messaging_health_check_circuit_breaker_unavailable(self):
-        """Test messaging health check when circuit breaker status is unavailable."""
-        # Arrange
-        health_results = {"queue": True, "worker": True, "storage": True}
-        self.mock_registry.health_check = AsyncMock(return_value=health_results)
-        self.mock_registry.environment.value = "test"
-        self.mock_registry.is_connected = True
-
-        with patch(
-            "src.presentation.api.routers.health.get_registry",
-            return_value=self.mock_registry,
-        ):
-            with patch(
-                "src.infrastructure.messaging.get_queue_service",
-                side_effect=RuntimeError("Queue service unavailable"),
-            ):
-                with patch("src.presentation.api.routers.health.logger") as _:
-                    # Act
-                    result = await _perform_messaging_health_check()
-
-                    # Assert
-                    assert result.status == "healthy"
-                    # Should still be healthy despite circuit breaker unavailability
-                    # Logger may or may not be called depending on implementation
-
-    @pytest.mark.asyncio
-    async def test_perform_messaging_health_check_registry_not_initialized(self):
-        """Test messaging health check when registry is not initialized."""
-        # Arrange
-        with patch(
-            "src.presentation.api.routers.health.get_registry",
-            side_effect=RuntimeError("Registry not initialized"),
-        ):
-            # Act
-            result = await _perform_messaging_health_check()
-
-            # Assert
-            assert result.status == "not_configured"
-            assert "Messaging services not initialized" in result.message
-            assert result.details["initialized"] is False
-            assert result.details["cached"] is False
-
-
-@pytest.mark.unit
-class TestMessagingHealthCaching:
-    """Test messaging health check caching functionality."""
-
-    def setup_method(self):
-        """Set up test fixtures and clear cache."""
-        clear_health_cache()
-
-    @pytest.mark.asyncio
-    async def test_messaging_health_check_caching_fresh_check(self):
-        """Test messaging health check performs fresh check when cache is empty."""
-        # Arrange
-        with patch(
-            "src.presentation.api.routers.health._perform_messaging_health_check"
-        ) as mock_perform:
-            expected_status = HealthStatus(
-                status="healthy", timestamp="2023-12-31T00:00:00Z"
-            )
-            mock_perform.return_value = expected_status
-
-            # Act
-            result = await _check_messaging_health()
-
-            # Assert
-            mock_perform.assert_called_once()
-            assert result.status == "healthy"
-
-    @pytest.mark.asyncio
-    async def test_messaging_health_check_returns_cached_result(self):
-        """Test messaging health check returns cached result when cache is valid."""
-        # Arrange - populate cache
-        import src.presentation.api.routers.health as health_module
-
-        cached_status = HealthStatus(
-            status="healthy",
-            message="Cached result",
+class TestMessagingHealthSummary:
+    """Test summarizing the health monitor snapshot of messaging services."""
+
+    @staticmethod
+    def status(status: str, stale: bool = False) -> HealthStatus:
+        """Create a monitored health status."""
+        return HealthStatus(
+            status=status,
             timestamp="2023-12-31T00:00:00Z",
-            details={"cached": False},
+            latency_ms=12.5,
+            age_seconds=3.0,
+            stale=stale,
         )
-        health_module._health_status_cache = cached_status
-        health_module._cache_timestamp = datetime.now(UTC)
-
-        with patch(
-            "src.presentation.api.routers.health._perform_messaging_health_check"
-        ) as mock_perform:
-            # Act
-            result = await _check_messaging_health()
-
-            # Assert
-            mock_perform.assert_not_called()  # Should use cache
-            assert result.status == "healthy"
-            assert result.message == "Cached result"
-            assert result.details["cached"] is True
-            assert "cache_age_seconds" in result.details
-
-    @pytest.mark.asyncio
-    async def test_messaging_health_check_cache_expiry(self):
-        """Test messaging health check performs fresh check when cache expires."""
-        # Arrange - populate cache with expired timestamp
-        import src.presentation.api.routers.health as health_module
-
-        cached_status = HealthStatus(status="healthy", timestamp="2023-12-31T00:00:00Z")
-        health_module._health_status_cache = cached_status
-        # Set cache timestamp to 60 seconds ago (beyond 30-second cache duration)
-        health_module._cache_timestamp = datetime.now(UTC) - timedelta(seconds=60)
-
-        with patch(
-            "src.presentation.api.routers.health._perform_messaging_health_check"
-        ) as mock_perform:
-            fresh_status = HealthStatus(
-                status="healthy", timestamp=datetime.now(UTC).isoformat()
-            )
-            mock_perform.return_value = fresh_status
 
-            # Act
-            result = await _check_messaging_health()
-
-            # Assert
-            mock_perform.assert_called_once()  # Should perform fresh check
-            assert result == fresh_status
-
-    @pytest.mark.asyncio
-    async def test_messaging_health_check_timeout_handling(self):
-        """Test messaging health check handles timeout and caches result."""
-        # Arrange
-        with patch(
-            "src.presentation.api.routers.health._perform_messaging_health_check",
-            side_effect=asyncio.TimeoutError,
-        ):
-            with patch("src.presentation.api.routers.health.logger") as mock_logger:
-                # Act
-                result = await _check_messaging_health()
+    def test_all_services_healthy(self):
+        """Test messaging is healthy when every service is healthy."""
+        # Act
+        result = _summarize_messaging_health(
+            {
+                "queue": self.status("healthy"),
+                "worker": self.status("healthy"),
+                "storage": self.status("healthy"),
+            }
+        )
 
-                # Assert
-                assert result.status == "degraded"
-                assert "Health check timed out" in result.message
-                assert result.details["error"] == "TimeoutError"
-                assert result.details["timeout_seconds"] == 10.0
-                mock_logger.warning.assert_called()
+        # Assert
+        assert result.status == "healthy"
+        assert "All messaging services are healthy" in result.message
+        assert result.details["services"] == {
+            "queue": True,
+            "worker": True,
+            "storage": True,
+        }
 
-    @pytest.mark.asyncio
-    async def test_messaging_health_check_cancellation_handling(self):
-        """Test messaging health check handles cancellation."""
-        # Arrange
-        with patch(
-            "src.presentation.api.routers.health._perform_messaging_health_check",
-            side_effect=asyncio.CancelledError,
-        ):
-            with patch("src.presentation.api.routers.health.logger") as mock_logger:
-                # Act
-                result = await _check_messaging_health()
+    def test_some_services_unhealthy(self):
+        """Test messaging is degraded when some services are unhealthy."""
+        # Act
+        result = _summarize_messaging_health(
+            {
+                "queue": self.status("healthy"),
+                "worker": self.status("unhealthy"),
+                "storage": self.status("degraded"),
+            }
+        )
 
-                # Assert
-                assert result.status == "degraded"
-                assert "Health check was cancelled" in result.message
-                assert result.details["error"] == "CancelledError"
-                mock_logger.warning.assert_called()
+        # Assert
+        assert result.status == "degraded"
+        assert "Some messaging services are unhealthy: worker, storage" in (
+            result.message
+        )
+        assert result.details["unhealthy_services"] == ["worker", "storage"]
 
-    @pytest.mark.asyncio
-    async def test_messaging_health_check_general_exception_no_caching(self):
-        """Test messaging health check handles general exceptions and doesn't cache errors."""
-        # Arrange
-        import src.presentation.api.routers.health as health_module
+    def test_stale_services_degrade_messaging(self):
+        """Test messaging is degraded when a status has not been refreshed."""
+        # Act
+        result = _summarize_messaging_health(
+            {
+                "queue": self.status("healthy", stale=True),
+                "storage": self.status("healthy"),
+            }
+        )
 
-        with patch(
-            "src.presentation.api.routers.health._perform_messaging_health_check",
-            side_effect=ValueError("Test error"),
-        ):
-            with patch("src.presentation.api.routers.health.logger") as mock_logger:
-                # Act
-                result = await _check_messaging_health()
+        # Assert
+        assert result.status == "degraded"
+        assert result.details["stale_services"] == ["queue"]
 
-                # Assert
-                assert result.status == "unhealthy"
-                assert "Messaging health check failed: Test error" in result.message
-                assert result.details["error"] == "Test error"
-                mock_logger.error.assert_called()
+    def test_registry_not_initialized(self):
+        """Test messaging is not configured when no service is initialized."""
+        # Act
+        result = _summarize_messaging_health(
+            {
+                "queue": self.status("not_configured"),
+                "storage": self.status("not_configured"),
+            }
+        )
 
-                # Verify error result is not cached
-                assert health_module._health_status_cache is None
+        # Assert
+        assert result.status == "not_configured"
+        assert "Messaging services not initialized" in result.message
+        assert result.details["initialized"] is False
 
 
 @pytest.mark.unit
@@ -489,7 +271,6 @@ class TestHealthRouterEndpoints:
         """Set up test client."""
         self.test_app = Mock()
         self.test_app.include_router = Mock()
-        clear_health_cache()
 
     @pytest.mark.asyncio
     async def test_messaging_health_check_endpoint(self):
@@ -500,7 +281,7 @@ class TestHealthRouterEndpoints:
         )
 
         with patch(
-            "src.presentation.api.routers.health._check_messaging_health",
+            "src.presentation.api.routers.health._summarize_messaging_health",
             return_value=expected_status,
         ):
             # Act
@@ -524,7 +305,7 @@ class TestHealthRouterEndpoints:
         )
 
         with patch(
-            "src.presentation.api.routers.health._check_messaging_health",
+            "src.presentation.api.routers.health._summarize_messaging_health",
             return_value=messaging_status,
         ):
             with patch(
@@ -565,7 +346,7 @@ class TestHealthRouterEndpoints:
         )
 
         with patch(
-            "src.presentation.api.routers.health._check_messaging_health",
+            "src.presentation.api.routers.health._summarize_messaging_health",
             return_value=messaging_status,
         ):
             with patch(
@@ -602,7 +383,7 @@ class TestHealthRouterEndpoints:
         )
 
         with patch(
-            "src.presentation.api.routers.health._check_messaging_health",
+            "src.presentation.api.routers.health._summarize_messaging_health",
             return_value=messaging_status,
         ):
             with patch(
@@ -637,7 +418,7 @@ class TestHealthRouterEndpoints:
         )
 
         with patch(
-            "src.presentation.api.routers.health._check_messaging_health",
+            "src.presentation.api.routers.health._summarize_messaging_health",
             return_value=messaging_status,
         ):
             with patch(
@@ -684,7 +465,7 @@ class TestHealthRouterEndpoints:
             )
 
             with patch(
-                "src.presentation.api.routers.health._check_messaging_health",
+                "src.presentation.api.routers.health._summarize_messaging_health",
                 return_value=messaging_status,
             ):
                 with patch(
@@ -736,7 +517,6 @@ class TestHealthEndpointsIntegration:
         self.app = FastAPI()
         self.app.include_router(router)
         self.client = TestClient(self.app)
-        clear_health_cache()
 
     def test_messaging_health_endpoint_integration(self):
         """Test messaging health endpoint returns correct response format."""
@@ -749,7 +529,7 @@ class TestHealthEndpointsIntegration:
         )
 
         with patch(
-            "src.presentation.api.routers.health._check_messaging_health",
+            "src.presentation.api.routers.health._summarize_messaging_health",
             return_value=expected_status,
         ):
             # Act
@@ -773,7 +553,7 @@ class TestHealthEndpointsIntegration:
         )
 
         with patch(
-            "src.presentation.api.routers.health._check_messaging_health",
+            "src.presentation.api.routers.health._summarize_messaging_health",
             return_value=messaging_status,
         ):
             with patch(
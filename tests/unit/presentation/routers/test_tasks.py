@@ -594,6 +594,91 @@ class TestTasksEndpointsIntegration:
             self.app.dependency_overrides.clear()
 
 
+@pytest.mark.unit
+class TestTaskStatusPushEndpoints:
+    """Test long-poll and server-sent-event task status endpoints."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        from fastapi import FastAPI
+
+        from src.presentation.api.dependencies import get_background_task_coordinator
+
+        self.app = FastAPI()
+        self.app.include_router(router)
+        self.client = TestClient(self.app)
+        self.mock_coordinator = Mock()
+        self.app.dependency_overrides[get_background_task_coordinator] = (
+            lambda: self.mock_coordinator
+        )
+
+    def teardown_method(self):
+        """Clear dependency overrides."""
+        self.app.dependency_overrides.clear()
+
+    def test_status_with_wait_long_polls(self):
+        """Test wait parameter routes to the long-poll coordinator call."""
+        self.mock_coordinator.wait_for_task_update = AsyncMock(
+            return_value=TaskResponse(task_id="task-1", status="completed")
+        )
+
+        response = self.client.get(
+            "/tasks/task-1/status", params={"wait": 10, "since": "2025-01-01"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+        self.mock_coordinator.wait_for_task_update.assert_called_once_with(
+            "task-1", timeout=10, since="2025-01-01"
+        )
+
+    def test_status_wait_is_capped(self):
+        """Test long-poll wait is capped by the server-side maximum."""
+        from src.shared.config.settings import settings
+
+        self.mock_coordinator.wait_for_task_update = AsyncMock(
+            return_value=TaskResponse(task_id="task-1", status="running")
+        )
+
+        self.client.get("/tasks/task-1/status", params={"wait": 100000})
+
+        call = self.mock_coordinator.wait_for_task_update.call_args
+        assert call.kwargs["timeout"] == settings.task_events_max_wait
+
+    def test_events_stream_until_terminal(self):
+        """Test events endpoint emits SSE frames for each update."""
+
+        async def updates(task_id, keepalive_interval):
+            yield TaskResponse(task_id=task_id, status="running")
+            yield None
+            yield TaskResponse(task_id=task_id, status="completed")
+
+        self.mock_coordinator.stream_task_updates = updates
+
+        response = self.client.get("/tasks/task-1/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [f for f in response.text.split("\n\n") if f]
+        assert len(frames) == 3
+        assert frames[0].startswith("event: status")
+        assert '"status": "running"' in frames[0]
+        assert frames[1] == ": keep-alive"
+        assert '"status": "completed"' in frames[2]
+
+    def test_events_not_found_returns_404(self):
+        """Test events endpoint returns 404 for unknown tasks."""
+
+        async def updates(task_id, keepalive_interval):
+            yield TaskResponse(task_id=task_id, status="not_found")
+
+        self.mock_coordinator.stream_task_updates = updates
+
+        response = self.client.get("/tasks/missing/events")
+
+        assert response.status_code == 404
+
+
 @pytest.mark.unit
 class TestTaskIdPathValidation:
     """Test task ID path parameter validation."""
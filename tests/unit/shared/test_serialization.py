@@ -0,0 +1,88 @@
+"""Tests for JSON serialization of stored content and responses."""
+
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.analysis import AnalysisType
+from src.infrastructure.messaging.implementations.local_file_storage import (
+    LocalFileStorageService,
+)
+from src.shared import serialization
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Test serializing values as stdlib ``json.dumps(default=str)`` could."""
+
+    def test_round_trip(self):
+        """Test nested results survive serialization unchanged."""
+        results = {
+            "executive_summary": "Strong year",
+            "section_analyses": [{"section_name": "Business", "score": 0.5}],
+        }
+
+        data = serialization.dumps(results)
+
+        assert isinstance(data, bytes)
+        assert serialization.loads(data) == results
+        assert json.loads(data) == results
+
+    def test_values_without_json_type(self):
+        """Test datetimes, UUIDs, enums, sets and non-string keys serialize."""
+        analysis_id = uuid4()
+        created_at = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+
+        value = serialization.loads(
+            serialization.dumps(
+                {
+                    "id": analysis_id,
+                    "created_at": created_at,
+                    "type": AnalysisType.COMPREHENSIVE,
+                    "tags": {"risk"},
+                    1: "one",
+                }
+            )
+        )
+
+        assert value["id"] == str(analysis_id)
+        assert datetime.fromisoformat(value["created_at"]) == created_at
+        assert value["type"] == "comprehensive"
+        assert value["tags"] == "{'risk'}"
+        assert value["1"] == "one"
+
+    def test_indent(self):
+        """Test indented output for files read by people."""
+        assert (
+            serialization.dumps({"a": [1]}, indent=True)
+            == b'{\n  "a": [\n    1\n  ]\n}'
+        )
+
+
+@pytest.mark.unit
+class TestStoredJson:
+    """Test reading stored JSON without parsing it."""
+
+    @pytest.mark.asyncio
+    async def test_local_storage_get_raw(self, tmp_path):
+        """Test the stored bytes are returned as written."""
+        storage = LocalFileStorageService(base_path=str(tmp_path))
+        results = {"executive_summary": "Strong year", "key_insights": ["Growth"]}
+        await storage.set("analysis:320193/000032019324000001/analysis_1", results)
+
+        raw = await storage.get_raw("analysis:320193/000032019324000001/analysis_1")
+
+        assert raw == serialization.dumps(results, indent=True)
+        assert await storage.get_raw("analysis:missing") is None
+
+    @pytest.mark.asyncio
+    async def test_default_get_raw_serializes_value(self, tmp_path):
+        """Test backends without raw reads serialize the stored value."""
+        storage = LocalFileStorageService(base_path=str(tmp_path))
+        await storage.set("task:1", {"status": "done"})
+
+        raw = await super(LocalFileStorageService, storage).get_raw("task:1")
+
+        assert serialization.loads(raw) == {"status": "done"}
@@ -0,0 +1,237 @@
+"""Tests for Prometheus metrics and OpenTelemetry tracing helpers."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from opentelemetry import context, trace
+from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+from prometheus_client import REGISTRY
+
+from src.infrastructure.messaging.implementations.local_worker import (
+    LocalWorkerService,
+)
+from src.infrastructure.messaging.implementations.mock_services import (
+    MockQueueService,
+)
+from src.infrastructure.messaging.interfaces import IQueueService
+from src.infrastructure.messaging.task_service import Task
+from src.shared import telemetry
+
+TRACE_ID = 0x5CE0E9A56015FEC5AADFA328AE398115
+
+
+def sample(name: str, **labels: str) -> float:
+    """Get the current value of a metric sample, 0 if not recorded yet."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def producer_span_context() -> context.Context:
+    """Create a context whose current span is one of a known trace."""
+    span_context = SpanContext(
+        trace_id=TRACE_ID,
+        span_id=0xE457B5A2E4D86BD1,
+        is_remote=False,
+        trace_flags=TraceFlags(TraceFlags.SAMPLED),
+    )
+    return trace.set_span_in_context(NonRecordingSpan(span_context))
+
+
+@pytest.mark.unit
+class TestTimed:
+    """Test observing durations in histograms."""
+
+    def test_context_manager_labels_outcome(self):
+        """Test blocks are observed with their outcome when tracked."""
+        labels = {"operation": "timed_block"}
+        before_ok = sample(
+            "aperilex_edgar_request_duration_seconds_count",
+            outcome="success",
+            **labels,
+        )
+        before_error = sample(
+            "aperilex_edgar_request_duration_seconds_count", outcome="error", **labels
+        )
+
+        with telemetry.timed(
+            telemetry.EDGAR_REQUEST_DURATION, track_outcome=True, **labels
+        ):
+            pass
+        with (
+            pytest.raises(ValueError),
+            telemetry.timed(
+                telemetry.EDGAR_REQUEST_DURATION, track_outcome=True, **labels
+            ),
+        ):
+            raise ValueError("not found")
+
+        assert (
+            sample(
+                "aperilex_edgar_request_duration_seconds_count",
+                outcome="success",
+                **labels,
+            )
+            == before_ok + 1
+        )
+        assert (
+            sample(
+                "aperilex_edgar_request_duration_seconds_count",
+                outcome="error",
+                **labels,
+            )
+            == before_error + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_decorates_sync_and_async_functions(self):
+        """Test decorated functions are observed on each call."""
+        name = "aperilex_storage_operation_duration_seconds_count"
+        before = sample(name, operation="timed_decorator")
+
+        @telemetry.timed(
+            telemetry.STORAGE_OPERATION_DURATION, operation="timed_decorator"
+        )
+        def read() -> str:
+            return "content"
+
+        @telemetry.timed(
+            telemetry.STORAGE_OPERATION_DURATION, operation="timed_decorator"
+        )
+        async def read_async() -> str:
+            return "content"
+
+        assert read() == "content"
+        assert await read_async() == "content"
+        assert sample(name, operation="timed_decorator") == before + 2
+
+    def test_nothing_recorded_when_disabled(self):
+        """Test no metrics are recorded when Prometheus is disabled."""
+        name = "aperilex_analysis_stage_duration_seconds_count"
+        before = sample(name, stage="disabled_stage")
+
+        with patch.object(telemetry.settings, "prometheus_enabled", False):
+            with telemetry.analysis_stage("disabled_stage"):
+                pass
+            telemetry.record_llm_tokens("openai", "gpt-4", "Disabled", 10, 5)
+
+        assert sample(name, stage="disabled_stage") == before
+        assert (
+            sample(
+                "aperilex_llm_tokens_total",
+                provider="openai",
+                model="gpt-4",
+                schema="Disabled",
+                kind="prompt",
+            )
+            == 0
+        )
+
+
+@pytest.mark.unit
+class TestLLMMetrics:
+    """Test LLM call, token and error metrics."""
+
+    def test_tokens_counted_by_kind(self):
+        """Test prompt and output tokens are counted, unknown counts ignored."""
+        labels = {"provider": "openai", "model": "gpt-4", "schema": "TokensSchema"}
+        before = sample("aperilex_llm_tokens_total", kind="prompt", **labels)
+
+        telemetry.record_llm_tokens(**labels, prompt_tokens=1500, output_tokens=800)
+        telemetry.record_llm_tokens(**labels, prompt_tokens=None, output_tokens=200)
+
+        assert sample("aperilex_llm_tokens_total", kind="prompt", **labels) == (
+            before + 1500
+        )
+        assert sample("aperilex_llm_tokens_total", kind="output", **labels) == 1000
+
+    def test_failed_calls_counted_as_errors(self):
+        """Test calls that raise are timed and counted by error type."""
+        labels = {"provider": "google", "model": "gemini", "schema": "ErrorSchema"}
+
+        with (
+            pytest.raises(TimeoutError),
+            telemetry.observe_llm_call(**labels),
+        ):
+            raise TimeoutError
+
+        assert sample("aperilex_llm_errors_total", error="TimeoutError", **labels) == 1
+        assert sample("aperilex_llm_request_duration_seconds_count", **labels) == 1
+
+
+@pytest.mark.unit
+class TestTracePropagation:
+    """Test tying API requests and worker tasks into one trace."""
+
+    def test_context_not_injected_when_disabled(self):
+        """Test messages carry no trace context when tracing is disabled."""
+        metadata: dict = {}
+        token = context.attach(producer_span_context())
+        try:
+            telemetry.inject_trace_context(metadata)
+        finally:
+            context.detach(token)
+
+        assert metadata == {}
+        assert telemetry.extract_trace_context(metadata) is None
+
+    @pytest.mark.asyncio
+    async def test_worker_continues_trace_of_queued_task(self):
+        """Test a task runs in the trace of the request that queued it."""
+        queue_service = MockQueueService()
+        await queue_service.connect()
+        worker = LocalWorkerService(queue_service, worker_id="test")
+        worker._publish_result = AsyncMock()
+        trace_ids = []
+
+        async def handler() -> None:
+            trace_ids.append(trace.get_current_span().get_span_context().trace_id)
+
+        worker.register_task("traced_task", handler)
+        task = Task(name="traced_task")
+        task._registered = True
+
+        with (
+            patch.object(telemetry.settings, "opentelemetry_enabled", True),
+            patch(
+                "src.infrastructure.messaging.task_service.get_queue_service",
+                AsyncMock(return_value=queue_service),
+            ),
+        ):
+            token = context.attach(producer_span_context())
+            try:
+                await task.apply_async()
+            finally:
+                context.detach(token)
+
+            message = await queue_service.receive_task()
+            assert message is not None
+            assert "traceparent" in message.metadata[telemetry.TRACE_CONTEXT_KEY]
+
+            before = sample(
+                "aperilex_worker_tasks_total", task="traced_task", status="success"
+            )
+            await worker._process_task(message)
+
+        assert trace_ids == [TRACE_ID]
+        assert (
+            sample("aperilex_worker_tasks_total", task="traced_task", status="success")
+            == before + 1
+        )
+        assert sample("aperilex_worker_busy_seconds_total", task="traced_task") > 0
+
+
+@pytest.mark.unit
+class TestQueueDepth:
+    """Test sampling queue depth in workers."""
+
+    @pytest.mark.asyncio
+    async def test_depth_sampled_at_most_once_per_interval(self):
+        """Test queue depth is sampled, then not again until the interval passes."""
+        queue_service = AsyncMock(spec=IQueueService)
+        queue_service.get_queue_size.return_value = 7
+        worker = LocalWorkerService(queue_service, worker_id="test")
+
+        await worker._sample_queue_depths(["depth_queue"])
+        await worker._sample_queue_depths(["depth_queue"])
+
+        assert sample("aperilex_queue_depth", queue="depth_queue") == 7
+        queue_service.get_queue_size.assert_awaited_once_with("depth_queue")